@@ -1,15 +1,24 @@
 #!/usr/bin/env python
 
+import json
 import sys
 
-from mathics.core.builtin import Builtin
+from mathics.core.builtin import Builtin, Operator, PatternObject, SympyObject
+from mathics.core.definitions import Definitions
 from mathics.core.load_builtin import (
+    BUILTIN_MANIFEST_PATH,
+    _builtins,
+    builtins_by_module,
     import_and_load_builtins,
     mathics3_builtins_modules,
     name_is_builtin_symbol,
 )
 
-import_and_load_builtins()
+import_and_load_builtins(lazy=False)
+
+# Modules whose Builtins register themselves in global tables
+# when they are instantiated.
+EAGER_MODULE_PREFIXES = ("mathics.builtin.forms", "mathics.builtin.makeboxes")
 
 
 def generate_available_builtins_names():
@@ -51,6 +60,64 @@ def build_builtin_manifest():
             f_out.write(key + "\n")
 
 
+def can_be_lazy(module_name: str) -> bool:
+    """
+    Check if the import of a builtin module can be deferred until one
+    of its symbols is used: its Builtins must not be added to the
+    global tables filled by ``add_builtins``.
+    """
+    if module_name.startswith(EAGER_MODULE_PREFIXES):
+        return False
+    for builtin in builtins_by_module[module_name]:
+        if (
+            hasattr(builtin, "python_equivalent")
+            or isinstance(builtin, (Operator, PatternObject, SympyObject))
+            or builtin.get_operator_display() is not None
+        ):
+            return False
+    return bool(builtins_by_module[module_name])
+
+
+def generate_lazy_builtin_manifest() -> dict:
+    """
+    Return a dictionary mapping the name of each module that can be
+    loaded lazily to the names of its builtins and of the other symbols
+    it defines that are not defined by the modules loaded at startup.
+    """
+
+    def contributed_names(builtins) -> set:
+        definitions = Definitions()
+        _builtins["System`MakeBoxes"].contribute(definitions)
+        for builtin in builtins:
+            builtin.contribute(definitions)
+        return set(definitions.builtin)
+
+    lazy_modules = sorted(name for name in builtins_by_module if can_be_lazy(name))
+    eager_names = contributed_names(
+        builtin
+        for module_name, builtins in builtins_by_module.items()
+        if module_name not in lazy_modules
+        for builtin in builtins
+    )
+    manifest = {}
+    for module_name in lazy_modules:
+        builtins = builtins_by_module[module_name]
+        # Builtin names are kept even if other modules use them
+        # as option names.
+        names = (contributed_names(builtins) - eager_names) | {
+            builtin.get_name() for builtin in builtins
+        }
+        if names:
+            manifest[module_name] = sorted(names)
+    return manifest
+
+
+def build_lazy_builtin_manifest():
+    with open(BUILTIN_MANIFEST_PATH, "w") as f_out:
+        json.dump(generate_lazy_builtin_manifest(), f_out, indent=1, sort_keys=True)
+        f_out.write("\n")
+
+
 def check_manifest():
     status_OK = True
     builtins_by_name = generate_available_builtins_names()
@@ -80,11 +147,18 @@ def check_manifest():
         build_builtin_manifest()
         print("SYMBOLS_MANIFEST was updated.")
 
+    with open(BUILTIN_MANIFEST_PATH, "r") as f_in:
+        lazy_manifest = json.load(f_in)
+    if lazy_manifest != generate_lazy_builtin_manifest():
+        build_lazy_builtin_manifest()
+        print(f"{BUILTIN_MANIFEST_PATH} was updated.")
+
 
 if __name__ == "__main__":
     if len(sys.argv) == 2:
         if sys.argv[1] == "--rebuild":
             build_builtin_manifest()
+            build_lazy_builtin_manifest()
     elif len(sys.argv) == 1:
         check_manifest()
         print("The manifest is consistent with the implemented builtins.")
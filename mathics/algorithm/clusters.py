@@ -4,8 +4,10 @@
 import bisect
 import math
 import random
+from collections import OrderedDict
 from itertools import chain, islice
 
+import numpy
 from mpmath import fsum
 
 
@@ -39,6 +41,8 @@ def robust_min(iterable):
 # Applied Mathematics Philadelphia, PA, USA. pp. 1027–1035.
 # [Hamerly2010] Greg Hamerly, Making k-means even faster In proceedings of the 2010 SIAM international
 # conference on data mining (SDM 2010), April 2010.
+# [Sculley2010] D. Sculley, "Web-Scale K-Means Clustering", Proceedings of the 19th International Conference on
+# World Wide Web (WWW 2010), pp. 1177-1178.
 
 # for agglomerative clustering, we use [Kurita1991].
 
@@ -180,6 +184,82 @@ class LazyDistances:
         raise ValueError("_compute_distance was not implemented")
 
 
+# distances between machine numbers are computed with NumPy, for a block of rows of the distance matrix at once. a
+# block holds at most _ARRAY_BLOCK_SIZE distances, which bounds the memory used for many points.
+_ARRAY_BLOCK_SIZE = 2**22
+
+
+def _array_distances(x, y, p, squared=False):
+    # returns the matrix of the distances between each row of x and each row of y, where the distance is the p-norm
+    # of the difference of two rows, or its square if squared is True. as in _squared_euclidean_distance, the
+    # coordinates are summed up one after the other.
+    d = numpy.zeros((len(x), len(y)))
+    for t in range(x.shape[1]):
+        delta = numpy.abs(numpy.subtract.outer(x[:, t], y[:, t]))
+        if p == 1:
+            d += delta
+        elif p == 2:
+            d += delta * delta
+        else:
+            numpy.maximum(d, delta, out=d)
+    if p == 2 and not squared:
+        numpy.sqrt(d, out=d)
+    return d
+
+
+def _paired_squared_distances(x, y):
+    # returns the squared euclidean distances between the rows of x and the rows of y with the same index.
+    d = numpy.zeros(len(x))
+    for t in range(x.shape[1]):
+        delta = x[:, t] - y[:, t]
+        d += delta * delta
+    return d
+
+
+class ArrayDistances:
+    # distances between the rows of a matrix x of machine numbers, see _array_distances. single distances are taken
+    # from whole rows of the distance matrix, of which the ones used last are kept.
+
+    def __init__(self, x, p, squared=False):
+        self._x = x
+        self._p = p
+        self._squared = squared
+        self._rows = OrderedDict()
+        self._max_rows = max(2, _ARRAY_BLOCK_SIZE // len(x))
+
+    def _block(self, start, stop, n):
+        # rows start, ..., stop - 1 of the distance matrix, up to column n - 1.
+        x = self._x
+        return _array_distances(x[start:stop], x[:n], self._p, self._squared)
+
+    def distance(self, i, j):
+        rows = self._rows
+        row = rows.get(i)
+        if row is None:
+            row = rows.get(j)
+            if row is not None:
+                rows.move_to_end(j)
+                return row.item(i)
+            row = self._block(i, i + 1, len(self._x))[0]
+            rows[i] = row
+            if len(rows) > self._max_rows:
+                rows.popitem(last=False)
+        else:
+            rows.move_to_end(i)
+        return row.item(j)
+
+    def matrix(self):
+        # the lower triangle of the distance matrix, as PrecomputedDistances holds it.
+        n = len(self._x)
+        step = max(1, _ARRAY_BLOCK_SIZE // n)
+        distances = []
+        for start in range(1, n, step):
+            stop = min(start + step, n)
+            for i, row in enumerate(self._block(start, stop, stop - 1), start):
+                distances.extend(row[:i].tolist())
+        return distances
+
+
 def _shuffled_range(n):
     # returns all numbers from [0, ..., n - 1] in random order, never returning any number twice.
 
@@ -1184,6 +1264,187 @@ class _KMeans:
         return self._optimize(solutions)
 
 
+def _smallest2_of_rows(d):
+    # the row by row version of _smallest2, returning the indices of the smallest values and the two smallest values
+    # of each row of d. as _smallest2 does, ties between the first two columns are resolved in favor of the second.
+    order = numpy.arange(d.shape[1])
+    order[:2] = (1, 0)
+    smallest = order[numpy.argmin(d[:, order], axis=1)]
+    ordered = numpy.partition(d, 1, axis=1)
+    return smallest, ordered[:, 0], ordered[:, 1]
+
+
+class _ArrayKMeans(_KMeans):
+    # _KMeans for a matrix x of machine numbers, with a row for each point. the distances between points and
+    # centroids, and the centroids, are computed with NumPy for blocks of points. the random choices are the same
+    # as in _KMeans, so that both give the same clusters, up to the rounding of the sums of points.
+
+    def __init__(self, x, epsilon):
+        super(_ArrayKMeans, self).__init__(
+            numpy.asarray(x, dtype=numpy.float64), None, epsilon
+        )
+
+    def _point_distances(self, x, c):
+        step = max(1, _ARRAY_BLOCK_SIZE // len(c))
+        return numpy.concatenate(
+            [
+                _array_distances(x[start : start + step], c, 2, True)
+                for start in range(0, len(x), step)
+            ]
+        )
+
+    def _pick_initial(self):
+        # use k-means++, see [Arthur2007] and _KMeans._pick_initial
+
+        x = self.x
+
+        candidates = numpy.arange(len(x))
+        size = len(candidates)
+
+        i = random.randint(0, size - 1)
+        new_centroid = x[candidates[i]]
+        yield new_centroid
+
+        def d2(centroid):
+            distance = _array_distances(
+                x[candidates[:size]], centroid[None, :], 2, True
+            )
+            return (distance * distance)[:, 0]
+
+        size -= 1
+        candidates[i] = candidates[size]
+
+        distances = d2(new_centroid)
+        while True:
+            cumulative = numpy.cumsum(distances[:size])
+            r = random.uniform(0, cumulative[-1])
+            i = min(int(numpy.searchsorted(cumulative, r, side="right")), size - 1)
+            new_centroid = x[candidates[i]]
+            yield new_centroid
+
+            size -= 1
+            candidates[i] = candidates[size]
+            distances[i] = distances[size]
+
+            numpy.minimum(distances[:size], d2(new_centroid), out=distances[:size])
+
+    def _separations(self, c):
+        # the distance of each centroid to its nearest other centroid.
+        cd = _array_distances(c, c, 2, True)
+        numpy.fill_diagonal(cd, numpy.inf)
+        return cd.min(axis=1)
+
+    def _silhouette_index(self, a, c, q, s):
+        # compute an approximate silhouette index, as _KMeans._kmeans does.
+        within = numpy.zeros(len(c))
+        numpy.add.at(within, a, _paired_squared_distances(self.x, c[a]))
+        if (q == 1).any():
+            return -1.0  # no good config
+        within /= q - 1
+        return fsum(
+            _silhouette(a, b) for a, b in zip(within.tolist(), s.tolist())
+        ) / len(c)
+
+    def _kmeans(self, k):
+        # implements [Hamerly2010] as _KMeans._kmeans does, but for all points at once.
+        x = self.x
+
+        assert k <= len(x)
+
+        c = numpy.array(list(islice(self._pick_initial(), 0, k)))
+        assert len(c) == k
+
+        a, u, l = _smallest2_of_rows(self._point_distances(x, c))
+        q = numpy.bincount(a, minlength=k)
+        cc = numpy.zeros(c.shape)
+        numpy.add.at(cc, a, x)
+
+        s = numpy.zeros(k)
+        p = numpy.zeros(k)
+        change = None
+
+        while change is None or change > self.epsilon:
+            s = self._separations(c)
+
+            # find new assignments
+            m = numpy.maximum(s[a] / 2.0, l)
+            far = numpy.flatnonzero(u > m)
+            u[far] = _paired_squared_distances(x[far], c[a[far]])
+            far = far[u[far] > m[far]]
+            if len(far):
+                new_a, u[far], l[far] = _smallest2_of_rows(
+                    self._point_distances(x[far], c)
+                )
+                is_moved = new_a != a[far]
+                moved, old_a, new_a = far[is_moved], a[far][is_moved], new_a[is_moved]
+                numpy.subtract.at(q, old_a, 1)
+                numpy.add.at(q, new_a, 1)
+                numpy.subtract.at(cc, old_a, x[moved])
+                numpy.add.at(cc, new_a, x[moved])
+                a[moved] = new_a
+
+            # move centers, up to the first empty cluster
+            empty = numpy.flatnonzero(q == 0)
+            moving = empty[0] if len(empty) else k
+            c_new = cc[:moving] / q[:moving, None]
+            p[:moving] = _paired_squared_distances(c[:moving], c_new)
+            c[:moving] = c_new
+
+            if len(empty):
+                break
+
+            # update bounds
+            r1 = numpy.argmax(p)
+            p2, p1 = numpy.partition(p, k - 2)[k - 2 :]
+            u += p[a]
+            l -= numpy.where(a == r1, p2, p1)
+
+            change = sum(p.tolist())
+
+        return a.tolist(), self._silhouette_index(a, c, q, s)
+
+
+class _MiniBatchKMeans(_ArrayKMeans):
+    # mini-batch k-means, see [Sculley2010]: the centroids are moved towards random samples of batch_size points
+    # instead of all the points. this is much faster for many points, but gives approximate clusters.
+
+    def __init__(self, x, epsilon, batch_size, iterations=100):
+        super(_MiniBatchKMeans, self).__init__(x, epsilon)
+        self.batch_size = min(batch_size, len(x))
+        self.iterations = iterations
+
+    def _kmeans(self, k):
+        x = self.x
+
+        assert k <= len(x)
+
+        c = numpy.array(list(islice(self._pick_initial(), 0, k)))
+        assert len(c) == k
+
+        # v[j] is the number of sampled points that centroid j is the mean of.
+        v = numpy.zeros(k)
+
+        for _ in range(self.iterations):
+            batch = x[random.sample(range(len(x)), self.batch_size)]
+            b, _, _ = _smallest2_of_rows(self._point_distances(batch, c))
+
+            sums = numpy.zeros(c.shape)
+            numpy.add.at(sums, b, batch)
+            v_new = v + numpy.bincount(b, minlength=k)
+            seen = v_new > v
+            c_new = c.copy()
+            c_new[seen] = (c[seen] * v[seen, None] + sums[seen]) / v_new[seen, None]
+
+            change = sum(_paired_squared_distances(c, c_new).tolist())
+            c, v = c_new, v_new
+            if change <= self.epsilon:
+                break
+
+        a, _, _ = _smallest2_of_rows(self._point_distances(x, c))
+        q = numpy.bincount(a, minlength=k)
+        return a.tolist(), self._silhouette_index(a, c, q, self._separations(c))
+
+
 def _squared_euclidean_distance(a, b):
     s = None
     for x, y in zip(a, b):
@@ -1195,11 +1456,18 @@ def _squared_euclidean_distance(a, b):
     return s
 
 
-def kmeans(x, x_repr, k, mode, seed, epsilon):
+def kmeans(x, x_repr, k, mode, seed, epsilon, batch_size=None):
+    # x is either a list of points, which are lists of mpmath numbers, or a NumPy matrix of machine numbers with a
+    # row for each point. mini-batches of batch_size points are only used for the latter.
     assert len(x) == len(x_repr)
 
     random.seed(seed)
-    km = _KMeans(x, _squared_euclidean_distance, epsilon)
+    if not isinstance(x, numpy.ndarray):
+        km = _KMeans(x, _squared_euclidean_distance, epsilon)
+    elif batch_size is None:
+        km = _ArrayKMeans(x, epsilon)
+    else:
+        km = _MiniBatchKMeans(x, epsilon, batch_size)
 
     if k is None:
         a, _, k = km.without_k()
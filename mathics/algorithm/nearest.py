@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+# relevant publications:
+
+# [Yianilos1993] Peter N. Yianilos, "Data Structures and Algorithms for Nearest Neighbor Search in
+# General Metric Spaces", Proceedings of the Fourth Annual ACM-SIAM Symposium on Discrete Algorithms,
+# 1993, pp. 311-321.
+
+# VPTree is the vantage point tree of [Yianilos1993]. It only needs a distance that is a metric, i.e.
+# that satisfies the triangle inequality, and makes no assumption about the points themselves. The
+# distances are asked for in batches, since each call of the distance function can be expensive.
+
+import heapq
+import random
+
+# number of points below which a subtree is stored as a plain list of points.
+_LEAF_SIZE = 8
+
+
+class VPTree:
+    def __init__(self, n, distances, seed=12345):
+        # distances(i, js) returns the list of distances between point i and each of the points js.
+        self.n = n
+        self._random = random.Random(seed)
+        self._root = self._build(list(range(n)), distances)
+
+    def _build(self, points, distances):
+        if len(points) <= _LEAF_SIZE:
+            return points
+
+        vantage = points.pop(self._random.randrange(len(points)))
+        d = sorted(zip(distances(vantage, points), points))
+        half = len(d) // 2
+
+        inner = [j for _, j in d[:half]]
+        outer = [j for _, j in d[half:]]
+
+        # all inner points are within inner_radius of the vantage point, and all outer points are at least
+        # outer_radius away from it.
+        inner_radius = d[half - 1][0]
+        outer_radius = d[half][0]
+
+        return (
+            vantage,
+            inner_radius,
+            outer_radius,
+            self._build(inner, distances),
+            self._build(outer, distances),
+        )
+
+    def nearest(self, distances, n=None, r=None):
+        # returns the indices of the n points nearest to a query point (all points if n is None) that are not
+        # farther than r from it (if r is not None), ordered by distance and then by index. distances(js)
+        # returns the list of distances between the query point and each of the points js.
+
+        # with n given, heap keeps the n best candidates found so far as (-distance, -index), so that the
+        # worst candidate is on top.
+        heap = []
+        found = []
+        bound = [r]  # the current search radius, or None
+
+        def add(d, i):
+            if r is not None and d > r:
+                return
+            if n is None:
+                found.append((d, i))
+                return
+            if len(heap) < n:
+                heapq.heappush(heap, (-d, -i))
+            elif (-d, -i) > heap[0]:
+                heapq.heapreplace(heap, (-d, -i))
+            else:
+                return
+            if len(heap) == n:
+                worst = -heap[0][0]
+                if bound[0] is None or worst < bound[0]:
+                    bound[0] = worst
+
+        def visible(lower_bound):
+            # ties are not pruned, so that the point with the lower index is kept.
+            return bound[0] is None or lower_bound <= bound[0]
+
+        def search(node):
+            if isinstance(node, list):
+                if node:
+                    for d, i in zip(distances(node), node):
+                        add(d, i)
+                return
+
+            vantage, inner_radius, outer_radius, inner, outer = node
+            d = distances([vantage])[0]
+            add(d, vantage)
+
+            if d <= (inner_radius + outer_radius) / 2:
+                if visible(d - inner_radius):
+                    search(inner)
+                if visible(outer_radius - d):
+                    search(outer)
+            else:
+                if visible(outer_radius - d):
+                    search(outer)
+                if visible(d - inner_radius):
+                    search(inner)
+
+        if n is not None and n < 1:
+            return []
+        search(self._root)
+
+        if n is None:
+            candidates = sorted(found)
+        else:
+            candidates = sorted((-d, -i) for d, i in heap)
+        return [i for _, i in candidates]
@@ -2,36 +2,24 @@
 
 Begin["System`Convert`TableDump`"]
 
-
-Options[ImportCSV] = {
-    "CharacterEncoding" :> $CharacterEncoding,
-    "FieldSeparators" -> ","
-};
-
-ImportCSV[stream_InputStream, OptionsPattern[]]:=
-    Module[{data, grid, sep = OptionValue["FieldSeparators"]},        
-        data = StringSplit[#, sep]& /@ ReadList[stream, String];
-        grid = Grid[data];
-        {
-            "Data" -> data,
-            "Grid" -> grid
-        }
-]
+(* CSVDataImport and CSVGridImport are defined in
+   mathics/builtin/fileformats/tableformat.py. *)
 
 ImportExport`RegisterImport[
     "CSV",
-    System`Convert`TableDump`ImportCSV,
     {
-        "Data" :> GetData,
-	    "Grid" :> GetGrid
+        "Data" :> CSVDataImport,
+        "Grid" :> CSVGridImport,
+        CSVDataImport
     },
-    (* Sources -> ImportExport`DefaultSources["Table"], *)
+    {},
     FunctionChannels -> {"Streams"},
     AvailableElements -> {"Data", "Grid"},
     DefaultElement -> "Data",
     Options -> {
         "CharacterEncoding",
-        "FieldSeparators"
+        "FieldSeparators",
+        "HeaderLines"
     }
 ]
 
@@ -0,0 +1,15 @@
+(* JSON Exporter *)
+
+Begin["System`Convert`JSONDump`"]
+
+ImportExport`RegisterExport[
+    "JSON",
+	System`Convert`JSONDump`JSONExport,
+	FunctionChannels -> {"Streams"},
+	Options -> {"CharacterEncoding"},
+	DefaultElement -> "Plaintext",
+	BinaryFormat -> False
+]
+
+
+End[]
@@ -0,0 +1,18 @@
+(* TSV Exporter *)
+
+Begin["System`Convert`TableDump`"]
+
+ImportExport`RegisterExport[
+    "TSV",
+    System`Convert`TableDump`TSVExport,
+    FunctionChannels -> {"Streams"},
+    DefaultElement -> "Plaintext",
+    BinaryFormat -> False,
+    Options -> {
+        "CharacterEncoding",
+        "FieldSeparators"
+    }
+]
+
+
+End[]
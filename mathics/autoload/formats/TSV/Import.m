@@ -0,0 +1,27 @@
+(* TSV Importer *)
+
+Begin["System`Convert`TableDump`"]
+
+(* TSVDataImport and TSVGridImport are defined in
+   mathics/builtin/fileformats/tableformat.py. *)
+
+ImportExport`RegisterImport[
+    "TSV",
+    {
+        "Data" :> TSVDataImport,
+        "Grid" :> TSVGridImport,
+        TSVDataImport
+    },
+    {},
+    FunctionChannels -> {"Streams"},
+    AvailableElements -> {"Data", "Grid"},
+    DefaultElement -> "Data",
+    Options -> {
+        "CharacterEncoding",
+        "FieldSeparators",
+        "HeaderLines"
+    }
+]
+
+
+End[]
@@ -10,3 +10,9 @@ Unprotect[Settings`$TraceGet]
 Settings`$PreferredBackendMethod::usage = "This sets whether to use mpmath, numpy or Sympy for numeric and symbolic constants and methods, when there is a choice.";
 Settings`$PreferredBackendMethod = "sympy"
 Unprotect[Settings`$PreferredBackendMethod]
+
+
+Settings`$EvaluationCacheSize::usage = "This sets the maximum number of calls of pure builtin functions on numbers or strings, like Sin[1/7], whose results are remembered. 0 disables the cache.";
+Settings`$EvaluationCacheSize::setsize = "Cannot set the size of the evaluation cache to `1`; value must be a non-negative integer.";
+Settings`$EvaluationCacheSize = 0
+Unprotect[Settings`$EvaluationCacheSize]
@@ -91,6 +91,13 @@ BENCHMARKS = {
         "RandomInteger[{0,1}, {10,10}] . RandomInteger[{0,1}, {10,10}]",
         "RandomInteger[{0,10}, {10,10}] + RandomInteger[{0,10}, {10,10}]",
     ],
+    "Sort": [
+        "Sort[RandomInteger[100, 1000], Greater]",
+        "Sort[RandomReal[1, 1000], #1 < #2 &]",
+        "Sort[RandomInteger[10, {1000, 2}], #1[[2]] < #2[[2]] &]",
+        "Sort[RandomInteger[10, 100], (#1 - #2 < 0) &]",
+        "SortBy[RandomInteger[100, {1000, 2}], Last]",
+    ],
 }
 
 DEPTH = 300
@@ -7,6 +7,8 @@ on a calculator.
 
 """
 
+from fractions import Fraction
+
 from mathics.builtin.arithmetic import create_infix
 from mathics.core.atoms import (
     Complex,
@@ -41,6 +43,7 @@ from mathics.core.convert.expression import to_expression
 from mathics.core.convert.sympy import from_sympy
 from mathics.core.expression import Expression
 from mathics.core.list import ListExpression
+from mathics.core.sparse import SparseArrayExpression
 from mathics.core.symbols import (
     Symbol,
     SymbolDivide,
@@ -59,9 +62,18 @@ from mathics.core.systemsymbols import (
     SymbolPattern,
     SymbolSequence,
 )
-from mathics.eval.arithfns.basic import eval_Plus, eval_Times
+from mathics.eval.arithfns.basic import (
+    eval_Divide_vectorized,
+    eval_Plus,
+    eval_Plus_vectorized,
+    eval_Power_vectorized,
+    eval_Subtract_vectorized,
+    eval_Times,
+    eval_Times_vectorized,
+)
 from mathics.eval.nevaluator import eval_N
 from mathics.eval.numerify import numerify
+from mathics.eval.sparse import eval_Plus_sparse, eval_Times_sparse
 
 
 class CubeRoot(Builtin):
@@ -168,6 +180,11 @@ class Divide(InfixOperator):
 
     summary_text = "divide a number"
 
+    def vectorized_function(self, *args):
+        if len(args) != 2:
+            return None
+        return eval_Divide_vectorized(*args)
+
 
 class Minus(PrefixOperator):
     """
@@ -215,6 +232,11 @@ class Minus(PrefixOperator):
         "Minus[x_Integer]"
         return Integer(-x.value)
 
+    def vectorized_function(self, *args):
+        if len(args) != 1:
+            return None
+        return eval_Times_vectorized(-1, *args)
+
 
 class Plus(InfixOperator, SympyFunction):
     """
@@ -336,9 +358,17 @@ class Plus(InfixOperator, SympyFunction):
 
     def eval(self, items, evaluation):
         "Plus[items___]"
+        items_tuple = items.get_sequence()
+        if any(isinstance(item, SparseArrayExpression) for item in items_tuple):
+            result = eval_Plus_sparse(items_tuple, evaluation)
+            if result is not None:
+                return result
         items_tuple = numerify(items, evaluation).get_sequence()
         return eval_Plus(*items_tuple)
 
+    def vectorized_function(self, *args):
+        return eval_Plus_vectorized(*args)
+
 
 class Power(InfixOperator, MPMathFunction):
     """
@@ -471,6 +501,11 @@ class Power(InfixOperator, MPMathFunction):
         if result is None or result != SymbolNull:
             return result
 
+    def vectorized_function(self, *args):
+        if len(args) != 2:
+            return None
+        return eval_Power_vectorized(*args)
+
 
 class Sqrt(SympyFunction):
     """
@@ -517,6 +552,11 @@ class Sqrt(SympyFunction):
 
     summary_text = "take the square root of a number"
 
+    def vectorized_function(self, *args):
+        if len(args) != 1:
+            return None
+        return eval_Power_vectorized(*args, Fraction(1, 2))
+
 
 class Subtract(InfixOperator):
     """
@@ -550,6 +590,11 @@ class Subtract(InfixOperator):
 
     summary_text = "subtract from a number"
 
+    def vectorized_function(self, *args):
+        if len(args) != 2:
+            return None
+        return eval_Subtract_vectorized(*args)
+
 
 class Times(InfixOperator, SympyFunction):
     """
@@ -691,5 +736,13 @@ class Times(InfixOperator, SympyFunction):
 
     def eval(self, items, evaluation):
         "Times[items___]"
+        items_tuple = items.get_sequence()
+        if any(isinstance(item, SparseArrayExpression) for item in items_tuple):
+            result = eval_Times_sparse(items_tuple, evaluation)
+            if result is not None:
+                return result
         items = numerify(items, evaluation).get_sequence()
         return eval_Times(*items)
+
+    def vectorized_function(self, *args):
+        return eval_Times_vectorized(*args)
@@ -5,8 +5,16 @@ Sums, Simple Statistics
 These functions perform a simple arithmetic computation over a list.
 """
 
+import math
 
+from mathics.core.atoms import Integer, MachineReal
 from mathics.core.builtin import Builtin
+from mathics.core.evaluation import Evaluation
+from mathics.core.expression import Expression, ExpressionInfinity
+from mathics.core.list import ListExpression
+from mathics.core.sparse import SparseArrayExpression
+from mathics.core.systemsymbols import SymbolApply, SymbolPlus
+from mathics.eval.sparse import eval_Total_sparse
 
 
 class Accumulate(Builtin):
@@ -57,6 +65,10 @@ class Total(Builtin):
     Total over rows instead of columns
     >> Total[{{1, 2, 3}, {4, 5, 6}, {7, 8 ,9}}, {2}]
      = {6, 15, 24}
+
+    Sparse arrays are totaled without building the dense array:
+    >> Total[SparseArray[{{1, 1} -> 1, {2, 1} -> 2, {2, 3} -> 3}]]
+     = SparseArray[Automatic, {3}, 0, {{1} -> 3, {3} -> 3}]
     """
 
     summary_text = "total of the elements in a list"
@@ -64,3 +76,37 @@ class Total(Builtin):
         "Total[head_]": "Apply[Plus, head]",
         "Total[head_, n_]": "Apply[Plus, Flatten[head, n]]",
     }
+
+    def eval_list(self, head: ListExpression, evaluation: Evaluation):
+        "Total[head_List]"
+        # Packed vectors are totaled without unpacking them. Like Plus,
+        # the total of machine reals is rounded once.
+        if head.is_packed and head.array.ndim == 1:
+            values = head.array.tolist()
+            if head.array.dtype.kind == "i":
+                return Integer(sum(values))
+            try:
+                return MachineReal(math.fsum(values))
+            except OverflowError:
+                pass
+        return Expression(SymbolApply, SymbolPlus, head)
+
+    def eval_sparse(self, array, evaluation: Evaluation):
+        "Total[array_SparseArray]"
+        if isinstance(array, SparseArrayExpression):
+            return eval_Total_sparse(array, evaluation)
+
+    def eval_sparse_levels(self, array, n, evaluation: Evaluation):
+        "Total[array_SparseArray, n_]"
+        if not isinstance(array, SparseArrayExpression):
+            return
+        if isinstance(n, Integer) and n.value >= 0:
+            levels = n.value
+        elif n.sameQ(ExpressionInfinity):
+            levels = len(array.dims)
+        else:
+            return
+        # Totals up to level n are totals at level 1, n times.
+        for _ in range(min(levels, len(array.dims))):
+            array = eval_Total_sparse(array, evaluation)
+        return array
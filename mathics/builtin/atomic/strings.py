@@ -93,6 +93,16 @@ def _evaluate_match(s, m, evaluation):
     return s.replace_vars(replace, in_scoping=False).evaluate(evaluation)
 
 
+def _finditer(patt, text, flags):
+    """
+    Iterate over the matches of ``patt`` in ``text``. If ``patt`` is a compiled
+    pattern, it was compiled with its flags, and ``flags`` is not used.
+    """
+    if isinstance(patt, re.Pattern):
+        return patt.finditer(text)
+    return re.finditer(patt, text, flags=flags)
+
+
 def _parallel_match(text, rules, flags, limit):
     heap = []
 
@@ -106,7 +116,7 @@ def _parallel_match(text, rules, flags, limit):
             heappush(heap, (m.start(), i, m, form, iter))
 
     for i, (patt, form) in enumerate(rules):
-        push(i, re.finditer(patt, text, flags=flags), form)
+        push(i, _finditer(patt, text, flags), form)
 
     k = 0
     n = 0
@@ -156,7 +166,7 @@ def mathics_split(patt, string, flags):
     For these reasons we implement our own split.
     """
     # (start, end) indices of splits
-    indices = list((m.start(), m.end()) for m in re.finditer(patt, string, flags))
+    indices = list((m.start(), m.end()) for m in _finditer(patt, string, flags))
 
     # (start, end) indices of stuff to keep
     indices = [(None, 0)] + indices + [(len(string), None)]
@@ -2,9 +2,9 @@
 Cluster Analysis
 """
 
-import heapq
 
 from mathics.algorithm.clusters import (
+    ArrayDistances,
     AutomaticMergeCriterion,
     AutomaticSplitCriterion,
     LazyDistances,
@@ -14,7 +14,13 @@ from mathics.algorithm.clusters import (
     optimize,
 )
 from mathics.builtin.options import options_to_rules
-from mathics.core.atoms import FP_MANTISA_BINARY_DIGITS, Integer, Real, String, min_prec
+from mathics.core.atoms import (
+    FP_MANTISA_BINARY_DIGITS,
+    Integer,
+    Integer1,
+    Real,
+    min_prec,
+)
 from mathics.core.builtin import Builtin
 from mathics.core.convert.expression import to_mathics_list
 from mathics.core.evaluation import Evaluation
@@ -25,6 +31,8 @@ from mathics.core.systemsymbols import (
     SymbolClusteringComponents,
     SymbolFailed,
     SymbolFindClusters,
+    SymbolMethod,
+    SymbolRandomSeed,
     SymbolRule,
 )
 from mathics.eval.distance.clusters import (
@@ -33,8 +41,14 @@ from mathics.eval.distance.clusters import (
     dist_repr,
     to_real_distance,
 )
+from mathics.eval.distance.nearest import (
+    KD_TREE_NORMS,
+    NearestFunctionAtom,
+    build_index,
+    eval_Nearest,
+    to_machine_array,
+)
 from mathics.eval.nevaluator import eval_N
-from mathics.eval.parts import walk_levels
 from mathics.eval.tensors import get_default_distance
 
 
@@ -63,6 +77,19 @@ class _PrecomputedDistances(PrecomputedDistances):
         super(_PrecomputedDistances, self).__init__(mpmath_distances)
 
 
+def _array_distances(distance_function, p):
+    # for machine numbers and vectors of them, the distances of KD_TREE_NORMS are computed with NumPy.
+    name = distance_function.get_name()
+    if name not in KD_TREE_NORMS:
+        return None
+    array = to_machine_array(p)
+    if array is None:
+        return None
+    return ArrayDistances(
+        array, KD_TREE_NORMS[name], name == "System`SquaredEuclideanDistance"
+    )
+
+
 class _Cluster(Builtin):
     options = {
         "Method": "Optimize",
@@ -73,6 +100,7 @@ class _Cluster(Builtin):
     messages = {
         "amtd": "`1` failed to pick a suitable distance function for `2`.",
         "bdmtd": 'Method in `` must be either "Optimize", "Agglomerate" or "KMeans".',
+        "bdsub": 'The only suboption of Method in `` is "BatchSize", which must be a positive integer, for "KMeans".',
         "intpm": "Positive integer expected at position 2 in ``.",
         "list": "Expected a list or a rule with equally sized lists at position 1 in ``.",
         "nclst": "Cannot find more clusters than there are elements: `1` is larger than `2`.",
@@ -89,12 +117,34 @@ class _Cluster(Builtin):
 
     def _cluster(self, p, k, mode, evaluation, options, expr):
         method_string, method = self.get_option_string(options, "Method", evaluation)
+        suboptions = ()
+        if method.has_form("List", 1, None):
+            method_string = method.elements[0].get_string_value()
+            suboptions = method.elements[1:]
         if method_string not in ("Optimize", "Agglomerate", "KMeans"):
             evaluation.message(
-                self.get_name(), "bdmtd", Expression(SymbolRule, "Method", method)
+                self.get_name(), "bdmtd", Expression(SymbolRule, SymbolMethod, method)
             )
             return
 
+        batch_size = None
+        for suboption in suboptions:
+            if (
+                method_string == "KMeans"
+                and suboption.has_form("Rule", 2)
+                and suboption.elements[0].get_string_value() == "BatchSize"
+                and isinstance(suboption.elements[1], Integer)
+                and suboption.elements[1].value > 0
+            ):
+                batch_size = suboption.elements[1].value
+            else:
+                evaluation.message(
+                    self.get_name(),
+                    "bdsub",
+                    Expression(SymbolRule, SymbolMethod, method),
+                )
+                return
+
         dist_p, repr_p = dist_repr(p)
 
         if dist_p is None or len(dist_p) != len(repr_p):
@@ -132,7 +182,7 @@ class _Cluster(Builtin):
             py_seed = seed.get_int_value()
         else:
             evaluation.message(
-                self.get_name(), "rseed", Expression(SymbolRule, "RandomSeed", seed)
+                self.get_name(), "rseed", Expression(SymbolRule, SymbolRandomSeed, seed)
             )
             return
 
@@ -161,13 +211,18 @@ class _Cluster(Builtin):
 
         try:
             if method_string == "Agglomerate":
-                clusters = self._agglomerate(mode, repr_p, dist_p, py_k, df, evaluation)
-            elif method_string == "Optimize":
-                clusters = optimize(
-                    repr_p, py_k, _LazyDistances(df, dist_p, evaluation), mode, py_seed
+                clusters = self._agglomerate(
+                    mode, repr_p, dist_p, py_k, df, distance_function, evaluation
                 )
+            elif method_string == "Optimize":
+                distances = _array_distances(distance_function, dist_p)
+                if distances is None:
+                    distances = _LazyDistances(df, dist_p, evaluation)
+                clusters = optimize(repr_p, py_k, distances, mode, py_seed)
             elif method_string == "KMeans":
-                clusters = self._kmeans(mode, repr_p, dist_p, py_k, py_seed, evaluation)
+                clusters = self._kmeans(
+                    mode, repr_p, dist_p, py_k, py_seed, batch_size, evaluation
+                )
         except IllegalDistance as e:
             evaluation.message(self.get_name(), "xnum", e.distance)
             return
@@ -188,19 +243,26 @@ class _Cluster(Builtin):
         else:
             raise ValueError("illegal mode %s" % mode)
 
-    def _agglomerate(self, mode, repr_p, dist_p, py_k, df, evaluation):
-        if mode == "clusters":
-            clusters = agglomerate(
-                repr_p, py_k, _PrecomputedDistances(df, dist_p, evaluation), mode
-            )
-        elif mode == "components":
-            clusters = agglomerate(
-                repr_p, py_k, _PrecomputedDistances(df, dist_p, evaluation), mode
-            )
+    def _agglomerate(
+        self, mode, repr_p, dist_p, py_k, df, distance_function, evaluation
+    ):
+        distances = _array_distances(distance_function, dist_p)
+        if distances is None:
+            distances = _PrecomputedDistances(df, dist_p, evaluation)
+        else:
+            distances = PrecomputedDistances(distances.matrix())
+        return agglomerate(repr_p, py_k, distances, mode)
 
-        return clusters
+    def _kmeans(self, mode, repr_p, dist_p, py_k, py_seed, batch_size, evaluation):
+        # compute epsilon similar to Real.__eq__, such that "numbers that differ in their last seven binary digits
+        # are considered equal"
+
+        # machine numbers are clustered with NumPy.
+        array = to_machine_array(dist_p)
+        if array is not None:
+            eps = 0.5 ** (FP_MANTISA_BINARY_DIGITS - 7)
+            return kmeans(array, repr_p, py_k, mode, py_seed, eps, batch_size)
 
-    def _kmeans(self, mode, repr_p, dist_p, py_k, py_seed, evaluation):
         items = []
 
         def convert_scalars(p):
@@ -230,13 +292,10 @@ class _Cluster(Builtin):
         else:
             numeric_p = list(convert_vectors(dist_p))
 
-        # compute epsilon similar to Real.__eq__, such that "numbers that differ in their last seven binary digits
-        # are considered equal"
-
         prec = min_prec(*items) or FP_MANTISA_BINARY_DIGITS
         eps = 0.5 ** (prec - 7)
 
-        return kmeans(numeric_p, repr_p, py_k, mode, py_seed, eps)
+        return kmeans(numeric_p, repr_p, py_k, mode, py_seed, eps, batch_size)
 
 
 class ClusteringComponents(_Cluster):
@@ -342,6 +401,13 @@ class FindClusters(_Cluster):
     The runtime of the Agglomerate method is quadratic in the number of clustered points n, builds the clustering
     from the bottom up, and is exact (no element of randomness). The Optimize method's runtime is linear in n,
     Optimize builds the clustering from top down, and uses random sampling.
+
+    The KMeans method moves the centroids of the clusters towards the mean of their points. With the suboption \
+    "BatchSize" -> $b$, each step only looks at a random sample of $b$ points of machine numbers, which is \
+    faster for many points:
+
+    >> FindClusters[{1, 2, 10, 11, 20, 21}, 3, Method -> {"KMeans", "BatchSize" -> 3}]
+     = {{10, 11}, {20, 21}, {1, 2}}
     """
 
     summary_text = "divide data into lists of similar elements"
@@ -388,6 +454,10 @@ class Nearest(Builtin):
 
       <dt>'Nearest[{$p1$, $p2$, ...} -> {$q1$, $q2$, ...}, $x$]'
       <dd>returns $q1$, $q2$, ... but measures the distances using $p1$, $p2$, ...
+
+      <dt>'Nearest[$list$]'
+      <dd>returns a 'NearestFunction' that finds the items of $list$ nearest to \
+        a point.
     </dl>
 
     >> Nearest[{5, 2.5, 10, 11, 15, 8.5, 14}, 12]
@@ -403,6 +473,21 @@ class Nearest(Builtin):
 
     >> Nearest[{{0, 1}, {1, 2}, {2, 3}} -> {a, b, c}, {1.1, 2}]
      = {b}
+
+    The option 'Method' sets how the nearest items are found:
+    <ul>
+      <li>"Scan" computes the distance to every item, for each query;
+      <li>"KDTree" builds a KD tree of the items, for numbers and vectors \
+        with the Euclidean, Manhattan and Chessboard distances, and a \
+        vantage point tree otherwise, which requires the distance function \
+        to be a metric;
+      <li>'Automatic' builds a KD tree when possible, and a vantage point \
+        tree for a 'NearestFunction' with a builtin metric, like \
+        'EditDistance'.
+    </ul>
+
+    >> Nearest[{"meep", "heap", "deep", "weep", "sheep"}, "seep", 2, Method -> "KDTree"]
+     = {meep, deep}
     """
 
     messages = {
@@ -413,23 +498,21 @@ class Nearest(Builtin):
 
     options = {
         "DistanceFunction": "Automatic",
-        "Method": '"Scan"',
+        "Method": "Automatic",
     }
 
-    rules = {
-        "Nearest[list_, pattern_]": "Nearest[list, pattern, 1]",
-        "Nearest[pattern_][list_]": "Nearest[list, pattern]",
-    }
     summary_text = "the nearest element from a list"
 
-    def eval(
-        self, expression, items, pivot, limit, evaluation: Evaluation, options: dict
+    def build(
+        self, expression, items, evaluation: Evaluation, options: dict, single_use
     ):
-        "expression: Nearest[items_, pivot_, limit_, OptionsPattern[%(name)s]]"
-
-        method = self.get_option(options, "Method", evaluation)
-        if not isinstance(method, String) or method.get_string_value() != "Scan":
-            evaluation("Nearest", "nimp", method)
+        """
+        Return the NearestFunction of ``items``, or None after a message
+        if it cannot be built.
+        """
+        method_string, method = self.get_option_string(options, "Method", evaluation)
+        if method_string not in ("Automatic", "KDTree", "Scan"):
+            evaluation.message(self.get_name(), "nimp", method)
             return
 
         dist_p, repr_p = dist_repr(items)
@@ -438,29 +521,11 @@ class Nearest(Builtin):
             evaluation.message(self.get_name(), "list", expression)
             return
 
-        if limit.has_form("List", 2):
-            up_to = limit.elements[0]
-            py_r = limit.elements[1].to_mpmath()
-        else:
-            up_to = limit
-            py_r = None
-
-        if isinstance(up_to, Integer):
-            py_n = up_to.get_int_value()
-        elif up_to.get_name() == "System`All":
-            py_n = None
-        else:
-            return
-
-        if not dist_p or (py_n is not None and py_n < 1):
-            return ListExpression()
-
-        multiple_x = False
-
         distance_function_string, distance_function = self.get_option_string(
             options, "DistanceFunction", evaluation
         )
-        if distance_function_string == "Automatic":
+        automatic_distance = distance_function_string == "Automatic"
+        if automatic_distance and dist_p:
             distance_function = get_default_distance(dist_p)
             if distance_function is None:
                 evaluation.message(
@@ -468,44 +533,81 @@ class Nearest(Builtin):
                 )
                 return
 
-            if pivot.get_head_name() == "System`List":
-                _, depth_x = walk_levels(pivot)
-                _, depth_items = walk_levels(dist_p[0])
+        if not dist_p:
+            index = None
+        else:
+            index = build_index(
+                dist_p, distance_function, method_string, evaluation, single_use
+            )
+        return NearestFunctionAtom(
+            dist_p, repr_p, distance_function, automatic_distance, index
+        )
+
+    def eval(
+        self, expression, items, pivot, limit, evaluation: Evaluation, options: dict
+    ):
+        "expression: Nearest[items_, pivot_?NotOptionQ, limit_?NotOptionQ, OptionsPattern[%(name)s]]"
+        try:
+            nearest = self.build(expression, items, evaluation, options, True)
+        except (IllegalDistance, ValueError):
+            return SymbolFailed
+        if nearest is None:
+            return
+        return eval_Nearest(nearest, pivot, limit, evaluation)
+
+    def eval_single(self, expression, items, pivot, evaluation: Evaluation, options):
+        "expression: Nearest[items_, pivot_?NotOptionQ, OptionsPattern[%(name)s]]"
+        return self.eval(expression, items, pivot, Integer1, evaluation, options)
+
+    def eval_function(self, expression, items, evaluation: Evaluation, options: dict):
+        "expression: Nearest[items_, OptionsPattern[%(name)s]]"
+        try:
+            return self.build(expression, items, evaluation, options, False)
+        except (IllegalDistance, ValueError):
+            return SymbolFailed
+
+
+class NearestFunction(Builtin):
+    """
+    <url>:WMA link:https://reference.wolfram.com/language/ref/NearestFunction.html</url>
+
+    <dl>
+      <dt>'NearestFunction[$data$]'
+      <dd>represents a function whose values give the items of $data$ nearest \
+        to a point. It is given by 'Nearest[$data$]'.
 
-                if depth_x > depth_items:
-                    multiple_x = True
+      <dt>'$nf$[$x$]'
+      <dd>returns the one item nearest to $x$.
 
-        def nearest(x) -> ListExpression:
-            calls = [Expression(distance_function, x, y) for y in dist_p]
-            distances = ListExpression(*calls).evaluate(evaluation)
+      <dt>'$nf$[$x$, $n$]'
+      <dd>returns the $n$ nearest items.
 
-            if not distances.has_form("List", len(dist_p)):
-                raise ValueError()
+      <dt>'$nf$[$x$, {$n$, $r$}]'
+      <dd>returns up to $n$ nearest items that are not farther from $x$ than $r$.
+    </dl>
 
-            py_distances = [
-                (to_real_distance(d), i) for i, d in enumerate(distances.elements)
-            ]
+    The items are indexed once, when the 'NearestFunction' is built:
+    >> nf = Nearest[{{0, 0}, {1, 1}, {2, 2}, {3, 3}, {4, 4}} -> {a, b, c, d, e}]
+     = NearestFunction[<5>]
+    >> nf[{1.2, 1.4}]
+     = {b}
+    >> nf[{2, 2}, {All, 2}]
+     = {c, b, d}
 
-            if py_r is not None:
-                py_distances = [(d, i) for d, i in py_distances if d <= py_r]
+    A list of points gives the items nearest to each of them:
+    >> nf[{{0.1, 0}, {4, 3.8}}, 2]
+     = {{a, b}, {e, d}}
 
-            def pick():
-                if py_n is None:
-                    candidates = sorted(py_distances)
-                else:
-                    candidates = heapq.nsmallest(py_n, py_distances)
+    >> Nearest[{"meep", "heap", "deep", "weep", "sheep"}]["seep", 2]
+     = {meep, deep}
+    """
 
-                for _, i in candidates:
-                    yield repr_p[i]
+    summary_text = "function giving the nearest items of a list"
 
-            return ListExpression(*list(pick()))
+    def eval(self, nearest, pivot, evaluation: Evaluation):
+        "(nearest_NearestFunction)[pivot_]"
+        return eval_Nearest(nearest, pivot, Integer1, evaluation)
 
-        try:
-            if not multiple_x:
-                return nearest(pivot)
-            else:
-                return ListExpression(*[nearest(t) for t in pivot.elements])
-        except IllegalDistance:
-            return SymbolFailed
-        except ValueError:
-            return SymbolFailed
+    def eval_limit(self, nearest, pivot, limit, evaluation: Evaluation):
+        "(nearest_NearestFunction)[pivot_, limit_]"
+        return eval_Nearest(nearest, pivot, limit, evaluation)
@@ -12,6 +12,7 @@ from mathics.core.rules import BasePattern
 from mathics.core.symbols import Atom, SymbolFalse, SymbolTrue
 from mathics.core.systemsymbols import SymbolMap, SymbolSortBy
 from mathics.eval.parts import python_levelspec, walk_levels
+from mathics.eval.sort import eval_sort_by_keys
 
 
 class MapApply(InfixOperator):
@@ -286,23 +287,5 @@ class SortBy(Builtin):
                 evaluation.message("SortBy", "func", expr, 2)
                 return
 
-            keys = keys_expr.elements
-            raw_keys = li.elements
-
-            class Key:
-                def __init__(self, index):
-                    self.index = index
-
-                def __gt__(self, other):
-                    kx, ky = keys[self.index], keys[other.index]
-                    if kx > ky:
-                        return True
-                    elif kx < ky:
-                        return False
-                    else:  # if f(x) == f(y), resort to x < y?
-                        return raw_keys[self.index] > raw_keys[other.index]
-
-            # we sort a list of indices. after sorting, we reorder the elements.
-            new_indices = sorted(list(range(len(raw_keys))), key=Key)
-            new_elements = [raw_keys[i] for i in new_indices]  # reorder elements
+            new_elements = eval_sort_by_keys(li.elements, keys_expr.elements)
             return li.restructure(li.head, new_elements, evaluation)
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+CSV and TSV
+
+Importers and exporters for tables of comma and tab separated values.
+"""
+
+from mathics.builtin.fileformats.textformat import _StreamExport
+from mathics.core.atoms import Integer, String
+from mathics.core.builtin import Builtin
+from mathics.core.evaluation import Evaluation
+from mathics.core.expression import Expression
+from mathics.core.list import ListExpression
+from mathics.core.systemsymbols import SymbolFailed, SymbolGrid, SymbolRule
+from mathics.eval.files_io.read import read_name_and_stream
+from mathics.eval.files_io.tables import import_table
+from mathics.eval.files_io.writers import table_chunks
+
+
+class _TableImport(Builtin):
+    context = "System`Convert`TableDump`"
+
+    messages = {
+        "fsep": "Value of option FieldSeparators -> `1` should be a string or a list of strings.",
+        "hdrl": "Value of option HeaderLines -> `1` should be a non-negative integer.",
+    }
+
+    options = {
+        "FieldSeparators": '","',
+        "HeaderLines": "0",
+    }
+
+    def _import(self, stream, parts, evaluation: Evaluation, options: dict):
+        """
+        Import the part ``parts`` of the table in ``stream``, or return
+        None.
+        """
+        separators = options["System`FieldSeparators"]
+        if isinstance(separators, String):
+            separators = [separators.value]
+        elif separators.has_form("List", None) and all(
+            isinstance(separator, String) for separator in separators.elements
+        ):
+            separators = [separator.value for separator in separators.elements]
+        else:
+            evaluation.message(self.get_name(), "fsep", separators)
+            return None
+
+        header_lines = options["System`HeaderLines"]
+        if not (isinstance(header_lines, Integer) and header_lines.value >= 0):
+            evaluation.message(self.get_name(), "hdrl", header_lines)
+            return None
+
+        name, _, py_stream = read_name_and_stream(stream, evaluation)
+        if name is None or name is SymbolFailed:
+            return None
+        return import_table(
+            py_stream.io, separators, header_lines.value, evaluation, *parts
+        )
+
+
+class CSVDataImport(_TableImport):
+    """
+    ## <url>:native internal:</url>
+
+    <dl>
+      <dt>'System`Convert`TableDump`CSVDataImport[$stream$]'
+      <dd>imports the comma separated values read from $stream$ as a table.
+
+      <dt>'System`Convert`TableDump`CSVDataImport[$stream$, $rows$, $cols$]'
+      <dd>imports only the rows $rows$ and the columns $cols$ of the table.
+    </dl>
+
+    Fields that are numbers are imported as numbers:
+    >> ImportString["x,1,2.5\\ny,3,4", "CSV"]
+     = {{x, 1, 2.5}, {y, 3, 4}}
+
+    Only the rows and the columns requested are converted:
+    >> ImportString["a,b\\n1,2\\n3,4\\n5,6", {"CSV", "Data", 2 ;; 3, 2}, "HeaderLines" -> 1]
+     = {4, 6}
+    """
+
+    summary_text = "import the data of a CSV file"
+
+    def eval(self, stream, parts, evaluation: Evaluation, options: dict):
+        "%(name)s[stream_InputStream, parts___?NotOptionQ, OptionsPattern[]]"
+        parts = parts.get_sequence()
+        if len(parts) > 2:
+            return None
+        table = self._import(stream, parts, evaluation, options)
+        if table is None:
+            return SymbolFailed
+        return ListExpression(Expression(SymbolRule, String("Data"), table))
+
+
+class CSVGridImport(_TableImport):
+    """
+    ## <url>:native internal:</url>
+
+    <dl>
+      <dt>'System`Convert`TableDump`CSVGridImport[$stream$]'
+      <dd>imports the comma separated values read from $stream$ as a 'Grid'.
+    </dl>
+
+    >> ImportString["1,2\\n3,4", {"CSV", "Grid"}]
+     = 1   2
+     .
+     . 3   4
+    """
+
+    summary_text = "import the data of a CSV file as a grid"
+
+    def eval(self, stream, evaluation: Evaluation, options: dict):
+        "%(name)s[stream_InputStream, OptionsPattern[]]"
+        table = self._import(stream, (), evaluation, options)
+        if table is None:
+            return SymbolFailed
+        return ListExpression(
+            Expression(SymbolRule, String("Grid"), Expression(SymbolGrid, table))
+        )
+
+
+class CSVExport(_StreamExport):
+    """
+    ## <url>:native internal:</url>
+
+    <dl>
+      <dt>'System`Convert`TableDump`CSVExport[$stream$, $table$]'
+      <dd>writes the rows of $table$ to $stream$ as comma separated values.
+    </dl>
+
+    Elements of the table that are not lists are rows with a single field:
+    >> ExportString[{{1, 2, 3}, 4, {"a,b", x^2}}, "CSV"]
+     = 1,2,3
+     . 4
+     . "a,b",x ^ 2
+    """
+
+    context = "System`Convert`TableDump`"
+    messages = {
+        "fsep": "Value of option FieldSeparators -> `1` should be a string.",
+    }
+    options = {
+        "FieldSeparators": '","',
+    }
+    summary_text = "export a table as CSV"
+
+    def chunks(self, expr, evaluation: Evaluation, options: dict):
+        separator = options["System`FieldSeparators"]
+        if not isinstance(separator, String):
+            evaluation.message(self.get_name(), "fsep", separator)
+            return None
+        return table_chunks(expr, separator.value, evaluation)
+
+
+class TSVDataImport(CSVDataImport):
+    """
+    ## <url>:native internal:</url>
+
+    <dl>
+      <dt>'System`Convert`TableDump`TSVDataImport[$stream$]'
+      <dd>imports the tab separated values read from $stream$ as a table.
+
+      <dt>'System`Convert`TableDump`TSVDataImport[$stream$, $rows$, $cols$]'
+      <dd>imports only the rows $rows$ and the columns $cols$ of the table.
+    </dl>
+
+    >> ImportString["x\\t1\\ty\\t2", "TSV"]
+     = {{x, 1, y, 2}}
+    """
+
+    options = {
+        "FieldSeparators": '"\\t"',
+        "HeaderLines": "0",
+    }
+    summary_text = "import the data of a TSV file"
+
+
+class TSVGridImport(CSVGridImport):
+    """
+    ## <url>:native internal:</url>
+
+    <dl>
+      <dt>'System`Convert`TableDump`TSVGridImport[$stream$]'
+      <dd>imports the tab separated values read from $stream$ as a 'Grid'.
+    </dl>
+    """
+
+    options = TSVDataImport.options
+    summary_text = "import the data of a TSV file as a grid"
+
+
+class TSVExport(CSVExport):
+    """
+    ## <url>:native internal:</url>
+
+    <dl>
+      <dt>'System`Convert`TableDump`TSVExport[$stream$, $table$]'
+      <dd>writes the rows of $table$ to $stream$ as tab separated values.
+    </dl>
+    """
+
+    options = {
+        "FieldSeparators": '"\\t"',
+    }
+    summary_text = "export a table as TSV"
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Text, JSON and SVG
+
+Exporters that write text to a stream, one chunk at a time.
+"""
+
+from typing import Iterator, Optional
+
+from mathics.builtin.atomic.strings import to_python_encoding
+from mathics.builtin.box.graphics import GraphicsBox
+from mathics.core.atoms import String
+from mathics.core.builtin import Builtin
+from mathics.core.element import BaseElement
+from mathics.core.evaluation import Evaluation
+from mathics.core.expression import BoxError, Expression
+from mathics.core.list import ListExpression
+from mathics.core.streams import stream_manager
+from mathics.core.symbols import SymbolFullForm, SymbolNull
+from mathics.core.systemsymbols import (
+    SymbolFailed,
+    SymbolGraphics,
+    SymbolInset,
+    SymbolMakeBoxes,
+)
+from mathics.eval.files_io.writers import (
+    group_pieces,
+    json_pieces,
+    string_chunks,
+    text_chunks,
+    to_text,
+    write_chunks,
+)
+
+
+class _StreamExport(Builtin):
+    """
+    Base class of the exporters that write the text of an expression to an
+    'OutputStream'. The subclasses give the chunks of the text in
+    ``chunks``, or None when the expression cannot be exported. By default,
+    the text of the expression is written, as 'ToString' gives it.
+    """
+
+    context = "System`Convert`TextDump`"
+
+    def chunks(
+        self, expr: BaseElement, evaluation: Evaluation, options: dict
+    ) -> Optional[Iterator[str]]:
+        return text_chunks(expr, evaluation)
+
+    def eval(self, stream, expr, evaluation: Evaluation, options=None):
+        "%(name)s[stream_OutputStream, expr_, OptionsPattern[]]"
+        if options is None:
+            options = {}
+        py_stream = stream_manager.lookup_stream(stream.elements[1].get_int_value())
+        if py_stream is None or py_stream.io is None or py_stream.io.closed:
+            return SymbolFailed
+
+        # ExportString[] of binary formats writes to a binary stream, which
+        # has no encoding of its own.
+        encoding = options.get("System`CharacterEncoding")
+        if isinstance(encoding, String):
+            encoding = to_python_encoding(encoding.value)
+        else:
+            encoding = None
+
+        try:
+            chunks = self.chunks(expr, evaluation, options)
+            if chunks is None:
+                return SymbolFailed
+            write_chunks(py_stream, chunks, encoding)
+        except BoxError:
+            evaluation.message(
+                "General",
+                "notboxes",
+                Expression(SymbolFullForm, expr).evaluate(evaluation),
+            )
+            return SymbolFailed
+        except UnicodeError:
+            return SymbolFailed
+        return SymbolNull
+
+
+class JSONExport(_StreamExport):
+    """
+    ## <url>:native internal:</url>
+
+    <dl>
+      <dt>'System`Convert`JSONDump`JSONExport[$stream$, $expr$]'
+      <dd>writes $expr$ to $stream$ as JSON.
+    </dl>
+
+    Lists of rules and associations are written as objects:
+    >> ExportString[{"a" -> {1, 2.5, True}, "b" -> <|"c" -> Null|>}, "JSON"]
+     = {"a": [1, 2.5, true], "b": {"c": null}}
+    """
+
+    context = "System`Convert`JSONDump`"
+    summary_text = "export an expression as JSON"
+
+    def chunks(self, expr, evaluation: Evaluation, options: dict):
+        return group_pieces(json_pieces(expr, evaluation))
+
+
+class SVGExport(_StreamExport):
+    """
+    ## <url>:native internal:</url>
+
+    <dl>
+      <dt>'System`Convert`TextDump`SVGExport[$stream$, $expr$]'
+      <dd>writes $expr$ to $stream$ as an SVG image. Expressions that are \
+          not graphics are written as a text inset.
+    </dl>
+    """
+
+    summary_text = "export an expression as an SVG image"
+
+    def chunks(self, expr, evaluation: Evaluation, options: dict):
+        if not expr.has_form("Graphics", None):
+            expr = Expression(
+                SymbolGraphics,
+                ListExpression(
+                    Expression(SymbolInset, String(to_text(expr, evaluation)))
+                ),
+            )
+        boxes = Expression(SymbolMakeBoxes, expr).evaluate(evaluation)
+        if not isinstance(boxes, GraphicsBox):
+            raise BoxError(boxes, "svg")
+        # The SVG document is built as a whole by the graphics formatter.
+        return string_chunks(boxes.boxes_to_svg(evaluation=evaluation))
+
+
+class TextExport(_StreamExport):
+    """
+    ## <url>:native internal:</url>
+
+    <dl>
+      <dt>'System`Convert`TextDump`TextExport[$stream$, $expr$]'
+      <dd>writes the text of $expr$, as 'ToString' gives it, to $stream$.
+    </dl>
+
+    Lists are written one element at a time, so the text of the whole list \
+    is never built in memory.
+    """
+
+    summary_text = "export an expression as text"
@@ -40,7 +40,12 @@ from mathics.core.systemsymbols import (
     SymbolOutputStream,
 )
 from mathics.eval.directories import TMP_DIR
-from mathics.eval.files_io.files import eval_Close, eval_Get, eval_Read
+from mathics.eval.files_io.files import (
+    eval_Close,
+    eval_Get,
+    eval_Read,
+    eval_ReadList,
+)
 from mathics.eval.files_io.read import (
     MathicsOpen,
     channel_to_stream,
@@ -1062,8 +1067,6 @@ class ReadList(Read):
         # token_words = py_options['TokenWords']
         # word_separators = py_options['WordSeparators']
 
-        result = []
-
         # FIXME: DRY better with Read[].
         # Validate types parameter and store the
         # result into tuple checked_types.
@@ -1088,28 +1091,17 @@ class ReadList(Read):
         elif name == SymbolFailed:
             return SymbolFailed
 
-        while True:
-            next_elt = eval_Read(
-                "ReadList", n, checked_types, stream, evaluation, options
-            )
-
-            if next_elt is None:
-                return
-
-            if next_elt is SymbolFailed:
-                return
-
-            if next_elt is SymbolEndOfFile:
-                break
-
-            if isinstance(next_elt, list) and py_options["TokenWords"]:
-                # FIXME: This might not be correct in all cases.
-                # we probably need a more positive way to indicate whether next_elt
-                # was returned from TokenWord parsing or not.
-                result += next_elt
-            else:
-                result.append(next_elt)
-        return from_python(result)
+        result = eval_ReadList(
+            n,
+            checked_types,
+            stream,
+            evaluation,
+            options,
+            bool(py_options["TokenWords"]),
+        )
+        if result is None:
+            return
+        return result
 
     def eval_n(self, file, types, n: Integer, evaluation: Evaluation, options: dict):
         "ReadList[file_, types_, n_Integer, OptionsPattern[ReadList]]"
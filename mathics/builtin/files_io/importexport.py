@@ -39,6 +39,7 @@ from mathics.core.symbols import Symbol, SymbolNull, SymbolTrue, strip_context
 from mathics.core.systemsymbols import (
     SymbolByteArray,
     SymbolFailed,
+    SymbolPart,
     SymbolRule,
     SymbolToString,
 )
@@ -1204,6 +1205,16 @@ class RegisterExport(Builtin):
      | rapbqrguvffgevat
 
     >> DeleteFile["sample.txt"]
+
+    Exporters registered with 'FunctionChannels -> {"Streams"}' are given an \
+    'OutputStream' instead of a file name, so that they can write their output \
+    piece by piece, without building it first:
+    >> ExampleExporter3[strm_OutputStream, data_List, opts___] := Scan[WriteString[strm, #, ";"]&, data]
+
+    >> ImportExport`RegisterExport["ExampleFormat3", ExampleExporter3, FunctionChannels -> {"Streams"}]
+
+    >> ExportString[{a, b, c}, "ExampleFormat3"]
+     = a;b;c;
     """
 
     summary_text = "register an exporter for a file format"
@@ -1409,11 +1420,17 @@ class Import(Builtin):
         else:
             elements = [elements]
 
-        for el in elements:
+        # The element names can be followed by the parts of the element to
+        # import, as in {"Data", rows, columns}.
+        parts = []
+        for index, el in enumerate(elements):
             if not isinstance(el, String):
-                evaluation.message("Import", "noelem", el)
-                evaluation.predetermined_out = current_predetermined_out
-                return SymbolFailed
+                if index == 0:
+                    evaluation.message("Import", "noelem", el)
+                    evaluation.predetermined_out = current_predetermined_out
+                    return SymbolFailed
+                elements, parts = elements[:index], elements[index:]
+                break
 
         elements = [el.get_string_value() for el in elements]
 
@@ -1455,7 +1472,19 @@ class Import(Builtin):
             evaluation.predetermined_out = current_predetermined_out
             return SymbolFailed
 
-        def get_results(tmp_function, findfile):
+        if parts and not elements:
+            if not isinstance(default_element, String):
+                evaluation.message("Import", "noelem", parts[0])
+                evaluation.predetermined_out = current_predetermined_out
+                return SymbolFailed
+            elements = [default_element.value]
+
+        def take_parts(result):
+            if not parts:
+                return result
+            return Expression(SymbolPart, result, *parts).evaluate(evaluation)
+
+        def get_results(tmp_function, findfile, parts=()):
             if function_channels == ListExpression(String("FileNames")):
                 joined_options = list(chain(stream_options, custom_options))
                 tmpfile = False
@@ -1469,7 +1498,9 @@ class Import(Builtin):
                         Expression(SymbolWriteString, String("")).evaluate(evaluation)
                     Expression(SymbolClose, stream).evaluate(evaluation)
                     stream = None
-                import_expression = Expression(tmp_function, findfile, *joined_options)
+                import_expression = Expression(
+                    tmp_function, findfile, *parts, *joined_options
+                )
                 tmp = import_expression.evaluate(evaluation)
                 if tmp is SymbolFailed:
                     return SymbolFailed
@@ -1486,10 +1517,13 @@ class Import(Builtin):
                     evaluation.message("Import", "nffil")
                     evaluation.predetermined_out = current_predetermined_out
                     return None
-                tmp = Expression(tmp_function, stream, *custom_options).evaluate(
-                    evaluation
-                )
+                tmp = Expression(
+                    tmp_function, stream, *parts, *custom_options
+                ).evaluate(evaluation)
                 Expression(SymbolClose, stream).evaluate(evaluation)
+                if tmp is SymbolFailed:
+                    evaluation.predetermined_out = current_predetermined_out
+                    return SymbolFailed
             else:
                 # TODO message
                 evaluation.predetermined_out = current_predetermined_out
@@ -1555,13 +1589,23 @@ class Import(Builtin):
                 )
             else:
                 if el in conditionals.keys():
-                    result = get_results(conditionals[el], findfile)
+                    # The conditional function is given the parts to
+                    # import, so that it can read only those. If it does
+                    # not take them, the parts are taken from the whole
+                    # element.
+                    result = None
+                    if parts:
+                        result = get_results(conditionals[el], findfile, parts)
                     if result is None:
+                        result = get_results(conditionals[el], findfile)
+                    else:
+                        parts = []
+                    if result is None or result is SymbolFailed:
                         evaluation.predetermined_out = current_predetermined_out
                         return SymbolFailed
                     if len(list(result.keys())) == 1 and list(result.keys())[0] == el:
                         evaluation.predetermined_out = current_predetermined_out
-                        return list(result.values())[0]
+                        return take_parts(list(result.values())[0])
                 elif el in posts.keys():
                     # TODO: allow use of conditionals
                     result = get_results(posts[el])
@@ -1576,7 +1620,7 @@ class Import(Builtin):
                             return SymbolFailed
                     if el in defaults.keys():
                         evaluation.predetermined_out = current_predetermined_out
-                        return defaults[el]
+                        return take_parts(defaults[el])
                     else:
                         evaluation.message(
                             "Import", "noelem", from_python(el), String(filetype)
@@ -1712,7 +1756,9 @@ class Export(Builtin):
         "tif": "TIFF",
         "txt": "Text",
         "csv": "CSV",
+        "json": "JSON",
         "svg": "SVG",
+        "tsv": "TSV",
         "asy": "asy",
     }
 
@@ -1865,15 +1911,15 @@ class ExportString(Builtin):
 
     >> ExportString[{{1,2,3,4},{3},{2},{4}}, "CSV"]
      = 1,2,3,4
-     . 3,
-     . 2,
-     . 4,
+     . 3
+     . 2
+     . 4
 
     >> ExportString[{1,2,3,4}, "CSV"]
-     = 1,
-     . 2,
-     . 3,
-     . 4,
+     = 1
+     . 2
+     . 3
+     . 4
     >> ExportString[Integrate[f[x],{x,0,2}], "SVG"]//Head
      = String
     """
@@ -1892,11 +1938,11 @@ class ExportString(Builtin):
     }
     summary_text = "export elements to a string"
 
-    def eval_element(self, expr, element: String, evaluation: Evaluation, **options):
+    def eval_element(self, expr, element: String, evaluation: Evaluation, options={}):
         "ExportString[expr_, element_String, OptionsPattern[ExportString]]"
-        return self.eval_elements(expr, ListExpression(element), evaluation, **options)
+        return self.eval_elements(expr, ListExpression(element), evaluation, options)
 
-    def eval_elements(self, expr, elems, evaluation: Evaluation, **options):
+    def eval_elements(self, expr, elems, evaluation: Evaluation, options={}):
         "ExportString[expr_, elems_List?(AllTrue[#, NotOptionQ]&), OptionsPattern[ExportString]]"
         # Process elems {comp* format?, elem1*}
         elements = elems.get_elements()
@@ -8,19 +8,104 @@ it is often sparse in that their key space is much larger than the number of \
 actual keys found in the collection.
 """
 
+from typing import Optional
 
 from mathics.builtin.box.layout import RowBox
-from mathics.core.atoms import Integer
-from mathics.core.attributes import A_HOLD_ALL_COMPLETE, A_PROTECTED
+from mathics.core.association import (
+    AssociationExpression,
+    AssociationTable,
+    association_key,
+)
+from mathics.core.atoms import Integer, String
+from mathics.core.attributes import (
+    A_HOLD_ALL_COMPLETE,
+    A_HOLD_FIRST,
+    A_PROTECTED,
+    A_READ_PROTECTED,
+)
 from mathics.core.builtin import Builtin, Test
 from mathics.core.convert.expression import to_mathics_list
+from mathics.core.element import BaseElement
 from mathics.core.evaluation import Evaluation
 from mathics.core.expression import Expression
-from mathics.core.symbols import Symbol, SymbolTrue
-from mathics.core.systemsymbols import SymbolAssociation, SymbolMakeBoxes, SymbolMissing
+from mathics.core.list import ListExpression
+from mathics.core.symbols import Symbol, SymbolFalse, SymbolTrue
+from mathics.core.systemsymbols import (
+    SymbolAssociation,
+    SymbolMakeBoxes,
+    SymbolMissing,
+    SymbolSet,
+)
+from mathics.eval.list.associations import get_association_rule, get_association_rules
 from mathics.eval.lists import list_boxes
 
 
+class AssociateTo(Builtin):
+    """
+    <url>:WMA link:https://reference.wolfram.com/language/ref/AssociateTo.html</url>
+
+    <dl>
+      <dt>'AssociateTo[$a$, $key$ -> $val$]'
+      <dd>adds the rule $key$ -> $val$ to the association stored in $a$, \
+          replacing the rule for $key$ if there is one, and sets $a$ to the result.
+
+      <dt>'AssociateTo[$a$, {$key1$ -> $val1$, $key2$ -> $val2$, ...}]'
+      <dd>adds several rules.
+    </dl>
+
+    >> a = <|x -> 1|>;
+    >> AssociateTo[a, y -> 2]
+     = <|x -> 1, y -> 2|>
+    >> AssociateTo[a, {x -> 3, z -> 4}]
+     = <|x -> 3, y -> 2, z -> 4|>
+    >> a
+     = <|x -> 3, y -> 2, z -> 4|>
+
+    The updated association shares its table with the old one, so that \
+    adding a rule does not copy all the other ones.
+    """
+
+    attributes = A_HOLD_FIRST | A_PROTECTED
+
+    messages = {
+        "invrl": "The argument `1` is not a valid Association or a list of rules.",
+    }
+
+    summary_text = "add rules to a stored association"
+
+    def eval(self, s, rules, evaluation: Evaluation):
+        "AssociateTo[s_, rules_]"
+        resolved_s = s.evaluate(evaluation)
+        if s.sameQ(resolved_s):
+            evaluation.message("AssociateTo", "rvalue", s)
+            return
+        if (
+            not resolved_s.has_form("Association", None)
+            or AssociationQ(resolved_s).evaluate(evaluation) is not SymbolTrue
+        ):
+            evaluation.message("AssociateTo", "invrl", resolved_s)
+            return
+
+        if rules.has_form(("Rule", "RuleDelayed"), 2):
+            new_rules = [rules]
+        else:
+            try:
+                new_rules = get_association_rules(rules)
+            except TypeError:
+                evaluation.message("AssociateTo", "invrl", rules)
+                return
+
+        if isinstance(resolved_s, AssociationExpression) and all(
+            association_key(rule.elements[0]) is not None for rule in new_rules
+        ):
+            result = resolved_s.set_rules(new_rules)
+        else:
+            result = Expression(
+                SymbolAssociation, *resolved_s.elements, *new_rules
+            ).evaluate(evaluation)
+        return Expression(SymbolSet, s, result).evaluate(evaluation)
+
+
 class Association(Builtin):
     """
     <url>
@@ -86,47 +171,51 @@ class Association(Builtin):
     def eval(self, rules, evaluation: Evaluation):
         "Association[rules__]"
 
-        def make_flatten(exprs, rules_dictionary: dict = {}):
+        # Rules are stored under the key of their left-hand side in the
+        # table of the association. Keys that can not be indexed, like
+        # inexact numbers, are stored as they are; then an ordinary
+        # expression is built.
+        rules_dictionary: dict = {}
+        indexable = True
+
+        def make_flatten(exprs):
+            nonlocal indexable
             for expr in exprs:
                 if expr.has_form(("Rule", "RuleDelayed"), 2):
-                    elements = expr.elements
-                    key = elements[0].evaluate(evaluation)
-                    value = elements[1].evaluate(evaluation)
-                    rules_dictionary[key] = Expression(expr.get_head(), key, value)
+                    old_key, old_value = expr.elements
+                    key = old_key.evaluate(evaluation)
+                    value = old_value.evaluate(evaluation)
+                    index_key = association_key(key)
+                    if index_key is None:
+                        indexable = False
+                        index_key = key
+                    # Rules that are already evaluated are stored as they are.
+                    if key is not old_key or value is not old_value:
+                        expr = Expression(expr.get_head(), key, value)
+                    rules_dictionary[index_key] = expr
                 elif expr.has_form(("List", "Association"), None):
-                    make_flatten(expr.elements, rules_dictionary)
+                    make_flatten(expr.elements)
                 else:
                     raise TypeError
-            return rules_dictionary.values()
 
         try:
-            return Expression(SymbolAssociation, *make_flatten(rules.get_sequence()))
+            make_flatten(rules.get_sequence())
         except TypeError:
             return None
+        if indexable:
+            return AssociationExpression(AssociationTable(rules_dictionary.items()))
+        return Expression(SymbolAssociation, *rules_dictionary.values())
 
-    def eval_key(self, rules, key, evaluation: Evaluation):
-        "Association[rules__][key_]"
-
-        def find_key(exprs, rules_dictionary: dict = {}):
-            for expr in exprs:
-                if expr.has_form(("Rule", "RuleDelayed"), 2):
-                    if expr.elements[0] == key:
-                        rules_dictionary[key] = expr.elements[1]
-                elif expr.has_form(("List", "Association"), None):
-                    find_key(expr.elements)
-                else:
-                    raise TypeError
-            return rules_dictionary
+    def eval_key(self, assoc, key, evaluation: Evaluation):
+        "assoc_Association[key_]"
 
         try:
-            result = find_key(rules.get_sequence())
-            return (
-                result[key]
-                if result
-                else Expression(SymbolMissing, Symbol("KeyAbsent"), key)
-            )
+            rule = get_association_rule(assoc, key)
         except TypeError:
             return None
+        if rule is None:
+            return Expression(SymbolMissing, Symbol("KeyAbsent"), key)
+        return rule.elements[1]
 
 
 class AssociationQ(Test):
@@ -148,6 +237,9 @@ class AssociationQ(Test):
     summary_text = "test if an expression is a valid association"
 
     def test(self, expr) -> bool:
+        if isinstance(expr, AssociationExpression):
+            return True
+
         def validate(elements):
             for element in elements:
                 if element.has_form(("Rule", "RuleDelayed"), 2):
@@ -180,6 +272,50 @@ class Key(Builtin):
     summary_text = "indicate a key within a part specification"
 
 
+class KeyExistsQ(Builtin):
+    """
+    <url>:WMA link:https://reference.wolfram.com/language/ref/KeyExistsQ.html</url>
+
+    <dl>
+      <dt>'KeyExistsQ[$assoc$, $key$]'
+      <dd>returns True if $key$ is a key of the association $assoc$, and \
+          False otherwise.
+
+      <dt>'KeyExistsQ[$key$]'
+      <dd>represents an operator form of 'KeyExistsQ' that can be applied \
+          to an association.
+    </dl>
+
+    >> KeyExistsQ[<|a -> 1, b -> 2|>, b]
+     = True
+    >> KeyExistsQ[<|a -> 1, b -> 2|>, c]
+     = False
+    >> KeyExistsQ[b][<|a -> 1, b -> 2|>]
+     = True
+    """
+
+    attributes = A_PROTECTED | A_READ_PROTECTED
+
+    messages = {
+        "invrl": "The argument `1` is not a valid Association or a list of rules.",
+    }
+
+    rules = {
+        "KeyExistsQ[key_][assoc_]": "KeyExistsQ[assoc, key]",
+    }
+
+    summary_text = "test if a key is in an association"
+
+    def eval(self, assoc, key, evaluation: Evaluation):
+        "KeyExistsQ[assoc_, key_]"
+        try:
+            rule = get_association_rule(assoc, key)
+        except TypeError:
+            evaluation.message("KeyExistsQ", "invrl", assoc)
+            return None
+        return SymbolFalse if rule is None else SymbolTrue
+
+
 class Keys(Builtin):
     """
     <url>:WMA link:https://reference.wolfram.com/language/ref/Keys.html</url>
@@ -250,17 +386,87 @@ class Lookup(Builtin):
       <dt>Lookup[$assoc$, $key$]
       <dd>looks up the value associated with $key$ in the association $assoc$, \
           or Missing[$KeyAbsent$].
+
+      <dt>Lookup[$assoc$, $key$, $default$]
+      <dd>gives $default$ if $key$ is not in $assoc$.
+
+      <dt>Lookup[$assoc$, {$key1$, $key2$, ...}]
+      <dd>gives the list of the values associated with the $keyi$.
+
+      <dt>Lookup[{$assoc1$, $assoc2$, ...}, $key$]
+      <dd>gives the list of the values associated with $key$ in the $associ$.
     </dl>
+
+    >> Lookup[<|a -> 1, b -> 2|>, b]
+     = 2
+    >> Lookup[<|a -> 1, b -> 2|>, c]
+     = Missing[KeyAbsent, c]
+
+    $default$ is only evaluated if the key is not found:
+    >> Lookup[<|a -> 1|>, a, Print["not found"]]
+     = 1
+    >> Lookup[<|a -> 1|>, b, Print["not found"]]
+     | not found
+
+    Lookup threads over lists of keys and lists of associations:
+    >> Lookup[{<|a -> 1, b -> 2|>, <|a -> 3|>}, {a, b}, 0]
+     = {{1, 2}, {3, 0}}
+
+    Use 'Key' to look up a key that is a list:
+    >> Lookup[<|{a, b} -> 1|>, Key[{a, b}]]
+     = 1
     """
 
     attributes = A_HOLD_ALL_COMPLETE
-    rules = {
-        "Lookup[assoc_?AssociationQ, key_, default_]": "FirstCase[assoc, _[Verbatim[key], val_] :> val, default]",
-        "Lookup[assoc_?AssociationQ, key_]": 'Lookup[assoc, key, Missing["KeyAbsent", key]]',
-    }
-
     summary_text = "perform lookup of a value by key, returning a specified default if it is not found"
 
+    def eval(self, assoc, key, evaluation: Evaluation):
+        "Lookup[assoc_, key_]"
+        return self.lookup(
+            assoc.evaluate(evaluation), key.evaluate(evaluation), None, evaluation
+        )
+
+    def eval_default(self, assoc, key, default, evaluation: Evaluation):
+        "Lookup[assoc_, key_, default_]"
+        return self.lookup(
+            assoc.evaluate(evaluation), key.evaluate(evaluation), default, evaluation
+        )
+
+    def lookup(
+        self, assoc, key, default, evaluation: Evaluation
+    ) -> Optional[BaseElement]:
+        """
+        Return the values of ``key`` in ``assoc``, threading over lists of
+        associations and lists of keys, or None if ``assoc`` is not an
+        association. Keys that are not found give the evaluated ``default``,
+        or Missing["KeyAbsent", key] if ``default`` is None.
+        """
+        if assoc.has_form("List", None):
+            values = []
+            for element in assoc.elements:
+                value = self.lookup(element, key, default, evaluation)
+                if value is None:
+                    return None
+                values.append(value)
+            return ListExpression(*values)
+        if AssociationQ(assoc).evaluate(evaluation) is not SymbolTrue:
+            return None
+        if key.has_form("List", None):
+            return ListExpression(
+                *(
+                    self.lookup(assoc, element, default, evaluation)
+                    for element in key.elements
+                )
+            )
+        if key.has_form("Key", 1):
+            key = key.elements[0]
+        rule = get_association_rule(assoc, key)
+        if rule is not None:
+            return rule.elements[1]
+        if default is None:
+            return Expression(SymbolMissing, String("KeyAbsent"), key)
+        return default.evaluate(evaluation)
+
 
 class Missing(Builtin):
     """
@@ -12,6 +12,8 @@ import typing
 from itertools import permutations
 from typing import Optional, Tuple
 
+import numpy
+
 from mathics.builtin.box.layout import RowBox
 from mathics.core.atoms import Integer, Integer1, is_integer_rational_or_real
 from mathics.core.attributes import A_HOLD_FIRST, A_LISTABLE, A_LOCKED, A_PROTECTED
@@ -21,7 +23,14 @@ from mathics.core.convert.sympy import from_sympy
 from mathics.core.element import ElementsProperties
 from mathics.core.evaluation import Evaluation
 from mathics.core.expression import Expression, structure
-from mathics.core.list import ListExpression
+from mathics.core.list import (
+    MACHINE_INTEGER_MAX,
+    MACHINE_INTEGER_MIN,
+    PACKED_ARRAY_MIN_LENGTH,
+    ListExpression,
+    PackedListExpression,
+    pack_elements,
+)
 from mathics.core.symbols import Atom, Symbol
 from mathics.core.systemsymbols import SymbolNormal, SymbolTuples
 from mathics.eval.lists import get_tuples, list_boxes
@@ -279,6 +288,13 @@ class Range(Builtin):
             and isinstance(di, Integer)
         ):
             pm = 1 if di.value >= 0 else -1
+            bounds = (imin.value, imax.value + pm, di.value)
+            if di.value != 0 and all(
+                MACHINE_INTEGER_MIN <= value <= MACHINE_INTEGER_MAX for value in bounds
+            ):
+                values = numpy.arange(*bounds, dtype=numpy.int64)
+                if len(values):
+                    return PackedListExpression(values)
             return ListExpression(
                 *[Integer(i) for i in range(imin.value, imax.value + pm, di.value)],
                 elements_properties=range_list_elements_properties,
@@ -297,6 +313,9 @@ class Range(Builtin):
             evaluation.check_stopped()
             result.append(from_sympy(index))
             index += di
+        packed = pack_elements(result)
+        if packed is not None:
+            return packed
         return ListExpression(
             *result, elements_properties=range_list_elements_properties
         )
@@ -565,6 +584,11 @@ class Table(IterationFunction):
     summary_text = "make a table of values of an expression"
 
     def get_result(self, elements) -> ListExpression:
+        # Long tables of machine numbers are packed, as in WMA.
+        if len(elements) >= PACKED_ARRAY_MIN_LENGTH:
+            packed = pack_elements(elements)
+            if packed is not None:
+                return packed
         return ListExpression(
             *elements,
             elements_properties=ElementsProperties(elements_fully_evaluated=True),
@@ -32,10 +32,12 @@ from mathics.core.exceptions import (
 from mathics.core.expression import Expression, ExpressionInfinity
 from mathics.core.list import ListExpression
 from mathics.core.rules import Rule
+from mathics.core.sparse import SparseArrayExpression, to_dense_list
 from mathics.core.symbols import Atom, Symbol, SymbolNull, SymbolTrue
 from mathics.core.systemsymbols import (
     SymbolAppend,
     SymbolAppendTo,
+    SymbolAssociation,
     SymbolByteArray,
     SymbolDrop,
     SymbolFailed,
@@ -43,11 +45,14 @@ from mathics.core.systemsymbols import (
     SymbolKey,
     SymbolMakeBoxes,
     SymbolMissing,
+    SymbolPart,
     SymbolSelect,
     SymbolSequence,
     SymbolSet,
+    SymbolSparseArray,
     SymbolTake,
 )
+from mathics.eval.list.associations import get_association_rule
 from mathics.eval.list.eol import (
     drop_span_selector,
     eval_Part,
@@ -62,6 +67,7 @@ from mathics.eval.parts import (
     walk_levels,
 )
 from mathics.eval.patterns import Matcher
+from mathics.eval.sparse import eval_Part_sparse
 
 SymbolDeleteCases = Symbol("System`DeleteCases")
 SymbolPrepend = Symbol("System`Prepend")
@@ -1122,6 +1128,14 @@ class Part(Builtin):
     >> F
      = {{{1, 2, k}, {2, t, k}, {3, t, 9}}, {{2, 4, k}, {4, t, k}, {6, t, 18}}, {{3, 6, k}, {6, t, k}, {9, t, 27}}}
 
+    The values of an association are extracted by their key:
+    >> <|a -> 1, "b" -> 2|>[[Key[a]]]
+     = 1
+    >> <|a -> 1, "b" -> 2|>[["b"]]
+     = 2
+    >> <|a -> 1, "b" -> 2|>[["c"]]
+     = Missing[KeyAbsent, c]
+
     Of course, part specifications have precedence over most arithmetic operations:
     >> A[[1]] + B[[2]] + C[[3]] // Hold // FullForm
      = Hold[Plus[Part[A, 1], Part[B, 2], Part[C, 3]]]
@@ -1183,6 +1197,37 @@ class Part(Builtin):
             evaluation.message("Part", "notimplemented")
             return
 
+        # Keys of associations
+        if indices and list.get_head() is SymbolAssociation:
+            index = indices[0]
+            if index.has_form("Key", 1):
+                key = index.elements[0]
+            elif isinstance(index, String):
+                key = index
+            else:
+                key = None
+            if key is not None:
+                try:
+                    rule = get_association_rule(list, key)
+                except TypeError:
+                    return
+                if rule is None:
+                    return Expression(SymbolMissing, String("KeyAbsent"), key)
+                if len(indices) == 1:
+                    return rule.elements[1]
+                return Expression(SymbolPart, rule.elements[1], *indices[1:])
+
+        # Elements of sparse arrays
+        if indices and isinstance(list, SparseArrayExpression):
+            if len(indices) == 1 and indices[0].sameQ(Integer0):
+                return SymbolSparseArray
+            if all(
+                isinstance(index, Integer) and index.value != 0 for index in indices
+            ):
+                return eval_Part_sparse(list, indices, evaluation)
+            # Other part specifications are taken from the dense array.
+            list = to_dense_list(list)
+
         # Otherwise...
         result = eval_Part([list], indices, evaluation)
         if result:
@@ -0,0 +1,171 @@
+"""
+Packed Arrays
+
+Lists of machine integers or machine reals, and rectangular arrays of them, \
+can be stored as packed arrays. Their elements are kept in a single block of \
+memory, and 'Listable' arithmetic functions operate on all of them at once.
+
+Packed arrays behave in the same way as any other list. 'Range', 'Table', \
+'RandomInteger' and 'RandomReal' produce them when possible.
+"""
+
+import numpy
+
+from mathics.core.atoms import Integer
+from mathics.core.builtin import Builtin
+from mathics.core.element import BaseElement
+from mathics.core.evaluation import Evaluation
+from mathics.core.list import PackedListExpression, to_packed_list, unpack_list
+from mathics.core.symbols import BooleanType, Symbol, SymbolFalse, SymbolTrue
+from mathics.core.systemsymbols import SymbolInteger, SymbolReal
+
+# Kind of the NumPy array of a packed array with elements of each type.
+PACKED_ARRAY_KINDS = {
+    SymbolInteger: "i",
+    SymbolReal: "f",
+}
+
+
+class FromPackedArray(Builtin):
+    """
+    <url>
+    :WMA link:
+    https://reference.wolfram.com/language/ref/Developer/FromPackedArray.html</url>
+
+    <dl>
+      <dt>'Developer`FromPackedArray[$expr$]'
+      <dd>unpacks $expr$ if it is a packed array.
+    </dl>
+
+    >> list = Range[5];
+    >> Developer`PackedArrayQ[list]
+     = True
+    >> Developer`PackedArrayQ[Developer`FromPackedArray[list]]
+     = False
+
+    The unpacked list has the same elements:
+    >> Developer`FromPackedArray[list] === list
+     = True
+    """
+
+    context = "Developer`"
+    summary_text = "unpack a packed array"
+
+    def eval(self, expr, evaluation: Evaluation) -> BaseElement:
+        "Developer`FromPackedArray[expr_]"
+        return unpack_list(expr)
+
+
+class PackedArrayQ(Builtin):
+    """
+    <url>
+    :WMA link:
+    https://reference.wolfram.com/language/ref/Developer/PackedArrayQ.html</url>
+
+    <dl>
+      <dt>'Developer`PackedArrayQ[$expr$]'
+      <dd>returns 'True' if $expr$ is a packed array, and 'False' otherwise.
+
+      <dt>'Developer`PackedArrayQ[$expr$, $type$]'
+      <dd>tests whether $expr$ is a packed array of elements of type $type$, \
+          which can be 'Integer' or 'Real'.
+
+      <dt>'Developer`PackedArrayQ[$expr$, $type$, $rank$]'
+      <dd>also tests whether the packed array has rank $rank$.
+    </dl>
+
+    'Range' gives packed arrays of machine numbers:
+    >> Developer`PackedArrayQ[Range[10]]
+     = True
+    >> Developer`PackedArrayQ[{1, 2, 3}]
+     = False
+
+    >> Developer`PackedArrayQ[RandomReal[1, {3, 2}], Real, 2]
+     = True
+    >> Developer`PackedArrayQ[Range[10], Real]
+     = False
+
+    Arithmetic on packed arrays gives packed arrays:
+    >> Developer`PackedArrayQ[2 Range[10] + 1.5]
+     = True
+
+    Changing an element unpacks the array:
+    >> list = Range[5]; list[[1]] = x;
+    >> Developer`PackedArrayQ[list]
+     = False
+    """
+
+    context = "Developer`"
+    summary_text = "test whether an expression is a packed array"
+
+    def eval(self, expr, evaluation: Evaluation) -> BooleanType:
+        "Developer`PackedArrayQ[expr_]"
+        return SymbolTrue if expr.is_packed else SymbolFalse
+
+    def eval_type(self, expr, typ, evaluation: Evaluation) -> BooleanType:
+        "Developer`PackedArrayQ[expr_, typ_]"
+        if expr.is_packed and expr.array.dtype.kind == PACKED_ARRAY_KINDS.get(typ):
+            return SymbolTrue
+        return SymbolFalse
+
+    def eval_rank(self, expr, typ, rank, evaluation: Evaluation) -> BooleanType:
+        "Developer`PackedArrayQ[expr_, typ_, rank_]"
+        if (
+            self.eval_type(expr, typ, evaluation) is SymbolTrue
+            and isinstance(rank, Integer)
+            and expr.array.ndim == rank.value
+        ):
+            return SymbolTrue
+        return SymbolFalse
+
+
+class ToPackedArray(Builtin):
+    """
+    <url>
+    :WMA link:
+    https://reference.wolfram.com/language/ref/Developer/ToPackedArray.html</url>
+
+    <dl>
+      <dt>'Developer`ToPackedArray[$expr$]'
+      <dd>packs $expr$, a list or a rectangular array of machine numbers, \
+          into a packed array.
+
+      <dt>'Developer`ToPackedArray[$expr$, $type$]'
+      <dd>packs $expr$ into a packed array of elements of type $type$, \
+          which can be 'Integer' or 'Real'.
+    </dl>
+
+    >> Developer`PackedArrayQ[Developer`ToPackedArray[{{1, 2}, {3, 4}}]]
+     = True
+
+    Integers are converted to reals if there are reals in $expr$:
+    >> Developer`PackedArrayQ[Developer`ToPackedArray[{1, 2.5}], Real]
+     = True
+    >> Developer`ToPackedArray[{1, 2}, Real]
+     = {1., 2.}
+
+    Expressions that can't be packed are returned unchanged:
+    >> Developer`ToPackedArray[{1, x}]
+     = {1, x}
+    """
+
+    context = "Developer`"
+    summary_text = "pack a list of machine numbers into a packed array"
+
+    def eval(self, expr, evaluation: Evaluation) -> BaseElement:
+        "Developer`ToPackedArray[expr_]"
+        return to_packed_list(expr, coerce=True)
+
+    def eval_type(self, expr, typ: Symbol, evaluation: Evaluation) -> BaseElement:
+        "Developer`ToPackedArray[expr_, typ_Symbol]"
+        kind = PACKED_ARRAY_KINDS.get(typ)
+        if kind is None:
+            return None
+        packed = to_packed_list(expr, coerce=True)
+        if not packed.is_packed:
+            return expr
+        if packed.array.dtype.kind == kind:
+            return packed
+        if kind == "f":
+            return PackedListExpression(packed.array.astype(numpy.float64))
+        return expr
@@ -15,7 +15,7 @@ from mathics.core.attributes import A_FLAT, A_ONE_IDENTITY, A_PROTECTED
 from mathics.core.builtin import Builtin, MessageException
 from mathics.core.element import BaseElement
 from mathics.core.evaluation import Evaluation
-from mathics.core.expression import Expression, structure
+from mathics.core.expression import Expression, sorted_elements, structure
 from mathics.core.expression_predefined import MATHICS3_INFINITY
 from mathics.core.list import ListExpression
 from mathics.core.symbols import Atom, Symbol, SymbolTrue
@@ -458,7 +458,7 @@ class _SetOperation(Builtin):
                 functools.reduce(getattr(set, self._operation), map(set, operands))
             )
 
-        return Expression(seq[0].get_head(), *sorted(items))
+        return Expression(seq[0].get_head(), *sorted_elements(items))
 
 
 class _TallyBin:
@@ -251,6 +251,7 @@ class General(Builtin):
         "syntax": "`1`",
         "invalidargs": "Invalid arguments.",
         "notboxes": "`1` is not a valid box structure.",
+        "kernerr": "A parallel kernel failed with `1`.",
         "pyimport": '`1`[] is not available. Python module "`2`" is not installed.',
     }
     summary_text = "general-purpose messages"
@@ -17,7 +17,9 @@ from mathics.core.convert.sympy import from_sympy, to_sympy_matrix
 from mathics.core.evaluation import Evaluation
 from mathics.core.expression import Expression
 from mathics.core.list import ListExpression
+from mathics.core.sparse import SparseArrayExpression, to_dense_list
 from mathics.core.symbols import SymbolList
+from mathics.eval.sparse import eval_LinearSolve_sparse
 
 
 class DesignMatrix(Builtin):
@@ -508,6 +510,16 @@ class LinearSolve(Builtin):
     def eval(self, m, b, evaluation: Evaluation):
         "LinearSolve[m_, b_]"
 
+        if isinstance(m, SparseArrayExpression):
+            # Inexact numeric systems are solved without building
+            # the dense matrix.
+            solution = eval_LinearSolve_sparse(m, b, evaluation)
+            if solution is not None:
+                return solution
+            m = to_dense_list(m)
+        if isinstance(b, SparseArrayExpression):
+            b = to_dense_list(b)
+
         matrix = matrix_data(m)
         if matrix is None:
             evaluation.message("LinearSolve", "matrix", m, 1)
@@ -184,6 +184,7 @@ class Divisors(Builtin):
     # TODO: support GaussianIntegers
     # e.g. Divisors[2, GaussianIntegers -> True]
     attributes = A_LISTABLE | A_PROTECTED
+    pure = True
     summary_text = "get integer divisors"
 
     def eval(self, n: Integer, evaluation: Evaluation):
@@ -303,6 +304,7 @@ class FactorInteger(Builtin):
     """
 
     attributes = A_LISTABLE | A_PROTECTED
+    pure = True
     summary_text = "list prime factors and exponents of a number"
 
     # TODO: GausianIntegers option
@@ -889,6 +891,7 @@ class Prime(SympyFunction):
     """
 
     attributes = A_LISTABLE | A_NUMERIC_FUNCTION | A_PROTECTED
+    pure = True
     summary_text = "get nth prime number"
 
     def eval(self, n, evaluation: Evaluation):
@@ -927,6 +930,7 @@ class PrimePi(SympyFunction):
     """
 
     attributes = A_LISTABLE | A_NUMERIC_FUNCTION | A_PROTECTED
+    pure = True
     mpmath_name = "primepi"
     summary_text = "count the number of primes less than or equal to a number"
     sympy_name = "primepi"
@@ -20,7 +20,7 @@ from mathics.builtin.numpy_utils import instantiate_elements, stack
 from mathics.core.atoms import Complex, Integer, Real, String
 from mathics.core.builtin import Builtin
 from mathics.core.expression import Expression
-from mathics.core.list import ListExpression
+from mathics.core.list import ListExpression, PackedListExpression
 from mathics.core.symbols import Symbol, SymbolDivide, SymbolNull
 from mathics.core.systemsymbols import (
     SymbolRandomComplex,
@@ -38,6 +38,18 @@ def random_get_state():
     return numpy.random.get_state()
 
 
+def instantiate_packed_array(values, new_element):
+    """
+    Return the NumPy array `values` of machine integers or reals as a
+    packed array. Arrays with no elements are returned as Lists, with
+    `new_element` building their atoms.
+    """
+    if isinstance(values, numpy.ndarray) and values.ndim > 0 and values.size > 0:
+        dtype = numpy.float64 if values.dtype.kind == "f" else numpy.int64
+        return PackedListExpression(values.astype(dtype, copy=False))
+    return instantiate_elements(values, new_element)
+
+
 def random_set_state(state):
     return numpy.random.set_state(state)
 
@@ -514,7 +526,7 @@ class RandomInteger(Builtin):
         result = ns.to_python()
 
         with RandomEnv(evaluation) as rand:
-            return instantiate_elements(rand.randint(rmin, rmax, result), Integer)
+            return instantiate_packed_array(rand.randint(rmin, rmax, result), Integer)
 
 
 class RandomReal(Builtin):
@@ -600,7 +612,7 @@ class RandomReal(Builtin):
         assert all(isinstance(i, int) for i in result)
 
         with RandomEnv(evaluation) as rand:
-            return instantiate_elements(
+            return instantiate_packed_array(
                 rand.randreal(min_value, max_value, result), Real
             )
 
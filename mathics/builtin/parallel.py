@@ -0,0 +1,423 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel Computing
+
+Parallel evaluations are done by worker kernels, which are separate \
+processes running on the processors of the computer. The kernels are \
+launched by the first parallel evaluation, or by 'LaunchKernels'.
+
+The definitions of the symbols in the 'Global`' context are distributed to \
+the kernels with each parallel evaluation. Other definitions are \
+distributed with 'DistributeDefinitions'.
+"""
+
+from typing import Iterable, List, Optional
+
+from mathics.core.atoms import Integer, String
+from mathics.core.attributes import A_HOLD_ALL, A_PROTECTED
+from mathics.core.builtin import Builtin, Predefined
+from mathics.core.element import BaseElement
+from mathics.core.evaluation import Evaluation
+from mathics.core.expression import Expression
+from mathics.core.list import ListExpression
+from mathics.core.symbols import Atom, Symbol, SymbolList, SymbolNull, SymbolPlus
+from mathics.core.systemsymbols import (
+    SymbolBlock,
+    SymbolDo,
+    SymbolJoin,
+    SymbolQuiet,
+    SymbolSet,
+    SymbolSum,
+    SymbolTable,
+)
+from mathics.eval.parallel import (
+    close_kernels,
+    distributed_names,
+    ensure_kernels,
+    kernel_count,
+    launch_kernels,
+    parallel_evaluate,
+    split_in_chunks,
+)
+
+SymbolKernelObject = Symbol("System`KernelObject")
+
+# The ways of distributing the evaluations among the kernels.
+PARALLEL_METHODS = ("Automatic", "CoarsestGrained", "FinestGrained")
+
+method_messages = {
+    "bdmtd": (
+        "Value of option Method -> `1` is not Automatic, "
+        '"CoarsestGrained" or "FinestGrained".'
+    ),
+}
+
+
+def kernel_objects(numbers: Iterable[int]) -> ListExpression:
+    return ListExpression(
+        *(
+            Expression(SymbolKernelObject, Integer(number), String("local"))
+            for number in numbers
+        )
+    )
+
+
+def get_method(
+    builtin: Builtin, options: dict, evaluation: Evaluation
+) -> Optional[str]:
+    """
+    Return the distribution method set by the option Method of
+    ``builtin``, or None after a message if it is not valid.
+    """
+    method_string, method = builtin.get_option_string(options, "Method", evaluation)
+    if method_string not in PARALLEL_METHODS:
+        evaluation.message(builtin.get_name(), "bdmtd", method)
+        return None
+    return method_string
+
+
+class _ParallelIteration(Builtin):
+    """
+    Base class of the parallel versions of the iteration functions.
+
+    The values of the first iterator are found in the main kernel, and the
+    kernels evaluate the iteration function over the other iterators for
+    each of them.
+    """
+
+    attributes = A_HOLD_ALL | A_PROTECTED
+    messages = method_messages
+    options = {"Method": "Automatic"}
+    rules = {
+        "%(name)s[expr_, n_Integer, opts:OptionsPattern[]]": "%(name)s[expr, {n}, opts]",
+    }
+
+    # The sequential iteration function.
+    iteration_symbol: Symbol
+
+    def iterate(
+        self, expr, iterators, method: str, evaluation: Evaluation
+    ) -> Optional[List[BaseElement]]:
+        """
+        Return the results of the evaluations for the values of the first
+        iterator, or None if the iteration cannot be done in parallel.
+        """
+        first, *rest = iterators.get_sequence()
+        if rest:
+            expr = Expression(self.iteration_symbol, expr, *rest)
+
+        if len(first.elements) == 1:
+            count = first.elements[0].evaluate(evaluation)
+            if not isinstance(count, Integer):
+                return None
+            tasks = [expr] * max(count.value, 0)
+        else:
+            variable = first.elements[0]
+            values = Expression(
+                SymbolQuiet, Expression(SymbolTable, variable, first)
+            ).evaluate(evaluation)
+            if not values.has_form("List", None):
+                return None
+            tasks = [
+                Expression(
+                    SymbolBlock,
+                    ListExpression(Expression(SymbolSet, variable, value)),
+                    expr,
+                )
+                for value in values.elements
+            ]
+
+        return parallel_evaluate(tasks, method, evaluation)
+
+
+class CloseKernels(Builtin):
+    """
+    <url>:WMA link:https://reference.wolfram.com/language/ref/CloseKernels.html</url>
+
+    <dl>
+      <dt>'CloseKernels[]'
+      <dd>stops all the parallel kernels.
+    </dl>
+
+    >> LaunchKernels[1];
+    >> CloseKernels[]
+     = {KernelObject[1, local]}
+    >> $KernelCount
+     = 0
+    """
+
+    summary_text = "stop the parallel kernels"
+
+    def eval(self, evaluation: Evaluation):
+        "CloseKernels[]"
+        return kernel_objects(close_kernels())
+
+
+class DistributeDefinitions(Builtin):
+    """
+    <url>:WMA link:https://reference.wolfram.com/language/ref/DistributeDefinitions.html</url>
+
+    <dl>
+      <dt>'DistributeDefinitions[$s1$, $s2$, ...]'
+      <dd>distributes the definitions of the symbols $si$ to the parallel \
+          kernels.
+    </dl>
+
+    The definitions of symbols in contexts other than 'Global`' are \
+    distributed explicitly:
+    >> Private`g[x_] := x + 1
+    >> DistributeDefinitions[Private`g]
+     = {Private`g}
+    >> ParallelMap[Private`g, {1, 2, 3}]
+     = {2, 3, 4}
+    #> CloseKernels[];
+    """
+
+    attributes = A_HOLD_ALL | A_PROTECTED
+    summary_text = "distribute definitions to the parallel kernels"
+
+    def eval(self, symbols, evaluation: Evaluation):
+        "DistributeDefinitions[symbols___]"
+        result = []
+        for symbol in symbols.get_sequence():
+            if isinstance(symbol, String):
+                symbol = Symbol(evaluation.definitions.lookup_name(symbol.value))
+            if not isinstance(symbol, Symbol):
+                continue
+            distributed_names.add(symbol.get_name())
+            result.append(symbol)
+        return ListExpression(*result)
+
+
+class KernelCount(Predefined):
+    """
+    <url>:WMA link:https://reference.wolfram.com/language/ref/$KernelCount.html</url>
+
+    <dl>
+      <dt>'$KernelCount'
+      <dd>gives the number of running parallel kernels.
+    </dl>
+
+    >> LaunchKernels[2];
+    >> $KernelCount
+     = 2
+    #> CloseKernels[];
+    """
+
+    name = "$KernelCount"
+    summary_text = "number of running parallel kernels"
+
+    def evaluate(self, evaluation: Evaluation) -> Integer:
+        return Integer(kernel_count())
+
+
+class LaunchKernels(Builtin):
+    """
+    <url>:WMA link:https://reference.wolfram.com/language/ref/LaunchKernels.html</url>
+
+    <dl>
+      <dt>'LaunchKernels[]'
+      <dd>launches a parallel kernel for each processor, if no kernel is \
+          running.
+
+      <dt>'LaunchKernels[$n$]'
+      <dd>launches $n$ more parallel kernels.
+    </dl>
+
+    >> LaunchKernels[2]
+     = {KernelObject[1, local], KernelObject[2, local]}
+    #> CloseKernels[];
+    """
+
+    summary_text = "launch parallel kernels"
+
+    def eval(self, evaluation: Evaluation):
+        "LaunchKernels[]"
+        if kernel_count():
+            return ListExpression()
+        ensure_kernels()
+        return kernel_objects(range(1, kernel_count() + 1))
+
+    def eval_n(self, n: Integer, evaluation: Evaluation):
+        "LaunchKernels[n_Integer?Positive]"
+        return kernel_objects(launch_kernels(n.value))
+
+
+class ParallelCombine(Builtin):
+    """
+    <url>:WMA link:https://reference.wolfram.com/language/ref/ParallelCombine.html</url>
+
+    <dl>
+      <dt>'ParallelCombine[$f$, $h$[$e1$, $e2$, ...], $comb$]'
+      <dd>evaluates $f$[$h$[...]] for parts of the elements $ei$ in \
+          parallel, and combines the results with $comb$.
+
+      <dt>'ParallelCombine[$f$, $h$[$e1$, $e2$, ...]]'
+      <dd>combines the results with 'Join' if $h$ is 'List', and with $h$ \
+          otherwise.
+    </dl>
+
+    >> ParallelCombine[Map[#^2 &, #] &, {1, 2, 3, 4, 5}]
+     = {1, 4, 9, 16, 25}
+    >> ParallelCombine[Total, {1, 2, 3, 4, 5}, Plus]
+     = 15
+    #> CloseKernels[];
+    """
+
+    messages = method_messages
+    options = {"Method": "Automatic"}
+    summary_text = "evaluate a function on parts of an expression in parallel"
+
+    def eval(self, f, expr, evaluation: Evaluation, options: dict):
+        "ParallelCombine[f_, expr_, OptionsPattern[ParallelCombine]]"
+        if isinstance(expr, Atom):
+            return None
+        comb = SymbolJoin if expr.head is SymbolList else expr.head
+        return self.eval_comb(f, expr, comb, evaluation, options)
+
+    def eval_comb(self, f, expr, comb, evaluation: Evaluation, options: dict):
+        "ParallelCombine[f_, expr_, comb_?NotOptionQ, OptionsPattern[ParallelCombine]]"
+        if isinstance(expr, Atom):
+            return None
+        method = get_method(self, options, evaluation)
+        if method is None:
+            return None
+        ensure_kernels()
+        tasks = [
+            Expression(f, Expression(expr.head, *chunk))
+            for chunk in split_in_chunks(expr.elements, method)
+        ]
+        results = parallel_evaluate(tasks, "FinestGrained", evaluation)
+        return Expression(comb, *results)
+
+
+class ParallelDo(_ParallelIteration):
+    """
+    <url>:WMA link:https://reference.wolfram.com/language/ref/ParallelDo.html</url>
+
+    <dl>
+      <dt>'ParallelDo[$expr$, {$i$, $imin$, $imax$}, ...]'
+      <dd>evaluates $expr$ for each value of $i$ in parallel, as 'Do' does.
+    </dl>
+
+    The output of the kernels is shown after the evaluation:
+    >> ParallelDo[Print[i], {i, 3}, Method -> "FinestGrained"]
+     | 1
+     | 2
+     | 3
+    #> CloseKernels[];
+    """
+
+    iteration_symbol = SymbolDo
+    summary_text = "evaluate a loop in parallel"
+
+    def eval(self, expr, iterators, evaluation: Evaluation, options: dict):
+        "ParallelDo[expr_, iterators__List, OptionsPattern[ParallelDo]]"
+        method = get_method(self, options, evaluation)
+        if method is None:
+            return None
+        if self.iterate(expr, iterators, method, evaluation) is None:
+            Expression(SymbolDo, expr, *iterators.get_sequence()).evaluate(evaluation)
+        return SymbolNull
+
+
+class ParallelMap(Builtin):
+    """
+    <url>:WMA link:https://reference.wolfram.com/language/ref/ParallelMap.html</url>
+
+    <dl>
+      <dt>'ParallelMap[$f$, $expr$]'
+      <dd>applies $f$ to each element of $expr$ in parallel, as 'Map' does.
+    </dl>
+
+    >> ParallelMap[#^2 &, {1, 2, 3, 4}]
+     = {1, 4, 9, 16}
+
+    The definitions of the symbols in 'Global`' are used by the kernels:
+    >> f[n_] := n!
+    >> ParallelMap[f, h[1, 2, 3], Method -> "CoarsestGrained"]
+     = h[1, 2, 6]
+    #> CloseKernels[]; Clear[f];
+    """
+
+    messages = method_messages
+    options = {"Method": "Automatic"}
+    summary_text = "apply a function to the elements of an expression in parallel"
+
+    def eval(self, f, expr, evaluation: Evaluation, options: dict):
+        "ParallelMap[f_, expr_, OptionsPattern[ParallelMap]]"
+        method = get_method(self, options, evaluation)
+        if method is None:
+            return None
+        if isinstance(expr, Atom):
+            return expr
+        tasks = [Expression(f, element) for element in expr.elements]
+        return Expression(expr.head, *parallel_evaluate(tasks, method, evaluation))
+
+
+class ParallelSum(_ParallelIteration):
+    """
+    <url>:WMA link:https://reference.wolfram.com/language/ref/ParallelSum.html</url>
+
+    <dl>
+      <dt>'ParallelSum[$expr$, {$i$, $imin$, $imax$}, ...]'
+      <dd>evaluates the sum of $expr$ with $i$ going from $imin$ to $imax$ \
+          in parallel, as 'Sum' does.
+    </dl>
+
+    >> ParallelSum[i^2, {i, 1, 10}]
+     = 385
+    >> ParallelSum[i j, {i, 3}, {j, 2}]
+     = 18
+
+    Symbolic sums are evaluated by 'Sum':
+    >> ParallelSum[k, {k, 1, n}]
+     = n (1 + n) / 2
+    #> CloseKernels[];
+    """
+
+    iteration_symbol = SymbolSum
+    summary_text = "evaluate a sum in parallel"
+
+    def eval(self, expr, iterators, evaluation: Evaluation, options: dict):
+        "ParallelSum[expr_, iterators__List, OptionsPattern[ParallelSum]]"
+        method = get_method(self, options, evaluation)
+        if method is None:
+            return None
+        results = self.iterate(expr, iterators, method, evaluation)
+        if results is None:
+            return Expression(SymbolSum, expr, *iterators.get_sequence())
+        return Expression(SymbolPlus, *results)
+
+
+class ParallelTable(_ParallelIteration):
+    """
+    <url>:WMA link:https://reference.wolfram.com/language/ref/ParallelTable.html</url>
+
+    <dl>
+      <dt>'ParallelTable[$expr$, {$i$, $imin$, $imax$}, ...]'
+      <dd>makes a table of the values of $expr$ in parallel, as 'Table' \
+          does.
+    </dl>
+
+    >> ParallelTable[i^2, {i, 5}]
+     = {1, 4, 9, 16, 25}
+    >> ParallelTable[{i, j}, {i, {a, b}}, {j, 2}]
+     = {{{a, 1}, {a, 2}}, {{b, 1}, {b, 2}}}
+    >> ParallelTable[x, 3]
+     = {x, x, x}
+    #> CloseKernels[];
+    """
+
+    iteration_symbol = SymbolTable
+    summary_text = "make a table of values in parallel"
+
+    def eval(self, expr, iterators, evaluation: Evaluation, options: dict):
+        "ParallelTable[expr_, iterators__List, OptionsPattern[ParallelTable]]"
+        method = get_method(self, options, evaluation)
+        if method is None:
+            return None
+        results = self.iterate(expr, iterators, method, evaluation)
+        if results is None:
+            return Expression(SymbolTable, expr, *iterators.get_sequence())
+        return ListExpression(*results)
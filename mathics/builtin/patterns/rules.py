@@ -77,6 +77,7 @@ from mathics.core.evaluation import Evaluation
 from mathics.core.exceptions import InvalidLevelspecError
 from mathics.core.expression import Expression, ExpressionInfinity
 from mathics.core.list import ListExpression
+from mathics.core.rule_index import DispatchTable
 from mathics.core.symbols import SymbolTrue
 from mathics.core.systemsymbols import (
     SymbolInfinity,
@@ -103,9 +104,10 @@ class DispatchAtom(AtomBuiltin):
 
     <dl>
       <dt>'Dispatch[$rulelist$]'
-      <dd>Introduced for compatibility. Currently, it just return $rulelist$. \
-          In the future, it should return an optimized DispatchRules atom, \
-          containing an optimized set of rules.
+      <dd>generates an optimized dispatch table representation of $rulelist$. \
+          Rules whose left-hand side is free of patterns are stored in a hash \
+          table, and the rest are grouped by the head of their pattern, so \
+          replacements only try the rules that could match each subexpression.
     </dl>
 
     >> rules = {{a_,b_}->a^b, {1,2}->3., F[x_]->x^2};
@@ -393,6 +395,9 @@ class ReplaceList(Builtin):
         if ret:
             return rules
 
+        if isinstance(rules, DispatchTable):
+            rules = rules.get_candidates(expr)
+
         list_result = []
         for rule in rules:
             result = rule.apply(expr, evaluation, return_list=True, max_list=max_count)
@@ -11,8 +11,13 @@ from mathics.core.attributes import A_HOLD_ALL, A_PROTECTED, attribute_string_to
 from mathics.core.builtin import Builtin, Predefined
 from mathics.core.evaluation import Evaluation
 from mathics.core.list import ListExpression
-from mathics.core.symbols import Symbol, fully_qualified_symbol_name
-from mathics.eval.scoping import eval_contexts, eval_contexts_with_string
+from mathics.core.symbols import Symbol
+from mathics.eval.scoping import (
+    dynamic_scoping,
+    eval_contexts,
+    eval_contexts_with_string,
+    eval_Module,
+)
 
 
 def get_scoping_vars(var_list, msg_symbol="", evaluation=None):
@@ -46,29 +51,6 @@ def get_scoping_vars(var_list, msg_symbol="", evaluation=None):
             yield var_name, new_def
 
 
-def dynamic_scoping(func, vars, evaluation: Evaluation):
-    """
-    Changes temporarily the value of a set of symbols listed in vars,
-    and evaluates func(evaluation)
-    """
-    original_definitions = {}
-    for var_name, new_def in vars.items():
-        assert fully_qualified_symbol_name(var_name)
-        original_definitions[var_name] = evaluation.definitions.get_user_definition(
-            var_name
-        )
-        evaluation.definitions.reset_user_definition(var_name)
-        if new_def is not None:
-            new_def = new_def.evaluate(evaluation)
-            evaluation.definitions.set_ownvalue(var_name, new_def)
-    try:
-        result = func(evaluation)
-    finally:
-        for name, definition in original_definitions.items():
-            evaluation.definitions.add_user_definition(name, definition)
-    return result
-
-
 class Begin(Builtin):
     """
     <url>
@@ -420,6 +402,13 @@ class Module(Builtin):
           Each time a module is evaluated, '$ModuleNumber' is incremented.
     </dl>
 
+    The local variables are temporary: they are removed once nothing refers \
+    to them.
+    >> Module[{t = 1}, t + 1]
+     = 2
+    >> Names["Global`t$*"]
+     = {}
+
     ## FIXME: fix and go over
     ## >> x = 10;
     ## >> Module[{x=x}, x=x+1; x]
@@ -466,20 +455,7 @@ class Module(Builtin):
     def eval(self, vars, expr, evaluation: Evaluation):
         "Module[vars_, expr_]"
 
-        scoping_vars = get_scoping_vars(vars, "Module", evaluation)
-        replace = {}
-        number = Symbol("$ModuleNumber").evaluate(evaluation).get_int_value()
-        if number is None:
-            number = 1
-        evaluation.definitions.set_ownvalue("$ModuleNumber", Integer(number + 1))
-        for name, new_def in scoping_vars:
-            new_name = "%s$%d" % (name, number)
-            if new_def is not None:
-                evaluation.definitions.set_ownvalue(new_name, new_def.copy())
-            replace[name] = Symbol(new_name)
-        new_expr = expr.replace_vars(replace, in_scoping=False)
-        result = new_expr.evaluate(evaluation)
-        return result
+        return eval_Module(vars, expr, evaluation)
 
 
 class ModuleNumber_(Predefined):
@@ -10,6 +10,11 @@ from mathics.core.builtin import Builtin
 from mathics.core.evaluation import Evaluation
 from mathics.core.expression import Expression
 from mathics.core.list import ListExpression
+from mathics.core.sparse import (
+    SparseArrayExpression,
+    sparse_array_from_rules,
+    to_dense_list,
+)
 from mathics.core.symbols import Atom, Symbol
 from mathics.core.systemsymbols import (
     SymbolAutomatic,
@@ -18,6 +23,7 @@ from mathics.core.systemsymbols import (
     SymbolTable,
 )
 from mathics.eval.list.eol import eval_Part
+from mathics.eval.sparse import eval_SparseArray_positions, get_sparse_dims
 
 
 class SparseArray(Builtin):
@@ -35,8 +41,16 @@ class SparseArray(Builtin):
 
       <dt>'SparseArray[$list$]'
       <dd>Builds a sparse representation of $list$.
+
+      <dt>'SparseArray[{$pos_1$, $pos_2$, ...} -> {$v_1$, $v_2$, ...}, $dims$]'
+      <dd>Builds a sparse array of dimensions $dims$ with the values $v_i$ \
+      at the positions $pos_i$.
     </dl>
 
+    Sparse arrays store only the elements that are not the default value. \
+    'Dot', 'Transpose', 'Plus', 'Times' by scalars, 'Part', 'Total' and \
+    'LinearSolve' work without building the dense array:
+
     >> SparseArray[{{1, 2} -> 1, {2, 1} -> 1}]
      = SparseArray[Automatic, {2, 2}, 0, {{1, 2} -> 1, {2, 1} -> 1}]
     >> SparseArray[{{1, 2} -> 1, {2, 1} -> 1}, {3, 3}]
@@ -46,6 +60,14 @@ class SparseArray(Builtin):
     >> M //Normal
      = {{0, a}, {b, 0}}
 
+    >> S = SparseArray[{{1, 2}, {2, 3}, {3, 1}} -> 1, {3, 3}]
+     = SparseArray[Automatic, {3, 3}, 0, {{1, 2} -> 1, {2, 3} -> 1, {3, 1} -> 1}]
+    >> S . S
+     = SparseArray[Automatic, {3, 3}, 0, {{1, 3} -> 1, {2, 1} -> 1, {3, 2} -> 1}]
+    >> 2 S + Transpose[S] // Normal
+     = {{0, 2, 1}, {1, 0, 2}, {2, 1, 0}}
+    >> {S[[2]], S[[2, 3]], Total[S, 2]}
+     = {SparseArray[Automatic, {3}, 0, {{3} -> 1}], 1, 3}
     """
 
     messages = {
@@ -122,12 +144,27 @@ class SparseArray(Builtin):
             ListExpression(*rules),
         )
 
-    def eval_dimensions(self, dims, default, data, evaluation: Evaluation):
-        """System`Dimensions[System`SparseArray[System`Automatic, dims_List, default_, data_List]]"""
-        return dims
+    def eval_dimensions(self, array, evaluation: Evaluation):
+        """System`Dimensions[array_System`SparseArray]"""
+        if isinstance(array, SparseArrayExpression):
+            return ListExpression(*(Integer(dim) for dim in array.dims))
+        if array.has_form("SparseArray", 4) and array.elements[1].has_form(
+            "List", None
+        ):
+            return array.elements[1]
 
-    def eval_normal(self, dims, default, data, evaluation: Evaluation):
-        """System`Normal[System`SparseArray[System`Automatic, dims_List, default_, data_List]]"""
+    def eval_normal(self, array, evaluation: Evaluation):
+        """System`Normal[array_System`SparseArray]"""
+        if isinstance(array, SparseArrayExpression):
+            return to_dense_list(array)
+        if not (
+            array.has_form("SparseArray", 4)
+            and array.elements[0] is SymbolAutomatic
+            and array.elements[1].has_form("List", None)
+            and array.elements[3].has_form("List", None)
+        ):
+            return
+        dims, default, data = array.elements[1:]
         its = [ListExpression(n) for n in dims.elements]
         table = Expression(SymbolTable, default, *its)
         table = table.evaluate(evaluation)
@@ -184,4 +221,57 @@ class SparseArray(Builtin):
         self, rules, dims, default, evaluation: Evaluation
     ):
         """SparseArray[rules_List, dims_List, default_]"""
+        dims_tuple = get_sparse_dims(dims)
+        if dims_tuple is not None:
+            array = sparse_array_from_rules(dims_tuple, default, rules.elements)
+            if array is not None:
+                return array
         return Expression(SymbolSparseArray, SymbolAutomatic, dims, default, rules)
+
+    def eval_positions(self, positions, values, evaluation: Evaluation):
+        """SparseArray[positions_List -> values_]"""
+        if not all(position.has_form("List", None) for position in positions.elements):
+            # A single position.
+            rules = [Expression(SymbolRule, positions, values)]
+        elif values.has_form("List", len(positions.elements)):
+            rules = [
+                Expression(SymbolRule, position, value)
+                for position, value in zip(positions.elements, values.elements)
+            ]
+        else:
+            rules = [
+                Expression(SymbolRule, position, values)
+                for position in positions.elements
+            ]
+        return self.eval_with_rules(ListExpression(*rules), evaluation)
+
+    def eval_positions_and_dims(self, positions, values, dims, evaluation: Evaluation):
+        """SparseArray[positions_List -> values_, dims_List]"""
+        return self.eval_positions_dims_and_default(
+            positions, values, dims, Integer0, evaluation
+        )
+
+    def eval_positions_dims_and_default(
+        self, positions, values, dims, default, evaluation: Evaluation
+    ):
+        """SparseArray[positions_List -> values_, dims_List, default_]"""
+        dims_tuple = get_sparse_dims(dims)
+        if dims_tuple is None:
+            return
+        if not all(position.has_form("List", None) for position in positions.elements):
+            return sparse_array_from_rules(
+                dims_tuple, default, [Expression(SymbolRule, positions, values)]
+            )
+        return eval_SparseArray_positions(positions, values, dims_tuple, default)
+
+    def eval_sparse_array(
+        self, dims, default, rules, evaluation: Evaluation, expression: Expression
+    ):
+        """expression: SparseArray[Automatic, dims_List, default_, rules_List]"""
+        # Store the elements of the sparse array by position.
+        if isinstance(expression, SparseArrayExpression):
+            return
+        dims_tuple = get_sparse_dims(dims)
+        if dims_tuple is None:
+            return
+        return sparse_array_from_rules(dims_tuple, default, rules.elements)
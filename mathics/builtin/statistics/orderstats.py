@@ -13,15 +13,16 @@ Important special cases of order statistics are finding \
 minimum and maximum value of a sample and sample quantiles.
 """
 
+import numpy
 from mpmath import ceil as mpceil, floor as mpfloor
 
 from mathics.algorithm.introselect import introselect
 from mathics.builtin.list.math import _RankedTakeLargest, _RankedTakeSmallest
-from mathics.core.atoms import Atom, Integer, Integer1, SymbolTrue
+from mathics.core.atoms import Atom, Integer, Integer1
 from mathics.core.attributes import A_PROTECTED, A_READ_PROTECTED
 from mathics.core.builtin import Builtin
-from mathics.core.expression import Evaluation, Expression
-from mathics.core.list import ListExpression
+from mathics.core.expression import Evaluation, Expression, sorted_elements
+from mathics.core.list import ListExpression, PackedListExpression
 from mathics.core.symbols import SymbolFloor, SymbolPlus, SymbolTimes
 from mathics.core.systemsymbols import (
     SymbolRankedMax,
@@ -30,6 +31,7 @@ from mathics.core.systemsymbols import (
     SymbolSubtract,
 )
 from mathics.eval.numerify import numerify
+from mathics.eval.sort import eval_sort_with_ordering_function
 
 
 class Quantile(Builtin):
@@ -342,8 +344,11 @@ class Sort(Builtin):
 
         if isinstance(list, Atom):
             evaluation.message("Sort", "normal", Integer1, Expression(SymbolSort, list))
+        elif isinstance(list, PackedListExpression) and list.array.ndim == 1:
+            # The canonical order of machine numbers is the order of their values.
+            return PackedListExpression(numpy.sort(list.array, kind="stable"))
         else:
-            new_elements = sorted(list.elements)
+            new_elements = sorted_elements(list.elements)
             return list.restructure(list.head, new_elements, evaluation)
 
     def eval_predicate(self, list, p, evaluation: Evaluation):
@@ -352,18 +357,9 @@ class Sort(Builtin):
         if isinstance(list, Atom):
             evaluation.message("Sort", "normal", Integer1, Expression(SymbolSort, list))
         else:
-
-            class Key:
-                def __init__(self, element):
-                    self.element = element
-
-                def __gt__(self, other):
-                    return (
-                        Expression(p, self.element, other.element).evaluate(evaluation)
-                        is not SymbolTrue
-                    )
-
-            new_elements = sorted(list.elements, key=Key)
+            new_elements = eval_sort_with_ordering_function(
+                list.elements, p, evaluation
+            )
             return list.restructure(list.head, new_elements, evaluation)
 
 
@@ -22,7 +22,7 @@ from mathics.core.attributes import (
 )
 from mathics.core.builtin import Builtin, InfixOperator
 from mathics.core.convert.python import from_python
-from mathics.core.convert.regex import to_regex
+from mathics.core.convert.regex import compile_regex, to_regex
 from mathics.core.evaluation import Evaluation
 from mathics.core.expression import BoxError, Expression, string_list
 from mathics.core.expression_predefined import MATHICS3_INFINITY
@@ -456,14 +456,13 @@ class StringPosition(Builtin):
             patts = patt.get_elements()
         else:
             patts = [patt]
-        re_patts = []
+        compiled_patts = []
         for p in patts:
-            py_p = to_regex(p, show_message=evaluation.message)
+            py_p = compile_regex(p, show_message=evaluation.message)
             if py_p is None:
                 evaluation.message("StringExpression", "invld", p, patt)
                 return
-            re_patts.append(py_p)
-        compiled_patts = [re.compile(re_patt) for re_patt in re_patts]
+            compiled_patts.append(py_p)
 
         # string or list of strings
         if string.has_form("List", None):
@@ -764,52 +763,61 @@ class StringSplit(Builtin):
     def eval(self, string, patt, evaluation: Evaluation, options: dict):
         "StringSplit[string_, patt_, OptionsPattern[%(name)s]]"
 
-        if string.get_head_name() == "System`List":
-            elements = [
-                self.eval(s, patt, evaluation, options) for s in string.elements
-            ]
-            return ListExpression(*elements)
-
-        py_string = string.get_string_value()
-
-        if py_string is None:
-            evaluation.message(
-                "StringSplit", "strse", Integer1, Expression(SymbolStringSplit, string)
-            )
-            return
-
         if patt.has_form("List", None):
             patts = patt.get_elements()
         else:
             patts = [patt]
+
+        flags = re.MULTILINE
+        if options["System`IgnoreCase"] is SymbolTrue:
+            flags = flags | re.IGNORECASE
+
         re_patts = []
         for p in patts:
-            py_p = to_regex(p, show_message=evaluation.message)
+            py_p = compile_regex(p, flags, show_message=evaluation.message)
             if py_p is None:
                 evaluation.message("StringExpression", "invld", p, patt)
                 return
             re_patts.append(py_p)
 
-        flags = re.MULTILINE
-        if options["System`IgnoreCase"] is SymbolTrue:
-            flags = flags | re.IGNORECASE
-
-        result = [py_string]
-        for re_patt in re_patts:
-            result = [t for s in result for t in mathics_split(re_patt, s, flags=flags)]
-
-        return string_list(
-            SymbolList,
-            [
-                String(x)
-                for x in result
-                # Remove the empty matches only if we aren't splitting by
-                # whitespace because Python's RegEx matches " " as ""
-                if x != "" or patts[0].to_python() in ("", "System`WhitespaceCharacter")
-            ],
-            evaluation,
+        # Remove the empty matches only if we aren't splitting by
+        # whitespace because Python's RegEx matches " " as ""
+        keep_empty = bool(patts) and patts[0].to_python() in (
+            "",
+            "System`WhitespaceCharacter",
         )
 
+        def split(string):
+            # The patterns are compiled once for a list of strings.
+            if string.get_head_name() == "System`List":
+                elements = [split(s) for s in string.elements]
+                if None in elements:
+                    return None
+                return ListExpression(*elements)
+
+            py_string = string.get_string_value()
+
+            if py_string is None:
+                evaluation.message(
+                    "StringSplit",
+                    "strse",
+                    Integer1,
+                    Expression(SymbolStringSplit, string),
+                )
+                return None
+
+            result = [py_string]
+            for re_patt in re_patts:
+                result = [t for s in result for t in mathics_split(re_patt, s, flags)]
+
+            return string_list(
+                SymbolList,
+                [String(x) for x in result if x != "" or keep_empty],
+                evaluation,
+            )
+
+        return split(string)
+
 
 class StringTake(Builtin):
     """
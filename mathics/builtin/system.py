@@ -13,8 +13,16 @@ import sys
 from pympler.asizeof import asizeof
 
 from mathics import version_string
-from mathics.core.atoms import Integer, Integer0, IntegerM1, Real, String
-from mathics.core.attributes import A_CONSTANT
+from mathics.core.atoms import (
+    NUMBER_INTERN_TABLES,
+    Integer,
+    Integer0,
+    IntegerM1,
+    MachineReal,
+    Real,
+    String,
+)
+from mathics.core.attributes import A_CONSTANT, A_HOLD_FIRST, A_PROTECTED
 from mathics.core.builtin import Builtin, Predefined
 from mathics.core.convert.expression import to_mathics_list
 from mathics.core.evaluation import Evaluation
@@ -27,6 +35,7 @@ from mathics.core.systemsymbols import (
     SymbolRule,
     SymbolSequence,
 )
+from mathics.eval.share import eval_Share
 from mathics.version import __version__
 
 try:
@@ -132,6 +141,32 @@ class Environment(Builtin):
             return String(os.environ[env_var])
 
 
+class EvaluationCacheStatistics(Builtin):
+    # No docstring since this is internal and it will mess up documentation.
+    #
+    # Internal`EvaluationCacheStatistics[] gives the number of entries of
+    # the cache of calls to pure builtins, its maximum size, set through
+    # Settings`$EvaluationCacheSize, and the hits and misses of its lookups.
+    no_doc = True
+    context = "Internal`"
+    summary_text = "statistics of the cache of calls to pure builtins"
+
+    def eval(self, evaluation: Evaluation) -> ListExpression:
+        """Internal`EvaluationCacheStatistics[]"""
+        cache = evaluation.definitions.evaluation_cache
+        lookups = cache.hits + cache.misses
+        fields = (
+            ("Size", Integer(len(cache))),
+            ("MaxSize", Integer(cache.max_size)),
+            ("Hits", Integer(cache.hits)),
+            ("Misses", Integer(cache.misses)),
+            ("HitRate", MachineReal(cache.hits / lookups if lookups else 0.0)),
+        )
+        return ListExpression(
+            *(Expression(SymbolRule, String(name), value) for name, value in fields)
+        )
+
+
 class GetEnvironment(Builtin):
     """
     <url>:WMA link:https://reference.wolfram.com/language/ref/GetEnvironment.html</url>
@@ -392,6 +427,44 @@ class MemoryInUse(Builtin):
         return Integer(asizeof(evaluation.definitions))
 
 
+class NumberCacheStatistics(Builtin):
+    # No docstring since this is internal and it will mess up documentation.
+    #
+    # Internal`NumberCacheStatistics[] gives, for each kind of number, the
+    # number of entries in the table used to intern its atoms, how many of
+    # them are pinned, and the hits and misses of the lookups in the rest
+    # of the table.
+    no_doc = True
+    context = "Internal`"
+    summary_text = "statistics of the tables of interned numbers"
+
+    def eval(self, evaluation: Evaluation) -> ListExpression:
+        """Internal`NumberCacheStatistics[]"""
+        statistics = []
+        for head_name, table in NUMBER_INTERN_TABLES.items():
+            lookups = table.hits + table.misses
+            fields = (
+                ("Size", Integer(len(table) + len(table.pinned))),
+                ("Pinned", Integer(len(table.pinned))),
+                ("Hits", Integer(table.hits)),
+                ("Misses", Integer(table.misses)),
+                ("HitRate", MachineReal(table.hits / lookups if lookups else 0.0)),
+            )
+            statistics.append(
+                Expression(
+                    SymbolRule,
+                    String(head_name),
+                    ListExpression(
+                        *(
+                            Expression(SymbolRule, String(name), value)
+                            for name, value in fields
+                        )
+                    ),
+                )
+            )
+        return ListExpression(*statistics)
+
+
 class Packages(Predefined):
     """
     <url>:WMA link:https://reference.wolfram.com/language/ref/Packages.html</url>
@@ -631,50 +704,45 @@ class Share(Builtin):
 
     <dl>
       <dt>'Share[]'
-      <dd>release memory forcing Python to do garbage collection. If Python package \
-          'psutil' installed is the amount of released memoryis returned. Otherwise \
-          returns $0$. This function differs from WMA which tries to reduce the amount \
-          of memory required to store definitions, by reducing duplicated definitions.
-      <dt>'Share[Symbol]'
-      <dd>Does the same thing as 'Share[]'; Note: this function differs from WMA which \
-          tries to reduce the amount of memory required to store definitions associated \
-          to $Symbol$.
-
+      <dd>tries to reduce the amount of memory used to store the definitions, \
+          including the 'Out' history, by sharing the subexpressions that \
+          appear more than once. Returns the number of bytes released, as \
+          'ByteCount' counts them.
+      <dt>'Share[$symbol$]'
+      <dd>does the same thing, for the definitions associated to $symbol$.
     </dl>
 
+    >> Do[hist[k] = {k, Expand[(x + 1)^2]}, {k, 100}]
+    >> Share[hist] > 0
+     = True
+
+    Sharing does not change the definitions:
+    >> hist[7]
+     = {7, 1 + 2 x + x ^ 2}
+
+    There is nothing to share anymore:
+    >> Share[hist]
+     = 0
+
     >> Share[]
      = ...
+    #> Clear[hist];
     """
 
-    summary_text = "force Python garbage collection"
+    attributes = A_HOLD_FIRST | A_PROTECTED
+    summary_text = "share repeated subexpressions of the definitions"
 
     def eval(self, evaluation: Evaluation) -> Integer:
         """Share[]"""
-        # TODO: implement a routine that swap all the definitions,
-        # collecting repeated symbols and expressions, and then
-        # replace them by references.
-        # Return the amount of memory recovered.
-        if have_psutil:
-            totalmem = psutil.virtual_memory().available
-            gc.collect()
-            return Integer(totalmem - psutil.virtual_memory().available)
-        else:
-            gc.collect()
-            return Integer0
+        released = eval_Share(evaluation.definitions)
+        gc.collect()
+        return Integer(released)
 
     def eval_with_symbol(self, symbol, evaluation: Evaluation) -> Integer:
         """Share[symbol_Symbol]"""
-        # TODO: implement a routine that swap all the definitions,
-        # collecting repeated symbols and expressions, and then
-        # replace them by references.
-        # Return the amount of memory recovered.
-        if have_psutil:
-            totalmem = psutil.virtual_memory().available
-            gc.collect()
-            return Integer(totalmem - psutil.virtual_memory().available)
-        else:
-            gc.collect()
-            return Integer0
+        released = eval_Share(evaluation.definitions, [symbol.get_name()])
+        gc.collect()
+        return Integer(released)
 
 
 class SystemID(Predefined):
@@ -724,6 +792,29 @@ class SystemWordLength(Predefined):
         return Integer(size << 1)
 
 
+class TemporarySymbolStatistics(Builtin):
+    # No docstring since this is internal and it will mess up documentation.
+    #
+    # Internal`TemporarySymbolStatistics[] gives the number of temporary
+    # symbols of Module[] that are still alive, and the number of temporary
+    # symbols created and removed in the session.
+    no_doc = True
+    context = "Internal`"
+    summary_text = "statistics of the temporary symbols of Module"
+
+    def eval(self, evaluation: Evaluation) -> ListExpression:
+        """Internal`TemporarySymbolStatistics[]"""
+        definitions = evaluation.definitions
+        fields = (
+            ("Live", Integer(len(definitions.temporaries))),
+            ("Created", Integer(definitions.temporaries_created)),
+            ("Reclaimed", Integer(definitions.temporaries_reclaimed)),
+        )
+        return ListExpression(
+            *(Expression(SymbolRule, String(name), value) for name, value in fields)
+        )
+
+
 class UserName(Predefined):
     r"""
     <url>:WMA link:https://reference.wolfram.com/language/ref/UserName.html</url>
@@ -24,10 +24,13 @@ from mathics.core.attributes import A_FLAT, A_ONE_IDENTITY, A_PROTECTED
 from mathics.core.builtin import Builtin, InfixOperator
 from mathics.core.evaluation import Evaluation
 from mathics.core.list import ListExpression
+from mathics.core.sparse import SparseArrayExpression
+from mathics.eval.sparse import eval_Dot_sparse, eval_Transpose_sparse
 from mathics.eval.tensors import (
     eval_Inner,
     eval_LeviCivitaTensor,
     eval_Outer,
+    eval_Transpose_numeric,
     get_dimensions,
 )
 
@@ -122,6 +125,16 @@ class Dot(InfixOperator):
 
     summary_text = "dot product"
 
+    def eval_sparse(self, a, b, evaluation: Evaluation):
+        "Dot[a_SparseArray, b:(_SparseArray | _List)]"
+        if isinstance(a, SparseArrayExpression):
+            return eval_Dot_sparse(a, b, evaluation)
+
+    def eval_list_sparse(self, a, b, evaluation: Evaluation):
+        "Dot[a_List, b_SparseArray]"
+        if isinstance(b, SparseArrayExpression):
+            return eval_Dot_sparse(a, b, evaluation)
+
 
 class Inner(Builtin):
     """
@@ -379,6 +392,10 @@ class Transpose(Builtin):
     def eval(self, m, evaluation: Evaluation):
         "Transpose[m_?MatrixQ]"
 
+        packed = eval_Transpose_numeric(m)
+        if packed is not None:
+            return packed
+
         result = []
         for row_index, row in enumerate(m.elements):
             for col_index, item in enumerate(row.elements):
@@ -388,6 +405,11 @@ class Transpose(Builtin):
                     result[col_index].append(item)
         return ListExpression(*[ListExpression(*row) for row in result])
 
+    def eval_sparse(self, array, evaluation: Evaluation):
+        "Transpose[array_SparseArray]"
+        if isinstance(array, SparseArrayExpression):
+            return eval_Transpose_sparse(array)
+
 
 class ConjugateTranspose(Builtin):
     """
@@ -549,6 +549,7 @@ class PrimeQ(SympyFunction):
     """
 
     attributes = A_LISTABLE | A_NUMERIC_FUNCTION | A_PROTECTED
+    pure = True
     sympy_name = "isprime"
     summary_text = "test whether elements are prime numbers"
 
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Module containing AssociationExpression
+
+An Association is stored as an expression ``Association[rule1, rule2, ...]``.
+Looking up a key in such an expression means walking through all of its
+rules, which is slow for the large associations that are used as lookup
+tables.
+
+``AssociationExpression`` keeps the rules in an ``AssociationTable``: an
+insertion-ordered hash table from the keys of the rules to the rules.
+The elements of the expression are only built when they are needed.
+"""
+
+import reprlib
+from typing import Hashable, Iterable, Iterator, Optional, Tuple
+
+from mathics.core.element import BaseElement, ElementsProperties
+from mathics.core.expression import Expression, ExpressionCache
+from mathics.core.rule_index import literal_key
+from mathics.core.systemsymbols import SymbolAssociation
+
+# Marks a key that is not in the table.
+_ABSENT = object()
+
+
+class AssociationTable:
+    """
+    Insertion-ordered table from the keys of the rules of an association
+    to the rules.
+
+    Tables are persistent: ``set()`` returns a new table and leaves this one
+    as it was, so that associations built from others share their tables.
+    Only one of the tables built from a dictionary owns it. The others
+    keep the change (key and old rule) that turns the contents of the
+    dictionary into theirs. When one of them is accessed, it takes the
+    dictionary over by undoing the chain of changes that leads to it.
+
+    Updating the latest version of a table, which is what a loop does, is
+    done in constant time.
+
+    Keys are the ``literal_key()`` of the left-hand sides of the rules.
+    """
+
+    __slots__ = ("_data", "_length")
+
+    def __init__(self, rules: Iterable[Tuple[Hashable, BaseElement]] = ()):
+        self._data = dict(rules)
+        self._length = len(self._data)
+
+    def __getstate__(self):
+        return list(self.items())
+
+    def __setstate__(self, state):
+        self.__init__(state)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _reroot(self) -> dict:
+        """Take over the dictionary and return it."""
+        data = self._data
+        if isinstance(data, dict):
+            return data
+
+        # Find the table that owns the dictionary.
+        path = []
+        table = self
+        while not isinstance(table._data, dict):
+            path.append(table)
+            table = table._data[2]
+        data = table._data
+
+        # Apply the changes from there back to this table, recording
+        # in each table the change that undoes them.
+        for node in reversed(path):
+            key, rule, parent = node._data
+            old_rule = data.get(key, _ABSENT)
+            if rule is _ABSENT:
+                del data[key]
+            else:
+                data[key] = rule
+            parent._data = (key, old_rule, node)
+            node._data = data
+        return data
+
+    def get(self, key: Hashable) -> Optional[BaseElement]:
+        """Return the rule with key ``key``, or None."""
+        return self._reroot().get(key, None)
+
+    def items(self) -> Iterator[Tuple[Hashable, BaseElement]]:
+        return iter(list(self._reroot().items()))
+
+    def rules(self) -> tuple:
+        """Return the rules in order."""
+        return tuple(self._reroot().values())
+
+    def set(self, key: Hashable, rule: BaseElement) -> "AssociationTable":
+        """
+        Return a new table where the rule of ``key`` is ``rule``. A new key
+        is added at the end.
+        """
+        data = self._reroot()
+        old_rule = data.get(key, _ABSENT)
+        data[key] = rule
+
+        table = AssociationTable.__new__(AssociationTable)
+        table._data = data
+        table._length = self._length + (old_rule is _ABSENT)
+        self._data = (key, old_rule, table)
+        return table
+
+
+def association_key(key: BaseElement) -> Optional[Hashable]:
+    """
+    Return the key of ``key`` in an ``AssociationTable``, or None if it
+    can not be indexed, for example because it contains inexact numbers.
+    """
+    return literal_key(key)
+
+
+class AssociationExpression(Expression):
+    """
+    A Mathics3 Association whose rules are indexed by their key.
+
+    All the keys of the rules must have an ``association_key()``.
+    Changing the elements turns this into an ordinary Expression.
+
+    positional Arguments:
+        - table -- an AssociationTable with the rules
+    """
+
+    def __init__(self, table: AssociationTable):
+        self.options = None
+        self.pattern_sequence = False
+        self._head = SymbolAssociation
+        self.table = table
+        self._rules: Optional[tuple] = None
+        self.value = None
+        self._is_literal = None
+        self.elements_properties = ElementsProperties(
+            elements_fully_evaluated=True, is_flat=True, is_ordered=False
+        )
+        self._sequences = None
+        self._cache = None
+        self.original = None
+
+    def __getnewargs__(self):
+        return (self.table,)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_rules"] = None
+        return state
+
+    def __repr__(self) -> str:
+        return f"<AssociationExpression: {reprlib.repr(self._elements)}>"
+
+    @property
+    def _elements(self) -> tuple:
+        rules = self._rules
+        if rules is None:
+            rules = self._rules = self.table.rules()
+        return rules
+
+    @_elements.setter
+    def _elements(self, elements: tuple):
+        # Setting other elements turns this into an ordinary Association.
+        del self.table
+        del self._rules
+        self.__class__ = Expression
+        Expression.__init__(self, SymbolAssociation, *elements)
+
+    def get_rule(self, key: BaseElement) -> Optional[BaseElement]:
+        """Return the rule for ``key``, or None if it is not there."""
+        index_key = association_key(key)
+        if index_key is None:
+            return None
+        return self.table.get(index_key)
+
+    def set_rules(self, rules: Iterable[BaseElement]) -> "AssociationExpression":
+        """
+        Return a new association with ``rules`` added or replacing the
+        rules with the same keys. The keys of ``rules`` must have an
+        ``association_key()``.
+
+        The new association shares the table with this one, and is
+        evaluated if this one is.
+        """
+        table = self.table
+        cache = self._rebuild_cache()
+        symbols = set(cache.symbols)
+        for rule in rules:
+            key = rule.elements[0]
+            table = table.set(association_key(key), rule)
+            if isinstance(rule, Expression):
+                symbols.update(rule._rebuild_cache().symbols)
+        result = AssociationExpression(table)
+        result._cache = ExpressionCache(cache.time, symbols, [])
+        return result
+
+    def copy(self, reevaluate=False) -> "Expression":
+        if reevaluate:
+            return super().copy(reevaluate)
+        return AssociationExpression(self.table)
+
+    def shallow_copy(self) -> "AssociationExpression":
+        expr = AssociationExpression(self.table)
+        expr._cache = self._rebuild_cache()
+        return expr
+
+    def sameQ(self, other: BaseElement) -> bool:
+        """Mathics3 SameQ"""
+        if isinstance(other, AssociationExpression) and other.table is self.table:
+            return True
+        return super().sameQ(other)
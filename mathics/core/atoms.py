@@ -4,6 +4,8 @@
 import base64
 import math
 import re
+import sys
+import weakref
 from typing import Any, Dict, Generic, Optional, Tuple, TypeVar, Union
 
 import mpmath
@@ -41,6 +43,64 @@ SYSTEM_SYMBOLS_INPUT_OR_FULL_FORM = symbol_set(SymbolInputForm, SymbolFullForm)
 
 T = TypeVar("T")
 
+# Integers in this range are interned for the whole session. Other
+# numbers are interned weakly: they are dropped from the tables
+# once no expression refers to them.
+SMALL_INTEGER_MIN = -1024
+SMALL_INTEGER_MAX = 1024
+
+
+class InternTable(dict):
+    """
+    Table of interned atoms, indexed by their value.
+
+    Atoms are referenced weakly, so the table does not grow without bounds
+    in long sessions: an entry goes away when its atom is garbage collected.
+    Atoms stored in ``pinned`` are never released.
+    ``hits`` and ``misses`` count the lookups in the weak part of the table.
+    """
+
+    __slots__ = ("pinned", "hits", "misses", "_remove", "__weakref__")
+
+    def __init__(self):
+        super().__init__()
+        self.pinned: Dict[Any, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+        def remove(
+            ref, table_ref=weakref.ref(self), is_finalizing=sys.is_finalizing
+        ):
+            table = table_ref()
+            # Hashing some keys, like sympy.Float, runs code that is not
+            # available anymore while Python shuts down.
+            if table is None or is_finalizing():
+                return
+            # The entry may already hold a new atom with the same key.
+            if dict.get(table, ref.key) is ref:
+                del table[ref.key]
+
+        self._remove = remove
+
+    def lookup(self, key):
+        """
+        Return the atom interned under ``key``, or None.
+        """
+        ref = self.get(key)
+        if ref is not None:
+            atom = ref()
+            if atom is not None:
+                self.hits += 1
+                return atom
+        self.misses += 1
+        return None
+
+    def add(self, key, atom) -> None:
+        """
+        Intern ``atom`` under ``key``.
+        """
+        self[key] = weakref.KeyedRef(atom, self._remove, key)
+
 
 class Number(Atom, ImmutableValueMixin, NumericOperators, Generic[T]):
     """
@@ -179,26 +239,38 @@ _number_form_options = {
 class Integer(Number[int]):
     class_head_name = "System`Integer"
 
-    # Dictionary of Integer constant values defined so far.
+    # Table of the Integer values in use.
     # We use this for object uniqueness.
     # The key is the Integer's Python `int` value, and the
-    # dictionary's value is the corresponding Mathics Integer object.
-    _integers: Dict[Any, "Integer"] = {}
+    # table's value is the corresponding Mathics Integer object.
+    # Small integers are pinned in ``_integers.pinned``.
+    _integers = InternTable()
 
     # We use __new__ here to ensure that two Integer's that have the same value
     # return the same object, and to set an object hash value.
-    # Consider also @lru_cache, and mechanisms for limiting and
-    # clearing the cache and the object store which might be useful in implementing
-    # Builtin Share[].
     def __new__(cls, value) -> "Integer":
         n = int(value)
-        self = cls._integers.get(value)
+        table = cls._integers
+        if SMALL_INTEGER_MIN <= n <= SMALL_INTEGER_MAX:
+            self = table.pinned.get(n)
+        else:
+            # This is InternTable.lookup(), inlined because creating
+            # Integers is very frequent.
+            ref = table.get(n)
+            self = None if ref is None else ref()
+            if self is None:
+                table.misses += 1
+            else:
+                table.hits += 1
         if self is None:
             self = super().__new__(cls)
             self._value = n
 
             # Cache object so we don't allocate again.
-            self._integers[value] = self
+            if SMALL_INTEGER_MIN <= n <= SMALL_INTEGER_MAX:
+                table.pinned[n] = self
+            else:
+                table.add(n, self)
 
             # Set a value for self.__hash__() once so that every time
             # it is used this is fast. Note that in contrast to the
@@ -419,20 +491,24 @@ class MachineReal(Real[float]):
     # We use this for object uniqueness.
     # The key is the MachineReal's Python `float` value, and the
     # dictionary's value is the corresponding Mathics MachineReal object.
-    _machine_reals: Dict[Any, "MachineReal"] = {}
+    _machine_reals = InternTable()
 
     def __new__(cls, value) -> "MachineReal":
         n = float(value)
         if math.isinf(n) or math.isnan(n):
             raise OverflowError
 
-        self = cls._machine_reals.get(n)
+        # This is InternTable.lookup(), inlined as in Integer.
+        table = cls._machine_reals
+        ref = table.get(n)
+        self = None if ref is None else ref()
         if self is None:
+            table.misses += 1
             self = Number.__new__(cls)
             self._value = n
 
             # Cache object so we don't allocate again.
-            self._machine_reals[n] = self
+            table.add(n, self)
 
             # Set a value for self.__hash__() once so that every time
             # it is used this is fast. Note that in contrast to the
@@ -440,6 +516,8 @@ class MachineReal(Real[float]):
             # Python objects, so we include the class in the
             # event that different objects have the same Python value
             self.hash = hash((cls, n))
+        else:
+            table.hits += 1
 
         return self
 
@@ -531,17 +609,17 @@ class PrecisionReal(Real[sympy.Float]):
     # We use this for object uniqueness.
     # The key is the PrecisionReal's sympy.Float, and the
     # dictionary's value is the corresponding Mathics PrecisionReal object.
-    _precision_reals: Dict[Any, "PrecisionReal"] = {}
+    _precision_reals = InternTable()
 
     def __new__(cls, value) -> "PrecisionReal":
         n = sympy.Float(value)
-        self = cls._precision_reals.get(n)
+        self = cls._precision_reals.lookup(n)
         if self is None:
             self = Number.__new__(cls)
             self._value = n
 
             # Cache object so we don't allocate again.
-            self._precision_reals[n] = self
+            self._precision_reals.add(n, self)
 
             # Set a value for self.__hash__() once so that every time
             # it is used this is fast. Note that in contrast to the
@@ -713,7 +791,7 @@ class Complex(Number[Tuple[Number[T], Number[T], Optional[int]]]):
     # We use this for object uniqueness.
     # The key is the Complex value's real and imaginary parts as a tuple,
     # dictionary's value is the corresponding Mathics Complex object.
-    _complex_numbers: Dict[Any, "Complex"] = {}
+    _complex_numbers = InternTable()
 
     # We use __new__ here to ensure that two Integer's that have the same value
     # return the same object, and to set an object hash value.
@@ -748,7 +826,7 @@ class Complex(Number[Tuple[Number[T], Number[T], Optional[int]]]):
             )
 
         value = (real, imag, prec)
-        self = cls._complex_numbers.get(value)
+        self = cls._complex_numbers.lookup(value)
         if self is None:
             self = super().__new__(cls)
             self.real = real
@@ -757,7 +835,7 @@ class Complex(Number[Tuple[Number[T], Number[T], Optional[int]]]):
             self._value = value
 
             # Cache object so we don't allocate again.
-            self._complex_numbers[value] = self
+            self._complex_numbers.add(value, self)
 
             # Set a value for self.__hash__() once so that every time
             # it is used this is fast. Note that in contrast to the
@@ -893,29 +971,30 @@ class Complex(Number[Tuple[Number[T], Number[T], Optional[int]]]):
 class Rational(Number[sympy.Rational]):
     class_head_name = "System`Rational"
 
-    # Collection of integers defined so far.
-    _rationals: Dict[Any, "Rational"] = {}
+    # Collection of rationals in use.
+    _rationals = InternTable()
 
     # We use __new__ here to ensure that two Rationals's that have the same value
     # return the same object, and to set an object hash value.
-    # Consider also @lru_cache, and mechanisms for limiting and
-    # clearing the cache and the object store which might be useful in implementing
-    # Builtin Share[].
     def __new__(cls, numerator, denominator=1) -> "Rational":
         value = sympy.Rational(numerator, denominator)
         key = (cls, value)
-        self = cls._rationals.get(key)
+        self = cls._rationals.lookup(key)
 
         if self is None:
             self = super().__new__(cls)
             self._value = value
 
             # Cache object so we don't allocate again.
-            self._rationals[key] = self
+            self._rationals.add(key, self)
 
             # Set a value for self.__hash__() once so that every time
             # it is used this is fast.
             self.hash = hash(key)
+
+            # Converting the value to a Float is slow, so the sort key is
+            # built once, when it is first needed.
+            self._sort_key = None
         return self
 
     # __hash__ is defined so that we can store Number-derived objects
@@ -957,8 +1036,11 @@ class Rational(Number[sympy.Rational]):
         if pattern_sort:
             return super().get_sort_key(True)
         else:
-            # HACK: otherwise "Bus error" when comparing 1==1.
-            return (0, 0, sympy.Float(self.value), 0, 1)
+            sort_key = self._sort_key
+            if sort_key is None:
+                # HACK: otherwise "Bus error" when comparing 1==1.
+                sort_key = self._sort_key = (0, 0, sympy.Float(self.value), 0, 1)
+            return sort_key
 
     def do_copy(self) -> "Rational":
         return Rational(self.value)
@@ -996,6 +1078,15 @@ NUMERICAL_CONSTANTS = {
     Symbol("System`$MinMachineNumber"): MachineReal(MIN_MACHINE_NUMBER),
 }
 
+# Interning tables of the number atoms, indexed by the name of their head.
+NUMBER_INTERN_TABLES: Dict[str, InternTable] = {
+    "Integer": Integer._integers,
+    "MachineReal": MachineReal._machine_reals,
+    "PrecisionReal": PrecisionReal._precision_reals,
+    "Rational": Rational._rationals,
+    "Complex": Complex._complex_numbers,
+}
+
 
 class String(Atom, BoxElementMixin):
     value: str
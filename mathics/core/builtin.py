@@ -8,10 +8,12 @@ SympyFunction, MPMathFunction, etc.
 
 import importlib
 import importlib.util
+import math
 import re
 from abc import ABC
+from fractions import Fraction
 from functools import total_ordering
-from itertools import chain
+from itertools import chain, count
 from types import ModuleType
 from typing import (
     Any,
@@ -47,6 +49,7 @@ from mathics.core.atoms import (
     MachineReal,
     Number,
     PrecisionReal,
+    Rational,
     String,
 )
 from mathics.core.attributes import (
@@ -60,10 +63,11 @@ from mathics.core.convert.expression import to_expression
 from mathics.core.convert.op import ascii_operator_to_symbol, operator_to_unicode
 from mathics.core.convert.python import from_bool
 from mathics.core.convert.sympy import from_sympy
-from mathics.core.definitions import Definition, Definitions
+from mathics.core.definitions import Definition, Definitions, ScopingFrame
 from mathics.core.evaluation import Evaluation
 from mathics.core.exceptions import MessageException
 from mathics.core.expression import Expression
+from mathics.core.expression_predefined import MATHICS3_INFINITY
 from mathics.core.interrupt import BreakInterrupt, ContinueInterrupt, ReturnInterrupt
 from mathics.core.list import ListExpression
 from mathics.core.number import PrecisionValueError, dps, get_precision, min_prec
@@ -207,11 +211,31 @@ class Builtin:
     options: Dict[str, Any] = {}
     defaults: Dict[Optional[int], str] = {}
 
+    # Listable builtins can define a method ``vectorized_function`` that
+    # evaluates them over packed arrays without unpacking them.
+    # It gets the arguments as NumPy arrays or Python numbers, and returns
+    # a NumPy array, or None if the result must be found by threading.
+    # See mathics.core.list.eval_vectorized().
+    vectorized_function: Optional[Callable] = None
+
+    # Builtins whose result depends only on their arguments: they have no
+    # side effects, and do not use the value of any other symbol. Their
+    # calls on numbers and strings can be kept in the evaluation cache,
+    # see mathics.core.evaluation_cache.EvaluationCache.
+    pure: bool = False
+
     def __getnewargs_ex__(self):
         return tuple(), {
             "expression": False,
         }
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Builtins in mathics.builtin are in the System` context, even
+        # if their module was imported but not loaded lazily yet.
+        if not cls.context and cls.__module__.startswith("mathics.builtin."):
+            cls.context = "System`"
+
     def __new__(cls, *args, **kwargs):
         # comment @mmatera:
         # The goal of this method is to allow to build expressions
@@ -663,6 +687,7 @@ class MPMathFunction(SympyFunction):
     # InverseErf or InverseErfc.
     # So those classes should expclicitly set/override this.
     attributes = A_LISTABLE | A_NUMERIC_FUNCTION | A_PROTECTED
+    pure = True
 
     mpmath_name: Optional[str] = None
     nargs = {1}
@@ -947,6 +972,79 @@ class AtomBuiltin(Builtin):
         return re.sub(r"Atom$", "", name)
 
 
+def _to_python_number(number: BaseElement) -> Union[int, float, Fraction, None]:
+    """
+    Convert an Integer, a Rational or a MachineReal to the Python number
+    with the same arithmetic. Return None for any other element.
+    """
+    if isinstance(number, (Integer, MachineReal)):
+        return number.value
+    if isinstance(number, Rational):
+        value = number.value
+        if isinstance(value, sympy.Rational):
+            return Fraction(int(value.p), int(value.q))
+    return None
+
+
+def _from_python_number(value: Union[int, float, Fraction]) -> Number:
+    """
+    Convert the result of _to_python_number() arithmetic back to an atom.
+    """
+    if isinstance(value, Fraction):
+        if value.denominator == 1:
+            return Integer(value.numerator)
+        return Rational(value.numerator, value.denominator)
+    if isinstance(value, float):
+        return MachineReal(value)
+    return Integer(value)
+
+
+def get_iteration_values(
+    imin: BaseElement,
+    di: BaseElement,
+    normalised_range: BaseElement,
+    evaluation: Evaluation,
+) -> Optional[Iterable[BaseElement]]:
+    """
+    Return the values taken by the index of the iterator {i, imin, imax, di},
+    with `normalised_range` the evaluated value of Chop[(imax - imin) / di].
+
+    When `imin` and `di` are integers, rationals or machine reals, and the
+    number of steps is a number or infinity, the values are computed with
+    Python arithmetic, which gives the same result as Plus[imin, Times[di, k]].
+    Otherwise, return None.
+    """
+    start = _to_python_number(imin)
+    step = _to_python_number(di)
+    if start is None or step is None:
+        return None
+
+    if normalised_range.sameQ(MATHICS3_INFINITY):
+        steps: Iterable[int] = count(1)
+    else:
+        last_range = _to_python_number(normalised_range)
+        if last_range is None:
+            return None
+        last = math.floor(last_range)
+        if isinstance(last_range, float):
+            # Decide the last step with the same comparison used in
+            # the general case.
+            while (
+                Expression(
+                    SymbolLessEqual, Integer(last + 1), normalised_range
+                ).evaluate(evaluation)
+                is SymbolTrue
+            ):
+                last += 1
+        if last < 0:
+            return ()
+        steps = range(1, last + 1)
+
+    return chain(
+        (imin,), (_from_python_number(start + step * index) for index in steps)
+    )
+
+
 class IterationFunction(Builtin, ABC):
     attributes = A_HOLD_ALL | A_PROTECTED
     allow_loopcontrol = False
@@ -1087,6 +1185,10 @@ class IterationFunction(Builtin, ABC):
             ),
         ).evaluate(evaluation)
 
+        index_values = get_iteration_values(imin, di, normalised_range, evaluation)
+        if index_values is not None:
+            return self.iterate_values(expr, i, index_values, evaluation)
+
         result = []
         while True:
             cont = Expression(SymbolLessEqual, index, normalised_range).evaluate(
@@ -1137,27 +1239,46 @@ class IterationFunction(Builtin, ABC):
         "%(name)s[expr_, {i_Symbol, {items___}}]"
 
         items = items.evaluate(evaluation).get_sequence()
+        return self.iterate_values(expr, i, items, evaluation)
+
+    def iterate_values(
+        self, expr, i: Symbol, values: Iterable[BaseElement], evaluation: Evaluation
+    ):
+        """
+        Evaluate `expr` with `i` taking each of `values`, and return the
+        result of the iteration.
+
+        This does the same as calling dynamic_scoping() for each value,
+        but `i` is bound once for the whole loop, and only its value is
+        replaced at each step.
+        """
+        name = i.name
+        frame = ScopingFrame(evaluation.definitions)
         result = []
-        for item in items:
-            evaluation.check_stopped()
-            try:
-                item = dynamic_scoping(expr.evaluate, {i.name: item}, evaluation)
-                result.append(item)
-            except ContinueInterrupt:
-                if self.allow_loopcontrol:
-                    pass
-                else:
-                    raise
-            except BreakInterrupt:
-                if self.allow_loopcontrol:
-                    break
-                else:
-                    raise
-            except ReturnInterrupt as e:
-                if self.allow_loopcontrol:
-                    return e.expr
-                else:
-                    raise
+        try:
+            frame.bind(name)
+            for value in values:
+                evaluation.check_stopped()
+                frame.set_value(name, value.evaluate(evaluation))
+                try:
+                    result.append(expr.evaluate(evaluation))
+                except ContinueInterrupt:
+                    if self.allow_loopcontrol:
+                        pass
+                    else:
+                        raise
+                except BreakInterrupt:
+                    if self.allow_loopcontrol:
+                        break
+                    else:
+                        raise
+                except ReturnInterrupt as e:
+                    if self.allow_loopcontrol:
+                        return e.expr
+                    else:
+                        raise
+        finally:
+            frame.exit()
         return self.get_result(result)
 
     def eval_multi(self, expr, first, sequ, evaluation):
@@ -1,12 +1,19 @@
 """
 Convert expressions to Python regular expressions
+
+String functions like ``StringReplace`` are often mapped over many strings
+with the same patterns. The translation of a pattern into a regular
+expression, and its compilation, are kept in ``REGEX_CACHE``, keyed on the
+pattern, so that they are done once.
 """
 import re
 from binascii import hexlify
-from typing import Callable, Optional
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Union
 
 from mathics.core.atoms import String
 from mathics.core.expression import Expression
+from mathics.core.rule_index import literal_key
 from mathics.core.symbols import Symbol
 from mathics.core.systemsymbols import (
     SymbolBlank,
@@ -53,10 +60,71 @@ REGEXP_FOR_SYMBOLS = {
 }
 
 
+class RegexCache:
+    """
+    Least-recently-used table mapping string patterns to their regular
+    expressions, as strings or compiled with some flags.
+
+    ``hits`` and ``misses`` count the lookups.
+    """
+
+    __slots__ = ("entries", "max_size", "hits", "misses")
+
+    def __init__(self, max_size: int):
+        self.entries: OrderedDict = OrderedDict()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        self.entries.clear()
+
+    def add(self, key: Hashable, regex: Union[str, re.Pattern]) -> None:
+        """Store the regular expression ``regex`` for ``key``."""
+        entries = self.entries
+        entries[key] = regex
+        if len(entries) > self.max_size:
+            entries.popitem(last=False)
+
+    def lookup(self, key: Hashable) -> Optional[Union[str, re.Pattern]]:
+        """Return the regular expression stored for ``key``, or None."""
+        regex = self.entries.get(key)
+        if regex is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return regex
+
+
+REGEX_CACHE = RegexCache(512)
+
+
 def _encode_pname(name):
     return "n" + hexlify(name.encode("utf8")).decode("utf8")
 
 
+def _cache_key(expr, q, abbreviated_patterns, flags) -> Optional[Hashable]:
+    """
+    Return the key of a pattern in ``REGEX_CACHE``, or None if it can not
+    be cached. ``flags`` is None for the regular expression as a string.
+    """
+    if q is _regex_longest:
+        quantifiers = "longest"
+    elif q is _regex_shortest:
+        quantifiers = "shortest"
+    else:
+        return None
+    pattern_key = literal_key(expr)
+    if pattern_key is None:
+        return None
+    return (pattern_key, quantifiers, abbreviated_patterns, flags)
+
+
 def to_regex(
     expr: Expression,
     q=_regex_longest,
@@ -71,16 +139,77 @@ def to_regex(
     if expr is None:
         return None
 
+    key = None
     if groups is None:
+        # The groups found are not asked for, so the result only depends
+        # on the pattern.
+        key = _cache_key(expr, q, abbreviated_patterns, None)
+        if key is not None:
+            result = REGEX_CACHE.lookup(key)
+            if result is not None:
+                return result
         groups = {}
 
-    result = to_regex_internal(expr, q, groups, abbreviated_patterns, show_message)
+    messages = []
+
+    def record_message(*args):
+        messages.append(args)
+        if show_message is not None:
+            show_message(*args)
+
+    result = to_regex_internal(expr, q, groups, abbreviated_patterns, record_message)
     if result is None:
         return None
 
+    # Patterns that give messages are translated again, to give them again.
+    if key is not None and not messages:
+        REGEX_CACHE.add(key, result)
     return result
 
 
+def compile_regex(
+    expr: Expression,
+    flags: int = 0,
+    q=_regex_longest,
+    abbreviated_patterns=False,
+    show_message: Optional[Callable] = None,
+) -> Optional[re.Pattern]:
+    """
+    Convert an expression into a Python regular expression, and return it
+    compiled with ``flags``. None is returned if there is an error of some
+    sort.
+    """
+    if expr is None:
+        return None
+
+    key = _cache_key(expr, q, abbreviated_patterns, flags)
+    if key is not None:
+        compiled = REGEX_CACHE.lookup(key)
+        if compiled is not None:
+            return compiled
+
+    messages = []
+
+    def record_message(*args):
+        messages.append(args)
+        if show_message is not None:
+            show_message(*args)
+
+    regex = to_regex(
+        expr,
+        q=q,
+        abbreviated_patterns=abbreviated_patterns,
+        show_message=record_message,
+    )
+    if regex is None:
+        return None
+    compiled = re.compile(regex, flags)
+
+    if key is not None and not messages:
+        REGEX_CACHE.add(key, compiled)
+    return compiled
+
+
 # Note: the code below must not introduct
 # re global flag like ?u or ?i.
 def to_regex_internal(
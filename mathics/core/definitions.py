@@ -6,9 +6,13 @@ groups of `Definitions`.
 
 import base64
 import bisect
+import hashlib
+import os
 import os.path as osp
 import pickle
 import re
+import sys
+import tempfile
 from collections import defaultdict
 from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
 
@@ -18,7 +22,16 @@ from mathics.core.atoms import Integer, String
 from mathics.core.attributes import A_NO_ATTRIBUTES
 from mathics.core.convert.expression import to_mathics_list
 from mathics.core.element import BaseElement, fully_qualified_symbol_name
-from mathics.core.load_builtin import definition_contribute, mathics3_builtins_modules
+from mathics.core.evaluation_cache import EvaluationCache
+from mathics.core.load_builtin import (
+    definition_contribute,
+    failed_builtin_modules,
+    get_lazy_builtin_names,
+    get_required_packages,
+    load_lazy_builtin_module,
+    mathics3_builtins_modules,
+)
+from mathics.core.rule_index import RuleIndex
 from mathics.core.rules import BaseRule, Rule
 from mathics.core.symbols import Atom, Symbol, strip_context
 from mathics.core.util import canonic_filename
@@ -30,6 +43,13 @@ OutputForms: Set[Symbol] = set()
 # The contents of $PrintForms. FormMeta in mathics.base.forms adds to this.
 PrintForms: Set[Symbol] = set()
 
+# Rule lists that can be looked up through a ``RuleIndex``.
+INDEXED_POSITIONS = ("downvalues", "upvalues")
+
+# Below this number of rules, it is cheaper to try all of them
+# than to look them up in a ``RuleIndex``.
+RULE_INDEX_THRESHOLD = 8
+
 
 class Definition:
     """
@@ -65,6 +85,7 @@ class Definition:
         self.attributes = attributes
         self.builtin = builtin
         self.changed = 0
+        self.rule_indices: Dict[str, RuleIndex] = {}
         for rule in rules:
             if not self.add_rule(rule):
                 print(f"{rule.pattern.expr} could not be associated with {self.name}")
@@ -78,13 +99,56 @@ class Definition:
         """Set one of the value lists"""
         assert pos.isalpha()
         setattr(self, pos, rules)
+        self.rule_indices.pop(pos, None)
+
+    def get_rule_index(self, position: str) -> Optional[RuleIndex]:
+        """
+        Return the index of the rules in `position` if it exists
+        and is up to date. Otherwise, return None.
+        """
+        index = self.rule_indices.get(position)
+        if index is None:
+            return None
+        if not index.is_valid_for(self.get_values_list(position)):
+            del self.rule_indices[position]
+            return None
+        return index
+
+    def get_candidate_rules(
+        self, position: str, expression: BaseElement, attributes: int
+    ) -> List[BaseRule]:
+        """
+        Return the rules in `position` that could match `expression`, in
+        the order they must be tried. `attributes` are the attributes of the
+        head of `expression`.
+
+        For long lists of downvalues and upvalues, the candidates are found
+        through a `RuleIndex`, which is built on the first lookup and kept
+        up to date when rules are added or removed.
+        """
+        rules = self.get_values_list(position)
+        if len(rules) < RULE_INDEX_THRESHOLD or position not in INDEXED_POSITIONS:
+            return rules
+        index = self.get_rule_index(position)
+        if index is None:
+            index = self.rule_indices[position] = RuleIndex(rules)
+        return index.get_candidates(expression, attributes)
 
     def add_rule_at(self, rule: BaseRule, position: str) -> bool:
         """
         Add `rule` to the set of rules in `position`
         """
         values = self.get_values_list(position)
-        insert_rule(values, rule)
+        index = self.get_rule_index(position)
+        if (
+            index is None
+            and position in INDEXED_POSITIONS
+            and len(values) >= RULE_INDEX_THRESHOLD
+        ):
+            index = self.rule_indices[position] = RuleIndex(values)
+        insert_position, replaced = insert_rule(values, rule, index)
+        if index is not None:
+            index.insert(insert_position, replaced)
         return True
 
     def add_rule(self, rule: BaseRule) -> bool:
@@ -99,12 +163,25 @@ class Definition:
         position = get_tag_position(lhs, self.name)
         if position:
             values = self.get_values_list(position)
+            rule_index = self.get_rule_index(position)
             for index, existing in enumerate(values):
                 if existing.pattern.expr.sameQ(lhs):
                     del values[index]
+                    if rule_index is not None:
+                        rule_index.remove(existing)
                     return True
         return False
 
+    def __getstate__(self):
+        # Rule indices are rebuilt on demand.
+        state = self.__dict__.copy()
+        state["rule_indices"] = {}
+        return state
+
+    def __setstate__(self, state):
+        state.setdefault("rule_indices", {})
+        self.__dict__.update(state)
+
     def __repr__(self) -> str:
         repr_str = (
             "<Definition: name: {},"
@@ -151,10 +228,32 @@ class Definitions:
         self.builtin: Dict[str, Definition] = {}
         self.user: Dict[str, Definition] = {}
         self.pymathics: Dict[str, Definition] = {}
+        # Names of the builtin symbols whose module was not loaded yet,
+        # mapped to the name of that module.
+        self.lazy_builtins: Dict[str, str] = {}
         self.definitions_cache: Dict[str, Definition] = {}
         self.lookup_cache: Dict[str, str] = {}
         self.proxy: Dict[str, Set[str]] = defaultdict(set)
         self.now = 0  # increments whenever something is updated
+        # The value of `now` when the definition of each symbol last
+        # changed. Symbols that are not here never changed. The symbols
+        # are kept in the order of their last change.
+        self.changed_epochs: Dict[str, int] = {}
+        # The value of `now` at the last change not made by a
+        # ScopingFrame, and the names of the symbols that were
+        # ever bound by a ScopingFrame.
+        self.last_unscoped_change = 0
+        self.scoped_names: Set[str] = set()
+        # The temporary symbols created by Module[] that may still be
+        # referenced, in the order of their creation, with their serial
+        # number. See mathics.eval.scoping.
+        self.temporaries: Dict[str, int] = {}
+        self.temporaries_created = 0
+        self.temporaries_reclaimed = 0
+        # The number of temporary symbols left after the last collection
+        # at the end of an evaluation.
+        self.temporaries_kept = 0
+        self.evaluation_cache = EvaluationCache()
         self._packages: List[str] = []
         self.current_context = "Global`"
         self.context_path: Tuple[str, ...] = (
@@ -211,11 +310,16 @@ class Definitions:
         # contexts that are actually not affected. still, this is a
         # safe solution.
 
+        # The evaluation cache (self.evaluation_cache) keeps the results
+        # of calls to builtins, which depend on their definition.
+
         if name is None:
             self.definitions_cache = {}
             self.lookup_cache = {}
             self.proxy = defaultdict(set)
+            self.evaluation_cache.clear()
         else:
+            self.evaluation_cache.invalidate(name)
             definitions_cache = self.definitions_cache
             lookup_cache = self.lookup_cache
             tail = strip_context(name)
@@ -244,14 +348,18 @@ class Definitions:
         that, then things have changed since the evaluation started
         and evaluation may lead to a different result.
         """
+        # Nothing at all has changed since the evaluation.
+        if last_evaluated_time >= self.now:
+            return False
+
+        # Only the values of dynamically scoped symbols changed since
+        # the evaluation, as when a loop variable takes its next value.
+        if last_evaluated_time >= self.last_unscoped_change:
+            symbols = self.scoped_names.intersection(symbols)
+
+        changed_epochs = self.changed_epochs
         for name in symbols:
-            try:
-                symbol = self.get_definition(name, only_if_exists=True)
-            except KeyError:
-                # "symbol" doesn't exist, so it was never changed.
-                continue
-            # Get timestamp for the most-recently changed part of the given expression.
-            if symbol.changed > last_evaluated_time:
+            if changed_epochs.get(name, 0) > last_evaluated_time:
                 return True
 
         return False
@@ -292,7 +400,7 @@ class Definitions:
 
     def get_builtin_names(self) -> set:
         """Return a set of builtin symbol names"""
-        return set(self.builtin)
+        return set(self.builtin) | set(self.lazy_builtins)
 
     def get_user_names(self) -> set:
         """Return a set of user symbol names"""
@@ -484,6 +592,8 @@ class Definitions:
 
         original_name = name
         name = self.lookup_name(name)
+        if name in self.lazy_builtins:
+            self.load_lazy_builtins(name)
         user = self.user.get(name, None)
         pymathics = self.pymathics.get(name, None)
         builtin = self.builtin.get(name, None)
@@ -516,6 +626,30 @@ class Definitions:
 
         return definition
 
+    def load_lazy_builtins(self, name: str) -> None:
+        """
+        Load the definitions of the builtins in the module
+        that defines the symbol `name`.
+        """
+        module_name = self.lazy_builtins[name]
+        self.lazy_builtins = {
+            lazy_name: lazy_module
+            for lazy_name, lazy_module in self.lazy_builtins.items()
+            if lazy_module != module_name
+        }
+        for builtin in load_lazy_builtin_module(module_name):
+            builtin.contribute(self)
+        self.clear_cache()
+
+    def get_builtin_definition(self, name: str) -> Optional[Definition]:
+        """
+        Return the builtin definition of the symbol with the fully
+        qualified name `name`, or None if it is not a builtin.
+        """
+        if name in self.lazy_builtins:
+            self.load_lazy_builtins(name)
+        return self.builtin.get(name)
+
     def get_attributes(self, name: str) -> int:
         """
         Return the integer representing the
@@ -540,6 +674,17 @@ class Definitions:
         """Return the list of upvalues"""
         return self.get_definition(name).upvalues
 
+    def get_candidate_rules(
+        self, name: str, position: str, expression: BaseElement, attributes: int
+    ) -> List[BaseRule]:
+        """
+        Return the rules in the list `position` of the Symbol `name` which
+        could match `expression`. See `Definition.get_candidate_rules`.
+        """
+        return self.get_definition(name).get_candidate_rules(
+            position, expression, attributes
+        )
+
     def get_formats(self, name: str, format_name="") -> List[BaseRule]:
         """
         Return a list of format rules associated with `name`.
@@ -607,25 +752,61 @@ class Definitions:
 
         if not create:
             raise KeyError(name)
-        builtin = self.builtin.get(name)
+        self.user[name] = self.new_user_definition(name)
+        self.clear_cache(name)
+        return self.user[name]
+
+    def new_user_definition(self, name: str) -> Definition:
+        """
+        Return a new, empty user definition for `name`, with the attributes
+        of the builtin definition of `name`. The definition is not stored.
+        """
+        builtin = self.get_builtin_definition(name)
         if builtin:
             attributes = builtin.attributes
             is_numeric = builtin.is_numeric
         else:
             attributes = A_NO_ATTRIBUTES
             is_numeric = False
-        self.user[name] = Definition(
+        return Definition(
             name=name,
             attributes=attributes,
             is_numeric=is_numeric,
         )
-        self.clear_cache(name)
-        return self.user[name]
 
     def mark_changed(self, definition: Definition) -> None:
         """Mark a definition change"""
+        self.advance_epoch(definition)
+        self.last_unscoped_change = self.now
+
+    def mark_scoped_change(self, definition: Definition) -> None:
+        """
+        Mark a change of the definition of a dynamically scoped symbol.
+        Cached expressions that do not contain the symbol remain valid.
+        """
+        self.scoped_names.add(definition.name)
+        self.advance_epoch(definition)
+
+    def advance_epoch(self, definition: Definition) -> None:
+        """Advance `now`, and record it as the time of the change of `definition`."""
         self.now += 1
         definition.changed = self.now
+        changed_epochs = self.changed_epochs
+        changed_epochs.pop(definition.name, None)
+        changed_epochs[definition.name] = self.now
+        self.evaluation_cache.invalidate(definition.name)
+
+    def get_changed_names(self, epoch: int) -> List[str]:
+        """
+        Return the names of the symbols whose definition changed
+        after `epoch`, from the latest change to the earliest one.
+        """
+        names = []
+        for name, changed in reversed(self.changed_epochs.items()):
+            if changed <= epoch:
+                break
+            names.append(name)
+        return names
 
     def reset_user_definition(self, name: str) -> None:
         """Remove the user definition associated with the Symbol `name`"""
@@ -748,6 +929,10 @@ class Definitions:
             self.user = pickle.loads(base64.decodebytes(definitions.encode("ascii")))
         else:
             self.user = {}
+        for name, definition in self.user.items():
+            self.now = max(self.now, definition.changed)
+            self.changed_epochs[name] = definition.changed
+        self.last_unscoped_change = self.now
         self.clear_cache()
 
     def get_ownvalue(self, name: str) -> BaseElement:
@@ -829,6 +1014,85 @@ class Definitions:
         return history_length
 
 
+class ScopingFrame:
+    """
+    The dynamic bindings of a group of symbols, as made by Block[] and by
+    the iterators of Table[], Do[], Sum[], etc.
+
+    ``bind()`` saves the user definition of a symbol and replaces it with
+    an empty one, and ``exit()`` puts the saved definitions back.
+
+    While the frame is active, ``set_value()`` replaces the ownvalue of a
+    bound symbol in place. The definitions cache is kept, and the change
+    is marked with ``Definitions.mark_scoped_change()``, so cached
+    expressions that do not contain the symbol are not evaluated again.
+    """
+
+    __slots__ = ("definitions", "saved", "installed", "merged")
+
+    def __init__(self, definitions: Definitions) -> None:
+        self.definitions = definitions
+        # The user definitions of the bound symbols before the frame.
+        self.saved: Dict[str, Definition] = {}
+        # The definitions installed by the frame, with the time of their
+        # last change made by the frame.
+        self.installed: Dict[str, Tuple[Definition, int]] = {}
+        # Bound symbols whose definition is merged with a builtin one.
+        self.merged: Set[str] = set()
+
+    def bind(self, name: str, value: Optional[BaseElement] = None) -> None:
+        """
+        Bind the symbol `name`, with the ownvalue `value`, or without
+        any value if `value` is None.
+        """
+        definitions = self.definitions
+        if name not in self.saved:
+            self.saved[name] = definitions.get_user_definition(name)
+            if (
+                name in definitions.builtin
+                or name in definitions.pymathics
+                or name in definitions.lazy_builtins
+            ):
+                self.merged.add(name)
+        self.install(name, value)
+
+    def install(self, name: str, value: Optional[BaseElement]) -> None:
+        """Replace the user definition of `name` with a new one, with `value`."""
+        definitions = self.definitions
+        definition = definitions.new_user_definition(name)
+        if value is not None:
+            definition.ownvalues = [Rule(Symbol(name), value)]
+        definitions.user[name] = definition
+        definitions.clear_cache(name)
+        definitions.mark_scoped_change(definition)
+        self.installed[name] = (definition, definition.changed)
+
+    def set_value(self, name: str, value: BaseElement) -> None:
+        """Set the ownvalue of the bound symbol `name` to `value`."""
+        definitions = self.definitions
+        definition, changed = self.installed[name]
+        # If the definition was changed or removed by other means, as in
+        # Do[i = 5, {i, 3}], a new definition is installed.
+        if definitions.user.get(name) is not definition or (
+            definition.changed != changed
+        ):
+            self.install(name, value)
+            return
+        definition.ownvalues = [Rule(Symbol(name), value)]
+        definitions.mark_scoped_change(definition)
+        self.installed[name] = (definition, definition.changed)
+        if name in self.merged:
+            definitions.clear_definitions_cache(name)
+
+    def exit(self) -> None:
+        """Restore the definitions of the bound symbols."""
+        definitions = self.definitions
+        for name, definition in self.saved.items():
+            definitions.user[name] = definition
+            definitions.clear_cache(name)
+            definitions.mark_scoped_change(definition)
+
+
 def _valuesname(name: str) -> str:
     """'NValues' -> 'n'"""
     assert name.startswith("System`"), name
@@ -972,7 +1236,9 @@ def get_tag_position(pattern: BaseElement, name: str) -> Optional[str]:
     return None
 
 
-def insert_rule(values: List[BaseRule], rule: BaseRule) -> None:
+def insert_rule(
+    values: List[BaseRule], rule: BaseRule, rule_index: Optional[RuleIndex] = None
+) -> Tuple[int, Optional[BaseRule]]:
     """
     Add a new rule inside a list of values.
     Rules are sorted in a way that the first elements
@@ -987,16 +1253,35 @@ def insert_rule(values: List[BaseRule], rule: BaseRule) -> None:
         A list of rules.
     rule : Rule
         A new rule.
+    rule_index : Optional[RuleIndex]
+        An up-to-date index over `values`, used to look for
+        an existing rule with the same pattern.
 
-    """
+    Returns
+    -------
+    Tuple[int, Optional[BaseRule]]
+        The position where `rule` was inserted, and the
+        rule it replaced, if any.
 
-    for index, existing in enumerate(values):
-        if existing.pattern.sameQ(rule.pattern):
-            del values[index]
-            break
-    # use insort_left to guarantee that if equal rules exist, newer rules will
+    """
+    replaced = None
+    if rule_index is None:
+        for index, existing in enumerate(values):
+            if existing.pattern.sameQ(rule.pattern):
+                replaced = existing
+                del values[index]
+                break
+    else:
+        for existing in rule_index.get_same_pattern_candidates(rule):
+            if existing.pattern.sameQ(rule.pattern):
+                replaced = existing
+                del values[rule_index.find(existing)]
+                break
+    # use bisect_left to guarantee that if equal rules exist, newer rules will
     # get higher precedence by being inserted before them. see DownValues[].
-    bisect.insort_left(values, rule)
+    position = bisect.bisect_left(values, rule)
+    values.insert(position, rule)
+    return position, replaced
 
 
 def merge_definitions(candidates: List[Definition]) -> Definition:
@@ -1058,6 +1343,124 @@ def merge_definitions(candidates: List[Definition]) -> Definition:
     )
 
 
+# Cached result of ``get_builtin_sources_digest()``.
+_builtin_snapshot_key: Optional[str] = None
+
+
+def get_builtin_snapshot_key() -> str:
+    """
+    Return a key identifying the builtin definitions of this
+    installation: it changes with the Mathics3 version, the Python
+    version, the contents of the modules and autoload files that
+    build the definitions, the packages available among those that
+    the builtins require, and the system character encoding.
+
+    The encoding is taken twice: the value it had when the builtin modules
+    were imported, which some of their rules keep, and its current value,
+    which a session can change before the definitions are built.
+    """
+    import mathics.settings
+    from mathics.builtin.atomic.strings import (
+        SYSTEM_CHARACTER_ENCODING as builtin_character_encoding,
+    )
+    from mathics.core.builtin import check_requires_list
+
+    global _builtin_snapshot_key
+    if _builtin_snapshot_key is None:
+        _builtin_snapshot_key = get_builtin_sources_digest()
+    # The builtins that require a missing package are stored with a
+    # function that reports it.
+    available_packages = " ".join(
+        package for package in get_required_packages() if check_requires_list([package])
+    )
+    return (
+        f"{_builtin_snapshot_key} {builtin_character_encoding} "
+        f"{mathics.settings.SYSTEM_CHARACTER_ENCODING} [{available_packages}]"
+    )
+
+
+def get_builtin_sources_digest() -> str:
+    """
+    Return a digest of the Mathics3 and Python versions and of the
+    sources of the builtin definitions.
+    """
+    from mathics.core.parser.operators import operator_tables_path
+    from mathics.settings import ENABLE_FILES_MODULE
+    from mathics.version import __version__
+
+    digest = hashlib.sha256()
+    digest.update(f"{__version__} {sys.version} {ENABLE_FILES_MODULE}".encode())
+    paths = [operator_tables_path]
+    for subdir in ("autoload", "builtin", "core", "eval"):
+        for root, dirs, files in os.walk(osp.join(ROOT_DIR, subdir)):
+            dirs.sort()
+            paths.extend(
+                osp.join(root, f) for f in sorted(files) if f.endswith((".py", ".m"))
+            )
+    for path in paths:
+        digest.update(osp.relpath(path, ROOT_DIR).encode())
+        with open(path, "rb") as snapshot_source:
+            digest.update(snapshot_source.read())
+    return digest.hexdigest()
+
+
+def load_builtin_snapshot(self: Definitions, builtin_filename: str) -> bool:
+    """
+    Load the builtin definitions from the snapshot stored in
+    `builtin_filename`. Return False if the file does not exist or
+    was built from a different version of the builtins.
+    """
+    from mathics.builtin.files_io.importexport import EXPORTERS, IMPORTERS
+
+    try:
+        with open(builtin_filename, "rb") as builtin_file:
+            if pickle.load(builtin_file) != get_builtin_snapshot_key():
+                return False
+            snapshot = pickle.load(builtin_file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return False
+
+    self.builtin = snapshot["builtin"]
+    self.now = self.last_unscoped_change = snapshot["now"]
+    # The formats registered by the autoload files.
+    IMPORTERS.update(snapshot["importers"])
+    EXPORTERS.update(snapshot["exporters"])
+    self.changed_epochs = {
+        name: definition.changed
+        for name, definition in self.builtin.items()
+        if definition.changed
+    }
+    self.clear_cache()
+    return True
+
+
+def save_builtin_snapshot(self: Definitions, builtin_filename: str):
+    """
+    Store the builtin definitions in `builtin_filename`. The file is
+    replaced atomically, so concurrent sessions never see a partial
+    snapshot. Failures to write it are ignored.
+    """
+    from mathics.builtin.files_io.importexport import EXPORTERS, IMPORTERS
+
+    snapshot = {
+        "builtin": self.builtin,
+        "now": self.now,
+        "importers": IMPORTERS,
+        "exporters": EXPORTERS,
+    }
+    try:
+        directory = osp.dirname(osp.abspath(builtin_filename))
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=directory, suffix=".tmp", delete=False
+        ) as builtin_file:
+            pickle.dump(get_builtin_snapshot_key(), builtin_file, -1)
+            pickle.dump(snapshot, builtin_file, -1)
+        os.replace(builtin_file.name, builtin_filename)
+    except (OSError, pickle.PicklingError):
+        pass
+
+
 def load_builtin_definitions(
     self: Definitions,
     builtin_filename: Optional[str] = None,
@@ -1065,28 +1468,35 @@ def load_builtin_definitions(
 ):
     """
     Load definitions from Builtin classes, autoload files and extension modules.
+
+    If `builtin_filename` is given, the builtin definitions obtained after
+    loading the autoload files are read from this snapshot file, or stored
+    there if the snapshot is missing or out of date. Snapshots are not used
+    when extension modules are loaded, when some builtin modules are
+    loaded lazily, or when some builtin modules could not be imported.
     """
-    from mathics.eval.files_io.files import get_file_time
+    from mathics.core.load_builtin import import_and_load_builtins
     from mathics.eval.pymathics import PyMathicsLoadException, load_pymathics_module
     from mathics.session import autoload_files
 
-    loaded = False
-    if builtin_filename is not None:
-        builtin_dates = [
-            get_file_time(module.__file__) for module in mathics3_builtins_modules
-        ]
-        builtin_time = max(builtin_dates)
-        if get_file_time(builtin_filename) > builtin_time:
-            with open(builtin_filename, "rb") as builtin_file:
-                self.builtin = pickle.load(builtin_file)
-            loaded = True
-    if not loaded:
-        definition_contribute(self)
-        for module in extension_modules:
-            load_pymathics_module(self, module)
-
-        if builtin_filename is not None:
-            with open(builtin_filename, "wb") as builtin_file:
-                pickle.dump(self.builtin, builtin_file, -1)
+    if not mathics3_builtins_modules:
+        import_and_load_builtins()
+
+    self.lazy_builtins = get_lazy_builtin_names()
+    if (
+        extension_modules
+        or self.lazy_builtins
+        or failed_builtin_modules
+        or not builtin_filename
+    ):
+        builtin_filename = None
+    elif load_builtin_snapshot(self, builtin_filename):
+        return
+
+    definition_contribute(self)
+    for module in extension_modules:
+        load_pymathics_module(self, module)
 
     autoload_files(self, ROOT_DIR, "autoload")
+    if builtin_filename is not None:
+        save_builtin_snapshot(self, builtin_filename)
@@ -213,6 +213,8 @@ class BaseElement(KeyComparable, ABC):
     unevaluated: bool
     # this variable holds a function defined in mathics.core.expression that creates an expression
     create_expression: Any
+    # True for the packed arrays in mathics.core.list.PackedListExpression
+    is_packed: bool = False
 
     def do_apply_rules(
         self, rules, evaluation, level=0, options=None
@@ -229,6 +231,12 @@ class BaseElement(KeyComparable, ABC):
             elif l2 is not None and level > l2:
                 return self, False
 
+        # Indexed rule tables, like the ones in Dispatch, provide
+        # the subset of rules which could match ``self``.
+        get_candidates = getattr(rules, "get_candidates", None)
+        if get_candidates is not None:
+            rules = get_candidates(self)
+
         for rule in rules:
             result = rule.apply(self, evaluation, fully=False)
             if result is not None:
@@ -117,6 +117,8 @@ class Evaluation:
         self.predetermined_out = None
 
         self.quiet_all = False
+        # Number of calls to ``message()``, including the quiet ones.
+        self.message_count = 0
         self.format = format
         self.catch_interrupt = catch_interrupt
         self.SymbolNull = SymbolNull
@@ -311,6 +313,16 @@ class Evaluation:
             if not (unset_in or unset_out):
                 break
             line -= 1
+
+        # Remove the temporary symbols of Module[] that nothing refers to.
+        # The collection looks at all the user definitions, so it runs
+        # again only once the number of temporary symbols doubled.
+        definitions = self.definitions
+        if len(definitions.temporaries) > 2 * definitions.temporaries_kept:
+            from mathics.eval.scoping import collect_temporaries
+
+            collect_temporaries(definitions, (self.last_eval,))
+            definitions.temporaries_kept = len(definitions.temporaries)
         return result
 
     def get_stored_result(self, eval_result, output_forms):
@@ -415,6 +427,7 @@ class Evaluation:
 
         # Allow evaluation.message('MyBuiltin', ...) (assume
         # System`MyBuiltin)
+        self.message_count += 1
         symbol = ensure_context(symbol_name)
         quiet_messages = set(self.get_quiet_messages())
 
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Memo of the results of evaluating calls to pure builtins.
+
+Numeric functions are often called many times with the same arguments,
+for example ``Sin[1/7]`` inside a loop. Each of these calls is built
+separately, so the check ``Expression.is_uncertain_final_definitions``
+does not help: each time the rules of the builtin are tried again.
+
+An ``EvaluationCache`` keeps the result of applying the rules to calls of
+builtins that declare themselves ``pure``, when all the arguments are
+numbers or strings. In that case, the result depends only on the
+definition of the head. The cache is cleared when that definition changes,
+which ``Definitions.mark_changed()`` reports, or when it is cleared or
+removed, which ``Definitions.clear_cache()`` reports.
+
+The cache is disabled until its size is set through
+``Settings`$EvaluationCacheSize``.
+"""
+
+from collections import OrderedDict
+from typing import Hashable, Optional, Set, Tuple
+
+from mathics.core.atoms import Complex, Integer, MachineReal, Rational, String
+from mathics.core.element import BaseElement
+from mathics.core.rule_index import literal_key
+
+# The outcome of a rewrite step: the new expression, and whether it must
+# be evaluated again.
+EvaluationStep = Tuple[BaseElement, bool]
+
+
+def argument_key(element: BaseElement) -> Optional[Hashable]:
+    """
+    Return a hashable key for ``element`` if it is a number or a string
+    that can be used as an argument in a key of the evaluation cache.
+    Otherwise, return None.
+
+    Two machine reals have the same key only if they have the same bits.
+    """
+    if isinstance(element, (Integer, Rational, String)):
+        return literal_key(element)
+    if isinstance(element, MachineReal):
+        return ("MachineReal", element.value.hex())
+    if isinstance(element, Complex):
+        real_key = argument_key(element.real)
+        imag_key = argument_key(element.imag)
+        if real_key is None or imag_key is None:
+            return None
+        return ("Complex", real_key, imag_key)
+    return None
+
+
+class EvaluationCache:
+    """
+    Least-recently-used table mapping calls of pure builtins, keyed on the
+    head name and the arguments, to the outcome of the rewrite step.
+
+    ``hits`` and ``misses`` count the lookups.
+    """
+
+    __slots__ = ("entries", "heads", "max_size", "hits", "misses")
+
+    def __init__(self, max_size: int = 0):
+        self.entries: OrderedDict = OrderedDict()
+        # Names of the heads of the calls in ``entries``.
+        self.heads: Set[str] = set()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        self.entries.clear()
+        self.heads.clear()
+
+    def invalidate(self, name: str) -> None:
+        """
+        Remove the entries that could depend on the definition of the
+        symbol ``name``.
+        """
+        # Changes in the definition of a head are rare, so it is not
+        # worth keeping track of the entries of each head.
+        if name in self.heads:
+            self.clear()
+
+    def resize(self, max_size: int) -> None:
+        """
+        Set the maximum number of entries, removing the least recently
+        used ones if there are too many. A size of 0 disables the cache.
+        """
+        self.max_size = max_size
+        if max_size == 0:
+            self.clear()
+            return
+        while len(self.entries) > max_size:
+            self.entries.popitem(last=False)
+
+    def add(self, key: Hashable, step: EvaluationStep) -> None:
+        """Store the outcome of the rewrite step for the call ``key``."""
+        entries = self.entries
+        entries[key] = step
+        self.heads.add(key[0])
+        if len(entries) > self.max_size:
+            entries.popitem(last=False)
+
+    def lookup(self, key: Hashable) -> Optional[EvaluationStep]:
+        """
+        Return the outcome of the rewrite step stored for the call
+        ``key``, or None.
+        """
+        step = self.entries.get(key)
+        if step is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return step
+
+    def get_key(self, expr, definitions) -> Optional[Hashable]:
+        """
+        Return the key of ``expr`` in the cache, or None if ``expr``
+        is not a call to a pure builtin with numbers or strings
+        as arguments. Arguments wrapped in ``Unevaluated`` are not
+        allowed either, since they come back in the result.
+        """
+        element_keys = []
+        for element in expr.elements:
+            if element.unevaluated:
+                return None
+            key = argument_key(element)
+            if key is None:
+                return None
+            element_keys.append(key)
+        head_name = expr.get_head_name()
+        if not head_name:
+            return None
+        builtin = definitions.get_definition(head_name).builtin
+        if builtin is None or not builtin.pure:
+            return None
+        return (head_name, tuple(element_keys))
@@ -19,7 +19,7 @@ from typing import (
 
 import sympy
 
-from mathics.core.atoms import Integer1, String
+from mathics.core.atoms import Integer, Integer1, MachineReal, String
 from mathics.core.attributes import (
     A_FLAT,
     A_HOLD_ALL,
@@ -187,16 +187,31 @@ class BoxError(Exception):
 
 
 class ExpressionCache:
-    def __init__(self, time=None, symbols=None, sequences=None, copy=None):
+    def __init__(
+        self, time=None, symbols=None, sequences=None, copy=None, sort_key=None
+    ):
         if copy is not None:
             time = time or copy.time
             symbols = symbols or copy.symbols
             sequences = sequences or copy.sequences
+            sort_key = sort_key or copy.sort_key
         self.time = time
         self.symbols = symbols
         self.sequences = sequences
+        # The (non-pattern) sort key of the Expression. It only depends
+        # on the head and the elements, so it is dropped whenever these
+        # change (see ``sliced()`` and ``reordered()``).
+        self.sort_key = sort_key
 
     def copy(self):
+        return ExpressionCache(
+            self.time, self.symbols, self.sequences, sort_key=self.sort_key
+        )
+
+    def without_sort_key(self):
+        # indicates that the Expression's elements have been replaced.
+        if self.sort_key is None:
+            return self
         return ExpressionCache(self.time, self.symbols, self.sequences)
 
     def sliced(self, lower, upper):
@@ -456,7 +471,9 @@ class Expression(BaseElement, NumericOperators, EvalMixin):
             elif isinstance(element, Symbol):
                 sym.add(element.get_name())
 
-        cache = ExpressionCache(time, sym, seq)
+        cache = ExpressionCache(
+            time, sym, seq, sort_key=None if cache is None else cache.sort_key
+        )
         self._cache = cache
         return cache
 
@@ -495,6 +512,8 @@ class Expression(BaseElement, NumericOperators, EvalMixin):
         self._elements = tuple(values)
         # Set to build self.elements_properties on next evaluation()
         self.elements_properties = None
+        if self._cache is not None:
+            self._cache = self._cache.without_sort_key()
 
     def equal2(self, rhs: Any) -> Optional[bool]:
         """Mathics3 two-argument Equal (==)
@@ -948,58 +967,69 @@ class Expression(BaseElement, NumericOperators, EvalMixin):
                     1,
                 )
         else:
-            """
-            General sort key structure:
-            0: 1/2:        Numeric / General Expression
-            1: 2/3         Special arithmetic (Times / Power) / General Expression
-            2: Element:        Head
-            3: tuple:        list of Elements
-            4: 1:        No clue...
-            """
-            exps: Dict[str, Union[float, complex]] = {}
-            head = self._head
-            if head is SymbolTimes:
-                for element in self.elements:
-                    name = element.get_name()
-                    if element.has_form("Power", 2):
-                        var = element.get_element(0).get_name()
-                        expr = element.get_element(1)
-                        assert isinstance(expr, (Expression, NumericOperators))
-                        exp = expr.round_to_float()
-                        if var and exp is not None:
-                            exps[var] = exps.get(var, 0) + exp
-                    elif name:
-                        exps[name] = exps.get(name, 0) + 1
-            elif self.has_form("Power", 2):
-                var = self.elements[0].get_name()
-                # TODO: Check if this is the expected behaviour.
-                # round_to_float is an attribute of Expression,
-                # but not for Atoms.
-                try:
-                    exp = self.elements[1].round_to_float()
-                except AttributeError:
-                    exp = None
-                if var and exp is not None:
-                    exps[var] = exps.get(var, 0) + exp
-            if exps:
-                return (
-                    1 if self.is_numeric() else 2,
-                    2,
-                    Monomial(exps),
-                    1,
-                    head,
-                    self._elements,
-                    1,
-                )
+            cache = self._cache
+            if cache is not None and cache.sort_key is not None:
+                return cache.sort_key
+            sort_key = self._build_sort_key()
+            if cache is None:
+                self._cache = ExpressionCache(sort_key=sort_key)
             else:
-                return (
-                    1 if self.is_numeric() else 2,
-                    3,
-                    head,
-                    len(self._elements),
-                    self._elements,
-                    1,
-                )
+                cache.sort_key = sort_key
+            return sort_key
+
+    def _build_sort_key(self) -> tuple:
+        """
+        General sort key structure:
+        0: 1/2:        Numeric / General Expression
+        1: 2/3         Special arithmetic (Times / Power) / General Expression
+        2: Element:        Head
+        3: tuple:        list of Elements
+        4: 1:        No clue...
+        """
+        exps: Dict[str, Union[float, complex]] = {}
+        head = self._head
+        if head is SymbolTimes:
+            for element in self.elements:
+                name = element.get_name()
+                if element.has_form("Power", 2):
+                    var = element.get_element(0).get_name()
+                    expr = element.get_element(1)
+                    assert isinstance(expr, (Expression, NumericOperators))
+                    exp = expr.round_to_float()
+                    if var and exp is not None:
+                        exps[var] = exps.get(var, 0) + exp
+                elif name:
+                    exps[name] = exps.get(name, 0) + 1
+        elif self.has_form("Power", 2):
+            var = self.elements[0].get_name()
+            # TODO: Check if this is the expected behaviour.
+            # round_to_float is an attribute of Expression,
+            # but not for Atoms.
+            try:
+                exp = self.elements[1].round_to_float()
+            except AttributeError:
+                exp = None
+            if var and exp is not None:
+                exps[var] = exps.get(var, 0) + exp
+        if exps:
+            return (
+                1 if self.is_numeric() else 2,
+                2,
+                Monomial(exps),
+                1,
+                head,
+                self._elements,
+                1,
+            )
+        else:
+            return (
+                1 if self.is_numeric() else 2,
+                3,
+                head,
+                len(self._elements),
+                self._elements,
+                1,
+            )
 
     @property
     def head(self):
@@ -1049,7 +1079,12 @@ class Expression(BaseElement, NumericOperators, EvalMixin):
             cache = self._rebuild_cache()
             assert cache is not None
 
-        return definitions.is_uncertain_final_value(time, cache.symbols)
+        if definitions.is_uncertain_final_value(time, cache.symbols):
+            return True
+        # Nothing this expression depends on changed until now, so the
+        # next check only needs to look at later changes.
+        cache.time = definitions.now
+        return False
 
     def has_form(
         self, heads: Union[Sequence[str], str], *element_counts: Optional[int]
@@ -1232,6 +1267,15 @@ class Expression(BaseElement, NumericOperators, EvalMixin):
             # FIXME: see if we can preserve elements properties in eval_elements()
             eval_elements()
 
+        # Listable builtins that have a vectorized implementation
+        # operate on packed arrays without unpacking them.
+        if A_LISTABLE & attributes and any(element.is_packed for element in elements):
+            from mathics.core.list import eval_vectorized
+
+            vectorized = eval_vectorized(head, elements, evaluation)
+            if vectorized is not None:
+                return vectorized, False
+
         if recompute_properties:
             new = Expression(head, *elements, elements_properties=None)
             new._build_elements_properties()
@@ -1383,6 +1427,24 @@ class Expression(BaseElement, NumericOperators, EvalMixin):
         # In Mathics3, the result in  "fish", but WL gives "5".
         # This shows that WMA evaluates certain symbols differently.
 
+        # Calls to pure builtins with numbers or strings as arguments
+        # may be in the evaluation cache. Otherwise, the outcome of this
+        # step is stored there, unless it issued messages.
+        cache_key = None
+        evaluation_cache = evaluation.definitions.evaluation_cache
+        if evaluation_cache.max_size:
+            cache_key = evaluation_cache.get_key(new, evaluation.definitions)
+            if cache_key is not None:
+                step = evaluation_cache.lookup(cache_key)
+                if step is not None:
+                    return step
+                message_count = evaluation.message_count
+
+        def cached(step: Tuple[BaseElement, bool]) -> Tuple[BaseElement, bool]:
+            if cache_key is not None and evaluation.message_count == message_count:
+                evaluation_cache.add(cache_key, step)
+            return step
+
         def rules():
             rules_names = set()
             if not A_HOLD_ALL_COMPLETE & attributes:
@@ -1393,12 +1455,14 @@ class Expression(BaseElement, NumericOperators, EvalMixin):
                     if len(name) > 0:  # only lookup rules if this is a symbol
                         if name not in rules_names:
                             rules_names.add(name)
-                            for rule in evaluation.definitions.get_upvalues(name):
-                                yield rule
+                            yield from evaluation.definitions.get_candidate_rules(
+                                name, "upvalues", new, attributes
+                            )
             lookup_name = new.get_lookup_name()
             if lookup_name == new.get_head_name():
-                for rule in evaluation.definitions.get_downvalues(lookup_name):
-                    yield rule
+                yield from evaluation.definitions.get_candidate_rules(
+                    lookup_name, "downvalues", new, attributes
+                )
             else:
                 # Subvalues applies for expressions of the form `D[1][f][x]`
                 # For this expression, the `head` would be `D[1][f]`
@@ -1414,12 +1478,17 @@ class Expression(BaseElement, NumericOperators, EvalMixin):
                 return Expression(SymbolOverflow), False
             if result is not None:
                 if not isinstance(result, EvalMixin):
-                    return result, False
+                    return cached((result, False))
                 if result.sameQ(new):
+                    # A rule can return the same expression in a specialized
+                    # form, like an Association with its rules in a table.
+                    # Keep that form.
+                    if isinstance(result, Expression) and type(result) is not type(new):
+                        new = result
                     new._timestamp_cache(evaluation)
-                    return new, False
+                    return cached((new, False))
                 else:
-                    return result, True
+                    return cached((result, True))
 
         # Step 7: If we are here, is because we didn't find any rule that
         # matches the expression.
@@ -1440,7 +1509,7 @@ class Expression(BaseElement, NumericOperators, EvalMixin):
         # Step 8: Update the cache. Return the new compound Expression and
         #        indicate that no further evaluation is needed.
         new._timestamp_cache(evaluation)
-        return new, False
+        return cached((new, False))
 
     #  Now, let's see how much take each step for certain typical expressions:
     #  (assuming that "F" and "a1", ... "a100" are undefined symbols, and
@@ -1621,20 +1690,20 @@ class Expression(BaseElement, NumericOperators, EvalMixin):
     def sort(self, pattern=False):
         """
         Sort the elements using the Python's list-method sort.
-        `get_sort_key() is used for comparison if `pattern` is True.
-        Otherwise use the the default Python 3.x compare function,
-        `__lt__()` that is found in each element.
+        `get_sort_key(pattern_sort=True)` is used for comparison if `pattern`
+        is True. Otherwise the elements are put in canonical order by
+        `sorted_elements()`.
 
         `self._cache` is updated if that is not None.
         """
         # There is no in-place sort method on a tuple, because tuples are not
         # mutable. So we turn into a elements into list and use Python's
         # list sort method. Another approach would be to use sorted().
-        elements = self.get_mutable_elements()
         if pattern:
+            elements = self.get_mutable_elements()
             elements.sort(key=lambda e: e.get_sort_key(pattern_sort=True))
         else:
-            elements.sort()
+            elements = sorted_elements(self._elements)
 
         # update `self._elements` and self._cache with the possible permuted order.
         self.elements = elements
@@ -1864,6 +1933,36 @@ class Expression(BaseElement, NumericOperators, EvalMixin):
             element.user_hash(update)
 
 
+# Numbers whose sort keys are ``(0, 0, value, 0, 1)``, where ``value`` is
+# a Python int or float. Their canonical order is the order of their values.
+_MACHINE_NUMBER_TYPES = (Integer, MachineReal)
+
+
+def sorted_elements(elements: Iterable[BaseElement]) -> list:
+    """
+    Return a list with ``elements`` in canonical order, the one given by
+    ``get_sort_key()``.
+
+    Lists of integers and machine reals are sorted by their values, without
+    building their sort keys. Otherwise, the sort key of each element is
+    computed just once, instead of once per comparison.
+    """
+    elements = list(elements)
+    if all(type(element) in _MACHINE_NUMBER_TYPES for element in elements):
+        elements.sort(key=_get_value)
+    else:
+        elements.sort(key=_get_sort_key)
+    return elements
+
+
+def _get_value(number):
+    return number.value
+
+
+def _get_sort_key(element: BaseElement) -> tuple:
+    return element.get_sort_key()
+
+
 def _create_expression(self, head: BaseElement, *elements: BaseElement) -> Expression:
     return Expression(head, *elements)
 
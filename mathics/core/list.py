@@ -4,13 +4,25 @@ Module containing ListExpression
 """
 
 import reprlib
-from typing import Optional, Tuple
+from fractions import Fraction
+from typing import Optional, Sequence, Tuple, Union
 
-from mathics.core.element import ElementsProperties
+import numpy
+
+from mathics.core.atoms import Integer, MachineReal, Rational
+from mathics.core.element import BaseElement, ElementsProperties
 from mathics.core.evaluation import Evaluation
-from mathics.core.expression import Expression
+from mathics.core.expression import Expression, ExpressionCache
 from mathics.core.symbols import EvalMixin, Symbol, SymbolList
 
+# Machine integers in packed arrays are stored as NumPy int64.
+MACHINE_INTEGER_MIN = -(2**63)
+MACHINE_INTEGER_MAX = 2**63 - 1
+
+# Table and similar functions pack their result when it has at least
+# this many elements, like TableCompileLength in WMA.
+PACKED_ARRAY_MIN_LENGTH = 250
+
 
 class ListExpression(Expression):
     """
@@ -115,6 +127,25 @@ class ListExpression(Expression):
         new_list._build_elements_properties()
         return new_list
 
+    def set_element(self, index: int, value):
+        """
+        Update element[i] with value, and check again whether the list
+        is literal.
+        """
+        was_literal = self._is_literal
+        super().set_element(index, value)
+        if not value.is_literal:
+            self._is_literal = False
+            self.value = None
+        elif was_literal:
+            values = list(self.value)
+            values[index] = value.value
+            self.value = tuple(values)
+        else:
+            self._is_literal = all(element.is_literal for element in self._elements)
+            if self._is_literal:
+                self.value = tuple(element.value for element in self._elements)
+
     @property
     def is_literal(self) -> bool:
         """
@@ -162,12 +193,16 @@ class ListExpression(Expression):
 
     def shallow_copy(self) -> "ListExpression":
         """
-        For an Expression this does something with its cache.
-        Here this does not need that complication.
+        Return a new ListExpression that shares the elements and the
+        cache of this one.
         """
-        return ListExpression(
+        expr = ListExpression(
             *self._elements, elements_properties=self.elements_properties
         )
+        # Keeping the cache avoids collecting the symbols of long lists
+        # again when the copy is evaluated.
+        expr._cache = self._rebuild_cache()
+        return expr
 
     def copy(self, reevaluate=False) -> "Expression":
         expr = ListExpression(self._head.copy(reevaluate))
@@ -176,3 +211,320 @@ class ListExpression(Expression):
         expr.original = self
         expr._sequences = self._sequences
         return expr
+
+
+class _PackedElementsSortKey:
+    """
+    Stand-in for the elements in the sort key of a packed array, so that
+    they are only built when the sort key is compared with another one
+    with the same head and length.
+    """
+
+    __slots__ = ("expr",)
+
+    def __init__(self, expr: "PackedListExpression"):
+        self.expr = expr
+
+    @staticmethod
+    def _elements_of(other):
+        if isinstance(other, _PackedElementsSortKey):
+            return other.expr._elements
+        return other
+
+    def __eq__(self, other) -> bool:
+        return self.expr._elements == self._elements_of(other)
+
+    def __lt__(self, other) -> bool:
+        return self.expr._elements < self._elements_of(other)
+
+    def __le__(self, other) -> bool:
+        return self.expr._elements <= self._elements_of(other)
+
+    def __gt__(self, other) -> bool:
+        return self.expr._elements > self._elements_of(other)
+
+    def __ge__(self, other) -> bool:
+        return self.expr._elements >= self._elements_of(other)
+
+
+def frozen_array(array: numpy.ndarray) -> numpy.ndarray:
+    """
+    Return ``array``, or a copy of it, as an array that owns its data and
+    can't be changed.
+
+    Arrays are shared between packed lists, so they must not change. Views
+    are copied, since Pympler, which ByteCount[] and MemoryInUse[] use,
+    can only measure arrays that own their data.
+    """
+    if array.flags.owndata and not array.flags.writeable:
+        return array
+    array = array.copy()
+    array.flags.writeable = False
+    return array
+
+
+class PackedListExpression(ListExpression):
+    """
+    A Mathics3 List of machine integers or machine reals, or a rectangular
+    nested List of them, stored in a NumPy array. This is the analog
+    of a WMA PackedArray.
+
+    The atoms of the elements are only built when they are needed. Listable
+    builtins that define ``vectorized_function`` operate on the NumPy
+    array directly. Changing the elements unpacks the list.
+
+    positional Arguments:
+        - array -- a NumPy array of int64 or float64 values, with at least one dimension
+    """
+
+    is_packed = True
+
+    def __init__(self, array: numpy.ndarray):
+        self.options = None
+        self.pattern_sequence = False
+        self._head = SymbolList
+        self.array = frozen_array(array)
+        self._unpacked: Optional[tuple] = None
+        self._is_literal = True
+        self.elements_properties = ElementsProperties(
+            elements_fully_evaluated=True, is_flat=array.ndim == 1, is_ordered=False
+        )
+        self._sequences = None
+        self._cache = None
+
+    def __getnewargs__(self):
+        return (self.array,)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_unpacked"] = None
+        return state
+
+    def __repr__(self) -> str:
+        return f"<PackedListExpression: {reprlib.repr(self.array.tolist())}>"
+
+    @property
+    def _elements(self) -> tuple:
+        elements = self._unpacked
+        if elements is None:
+            array = self.array
+            if array.ndim > 1:
+                elements = tuple(PackedListExpression(row) for row in array)
+            elif array.dtype.kind == "f":
+                elements = tuple(MachineReal(value) for value in array.tolist())
+            else:
+                elements = tuple(Integer(value) for value in array.tolist())
+            self._unpacked = elements
+        return elements
+
+    @_elements.setter
+    def _elements(self, elements: tuple):
+        # Setting other elements turns this into an ordinary List.
+        del self.array
+        del self._unpacked
+        self.__class__ = ListExpression
+        ListExpression.__init__(self, *elements)
+
+    @property
+    def value(self) -> tuple:
+        if self.array.ndim == 1:
+            return tuple(self.array.tolist())
+        if self.array.ndim == 2:
+            # Don't unpack the rows just for their values.
+            return tuple(map(tuple, self.array.tolist()))
+        return tuple(row.value for row in self._elements)
+
+    @value.setter
+    def value(self, value):
+        # The values are those of the array.
+        pass
+
+    def _rebuild_cache(self) -> ExpressionCache:
+        # Packed arrays only contain numbers, so there is no need to look
+        # at the elements.
+        cache = self._cache
+        if cache is None or cache.symbols is None or cache.sequences is None:
+            time = None if cache is None else cache.time
+            cache = ExpressionCache(time, {"System`List"}, [])
+            self._cache = cache
+        return cache
+
+    def copy(self, reevaluate=False) -> "PackedListExpression":
+        return PackedListExpression(self.array)
+
+    def get_sort_key(self, pattern_sort=False) -> tuple:
+        if pattern_sort:
+            return super().get_sort_key(True)
+        # This is the sort key of a List, with its elements built lazily.
+        return (2, 3, SymbolList, len(self.array), _PackedElementsSortKey(self), 1)
+
+    def replace_vars(self, vars, options=None, in_scoping=True, in_function=True):
+        # There are no symbols to replace in a packed array.
+        return self
+
+    def sameQ(self, other: BaseElement) -> bool:
+        """Mathics3 SameQ"""
+        if isinstance(other, PackedListExpression):
+            return (
+                self.array.dtype == other.array.dtype
+                and self.array.shape == other.array.shape
+                and bool((self.array == other.array).all())
+            )
+        # Avoid unpacking when the lists can't be the same.
+        if not (
+            isinstance(other, Expression)
+            and other.head is SymbolList
+            and len(other.elements) == len(self.array)
+        ):
+            return False
+        return super().sameQ(other)
+
+    def shallow_copy(self) -> "PackedListExpression":
+        return PackedListExpression(self.array)
+
+    def to_python(self, *args, **kwargs):
+        if args or kwargs:
+            return super().to_python(*args, **kwargs)
+        return self.array.tolist()
+
+
+def pack_elements(
+    elements: Sequence[BaseElement], coerce: bool = False
+) -> Optional[PackedListExpression]:
+    """
+    Return a PackedListExpression with `elements`, or None if they can't be
+    packed. The elements must be machine integers, machine reals, or packed
+    lists with the same shape.
+
+    If `coerce` is False, integers and reals can't be mixed. Otherwise, the
+    integers are converted to reals, as ToPackedArray does.
+    """
+    if not elements:
+        return None
+    first = elements[0]
+    if first.is_packed:
+        shape = first.array.shape
+        rows = []
+        for element in elements:
+            if not element.is_packed or element.array.shape != shape:
+                return None
+            rows.append(element.array)
+        kinds = {row.dtype.kind for row in rows}
+        if len(kinds) > 1 and not coerce:
+            return None
+        return PackedListExpression(numpy.stack(rows))
+
+    values: list = []
+    has_integers = has_reals = False
+    for element in elements:
+        if isinstance(element, MachineReal):
+            has_reals = True
+        elif isinstance(element, Integer):
+            if not MACHINE_INTEGER_MIN <= element.value <= MACHINE_INTEGER_MAX:
+                return None
+            has_integers = True
+        else:
+            return None
+        values.append(element.value)
+    if has_reals:
+        if has_integers and not coerce:
+            return None
+        return PackedListExpression(numpy.array(values, dtype=numpy.float64))
+    return PackedListExpression(numpy.array(values, dtype=numpy.int64))
+
+
+def to_packed_list(expr: BaseElement, coerce: bool = False) -> BaseElement:
+    """
+    Return `expr` as a packed array if it is a List that can be packed,
+    and `expr` otherwise. Nested lists are packed from the innermost level.
+    """
+    if expr.is_packed or not isinstance(expr, ListExpression):
+        return expr
+    elements = expr.elements
+    if elements and isinstance(elements[0], ListExpression):
+        elements = [to_packed_list(element, coerce) for element in elements]
+    packed = pack_elements(elements, coerce)
+    return expr if packed is None else packed
+
+
+def unpack_list(expr: BaseElement) -> BaseElement:
+    """
+    Return `expr` with all its packed arrays, at any level, unpacked.
+    """
+    if expr.is_packed:
+        return ListExpression(*(unpack_list(element) for element in expr.elements))
+    return expr
+
+
+def _to_vectorized_argument(
+    element: BaseElement,
+) -> Union[numpy.ndarray, int, float, Fraction, None]:
+    """
+    Convert an argument of a Listable function to the form used by
+    ``vectorized_function``.
+    """
+    if element.is_packed:
+        return element.array
+    if isinstance(element, MachineReal):
+        return element.value
+    if isinstance(element, Integer):
+        value = element.value
+        if MACHINE_INTEGER_MIN <= value <= MACHINE_INTEGER_MAX:
+            return value
+    elif isinstance(element, Rational):
+        numerator, denominator = element.value.as_numer_denom()
+        return Fraction(int(numerator), int(denominator))
+    return None
+
+
+def eval_vectorized(
+    head: BaseElement, elements: Sequence[BaseElement], evaluation: Evaluation
+) -> Optional[PackedListExpression]:
+    """
+    Evaluate `head` applied to `elements`, a Listable function with packed
+    array arguments, using the ``vectorized_function`` of its builtin, if it
+    has one.
+
+    The other arguments must be numbers. Like threading, the arrays are
+    aligned on their first dimensions. If the result can't be computed
+    in this way, return None, and `expr` is threaded over its lists.
+    """
+    if not isinstance(head, Symbol):
+        return None
+    name = head.get_name()
+    # The rules added by the user must be tried first.
+    if name in evaluation.definitions.user:
+        return None
+    builtin = evaluation.definitions.get_definition(name).builtin
+    vectorized_function = getattr(builtin, "vectorized_function", None)
+    if vectorized_function is None:
+        return None
+
+    args = []
+    shape: Tuple[int, ...] = ()
+    for element in elements:
+        arg = _to_vectorized_argument(element)
+        if arg is None:
+            return None
+        if isinstance(arg, numpy.ndarray):
+            if arg.ndim > len(shape):
+                if arg.shape[: len(shape)] != shape:
+                    return None
+                shape = arg.shape
+            elif shape[: arg.ndim] != arg.shape:
+                return None
+        args.append(arg)
+
+    # NumPy broadcasting aligns the last dimensions, so add trailing axes
+    # to the arrays with less dimensions.
+    args = [
+        arg.reshape(arg.shape + (1,) * (len(shape) - arg.ndim))
+        if isinstance(arg, numpy.ndarray) and arg.ndim < len(shape)
+        else arg
+        for arg in args
+    ]
+    with numpy.errstate(all="ignore"):
+        result = vectorized_function(*args)
+    if result is None:
+        return None
+    return PackedListExpression(result)
@@ -8,6 +8,7 @@ Builtin.
 
 import importlib
 import inspect
+import json
 import logging
 import os
 import os.path as osp
@@ -21,7 +22,7 @@ from mathics.core.parser.operators import calculate_operator_information
 from mathics.core.pattern import pattern_objects
 from mathics.core.symbols import Symbol
 from mathics.eval.makeboxes import builtins_precedence
-from mathics.settings import ENABLE_FILES_MODULE
+from mathics.settings import ENABLE_FILES_MODULE, LAZY_BUILTINS, ROOT_DIR
 
 if TYPE_CHECKING:
     from mathics.core.builtin import Builtin
@@ -42,6 +43,20 @@ _builtins = {}
 #
 builtins_by_module: Dict[str, list] = {}
 
+# Builtin modules whose import can be deferred until one of the
+# symbols they define is used, together with these symbol names.
+# This list is generated by ``admin-tools/build_and_check_manifest.py``
+# and contains only modules whose Builtins do not register themselves
+# in global tables like ``pattern_objects`` or ``mathics_to_sympy``.
+BUILTIN_MANIFEST_PATH = osp.join(ROOT_DIR, "data", "builtin-manifest.json")
+
+# Lazy modules (from the manifest) which were not imported by
+# ``import_and_load_builtins``.
+lazy_builtin_modules: Dict[str, List[str]] = {}
+
+# Names of the builtin modules that could not be imported.
+failed_builtin_modules: List[str] = []
+
 # Set operators strings, unary, binary, or ternary.
 # For example  "!, "!!", ^, "+", "-", ">=", "===", "<<", etc.
 display_operators_set: Set[str] = set()
@@ -197,9 +212,40 @@ def get_submodule_names(obj) -> list:
     return modpkgs
 
 
-def import_and_load_builtins():
+def get_required_packages() -> List[str]:
+    """
+    Return the names of the packages that some of the loaded builtins
+    require, sorted.
+    """
+    return sorted(
+        {
+            package
+            for builtin in _builtins.values()
+            for package in getattr(builtin, "requires", ())
+        }
+    )
+
+
+def get_lazy_builtin_names() -> Dict[str, str]:
+    """
+    Return a dictionary mapping the names of the symbols defined in
+    lazy modules that were not loaded yet to the name of their module.
+    """
+    return {
+        name: module_name
+        for module_name, names in lazy_builtin_modules.items()
+        if module_name not in builtins_by_module
+        for name in names
+    }
+
+
+def import_and_load_builtins(lazy: bool = LAZY_BUILTINS):
     """
     Imports Builtin modules in mathics.builtin and add rules, and definitions from that.
+
+    If `lazy` is True, the modules listed in the builtin manifest are not
+    imported: ``Definitions`` loads them when one of their symbols is
+    first looked up.
     """
     # TODO: Check if this is the expected behavior, or it the structures
     # must be cleaned.
@@ -207,6 +253,10 @@ def import_and_load_builtins():
         logging.warning("``import_and_load_builtins`` should be called just once...")
         return
 
+    if lazy and osp.exists(BUILTIN_MANIFEST_PATH):
+        with open(BUILTIN_MANIFEST_PATH, "r") as manifest_file:
+            lazy_builtin_modules.update(json.load(manifest_file))
+
     builtin_path = osp.join(
         osp.dirname(
             __file__,
@@ -242,12 +292,16 @@ def import_builtin_module(import_name: str, modules: List[ModuleType]):
 
     List ``module_names`` is updated.
     """
+    if import_name in lazy_builtin_modules:
+        return
+
     try:
         module = importlib.import_module(import_name)
     except Exception as exc:
         print(exc)
         print(f"    Not able to load {import_name}. Check your installation.")
         print(f"    mathics.builtin loads from {__file__[:-11]}")
+        failed_builtin_modules.append(import_name)
         return
 
     if module:
@@ -301,6 +355,18 @@ def import_builtin_subdirectories(
         import_builtins(submodule_names, modules, subdir)
 
 
+def load_lazy_builtin_module(module_name: str) -> list:
+    """
+    Import a module that was deferred by ``import_and_load_builtins``,
+    add its builtins, and return the list of its Builtin instances.
+    """
+    if module_name not in builtins_by_module:
+        module = importlib.import_module(module_name)
+        mathics3_builtins_modules.append(module)
+        add_builtins_from_builtin_modules([module])
+    return builtins_by_module[module_name]
+
+
 def name_is_builtin_symbol(module: ModuleType, name: str) -> Optional[type]:
     """
     Checks if ``name`` should be added to definitions, and return
@@ -190,10 +190,15 @@ class Converter(GenericConverter):
         self.definitions = None
 
     def convert(self, node, definitions):
+        # Looking up a name can load builtins, which parses their
+        # rules with this converter: restore the definitions
+        # being used before that.
+        previous_definitions = self.definitions
         self.definitions = definitions
-        result = self.do_convert(node)
-        self.definitions = None
-        return result
+        try:
+            return self.do_convert(node)
+        finally:
+            self.definitions = previous_definitions
 
     def do_convert(self, node):
         result = GenericConverter.do_convert(self, node)
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Direct matchers for simple patterns.
+
+Most of the patterns in the ``eval_`` methods of builtins, like
+``Sin[x_]``, ``Take[list_List, n_Integer]`` or ``StringLength[s_?StringQ]``,
+have a fixed number of elements, each of them matching exactly one
+element of the expression. For these patterns, the general matcher in
+``mathics.core.pattern`` spends most of its time setting up the machinery
+that handles sequences, ``Flat`` and ``Orderless`` heads, and backtracking.
+
+``compile_pattern()`` translates such a pattern into a Python function that
+checks the head, the number of elements and each element in turn, and
+returns the dictionary of pattern variables, or None if the expression
+does not match. Since there is at most one way to match these patterns,
+no backtracking is needed.
+
+The supported pattern elements are:
+
+* literal atoms and literal expressions,
+* ``_`` and ``_h``, where ``h`` is a symbol,
+* ``x_`` and ``x_h``, and in general ``Pattern[x, p]`` with ``p`` supported,
+* ``p?test``, with ``p`` supported, and
+* expressions with supported elements and a symbol as head, if the head
+  is not ``Flat``, ``Orderless`` or ``OneIdentity``.
+
+For other patterns, ``compile_pattern()`` returns None, and the general
+matcher is used.
+"""
+
+from typing import Callable, Dict, Optional
+
+from mathics.core.atoms import Integer, Number, Rational, Real, String
+from mathics.core.attributes import A_FLAT, A_ONE_IDENTITY, A_ORDERLESS
+from mathics.core.element import BaseElement
+from mathics.core.evaluation import Evaluation
+from mathics.core.expression import Expression
+from mathics.core.pattern import AtomPattern, BasePattern, ExpressionPattern
+from mathics.core.symbols import Atom, Symbol, SymbolTrue
+
+# A compiled pattern element. It checks whether the element of an
+# expression matches, adding the pattern variables it binds to the
+# dictionary.
+ElementMatcher = Callable[[BaseElement, dict, Evaluation], bool]
+
+# The compiled form of a whole pattern: it returns the dictionary of
+# pattern variables, or None if the expression does not match.
+PatternMatcher = Callable[[BaseElement, Evaluation], Optional[dict]]
+
+
+def _is_real_valued_number(item: BaseElement) -> bool:
+    return isinstance(item, (Integer, Rational, Real))
+
+
+# Tests that are checked without evaluating the element. They
+# are the same as the ones in ``PatternTest.init()``.
+QUICK_TESTS: Dict[str, Callable[[BaseElement, Evaluation], bool]] = {
+    "System`AtomQ": lambda item, evaluation: isinstance(item, Atom),
+    "System`StringQ": lambda item, evaluation: isinstance(item, String),
+    "System`NumberQ": lambda item, evaluation: isinstance(item, Number),
+    "System`NumericQ": lambda item, evaluation: (
+        isinstance(item, Number) or item.is_numeric(evaluation)
+    ),
+    "System`RealValuedNumberQ": lambda item, evaluation: _is_real_valued_number(item),
+    "Internal`RealValuedNumberQ": lambda item, evaluation: _is_real_valued_number(item),
+    "System`Negative": lambda item, evaluation: (
+        _is_real_valued_number(item) and item.value < 0
+    ),
+    "System`NonPositive": lambda item, evaluation: (
+        _is_real_valued_number(item) and item.value <= 0
+    ),
+    "System`NonNegative": lambda item, evaluation: (
+        _is_real_valued_number(item) and item.value >= 0
+    ),
+}
+
+
+def compile_pattern(
+    pattern: BasePattern, evaluation: Evaluation
+) -> Optional[PatternMatcher]:
+    """
+    Return a function that matches expressions against ``pattern``, or
+    None if ``pattern`` is not supported.
+    """
+    if not isinstance(pattern, ExpressionPattern):
+        return None
+    match_element = _compile_element(pattern, evaluation)
+    if match_element is None:
+        return None
+
+    def matcher(expression: BaseElement, evaluation: Evaluation) -> Optional[dict]:
+        evaluation.check_stopped()
+        vars_dict: dict = {}
+        if match_element(expression, vars_dict, evaluation):
+            return vars_dict
+        return None
+
+    return matcher
+
+
+def _compile_element(
+    pattern: BasePattern, evaluation: Evaluation
+) -> Optional[ElementMatcher]:
+    """
+    Compile a pattern element, or return None if it is not supported.
+    """
+    from mathics.builtin.patterns.basic import Blank
+    from mathics.builtin.patterns.composite import Pattern
+    from mathics.builtin.patterns.restrictions import PatternTest
+
+    if isinstance(pattern, AtomPattern):
+        return _compile_atom(pattern.atom)
+    if isinstance(pattern, ExpressionPattern):
+        return _compile_expression(pattern, evaluation)
+    if isinstance(pattern, Blank):
+        return _compile_blank(pattern.head)
+    if isinstance(pattern, Pattern):
+        return _compile_named(pattern, evaluation)
+    if isinstance(pattern, PatternTest):
+        return _compile_pattern_test(pattern, evaluation)
+    return None
+
+
+def _compile_atom(atom: Atom) -> ElementMatcher:
+    if isinstance(atom, Symbol):
+        return lambda item, vars_dict, evaluation: item is atom
+    return lambda item, vars_dict, evaluation: (
+        isinstance(item, Atom) and item.sameQ(atom)
+    )
+
+
+def _compile_blank(head: Optional[BaseElement]) -> ElementMatcher:
+    # As in ``Blank.match()``, ``Sequence[]`` does not match.
+    if head is None:
+        return lambda item, vars_dict, evaluation: not item.has_form("Sequence", 0)
+    return lambda item, vars_dict, evaluation: (
+        item.get_head().sameQ(head) and not item.has_form("Sequence", 0)
+    )
+
+
+def _compile_expression(
+    pattern: ExpressionPattern, evaluation: Evaluation
+) -> Optional[ElementMatcher]:
+    if pattern.attributes is None:
+        pattern.__set_pattern_attributes__(
+            pattern.head.get_attributes(evaluation.definitions)
+        )
+    assert pattern.attributes is not None
+    if pattern.attributes & (A_FLAT | A_ONE_IDENTITY | A_ORDERLESS):
+        return None
+    if pattern.isliteral:
+        expr = pattern.expr
+        return lambda item, vars_dict, evaluation: item.sameQ(expr)
+    if not isinstance(pattern.head, AtomPattern):
+        return None
+    head = pattern.head.atom
+    if not isinstance(head, Symbol):
+        return None
+
+    match_elements = []
+    for element in pattern.elements:
+        match_element = _compile_element(element, evaluation)
+        if match_element is None:
+            return None
+        match_elements.append(match_element)
+    match_elements = tuple(match_elements)
+    element_count = len(match_elements)
+
+    def match_expression(
+        item: BaseElement, vars_dict: dict, evaluation: Evaluation
+    ) -> bool:
+        if not isinstance(item, Expression) or item.get_head() is not head:
+            return False
+        elements = item.elements
+        if len(elements) != element_count:
+            return False
+        for match_element, element in zip(match_elements, elements):
+            if not match_element(element, vars_dict, evaluation):
+                return False
+        return True
+
+    return match_expression
+
+
+def _compile_named(pattern, evaluation: Evaluation) -> Optional[ElementMatcher]:
+    match_pattern = _compile_element(pattern.pattern, evaluation)
+    if match_pattern is None:
+        return None
+    varname = pattern.varname
+
+    def match_named(item: BaseElement, vars_dict: dict, evaluation: Evaluation):
+        # As in ``Pattern.match()``, a variable that is already bound
+        # only matches the same expression.
+        existing = vars_dict.get(varname, None)
+        if existing is not None:
+            return existing.sameQ(item)
+        vars_dict[varname] = item
+        return match_pattern(item, vars_dict, evaluation)
+
+    return match_named
+
+
+def _compile_pattern_test(pattern, evaluation: Evaluation) -> Optional[ElementMatcher]:
+    match_pattern = _compile_element(pattern.pattern, evaluation)
+    if match_pattern is None:
+        return None
+
+    quick_test = QUICK_TESTS.get(pattern.test_name, None)
+    if quick_test is not None:
+        test = quick_test
+    else:
+        test_expr = pattern.test
+        test_name = pattern.test_name
+
+        def test(item: BaseElement, evaluation: Evaluation) -> bool:
+            # The general case in ``PatternTest.match()``.
+            item = item.evaluate(evaluation)
+            result = pattern.quick_pattern_test(item, test_name, evaluation)
+            if result is True or result is False:
+                return result
+            return Expression(test_expr, item).evaluate(evaluation) is SymbolTrue
+
+    def match_pattern_test(
+        item: BaseElement, vars_dict: dict, evaluation: Evaluation
+    ) -> bool:
+        if not match_pattern(item, vars_dict, evaluation):
+            return False
+        for element in item.get_sequence():
+            if not test(element, evaluation):
+                return False
+        return True
+
+    return match_pattern_test
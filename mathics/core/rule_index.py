@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+"""
+Indexes over the lists of rules stored in a ``Definition``.
+
+``Expression.rewrite_apply_eval_step`` tries the rules associated to a symbol
+in order until one of them matches. For symbols with many rules, for example
+memoized functions like ``f[n_] := f[n] = ...``, most of the rules can be
+discarded without running the pattern matcher, just by looking at the number
+of elements of the expression or at its (literal) arguments.
+
+A ``RuleIndex`` classifies the rules of a list into three buckets:
+
+- ``exact``: rules whose pattern is free of patterns (a literal expression).
+  These are stored in a dictionary keyed by the structure of the pattern, so
+  the rules which can match an expression are found in O(1).
+- ``by_first``: rules whose first argument is a literal, keyed by that argument.
+- ``general``: all the other rules.
+
+Each rule also records the range of number of elements it can match, so
+rules in ``by_first`` and ``general`` with incompatible arity are skipped.
+
+Rules are returned in the same order they appear in the rule list. To do
+that without having to scan the list, each rule has an "ordinal": a number
+that increases with its position in the list.
+"""
+
+from bisect import bisect_left, insort
+from itertools import chain
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from mathics.core.atoms import Integer, Rational, String
+from mathics.core.attributes import A_FLAT, A_ONE_IDENTITY, A_ORDERLESS
+from mathics.core.element import BaseElement
+from mathics.core.expression import Expression
+from mathics.core.pattern import AtomPattern, BasePattern, ExpressionPattern
+from mathics.core.symbols import Symbol
+
+# With these attributes, the match of a pattern depends on more than
+# the number of elements and the literal arguments of the expression.
+A_UNINDEXABLE = A_FLAT | A_ONE_IDENTITY | A_ORDERLESS
+
+# An entry in a bucket: (ordinal, min number of elements, max number of
+# elements or None, rule)
+RuleEntry = Tuple[float, int, Optional[int], "BaseRule"]  # noqa
+
+
+def literal_key(element: BaseElement) -> Optional[Hashable]:
+    """
+    Return a hashable key for ``element`` such that two elements have
+    the same key if and only if they are ``SameQ``.
+
+    Returns None if such a key can not be built, for example
+    if ``element`` contains inexact numbers, whose ``SameQ`` is not
+    an equivalence relation.
+    """
+    if isinstance(element, Symbol):
+        return element
+    if isinstance(element, Integer):
+        return element.value
+    if isinstance(element, String):
+        return ("String", element.value)
+    if isinstance(element, Rational):
+        return ("Rational", element.value)
+    if isinstance(element, Expression):
+        head_key = literal_key(element.head)
+        if head_key is None:
+            return None
+        element_keys = []
+        for sub_element in element.elements:
+            key = literal_key(sub_element)
+            if key is None:
+                return None
+            element_keys.append(key)
+        return ("Expression", head_key, tuple(element_keys))
+    return None
+
+
+def _is_literal(pattern: BasePattern) -> bool:
+    """
+    Return True if ``pattern`` can only match the expressions
+    that are ``SameQ`` to its expression.
+
+    ``ExpressionPattern.isliteral`` is set only once the attributes of
+    the head are known, which usually happens the first time the pattern
+    is matched. Before that, a pattern free of pattern objects is taken
+    as literal: the expressions whose head has one of the attributes in
+    ``A_UNINDEXABLE`` are not looked up in the index anyway.
+    """
+    if isinstance(pattern, AtomPattern):
+        return True
+    if type(pattern) is not ExpressionPattern:
+        return False
+    if pattern.attributes is not None:
+        return pattern.isliteral
+    return _is_literal(pattern.head) and all(
+        _is_literal(element) for element in pattern.elements
+    )
+
+
+def _match_count_range(pattern) -> Tuple[int, Optional[int]]:
+    """
+    Return the range (min, max) of the number of elements in
+    an expression that can match ``pattern``.
+    """
+    min_count, max_count = 0, 0
+    for element in pattern.elements:
+        try:
+            element_min, element_max = element.get_match_count()
+        except (NotImplementedError, TypeError, ValueError):
+            return 0, None
+        min_count += element_min
+        if max_count is not None:
+            max_count = None if element_max is None else max_count + element_max
+    return min_count, max_count
+
+
+class RuleIndex:
+    """
+    Index over a list of rules, used to find the rules
+    that could match a given expression.
+    """
+
+    def __init__(self, rules: List["BaseRule"]):  # noqa
+        self.rebuild(rules)
+
+    def rebuild(self, rules: List["BaseRule"]) -> None:  # noqa
+        """Build the index from scratch."""
+        self.rules = rules
+        self.length = len(rules)
+        self.ordinals: Dict[int, float] = {}
+        # The bucket of each rule: the dictionary of buckets and the key,
+        # or (None, None) for ``general``.
+        self.locations: Dict[int, Tuple[Optional[dict], Optional[Hashable]]] = {}
+        self.exact: Dict[Hashable, List[RuleEntry]] = {}
+        self.exact_lengths: Dict[int, int] = {}
+        self.by_first: Dict[Hashable, List[RuleEntry]] = {}
+        self.general: List[RuleEntry] = []
+        for position, rule in enumerate(rules):
+            self._add_entry(rule, float(position))
+
+    def is_valid_for(self, rules: List["BaseRule"]) -> bool:  # noqa
+        """
+        Check that the index corresponds to ``rules``.
+        When the rule list is replaced, or modified without
+        notifying the index, it must be rebuilt.
+        """
+        return self.rules is rules and self.length == len(rules)
+
+    def _add_entry(self, rule, ordinal: float) -> None:
+        self.ordinals[id(rule)] = ordinal
+        pattern = rule.pattern
+        if not isinstance(pattern, ExpressionPattern) or (
+            pattern.attributes is not None and pattern.attributes & A_UNINDEXABLE
+        ):
+            self._store(rule, (ordinal, 0, None, rule), None, None)
+            return
+
+        if _is_literal(pattern):
+            key = literal_key(pattern.expr)
+            if key is not None:
+                self._store(rule, (ordinal, 0, None, rule), self.exact, key)
+                length = len(pattern.elements)
+                self.exact_lengths[length] = self.exact_lengths.get(length, 0) + 1
+                return
+
+        min_count, max_count = _match_count_range(pattern)
+        entry = (ordinal, min_count, max_count, rule)
+        if pattern.elements:
+            first = pattern.elements[0]
+            if _is_literal(first):
+                key = literal_key(first.expr)
+                if key is not None:
+                    self._store(rule, entry, self.by_first, key)
+                    return
+        self._store(rule, entry, None, None)
+
+    def _store(
+        self,
+        rule,
+        entry: RuleEntry,
+        buckets: Optional[dict],
+        key: Optional[Hashable],
+    ) -> None:
+        bucket = self.general if buckets is None else buckets.setdefault(key, [])
+        insort(bucket, entry)
+        self.locations[id(rule)] = (buckets, key)
+
+    def _remove_entry(self, rule) -> None:
+        ordinal = self.ordinals.pop(id(rule))
+        # The attributes of the pattern may be known by now, so the
+        # bucket is the one recorded when the rule was added.
+        buckets, key = self.locations.pop(id(rule))
+        bucket = self.general if buckets is None else buckets[key]
+        position = bisect_left(bucket, (ordinal,))
+        del bucket[position]
+        if buckets is self.exact:
+            length = len(rule.pattern.elements)
+            self.exact_lengths[length] -= 1
+            if not self.exact_lengths[length]:
+                del self.exact_lengths[length]
+        if buckets is not None and not bucket:
+            del buckets[key]
+
+    def find(self, rule) -> Optional[int]:
+        """
+        Return the position of ``rule`` in the rule list, or None if
+        it is not indexed. Ordinals increase with the position, so the
+        rule is found by bisection.
+        """
+        ordinal = self.ordinals.get(id(rule))
+        if ordinal is None:
+            return None
+        rules, ordinals = self.rules, self.ordinals
+        low, high = 0, len(rules)
+        while low < high:
+            middle = (low + high) // 2
+            if ordinals[id(rules[middle])] < ordinal:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(rules) and rules[low] is rule:
+            return low
+        return None
+
+    def insert(self, position: int, replaced=None) -> None:
+        """
+        Update the index after a rule was inserted at ``position``
+        in the rule list, possibly replacing the rule ``replaced``.
+        """
+        rules = self.rules
+        if replaced is not None:
+            self._remove_entry(replaced)
+        ordinals = self.ordinals
+        try:
+            lower = ordinals[id(rules[position - 1])] if position > 0 else None
+            upper = (
+                ordinals[id(rules[position + 1])] if position + 1 < len(rules) else None
+            )
+        except KeyError:
+            self.rebuild(rules)
+            return
+        if lower is None and upper is None:
+            ordinal = 0.0
+        elif lower is None:
+            ordinal = upper - 1.0
+        elif upper is None:
+            ordinal = lower + 1.0
+        else:
+            ordinal = (lower + upper) / 2
+            if not lower < ordinal < upper:
+                # We ran out of precision: renumber the rules.
+                self.rebuild(rules)
+                return
+        self.length = len(rules)
+        self._add_entry(rules[position], ordinal)
+
+    def remove(self, rule) -> None:
+        """Update the index after ``rule`` was removed from the rule list."""
+        self._remove_entry(rule)
+        self.length = len(self.rules)
+
+    def get_same_pattern_candidates(self, rule) -> List["BaseRule"]:  # noqa
+        """
+        Return the indexed rules whose pattern could be ``SameQ``
+        to the pattern of ``rule``.
+        """
+        pattern = rule.pattern
+        expr = pattern.expr
+        candidates = [entry[3] for entry in self.general]
+        if isinstance(expr, Expression):
+            key = literal_key(expr)
+            if key is not None:
+                candidates.extend(entry[3] for entry in self.exact.get(key, ()))
+            if expr.elements:
+                key = literal_key(expr.elements[0])
+                if key is not None:
+                    candidates.extend(entry[3] for entry in self.by_first.get(key, ()))
+        return candidates
+
+    def get_candidates(
+        self, expression: BaseElement, attributes: int
+    ) -> List["BaseRule"]:  # noqa
+        """
+        Return the rules that could match ``expression``, in
+        the order in which they must be tried. ``attributes`` are
+        the attributes of the head of ``expression``.
+        """
+        if attributes & A_UNINDEXABLE or not isinstance(expression, Expression):
+            return self.rules
+
+        elements = expression.elements
+        num_elements = len(elements)
+        candidates: List[List[RuleEntry]] = []
+
+        if num_elements in self.exact_lengths:
+            key = literal_key(expression)
+            if key is not None:
+                bucket = self.exact.get(key)
+                if bucket:
+                    candidates.append(bucket)
+
+        if self.by_first and num_elements > 0:
+            key = literal_key(elements[0])
+            if key is not None:
+                bucket = self.by_first.get(key)
+                if bucket:
+                    candidates.append(
+                        [
+                            entry
+                            for entry in bucket
+                            if entry[1] <= num_elements
+                            and (entry[2] is None or num_elements <= entry[2])
+                        ]
+                    )
+
+        if self.general:
+            candidates.append(
+                [
+                    entry
+                    for entry in self.general
+                    if entry[1] <= num_elements
+                    and (entry[2] is None or num_elements <= entry[2])
+                ]
+            )
+
+        candidates = [bucket for bucket in candidates if bucket]
+        if not candidates:
+            return []
+        if len(candidates) == 1:
+            return [entry[3] for entry in candidates[0]]
+        # Ordinals are unique, so rules are never compared here.
+        return [entry[3] for entry in sorted(chain(*candidates))]
+
+
+def _strip_pattern_wrappers(expr: BaseElement) -> BaseElement:
+    """
+    Remove the wrappers ``HoldPattern[...]``, ``name:...``, ``.../;cond``
+    and ``...?test`` around a pattern. These wrappers do not change the
+    head of the expressions that the pattern can match.
+    """
+    while isinstance(expr, Expression):
+        head_name = expr.get_head_name()
+        elements = expr.elements
+        if head_name == "System`HoldPattern" and len(elements) == 1:
+            expr = elements[0]
+        elif head_name == "System`Pattern" and len(elements) == 2:
+            expr = elements[1]
+        elif head_name in ("System`Condition", "System`PatternTest") and (
+            len(elements) == 2
+        ):
+            expr = elements[0]
+        else:
+            break
+    return expr
+
+
+class DispatchTable(list):
+    """
+    A list of transformation rules, together with a hash index used to
+    find the rules that could match a given expression. This is what a
+    ``Dispatch`` object stores.
+
+    Rules are classified as:
+
+    - literal rules, whose left-hand side is free of patterns. These are
+      stored in a dictionary keyed by the structure of their left-hand side.
+    - rules whose left-hand side is a pattern with a fixed symbolic head,
+      grouped by that head.
+    - any other rule, which must be tried on every subexpression.
+
+    The classification is done when the table is built, using the attributes
+    that the symbols have at that moment.
+    """
+
+    def __init__(self, rules, evaluation):
+        super().__init__(rules)
+        from mathics.core.pattern import pattern_objects
+
+        definitions = evaluation.definitions
+
+        def unindexable_head(head: BaseElement) -> bool:
+            if not isinstance(head, Symbol):
+                return True
+            if head.get_name() in pattern_objects:
+                return True
+            return bool(head.get_attributes(definitions) & A_UNINDEXABLE)
+
+        def is_literal(expr: BaseElement) -> bool:
+            if not isinstance(expr, Expression):
+                return True
+            if unindexable_head(expr.head):
+                return False
+            return all(is_literal(element) for element in expr.elements)
+
+        self.literals: Dict[Hashable, List[Tuple[int, "BaseRule"]]] = {}  # noqa
+        self.literal_heads = set()
+        self.by_head: Dict[Hashable, List[Tuple[int, "BaseRule"]]] = {}  # noqa
+        self.generic: List[Tuple[int, "BaseRule"]] = []  # noqa
+        for position, rule in enumerate(self):
+            entry = (position, rule)
+            lhs = rule.pattern.expr
+            key = literal_key(lhs) if is_literal(lhs) else None
+            if key is not None:
+                self.literals.setdefault(key, []).append(entry)
+                if isinstance(lhs, Expression):
+                    self.literal_heads.add(literal_key(lhs.head))
+                continue
+            lhs = _strip_pattern_wrappers(lhs)
+            # With OneIdentity, a pattern can also match expressions
+            # with a different head.
+            if (
+                isinstance(lhs, Expression)
+                and isinstance(lhs.head, Symbol)
+                and lhs.head.get_name() not in pattern_objects
+                and not lhs.head.get_attributes(definitions) & A_ONE_IDENTITY
+            ):
+                self.by_head.setdefault(lhs.head, []).append(entry)
+            else:
+                self.generic.append(entry)
+
+    def get_candidates(self, expr: BaseElement) -> List["BaseRule"]:  # noqa
+        """
+        Return the rules that could match ``expr``, in the order
+        they appear in the table.
+        """
+        candidates: List[List[Tuple[int, "BaseRule"]]] = []  # noqa
+        if isinstance(expr, Expression):
+            head_key = literal_key(expr.head)
+            if head_key is not None:
+                if self.literals and head_key in self.literal_heads:
+                    key = literal_key(expr)
+                    if key is not None:
+                        bucket = self.literals.get(key)
+                        if bucket:
+                            candidates.append(bucket)
+                if isinstance(expr.head, Symbol):
+                    bucket = self.by_head.get(expr.head)
+                    if bucket:
+                        candidates.append(bucket)
+        elif self.literals:
+            key = literal_key(expr)
+            if key is not None:
+                bucket = self.literals.get(key)
+                if bucket:
+                    candidates.append(bucket)
+        if self.generic:
+            candidates.append(self.generic)
+
+        if not candidates:
+            return []
+        if len(candidates) == 1:
+            return [entry[1] for entry in candidates[0]]
+        return [entry[1] for entry in sorted(chain(*candidates))]
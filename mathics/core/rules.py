@@ -58,6 +58,7 @@ from mathics.core.element import BaseElement, KeyComparable
 from mathics.core.evaluation import Evaluation
 from mathics.core.expression import Expression
 from mathics.core.pattern import BasePattern, StopGenerator
+from mathics.core.pattern_compiler import compile_pattern
 from mathics.core.symbols import strip_context
 
 
@@ -104,6 +105,22 @@ class BaseRule(KeyComparable, ABC):
         )
         self.system = system
 
+    # The direct matcher of ``self.pattern``, built by ``get_matcher()``
+    # the first time the rule is applied, or None if the pattern is not
+    # supported by ``compile_pattern()``.
+    _matcher: Optional[Callable] = None
+    _matcher_compiled: bool = False
+
+    def get_matcher(self, evaluation: Evaluation) -> Optional[Callable]:
+        """
+        Return the direct matcher of the pattern, or None if the general
+        matcher must be used.
+        """
+        if not self._matcher_compiled:
+            self._matcher = compile_pattern(self.pattern, evaluation)
+            self._matcher_compiled = True
+        return self._matcher
+
     def apply(
         self,
         expression: BaseElement,
@@ -161,16 +178,22 @@ class BaseRule(KeyComparable, ABC):
 
                 # only first possibility counts
 
+        matcher = self.get_matcher(evaluation)
         try:
-            self.pattern.match(
-                expression,
-                pattern_context={
-                    "yield_func": yield_match,
-                    "vars_dict": {},
-                    "evaluation": evaluation,
-                    "fully": fully,
-                },
-            )
+            if matcher is None:
+                self.pattern.match(
+                    expression,
+                    pattern_context={
+                        "yield_func": yield_match,
+                        "vars_dict": {},
+                        "evaluation": evaluation,
+                        "fully": fully,
+                    },
+                )
+            else:
+                vars = matcher(expression, evaluation)
+                if vars is not None:
+                    yield_match(vars, None)
         except StopGenerator_BaseRule as exc:
             # FIXME: figure where these values are not getting set or updated properly.
             # For now we have to take a pessimistic view
@@ -204,6 +227,14 @@ class BaseRule(KeyComparable, ABC):
         # FIXME: check if this makes sense:
         return tuple((self.system, self.pattern.get_sort_key(pattern_sort)))
 
+    def __getstate__(self):
+        # Matchers are closures, which cannot be pickled. They are built
+        # again when the rule is used.
+        odict = self.__dict__.copy()
+        odict.pop("_matcher", None)
+        odict.pop("_matcher_compiled", None)
+        return odict
+
 
 # FIXME: the class name would be better called RewriteRule.
 class Rule(BaseRule):
@@ -363,7 +394,7 @@ class FunctionApplyRule(BaseRule):
         return "<FunctionApplyRule: %s -> %s>" % (self.pattern, self.function)
 
     def __getstate__(self):
-        odict = self.__dict__.copy()
+        odict = super().__getstate__()
         return odict
 
     def __setstate__(self, dict):
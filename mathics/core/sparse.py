@@ -0,0 +1,530 @@
+# -*- coding: utf-8 -*-
+"""
+Module containing SparseArrayExpression
+
+A SparseArray is written as ``SparseArray[Automatic, dims, default, rules]``,
+where ``rules`` is a List of rules ``{i1, i2, ...} -> value`` for the elements
+that are not ``default``. Looking up an element in such an expression means
+walking through all of its rules, and most operations used to build the dense
+array first, which is not possible for the large sparse arrays used, for
+example, as adjacency matrices.
+
+``SparseArrayExpression`` stores the explicit elements of a sparse array by
+their positions. The rules are only built when they are needed.
+"""
+
+import reprlib
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy
+
+from mathics.core.atoms import Integer, MachineReal
+from mathics.core.element import BaseElement, ElementsProperties
+from mathics.core.expression import Expression, ExpressionCache
+from mathics.core.list import (
+    MACHINE_INTEGER_MAX,
+    MACHINE_INTEGER_MIN,
+    ListExpression,
+    PackedListExpression,
+    frozen_array,
+    pack_elements,
+)
+from mathics.core.systemsymbols import SymbolAutomatic, SymbolRule, SymbolSparseArray
+
+try:
+    import scipy.sparse as scipy_sparse
+except ImportError:
+    scipy_sparse = None
+
+# The position of an element, as a tuple of 1-based indices.
+Position = Tuple[int, ...]
+
+
+def is_machine_number(element: BaseElement) -> bool:
+    """Return True if ``element`` is a machine integer or a machine real."""
+    if isinstance(element, MachineReal):
+        return True
+    return (
+        isinstance(element, Integer)
+        and MACHINE_INTEGER_MIN <= element.value <= MACHINE_INTEGER_MAX
+    )
+
+
+class _SparseElementsSortKey:
+    """
+    Stand-in for the elements in the sort key of a sparse array, so that
+    two numeric arrays are compared by their explicit elements without
+    building the rules.
+    """
+
+    __slots__ = ("expr",)
+
+    def __init__(self, expr: "SparseArrayExpression"):
+        self.expr = expr
+
+    def _compare(self, other) -> int:
+        """Return -1, 0 or 1, as the elements of ``self`` are <, == or > ``other``."""
+        expr = self.expr
+        if (
+            isinstance(other, _SparseElementsSortKey)
+            and expr.data is None
+            and other.expr.data is None
+            and expr.values.dtype == other.expr.values.dtype
+        ):
+            other_expr = other.expr
+            # The elements are Automatic, the dims, the default, and the
+            # list of rules, whose sort key starts with its length.
+            first = (expr.dims_list(), expr.default, expr.explicit_length)
+            second = (
+                other_expr.dims_list(),
+                other_expr.default,
+                other_expr.explicit_length,
+            )
+            if first != second:
+                return -1 if first < second else 1
+            differences = numpy.flatnonzero(
+                (expr.indices != other_expr.indices).any(axis=1)
+                | (expr.values != other_expr.values)
+            )
+            if len(differences) == 0:
+                return 0
+            # The order is that of the first rule that is not the same.
+            index = int(differences[0])
+            first, second = expr.rule(index), other_expr.rule(index)
+            if first == second:
+                return 0
+            return -1 if first < second else 1
+
+        elements = expr.elements
+        if isinstance(other, _SparseElementsSortKey):
+            other = other.expr.elements
+        if elements == other:
+            return 0
+        return -1 if elements < other else 1
+
+    def __eq__(self, other) -> bool:
+        return self._compare(other) == 0
+
+    def __lt__(self, other) -> bool:
+        return self._compare(other) < 0
+
+    def __le__(self, other) -> bool:
+        return self._compare(other) <= 0
+
+    def __gt__(self, other) -> bool:
+        return self._compare(other) > 0
+
+    def __ge__(self, other) -> bool:
+        return self._compare(other) >= 0
+
+
+class SparseArrayExpression(Expression):
+    """
+    A Mathics3 ``SparseArray[Automatic, dims, default, rules]`` that stores
+    its explicit elements by position.
+
+    If the default and all the explicit values are machine numbers, and
+    the values are all integers or all reals, the 0-based positions of
+    the values are stored in the rows of the NumPy array ``indices``, in
+    lexicographic order, and the values in the NumPy array ``values``.
+    This is the COO format of SciPy; ``to_scipy()`` gives the CSR matrix
+    of a numeric array of rank 2. Otherwise, the explicit elements are
+    stored in the dictionary ``data``, from their positions to their
+    values, in lexicographic order of the positions.
+
+    Explicit elements are never equal to the default. The rules are only
+    built when the elements are needed. Changing the elements turns this
+    into an ordinary expression.
+
+    positional Arguments:
+        - dims -- the dimensions, a tuple of positive ints
+        - default -- the value of the elements that are not explicit
+
+    Keyword Arguments:
+        - data -- a dictionary from Positions to values
+        - indices -- a NumPy array of int64 0-based positions
+        - values -- a NumPy array of int64 or float64 values
+    """
+
+    def __init__(
+        self,
+        dims: Position,
+        default: BaseElement,
+        data: Optional[Dict[Position, BaseElement]] = None,
+        indices: Optional[numpy.ndarray] = None,
+        values: Optional[numpy.ndarray] = None,
+    ):
+        self.options = None
+        self.pattern_sequence = False
+        self._head = SymbolSparseArray
+        self.dims = dims
+        self.default = default
+        self.data = data
+        if data is None:
+            indices = frozen_array(indices)
+            values = frozen_array(values)
+            self.elements_properties = ElementsProperties(
+                elements_fully_evaluated=True, is_flat=True, is_ordered=False
+            )
+        else:
+            self.elements_properties = None
+        self.indices = indices
+        self.values = values
+        self._unpacked: Optional[tuple] = None
+        self._csr = None
+        self.value = None
+        self._is_literal = None
+        self._sequences = None
+        self._cache = None
+        self.original = None
+
+    def __getnewargs__(self):
+        return (self.dims, self.default, self.data, self.indices, self.values)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_unpacked"] = None
+        state["_csr"] = None
+        return state
+
+    def __hash__(self):
+        if self.data is not None:
+            return super().__hash__()
+        return hash(
+            (
+                "SparseArrayExpression",
+                self.dims,
+                self.default,
+                self.values.dtype.str,
+                self.indices.tobytes(),
+                self.values.tobytes(),
+            )
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<SparseArrayExpression: {self.dims}, {reprlib.repr(self.default)}, "
+            f"{self.explicit_length} explicit elements>"
+        )
+
+    @property
+    def _elements(self) -> tuple:
+        elements = self._unpacked
+        if elements is None:
+            rules = [_make_rule(position, value) for position, value in self.items()]
+            elements = (
+                SymbolAutomatic,
+                self.dims_list(),
+                self.default,
+                ListExpression(*rules),
+            )
+            self._unpacked = elements
+        return elements
+
+    @_elements.setter
+    def _elements(self, elements: tuple):
+        # Setting other elements turns this into an ordinary SparseArray.
+        for name in ("dims", "default", "data", "indices", "values"):
+            delattr(self, name)
+        del self._unpacked
+        del self._csr
+        self.__class__ = Expression
+        Expression.__init__(self, SymbolSparseArray, *elements)
+
+    def dims_list(self) -> ListExpression:
+        """Return the dimensions as a List."""
+        return ListExpression(*(Integer(dim) for dim in self.dims))
+
+    @property
+    def has_numeric_storage(self) -> bool:
+        return self.data is None
+
+    @property
+    def explicit_length(self) -> int:
+        """The number of explicit elements."""
+        if self.data is None:
+            return len(self.values)
+        return len(self.data)
+
+    def _value_atoms(self) -> list:
+        if self.values.dtype.kind == "f":
+            return [MachineReal(value) for value in self.values.tolist()]
+        return [Integer(value) for value in self.values.tolist()]
+
+    def items(self) -> Iterator[Tuple[Position, BaseElement]]:
+        """Iterate over the positions and the values of the explicit elements."""
+        if self.data is not None:
+            return iter(self.data.items())
+        positions = (tuple(row) for row in (self.indices + 1).tolist())
+        return zip(positions, self._value_atoms())
+
+    def to_dict(self) -> Dict[Position, BaseElement]:
+        """Return a dictionary from the positions to the explicit values."""
+        if self.data is not None:
+            return self.data
+        return dict(self.items())
+
+    def find_range(self, prefix: Position) -> Tuple[int, int]:
+        """
+        For a numeric array, return the range of the rows of ``indices``
+        that start with ``prefix``, a tuple of 0-based indices.
+        """
+        start, end = 0, len(self.indices)
+        for column, index in enumerate(prefix):
+            column_values = self.indices[start:end, column]
+            end = start + int(numpy.searchsorted(column_values, index, "right"))
+            start += int(numpy.searchsorted(column_values, index, "left"))
+        return start, end
+
+    def rule(self, index: int) -> Expression:
+        """Return the rule for the explicit element ``index`` of a numeric array."""
+        position = tuple(index + 1 for index in self.indices[index].tolist())
+        value = self.values[index].item()
+        return _make_rule(
+            position, MachineReal(value) if isinstance(value, float) else Integer(value)
+        )
+
+    def get(self, position: Position) -> BaseElement:
+        """Return the element at ``position``, a tuple of 1-based indices."""
+        if self.data is not None:
+            return self.data.get(position, self.default)
+        start, end = self.find_range(tuple(index - 1 for index in position))
+        if start == end:
+            return self.default
+        value = self.values[start].item()
+        return MachineReal(value) if isinstance(value, float) else Integer(value)
+
+    def to_numpy(self) -> numpy.ndarray:
+        """Return the dense NumPy array of a numeric array."""
+        dtype = numpy.result_type(self.values, self.default.value)
+        array = numpy.full(self.dims, self.default.value, dtype=dtype)
+        array[tuple(self.indices.T)] = self.values
+        return array
+
+    def to_scipy(self):
+        """
+        Return the SciPy CSR matrix of a numeric array of rank 2 whose
+        default is 0, or None.
+        """
+        if (
+            self.data is not None
+            or len(self.dims) != 2
+            or scipy_sparse is None
+            or self.default.value != 0
+        ):
+            return None
+        if self._csr is None:
+            self._csr = scipy_sparse.csr_array(
+                (self.values, (self.indices[:, 0], self.indices[:, 1])),
+                shape=self.dims,
+            )
+        return self._csr
+
+    def _rebuild_cache(self) -> ExpressionCache:
+        if self.data is not None:
+            return super()._rebuild_cache()
+        # Numeric arrays only contain numbers, so there is no need to look
+        # at the elements.
+        cache = self._cache
+        if cache is None or cache.symbols is None or cache.sequences is None:
+            time = None if cache is None else cache.time
+            cache = ExpressionCache(
+                time,
+                {
+                    "System`SparseArray",
+                    "System`Automatic",
+                    "System`List",
+                    "System`Rule",
+                },
+                [],
+            )
+            self._cache = cache
+        return cache
+
+    def _new(self) -> "SparseArrayExpression":
+        return SparseArrayExpression(
+            self.dims, self.default, self.data, self.indices, self.values
+        )
+
+    def copy(self, reevaluate=False) -> "Expression":
+        if reevaluate:
+            return super().copy(reevaluate)
+        return self._new()
+
+    def replace_vars(self, vars, options=None, in_scoping=True, in_function=True):
+        if self.data is None:
+            # There are no symbols to replace in a numeric array.
+            return self
+        return super().replace_vars(vars, options, in_scoping, in_function)
+
+    def rewrite_apply_eval_step(self, evaluation) -> Tuple[Expression, bool]:
+        if (
+            self.data is None
+            and "System`SparseArray" not in evaluation.definitions.user
+        ):
+            # Numeric arrays are fully evaluated.
+            return self, False
+        return super().rewrite_apply_eval_step(evaluation)
+
+    def get_sort_key(self, pattern_sort=False) -> tuple:
+        if pattern_sort:
+            return super().get_sort_key(True)
+        # This is the sort key of an Expression, with its elements built lazily.
+        return (2, 3, SymbolSparseArray, 4, _SparseElementsSortKey(self), 1)
+
+    def sameQ(self, other: BaseElement) -> bool:
+        """Mathics3 SameQ"""
+        if self is other:
+            return True
+        if isinstance(other, SparseArrayExpression):
+            if self.dims != other.dims or not self.default.sameQ(other.default):
+                return False
+            if self.data is None and other.data is None:
+                return (
+                    self.values.dtype == other.values.dtype
+                    and self.indices.shape == other.indices.shape
+                    and bool((self.indices == other.indices).all())
+                    and bool((self.values == other.values).all())
+                )
+        elif not (
+            isinstance(other, Expression)
+            and other.head is SymbolSparseArray
+            and len(other.elements) == 4
+        ):
+            return False
+        return super().sameQ(other)
+
+    def shallow_copy(self) -> "SparseArrayExpression":
+        expr = self._new()
+        expr._cache = self._rebuild_cache()
+        return expr
+
+
+def _make_rule(position: Position, value: BaseElement) -> Expression:
+    return Expression(
+        SymbolRule, ListExpression(*(Integer(index) for index in position)), value
+    )
+
+
+def _lexicographic_order(indices: numpy.ndarray) -> numpy.ndarray:
+    """
+    Return the permutation that sorts the rows of ``indices``
+    lexicographically, keeping equal rows in order.
+    """
+    if indices.shape[1] == 0:
+        return numpy.arange(len(indices))
+    return numpy.lexsort(indices.T[::-1])
+
+
+def numeric_sparse_array(
+    dims: Position,
+    default: BaseElement,
+    indices: numpy.ndarray,
+    values: numpy.ndarray,
+) -> SparseArrayExpression:
+    """
+    Return a numeric SparseArrayExpression with the values ``values`` at the
+    0-based positions in the rows of ``indices``. If a position appears more
+    than once, the first value is used.
+    """
+    indices = numpy.asarray(indices, dtype=numpy.int64).reshape(-1, len(dims))
+    order = _lexicographic_order(indices)
+    indices = indices[order]
+    values = values[order]
+    if len(indices) > 1:
+        # The order is stable, so the first of equal positions is kept.
+        keep = numpy.empty(len(indices), dtype=bool)
+        keep[0] = True
+        keep[1:] = (indices[1:] != indices[:-1]).any(axis=1)
+        indices = indices[keep]
+        values = values[keep]
+    if isinstance(default, MachineReal) == (values.dtype.kind == "f"):
+        explicit = values != default.value
+        if not explicit.all():
+            indices = indices[explicit]
+            values = values[explicit]
+    return SparseArrayExpression(dims, default, indices=indices, values=values)
+
+
+def sparse_array_from_dict(
+    dims: Position, default: BaseElement, data: Dict[Position, BaseElement]
+) -> SparseArrayExpression:
+    """
+    Return a SparseArrayExpression with the values of ``data`` at the
+    positions of its keys. Numeric arrays get numeric storage.
+    """
+    if is_machine_number(default):
+        packed = pack_elements(list(data.values())) if data else None
+        if packed is not None and packed.array.ndim == 1:
+            return numeric_sparse_array(
+                dims,
+                default,
+                numpy.array(list(data.keys()), dtype=numpy.int64) - 1,
+                packed.array,
+            )
+        if not data:
+            return SparseArrayExpression(
+                dims,
+                default,
+                indices=numpy.zeros((0, len(dims)), dtype=numpy.int64),
+                values=numpy.zeros(0, dtype=numpy.int64),
+            )
+    data = {
+        position: value
+        for position, value in sorted(data.items(), key=lambda item: item[0])
+        if not value.sameQ(default)
+    }
+    return SparseArrayExpression(dims, default, data=data)
+
+
+def sparse_array_from_rules(
+    dims: Position, default: BaseElement, rules: Sequence[BaseElement]
+) -> Optional[SparseArrayExpression]:
+    """
+    Return a SparseArrayExpression from a list of rules
+    ``{i1, i2, ...} -> value``, or None if some rule does not give the
+    value of an element within ``dims``. If there are several rules for
+    the same element, the first one is used.
+    """
+    data: Dict[Position, BaseElement] = {}
+    rank = len(dims)
+    for rule in rules:
+        if not rule.has_form("Rule", 2):
+            return None
+        position_expr, value = rule.elements
+        if not position_expr.has_form("List", rank):
+            return None
+        position = []
+        for index, dim in zip(position_expr.elements, dims):
+            if not isinstance(index, Integer) or not 1 <= index.value <= dim:
+                return None
+            position.append(index.value)
+        data.setdefault(tuple(position), value)
+    return sparse_array_from_dict(dims, default, data)
+
+
+def to_dense_list(array: SparseArrayExpression) -> ListExpression:
+    """Return the List with the elements of ``array``."""
+    if array.data is None and isinstance(array.default, MachineReal) == (
+        array.values.dtype.kind == "f"
+    ):
+        return PackedListExpression(array.to_numpy())
+
+    def build(level: int) -> list:
+        if level == len(array.dims) - 1:
+            return [array.default] * array.dims[level]
+        return [build(level + 1) for _ in range(array.dims[level])]
+
+    dense = build(0)
+    for position, value in array.items():
+        row = dense
+        for index in position[:-1]:
+            row = row[index - 1]
+        row[position[-1] - 1] = value
+
+    def to_list(row: list) -> ListExpression:
+        if row and isinstance(row[0], list):
+            return ListExpression(*(to_list(element) for element in row))
+        return ListExpression(*row)
+
+    return to_list(dense)
@@ -1,6 +1,7 @@
 # cython: language_level=3
 # -*- coding: utf-8 -*-
 
+from copy import copy
 
 from mathics.core.atoms import Integer
 from mathics.core.exceptions import MessageException
@@ -154,10 +155,16 @@ class ExpressionPointer:
             else:
                 return element.copy()
 
-    def replace(self, new):
+    def replace(self, new, owned=None):
         """
         This method replaces the value pointed out by a `new` value.
+
+        The expressions along the path are copied before they are changed,
+        since they may be shared with other expressions. `owned` is the set
+        of ids of the copies already made, which are changed in place.
         """
+        if owned is None:
+            owned = set()
         # First, look for the ancestor that is not an ExpressionPointer,
         # keeping the positions of each step:
         parent = self.parent
@@ -172,12 +179,18 @@ class ExpressionPointer:
         # At this point, we hit the expression, and we have
         # the path to reach the position
         i = pos.pop()
+        steps = []
         try:
             while pos:
                 if i == 0:
-                    parent = parent._head
+                    child = parent._head
                 else:
-                    parent = parent.elements[i - 1]
+                    child = parent.elements[i - 1]
+                if isinstance(child, Expression) and id(child) not in owned:
+                    child = copy(child)
+                    owned.add(id(child))
+                steps.append((parent, i, child))
+                parent = child
                 i = pos.pop()
         except Exception:
             raise MessageException("Part", "span", pos)
@@ -189,6 +202,14 @@ class ExpressionPointer:
         else:
             parent.set_element(i - 1, new)
 
+        # Link the changed parts back, from the innermost one, so that the
+        # properties of each parent are those of its changed elements.
+        for parent, i, child in reversed(steps):
+            if i == 0:
+                parent.set_head(child)
+            else:
+                parent.set_element(i - 1, child)
+
 
 class SubExpression:
     """
@@ -284,15 +305,17 @@ class SubExpression:
             *(element.to_expression() for element in self._elementsp),
         )
 
-    def replace(self, new):
+    def replace(self, new, owned=None):
         """
         Assigns `new` to the subexpression, according to the logic of `mathics.eval.list.eol.eval_Part`
         """
+        if owned is None:
+            owned = set()
         if (new.has_form("List", None) or new.get_head_name() == "System`List") and len(
             new.elements
         ) == len(self._elementsp):
             for element, sub_new in zip(self._elementsp, new.elements):
-                element.replace(sub_new)
+                element.replace(sub_new, owned)
         else:
             for element in self._elementsp:
-                element.replace(new)
+                element.replace(new, owned)
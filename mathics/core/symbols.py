@@ -1,6 +1,7 @@
 # cython: language_level=3
 # -*- coding: utf-8 -*-
 
+import sys
 from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Sequence, Union
 
 from mathics.core.element import (
@@ -222,6 +223,15 @@ class Atom(BaseElement):
     class_head_name = ""
     original: Optional["Atom"] = None
 
+    def __getstate__(self):
+        # Hash values of strings and classes change from one Python
+        # process to another, so the hash is not pickled: it is set
+        # by __new__ when the atom is unpickled. Otherwise, loading a
+        # pickle would overwrite the hash of interned atoms.
+        state = self.__dict__.copy()
+        state.pop("hash", None)
+        return state
+
     def __repr__(self) -> str:
         return "<%s: %s>" % (self.get_atom_name(), self)
 
@@ -441,6 +451,26 @@ class Symbol(Atom, NumericOperators, EvalMixin):
 
         return self
 
+    @classmethod
+    def release(cls, name: str) -> bool:
+        """
+        Remove the symbol ``name`` from the dictionary of Symbols, if no
+        other object refers to it. Return True if it was removed.
+
+        This is used for temporary symbols, which are never created again
+        with the same name. Without reference counts, as in PyPy, symbols
+        are never removed.
+        """
+        symbol = cls._symbols.get(name)
+        if symbol is None or not hasattr(sys, "getrefcount"):
+            return False
+        # The references are the dictionary, ``symbol`` and the argument
+        # of getrefcount().
+        if sys.getrefcount(symbol) > 3:
+            return False
+        del cls._symbols[name]
+        return True
+
     def __eq__(self, other) -> bool:
         return self is other
 
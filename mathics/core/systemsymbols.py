@@ -36,6 +36,7 @@ SymbolApply = Symbol("System`Apply")
 SymbolArcCos = Symbol("System`ArcCos")
 SymbolArcSin = Symbol("System`ArcSin")
 SymbolArcTan = Symbol("System`ArcTan")
+SymbolAssociateTo = Symbol("System`AssociateTo")
 SymbolAssociation = Symbol("System`Association")
 SymbolAssumptions = Symbol("System`$Assumptions")
 SymbolAttributes = Symbol("System`Attributes")
@@ -46,12 +47,15 @@ SymbolBlank = Symbol("System`Blank")
 SymbolBlankNullSequence = Symbol("System`BlankNullSequence")
 SymbolBlankSequence = Symbol("System`BlankSequence")
 SymbolBlend = Symbol("System`Blend")
+SymbolBlock = Symbol("System`Block")
 SymbolBreak = Symbol("System`Break")
+SymbolByte = Symbol("System`Byte")
 SymbolByteArray = Symbol("System`ByteArray")
 SymbolC = Symbol("System`C")
 SymbolCases = Symbol("System`Cases")
 SymbolCatalan = Symbol("System`Catalan")
 SymbolCeiling = Symbol("System`Ceiling")
+SymbolCharacter = Symbol("System`Character")
 SymbolClusteringComponents = Symbol("System`ClusteringComponents")
 SymbolColorConvert = Symbol("System`ColorConvert")
 SymbolColorData = Symbol("System`ColorData")
@@ -79,6 +83,7 @@ SymbolDerivative = Symbol("System`Derivative")
 SymbolDigitCharacter = Symbol("System`DigitCharacter")
 SymbolDirectedInfinity = Symbol("System`DirectedInfinity")
 SymbolDispatch = Symbol("System`Dispatch")
+SymbolDo = Symbol("System`Do")
 SymbolDot = Symbol("System`Dot")
 SymbolDownValues = Symbol("System`DownValues")
 SymbolDrop = Symbol("System`Drop")
@@ -130,10 +135,12 @@ SymbolInequality = Symbol("System`Inequality")
 SymbolInfinity = Symbol("System`Infinity")
 SymbolInfix = Symbol("System`Infix")
 SymbolInner = Symbol("System`Inner")
+SymbolInset = Symbol("System`Inset")
 SymbolInputForm = Symbol("System`InputForm")
 SymbolInputStream = Symbol("System`InputStream")
 SymbolInteger = Symbol("System`Integer")
 SymbolIntegrate = Symbol("System`Integrate")
+SymbolJoin = Symbol("System`Join")
 SymbolLeft = Symbol("System`Left")
 SymbolLength = Symbol("System`Length")
 SymbolLess = Symbol("System`Less")
@@ -162,6 +169,7 @@ SymbolMedian = Symbol("System`Median")
 SymbolMemberQ = Symbol("System`MemberQ")
 SymbolMessageName = Symbol("System`MessageName")
 SymbolMessages = Symbol("System`Messages")
+SymbolMethod = Symbol("System`Method")
 SymbolMinus = Symbol("System`Minus")
 SymbolMissing = Symbol("System`Missing")
 SymbolN = Symbol("System`N")
@@ -173,6 +181,7 @@ SymbolNorm = Symbol("System`Norm")
 SymbolNormal = Symbol("System`Normal")
 SymbolNot = Symbol("System`Not")
 SymbolNothing = Symbol("System`Nothing")
+SymbolNumber = Symbol("System`Number")
 SymbolNumberForm = Symbol("System`NumberForm")
 SymbolNumberString = Symbol("System`NumberString")
 SymbolNumberQ = Symbol("System`NumberQ")
@@ -185,6 +194,7 @@ SymbolOptional = Symbol("System`Optional")
 SymbolOptions = Symbol("System`Options")
 SymbolOptionsPattern = Symbol("System`OptionsPattern")
 SymbolOr = Symbol("System`Or")
+SymbolOrderedQ = Symbol("System`OrderedQ")
 SymbolOut = Symbol("System`Out")
 SymbolOutputForm = Symbol("System`OutputForm")
 SymbolOutputStream = Symbol("System`OutputStream")
@@ -196,6 +206,7 @@ SymbolPart = Symbol("System`Part")
 SymbolPath = Symbol("System`$Path")
 SymbolPattern = Symbol("System`Pattern")
 SymbolPatternTest = Symbol("System`PatternTest")
+SymbolPatternsOrderedQ = Symbol("System`PatternsOrderedQ")
 SymbolPause = Symbol("System`Pause")
 SymbolPi = Symbol("System`Pi")
 SymbolPiecewise = Symbol("System`Piecewise")
@@ -213,6 +224,7 @@ SymbolQuotientRemainder = Symbol("System`QuotientRemainder")
 SymbolRGBColor = Symbol("System`RGBColor")
 SymbolRandomComplex = Symbol("System`RandomComplex")
 SymbolRandomReal = Symbol("System`RandomReal")
+SymbolRandomSeed = Symbol("System`RandomSeed")
 SymbolRankedMax = Symbol("RankedMax")
 SymbolRankedMin = Symbol("RankedMin")
 SymbolRational = Symbol("System`Rational")
@@ -221,6 +233,7 @@ SymbolReal = Symbol("System`Real")
 SymbolRealAbs = Symbol("System`RealAbs")
 SymbolRealDigits = Symbol("System`RealDigits")
 SymbolRealSign = Symbol("System`RealSign")
+SymbolRecord = Symbol("System`Record")
 SymbolRepeated = Symbol("System`Repeated")
 SymbolRepeatedNull = Symbol("System`RepeatedNull")
 SymbolReplaceList = Symbol("System`ReplaceList")
@@ -268,6 +281,7 @@ SymbolSubsetQ = Symbol("System`SubsetQ")
 SymbolSubtract = Symbol("System`Subtract")
 SymbolSubscriptBox = Symbol("System`SubscriptBox")
 SymbolSubsuperscriptBox = Symbol("System`SubsuperscriptBox")
+SymbolSum = Symbol("System`Sum")
 SymbolSuperscriptBox = Symbol("System`SuperscriptBox")
 SymbolTable = Symbol("System`Table")
 SymbolTake = Symbol("System`Take")
@@ -175,7 +175,7 @@ def main():
     # LoadModule Mathics3 modules to pull in modules, and
     # their docstrings
 
-    import_and_load_builtins()
+    import_and_load_builtins(lazy=False)
 
     if args.pymathics:
         definitions = Definitions(add_builtin=True)
@@ -949,5 +949,5 @@ def main():
 
 
 if __name__ == "__main__":
-    import_and_load_builtins()
+    import_and_load_builtins(lazy=False)
     main()
@@ -7,9 +7,11 @@ Many of these depend on the evaluation context. Conversions to SymPy are
 used just as a last resource.
 """
 
-from typing import Optional
+from fractions import Fraction
+from typing import Optional, Union
 
 import mpmath
+import numpy
 import sympy
 
 # Note: it is important *not* use: from mathics.eval.tracing import run_sympy
@@ -41,6 +43,13 @@ RationalMOneHalf = Rational(-1, 2)
 RealM0p5 = Real(-0.5)
 RealOne = Real(1.0)
 
+# Integers with an absolute value up to this are converted exactly to
+# machine reals.
+MAX_EXACT_FLOAT_INTEGER = 2**53
+MAX_MACHINE_INTEGER = 2**63 - 1
+
+VectorizedArgument = Union[numpy.ndarray, int, float, Fraction]
+
 
 def eval_Plus(*items: BaseElement) -> BaseElement:
     "evaluate Plus for general elements"
@@ -268,3 +277,167 @@ def eval_multiply_numbers(*numbers: Number) -> Number:
             return from_mpmath(number, prec)
     else:
         return from_sympy(sympy.Mul(*(item.to_sympy() for item in numbers)))
+
+
+# Vectorized versions of the arithmetic functions, for packed arrays.
+# See mathics.core.list.eval_vectorized().
+#
+# They give exactly the same result as evaluating the threaded
+# expression. So, machine integers must not overflow, and an operation
+# on machine reals must round only once, as mpmath does for Plus and
+# Times with machine precision numbers. Otherwise, they return None.
+
+
+def _is_integer_argument(arg: VectorizedArgument) -> bool:
+    if isinstance(arg, numpy.ndarray):
+        return arg.dtype.kind == "i"
+    return isinstance(arg, int)
+
+
+def max_abs(arg: VectorizedArgument) -> int:
+    """
+    Maximum absolute value of an integer argument, as a Python int.
+    """
+    if isinstance(arg, numpy.ndarray):
+        if arg.size == 0:
+            return 0
+        return max(-int(arg.min()), int(arg.max()))
+    return abs(arg)
+
+
+def machine_real_result(result: numpy.ndarray) -> Optional[numpy.ndarray]:
+    """
+    Check that `result` does not have infinities, NaNs or denormalized
+    numbers, whose value would be different with mpmath.
+    """
+    if not numpy.isfinite(result).all():
+        return None
+    magnitude = numpy.abs(result)
+    if ((magnitude < numpy.finfo(numpy.float64).tiny) & (result != 0)).any():
+        return None
+    # Turn -0. into 0.
+    return result + 0.0
+
+
+def _split_arguments(args):
+    """
+    Split the arguments of Plus or Times into integer and real arguments.
+    Return None if there are rational arguments, or if the result would be
+    rounded more than once: integers are combined exactly, and then each
+    real argument takes a rounded operation.
+    """
+    integers = []
+    reals = []
+    for arg in args:
+        if _is_integer_argument(arg):
+            integers.append(arg)
+        elif isinstance(arg, Fraction):
+            return None
+        else:
+            reals.append(arg)
+    if len(reals) > (1 if integers else 2):
+        return None
+    return integers, reals
+
+
+def eval_Plus_vectorized(*args: VectorizedArgument) -> Optional[numpy.ndarray]:
+    "Plus over packed arrays"
+    split = _split_arguments(args)
+    if split is None:
+        return None
+    integers, reals = split
+    bound = MAX_EXACT_FLOAT_INTEGER if reals else MAX_MACHINE_INTEGER
+    if sum(max_abs(arg) for arg in integers) > bound:
+        return None
+    if len(reals) == 2:
+        return machine_real_result(reals[0] + reals[1])
+    result = sum(integers)
+    if reals:
+        return machine_real_result(result + reals[0])
+    return result
+
+
+def eval_Times_vectorized(*args: VectorizedArgument) -> Optional[numpy.ndarray]:
+    "Times over packed arrays"
+    split = _split_arguments(args)
+    if split is None:
+        return None
+    integers, reals = split
+    # Products with machine reals are rounded after each factor.
+    if reals and len(integers) > 1:
+        return None
+    bound = MAX_EXACT_FLOAT_INTEGER if reals else MAX_MACHINE_INTEGER
+    max_product = 1
+    for arg in integers:
+        max_product *= max_abs(arg)
+        if max_product > bound:
+            return None
+    if len(reals) == 2:
+        return machine_real_result(reals[0] * reals[1])
+    result = 1
+    for arg in integers:
+        result = result * arg
+    if reals:
+        return machine_real_result(result * reals[0])
+    return result
+
+
+def eval_Power_vectorized(
+    base: VectorizedArgument, exponent: VectorizedArgument
+) -> Optional[numpy.ndarray]:
+    "Power over packed arrays"
+    if _is_integer_argument(base) and _is_integer_argument(exponent):
+        if isinstance(exponent, numpy.ndarray):
+            if exponent.size == 0:
+                return numpy.power(base, exponent)
+            min_exponent, max_exponent = int(exponent.min()), int(exponent.max())
+        else:
+            min_exponent = max_exponent = exponent
+        # Negative exponents give rationals, and 0^0 is indeterminate.
+        if min_exponent <= 0:
+            return None
+        max_base = max_abs(base)
+        if max_base > 1 and (
+            max_exponent > 63 or max_base**max_exponent > MAX_MACHINE_INTEGER
+        ):
+            return None
+        return numpy.power(base, exponent)
+
+    # Machine real powers are rounded once only for a few exponents.
+    if isinstance(exponent, numpy.ndarray) or not isinstance(base, numpy.ndarray):
+        return None
+    if base.dtype.kind != "f":
+        return None
+    if exponent == 2:
+        result = base * base
+    elif exponent == -1:
+        result = 1.0 / base
+    elif exponent == Fraction(1, 2):
+        if (base < 0).any():
+            return None
+        result = numpy.sqrt(base)
+    else:
+        return None
+    return machine_real_result(result)
+
+
+def eval_Subtract_vectorized(
+    x: VectorizedArgument, y: VectorizedArgument
+) -> Optional[numpy.ndarray]:
+    "Subtract over packed arrays, as Plus[x, Times[-1, y]]"
+    minus_y = eval_Times_vectorized(-1, y)
+    if minus_y is None:
+        return None
+    return eval_Plus_vectorized(x, minus_y)
+
+
+def eval_Divide_vectorized(
+    x: VectorizedArgument, y: VectorizedArgument
+) -> Optional[numpy.ndarray]:
+    "Divide over packed arrays, as Times[x, Power[y, -1]]"
+    if not isinstance(y, numpy.ndarray):
+        return None
+    inverse_y = eval_Power_vectorized(y, -1)
+    if inverse_y is None:
+        return None
+    return eval_Times_vectorized(x, inverse_y)
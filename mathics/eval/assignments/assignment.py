@@ -6,6 +6,7 @@ evaluation routines for Set and SetDelayed, and Builtin functions
 found in module mathics.builtin.assignments.assignment
 """
 
+from copy import copy
 from functools import reduce
 from typing import List, Optional, Tuple
 
@@ -392,6 +393,21 @@ def eval_assign_definition_values(
     return True
 
 
+def eval_assign_evaluation_cache_size(
+    lhs: BaseElement, rhs: BaseElement, evaluation: Evaluation
+) -> bool:
+    """
+    Set ownvalue for the Settings`$EvaluationCacheSize symbol, and
+    resize the evaluation cache.
+    """
+    rhs_int_value = rhs.get_int_value()
+    if rhs_int_value is None or rhs_int_value < 0:
+        evaluation.message("Settings`$EvaluationCacheSize", "setsize", rhs)
+        raise AssignmentException(lhs, None)
+    evaluation.definitions.evaluation_cache.resize(rhs_int_value)
+    return True
+
+
 def eval_assign_format(
     self: Builtin,
     lhs: BaseElement,
@@ -1052,6 +1068,8 @@ def eval_assign_other(
         eval_assign_minprecision(self, lhs, rhs, evaluation, tags, upset)
     elif lhs_name == "System`$MaxPrecision":
         eval_assign_maxprecision(self, lhs, rhs, evaluation, tags, upset)
+    elif lhs_name == "Settings`$EvaluationCacheSize":
+        eval_assign_evaluation_cache_size(lhs, rhs, evaluation)
     else:
         return False, tags
     return True, tags
@@ -1111,7 +1129,14 @@ def eval_assign_part(
         evaluation.message(self.get_name(), "noval", symbol)
         return False
     indices = lhs.elements[1:]
-    return eval_Part([rule], indices, evaluation, rhs)
+    # The stored value may be shared with other values, so the parts are
+    # set on a copy, which is stored back.
+    if isinstance(rule, Expression):
+        rule = copy(rule)
+    result = eval_Part([rule], indices, evaluation, rhs)
+    if result is not False:
+        defs.set_ownvalue(name, rule)
+    return result
 
 
 def eval_assign_random_state(
@@ -0,0 +1,438 @@
+"""
+Nearest-neighbour search for Nearest[] and NearestFunction.
+
+A ``NearestFunctionAtom`` holds an index of the data points, built once,
+that answers the queries:
+
+- ``KDTreeIndex``: a KD tree of SciPy, for machine numbers and vectors,
+  with the Euclidean, Manhattan or Chessboard distances. A batch of
+  queries is answered in a single call.
+- ``VPTreeIndex``: a vantage point tree, for any distance function that
+  is a metric. Distances are computed by evaluating the distance function,
+  but only for a few points per query.
+- ``ScanIndex``: the distance to each point is computed for every query.
+
+The points are ordered by their distance to the query point, and then by
+their position in the data, whatever the index.
+"""
+
+import math
+from typing import List, Optional, Sequence
+
+import mpmath
+import numpy
+from scipy.spatial import cKDTree
+
+from mathics.algorithm.nearest import VPTree
+from mathics.core.atoms import Integer, String
+from mathics.core.element import BaseElement
+from mathics.core.evaluation import Evaluation
+from mathics.core.expression import Expression
+from mathics.core.list import ListExpression, to_packed_list
+from mathics.core.symbols import Atom, Symbol, SymbolList
+from mathics.core.systemsymbols import SymbolAll, SymbolFailed
+from mathics.eval.distance.clusters import IllegalDistance, to_real_distance
+from mathics.eval.nevaluator import eval_N
+from mathics.eval.parts import walk_levels
+
+# The distances a KD tree can use, with the exponent of their norm.
+KD_TREE_NORMS = {
+    "System`EuclideanDistance": 2,
+    "System`SquaredEuclideanDistance": 2,
+    "System`ManhattanDistance": 1,
+    "System`ChessboardDistance": math.inf,
+}
+
+# The builtin distances that are metrics, for which a vantage point tree
+# is built automatically. SquaredEuclideanDistance is not a metric, but
+# its square root is.
+METRIC_DISTANCES = (
+    "System`EuclideanDistance",
+    "System`SquaredEuclideanDistance",
+    "System`ManhattanDistance",
+    "System`ChessboardDistance",
+    "System`HammingDistance",
+    "System`EditDistance",
+    "System`DamerauLevenshteinDistance",
+)
+
+# Distances closer than this, relative to their size, may be computed
+# differently by SciPy and by NumPy. The KD tree is asked for a bit more
+# points, and the distances to them are computed again.
+RELATIVE_TOLERANCE = 1e-12
+
+# Integers above this cannot all be converted to machine reals exactly.
+MAX_EXACT_FLOAT_INTEGER = 2**53
+
+
+def evaluate_distances(
+    distance_function: BaseElement,
+    x: BaseElement,
+    points: Sequence[BaseElement],
+    squared: bool,
+    evaluation: Evaluation,
+) -> list:
+    """
+    Return the distances between ``x`` and each of ``points``, or their
+    square roots if ``squared`` is True. The numeric values of the
+    distances are evaluated together. Raise ValueError if the distance
+    function does not give a list of distances, and IllegalDistance if one
+    of them is not a non-negative real number.
+    """
+    calls = [Expression(distance_function, x, y) for y in points]
+    distances = eval_N(ListExpression(*calls), evaluation)
+    if not distances.has_form("List", len(points)):
+        raise ValueError()
+    result = [to_real_distance(d) for d in distances.elements]
+    if squared:
+        result = [mpmath.sqrt(d) for d in result]
+    return result
+
+
+class ScanIndex:
+    """Computes the distance to each point for every query."""
+
+    def __init__(self, points: Sequence[BaseElement], distance_function: BaseElement):
+        self.points = points
+        self.distance_function = distance_function
+
+    def nearest(
+        self,
+        queries: Sequence[BaseElement],
+        n: Optional[int],
+        r,
+        evaluation: Evaluation,
+    ) -> List[List[int]]:
+        result = []
+        for x in queries:
+            distances = evaluate_distances(
+                self.distance_function, x, self.points, False, evaluation
+            )
+            candidates = sorted(
+                (d, i) for i, d in enumerate(distances) if r is None or d <= r
+            )
+            if n is not None:
+                candidates = candidates[:n]
+            result.append([i for _, i in candidates])
+        return result
+
+
+class VPTreeIndex:
+    """A vantage point tree, for distance functions that are metrics."""
+
+    def __init__(
+        self,
+        points: Sequence[BaseElement],
+        distance_function: BaseElement,
+        evaluation: Evaluation,
+    ):
+        self.points = points
+        self.distance_function = distance_function
+        # The tree is built on the square roots of squared distances.
+        self.squared = distance_function.get_name() == "System`SquaredEuclideanDistance"
+
+        def distances(i, js):
+            return evaluate_distances(
+                distance_function,
+                points[i],
+                [points[j] for j in js],
+                self.squared,
+                evaluation,
+            )
+
+        self.tree = VPTree(len(points), distances)
+
+    def nearest(
+        self,
+        queries: Sequence[BaseElement],
+        n: Optional[int],
+        r,
+        evaluation: Evaluation,
+    ) -> List[List[int]]:
+        if r is not None and self.squared:
+            r = mpmath.sqrt(r)
+        points = self.points
+        result = []
+        for x in queries:
+
+            def distances(js):
+                return evaluate_distances(
+                    self.distance_function,
+                    x,
+                    [points[j] for j in js],
+                    self.squared,
+                    evaluation,
+                )
+
+            result.append(self.tree.nearest(distances, n, r))
+        return result
+
+
+def to_machine_array(
+    elements: Sequence[BaseElement], dimension: Optional[int] = None
+) -> Optional[numpy.ndarray]:
+    """
+    Return ``elements``, machine numbers or vectors of machine numbers
+    with the same length, as a matrix with a row for each element. If
+    ``dimension`` is given, the vectors must have that length. Return
+    None if the elements cannot be converted exactly.
+    """
+    if not elements:
+        return None
+    packed = to_packed_list(ListExpression(*elements), coerce=True)
+    if not packed.is_packed:
+        return None
+    array = packed.array
+    if array.ndim == 1:
+        array = array.reshape(-1, 1)
+    elif array.ndim != 2:
+        return None
+    if array.dtype.kind == "i":
+        if array.size and numpy.abs(array).max() > MAX_EXACT_FLOAT_INTEGER:
+            return None
+        array = array.astype(numpy.float64)
+    elif not numpy.isfinite(array).all():
+        return None
+    if dimension is not None and array.shape[1] != dimension:
+        return None
+    return array
+
+
+class KDTreeIndex:
+    """
+    A KD tree, for machine numbers or vectors, and the distances in
+    ``KD_TREE_NORMS``. Queries that are not machine numbers are answered
+    by scanning the points.
+    """
+
+    def __init__(
+        self,
+        array: numpy.ndarray,
+        points: Sequence[BaseElement],
+        distance_function: BaseElement,
+    ):
+        name = distance_function.get_name()
+        self.array = array
+        self.norm = KD_TREE_NORMS[name]
+        self.squared = name == "System`SquaredEuclideanDistance"
+        self.tree = cKDTree(array)
+        self.scan = ScanIndex(points, distance_function)
+
+    def distances(self, x: numpy.ndarray, indices: numpy.ndarray) -> numpy.ndarray:
+        """Return the distances between ``x`` and the points ``indices``."""
+        differences = numpy.abs(self.array[indices] - x)
+        if self.norm == 1:
+            return differences.sum(axis=1)
+        if self.norm == math.inf:
+            return differences.max(axis=1)
+        return numpy.sqrt((differences * differences).sum(axis=1))
+
+    def ordered(self, x: numpy.ndarray, indices, r: Optional[float]) -> List[int]:
+        """
+        Return the points ``indices`` that are not farther than ``r`` from
+        ``x``, ordered by distance and by position.
+        """
+        indices = numpy.asarray(indices, dtype=numpy.intp)
+        distances = self.distances(x, indices)
+        if r is not None:
+            within = distances <= r
+            indices = indices[within]
+            distances = distances[within]
+        return indices[numpy.lexsort((indices, distances))].tolist()
+
+    def nearest(
+        self,
+        queries: Sequence[BaseElement],
+        n: Optional[int],
+        r,
+        evaluation: Evaluation,
+    ) -> List[List[int]]:
+        xs = to_machine_array(queries, self.array.shape[1])
+        if xs is None:
+            return self.scan.nearest(queries, n, r, evaluation)
+        if r is not None:
+            r = math.sqrt(float(r)) if self.squared else float(r)
+
+        size = len(self.array)
+        slack = 1 + RELATIVE_TOLERANCE
+        if n is None:
+            if r is None:
+                return [self.ordered(x, numpy.arange(size), None) for x in xs]
+            balls = self.tree.query_ball_point(xs, r * slack, p=self.norm)
+            return [self.ordered(x, ball, r) for x, ball in zip(xs, balls)]
+
+        # One more point than needed is asked for, to tell whether the
+        # last one is tied with the following ones.
+        k = min(n + 1, size)
+        bound = math.inf if r is None else r * slack
+        distances, indices = self.tree.query(
+            xs, k=k, p=self.norm, distance_upper_bound=bound
+        )
+        distances = distances.reshape(len(xs), k)
+        indices = indices.reshape(len(xs), k)
+
+        result = []
+        for x, row_distances, row_indices in zip(xs, distances, indices):
+            found = row_indices < size
+            row_distances = row_distances[found]
+            row_indices = row_indices[found]
+            if len(row_indices) > n and (
+                row_distances[n] <= row_distances[n - 1] * slack
+            ):
+                # Ties are broken by the position of the points.
+                ball = self.tree.query_ball_point(
+                    x, row_distances[n - 1] * slack, p=self.norm
+                )
+                result.append(self.ordered(x, ball, r)[:n])
+            else:
+                result.append(self.ordered(x, row_indices, r)[:n])
+        return result
+
+
+def build_index(
+    points: Sequence[BaseElement],
+    distance_function: BaseElement,
+    method: str,
+    evaluation: Evaluation,
+    single_use: bool = False,
+):
+    """
+    Return the index of ``points`` for ``method``, "Scan", "KDTree" or
+    "Automatic".
+
+    With "KDTree", a KD tree is built if the points and the distance
+    function allow it, and a vantage point tree otherwise: the distance
+    function must be a metric. With "Automatic", a vantage point tree is
+    only built for the metrics in ``METRIC_DISTANCES``, and not for an
+    index used only once, since building it takes more distance
+    evaluations than scanning the points.
+    """
+    if method == "Scan":
+        return ScanIndex(points, distance_function)
+
+    name = distance_function.get_name()
+    if name in KD_TREE_NORMS:
+        array = to_machine_array(points)
+        if array is not None:
+            return KDTreeIndex(array, points, distance_function)
+
+    if method == "KDTree" or (name in METRIC_DISTANCES and not single_use):
+        return VPTreeIndex(points, distance_function, evaluation)
+    return ScanIndex(points, distance_function)
+
+
+class NearestFunctionAtom(Atom):
+    """
+    An atom holding the data of Nearest[], together with an index that
+    finds the points nearest to a query point.
+    """
+
+    class_head_name = "System`NearestFunction"
+
+    def __init__(
+        self,
+        points: Sequence[BaseElement],
+        values: Sequence[BaseElement],
+        distance_function: BaseElement,
+        automatic_distance: bool,
+        index,
+    ) -> None:
+        self.points = points
+        self.values = values
+        self.distance_function = distance_function
+        # With the automatic distance function, a list of points is
+        # taken as a list of queries.
+        self.automatic_distance = automatic_distance
+        self.index = index
+
+    def __hash__(self):
+        return hash(("NearestFunction", id(self)))
+
+    def __repr__(self):
+        return "-NearestFunction-"
+
+    def __str__(self):
+        return f"NearestFunction[<{len(self.points)}>]"
+
+    def atom_to_boxes(self, f: Symbol, evaluation: Evaluation):
+        from mathics.builtin.box.layout import RowBox
+
+        return RowBox(
+            String("NearestFunction"),
+            String("["),
+            String(f"<{len(self.points)}>"),
+            String("]"),
+        )
+
+    def default_format(self, evaluation, form):
+        return str(self)
+
+    def do_copy(self) -> "NearestFunctionAtom":
+        return NearestFunctionAtom(
+            self.points,
+            self.values,
+            self.distance_function,
+            self.automatic_distance,
+            self.index,
+        )
+
+    def get_atom_name(self):
+        return "System`NearestFunction"
+
+    def get_sort_key(self, pattern_sort: bool = False) -> tuple:
+        if pattern_sort:
+            return super().get_sort_key(True)
+        return (0, 3, hex(id(self)))
+
+    def sameQ(self, rhs) -> bool:
+        """Mathics SameQ"""
+        return self is rhs
+
+    def to_python(self, *args, **kwargs):
+        return None
+
+
+def eval_Nearest(
+    nearest: NearestFunctionAtom,
+    pivot: BaseElement,
+    limit: BaseElement,
+    evaluation: Evaluation,
+) -> Optional[BaseElement]:
+    """
+    Return the values of the points of ``nearest`` nearest to ``pivot``,
+    with at most ``limit`` of them, where ``limit`` is ``n``, ``All`` or
+    ``{n, r}``. If ``pivot`` is a list of query points, return the list
+    of the results for each of them.
+    """
+    if limit.has_form("List", 2):
+        up_to = limit.elements[0]
+        py_r = limit.elements[1].to_mpmath()
+    else:
+        up_to = limit
+        py_r = None
+
+    if isinstance(up_to, Integer):
+        py_n = up_to.get_int_value()
+    elif up_to is SymbolAll:
+        py_n = None
+    else:
+        return None
+
+    if not nearest.points or (py_n is not None and py_n < 1):
+        return ListExpression()
+
+    multiple_x = False
+    if nearest.automatic_distance and pivot.get_head() is SymbolList:
+        _, depth_x = walk_levels(pivot)
+        _, depth_items = walk_levels(nearest.points[0])
+        multiple_x = depth_x > depth_items
+
+    queries = pivot.elements if multiple_x else (pivot,)
+    try:
+        results = nearest.index.nearest(queries, py_n, py_r, evaluation)
+    except (IllegalDistance, ValueError):
+        return SymbolFailed
+
+    values = nearest.values
+    lists = [ListExpression(*[values[i] for i in result]) for result in results]
+    return ListExpression(*lists) if multiple_x else lists[0]
@@ -6,37 +6,44 @@ File related evaluation functions.
 import os
 from typing import Callable, Literal, Optional
 
+import numpy
 from mathics_scanner import TranslateError
 from mathics_scanner.errors import IncompleteSyntaxError, InvalidSyntaxError
 
 import mathics
 import mathics.core.parser
 import mathics.core.streams
-from mathics.core.atoms import String
+from mathics.core.atoms import Integer, MachineReal, String, SymbolString
 from mathics.core.builtin import MessageException
 from mathics.core.convert.expression import to_expression, to_mathics_list
 from mathics.core.convert.python import from_python
+from mathics.core.element import ElementsProperties
 from mathics.core.evaluation import Evaluation
 from mathics.core.expression import BaseElement, Expression
+from mathics.core.list import ListExpression, PackedListExpression
 from mathics.core.parser import MathicsFileLineFeeder, MathicsMultiLineFeeder, parse
 from mathics.core.streams import stream_manager
 from mathics.core.symbols import Symbol, SymbolNull
 from mathics.core.systemsymbols import (
+    SymbolByte,
+    SymbolCharacter,
     SymbolEndOfFile,
     SymbolExpression,
     SymbolFailed,
     SymbolHold,
     SymbolHoldExpression,
+    SymbolNumber,
     SymbolPath,
     SymbolReal,
+    SymbolRecord,
     SymbolWord,
 )
 from mathics.core.util import canonic_filename
 from mathics.eval.files_io.read import (
     READ_TYPES,
     MathicsOpen,
+    StreamReader,
     close_stream,
-    read_from_stream,
     read_get_separators,
 )
 
@@ -169,6 +176,16 @@ def eval_Get(
     return result
 
 
+# Characters that can appear in Number and Real objects.
+NUMBER_CHARS = "+-.0123456789"
+REAL_CHARS = NUMBER_CHARS + "eE^*"
+
+# Properties of the lists of numbers built by ReadList[], and of the lists of
+# those lists.
+NUMBERS_PROPERTIES = ElementsProperties(elements_fully_evaluated=True, is_flat=True)
+ROWS_PROPERTIES = ElementsProperties(elements_fully_evaluated=True)
+
+
 def eval_Read(
     name: str, n: int, types: tuple, stream, evaluation: Evaluation, options: dict
 ):
@@ -187,47 +204,167 @@ def eval_Read(
     if separators is None:
         return
 
-    record_separators, token_words, word_separators = separators
+    reader = StreamReader(stream, evaluation.message)
+    try:
+        return read_objects(name, n, types, reader, separators, evaluation)
+    finally:
+        reader.sync()
 
-    # name = name.to_python()
 
-    result = []
+def eval_ReadList(
+    n: int,
+    types: tuple,
+    stream,
+    evaluation: Evaluation,
+    options: dict,
+    token_words: bool,
+) -> Optional[BaseElement]:
+    """
+    Evaluation method for ReadList[]: read objects of ``types`` until the end
+    of ``stream``. If ``token_words`` is True, the words and the token words
+    read together are added separately.
+    """
+    types = to_mathics_list(*types)
 
-    read_word = read_from_stream(
-        stream, word_separators + record_separators, token_words, evaluation.message
-    )
-    read_record = read_from_stream(
-        stream, record_separators, token_words, evaluation.message
-    )
-    read_number = read_from_stream(
-        stream,
-        word_separators + record_separators,
-        token_words,
-        evaluation.message,
-        ["+", "-", "."] + [str(i) for i in range(10)],
-    )
-    read_real = read_from_stream(
-        stream,
-        word_separators + record_separators,
-        token_words,
-        evaluation.message,
-        ["+", "-", ".", "e", "E", "^", "*"] + [str(i) for i in range(10)],
+    for typ in types.elements:
+        if typ not in READ_TYPES:
+            evaluation.message("ReadList", "readf", typ)
+            return None
+
+    separators = read_get_separators(options, evaluation)
+    if separators is None:
+        return None
+
+    # The stream is read with the same reader for all the objects.
+    reader = StreamReader(stream, evaluation.message)
+    try:
+        if not separators[1] and all(
+            typ in (SymbolNumber, SymbolReal) for typ in types.elements
+        ):
+            return read_number_list(n, types, reader, separators, evaluation)
+
+        result = []
+        while True:
+            next_elt = read_objects(
+                "ReadList", n, types, reader, separators, evaluation
+            )
+
+            if next_elt is None or next_elt is SymbolFailed:
+                return None
+
+            if next_elt is SymbolEndOfFile:
+                break
+
+            if isinstance(next_elt, list) and token_words:
+                # FIXME: This might not be correct in all cases.
+                # we probably need a more positive way to indicate whether next_elt
+                # was returned from TokenWord parsing or not.
+                result += next_elt
+            else:
+                result.append(next_elt)
+    finally:
+        reader.sync()
+    return from_python(result)
+
+
+def read_number(reader: StreamReader, typ: Symbol, separators: tuple, token_words):
+    """
+    Read a Number or a Real object with ``reader``. Raise ValueError if the
+    token read is not a number.
+    """
+    if typ is SymbolNumber:
+        tmp = reader.read_token(separators, token_words, NUMBER_CHARS)
+        try:
+            return int(tmp)
+        except ValueError:
+            return float(tmp)
+    tmp = reader.read_token(separators, token_words, REAL_CHARS)
+    return float(tmp.replace("*^", "E"))
+
+
+def read_number_list(
+    n: int,
+    types: ListExpression,
+    reader: StreamReader,
+    separators: tuple,
+    evaluation: Evaluation,
+) -> Optional[BaseElement]:
+    """
+    ReadList[] for types that are all Number or Real. The numbers are
+    collected as Python values, and returned in a packed list when they are
+    all machine integers or all machine reals.
+    """
+    record_separators, token_words, word_separators = separators
+    word_and_record_separators = word_separators + record_separators
+    row_types = types.elements
+
+    rows = []
+    try:
+        while True:
+            rows.append(
+                [
+                    read_number(reader, typ, word_and_record_separators, token_words)
+                    for typ in row_types
+                ]
+            )
+    except EOFError:
+        pass
+    except ValueError:
+        evaluation.message(
+            "ReadList", "readn", to_expression("InputSteam", "ReadList", n)
+        )
+        return None
+
+    values = [row[0] for row in rows] if len(row_types) == 1 else rows
+    value_types = {type(value) for row in rows for value in row}
+    try:
+        if value_types == {int}:
+            return PackedListExpression(numpy.array(values, dtype=numpy.int64))
+        if value_types == {float}:
+            return PackedListExpression(numpy.array(values, dtype=numpy.float64))
+    except OverflowError:
+        pass
+
+    def to_number(value):
+        return MachineReal(value) if type(value) is float else Integer(value)
+
+    if len(row_types) == 1:
+        return ListExpression(
+            *map(to_number, values), elements_properties=NUMBERS_PROPERTIES
+        )
+    return ListExpression(
+        *(
+            ListExpression(*map(to_number, row), elements_properties=NUMBERS_PROPERTIES)
+            for row in rows
+        ),
+        elements_properties=ROWS_PROPERTIES,
     )
 
+
+def read_objects(
+    name: str,
+    n: int,
+    types: ListExpression,
+    reader: StreamReader,
+    separators: tuple,
+    evaluation: Evaluation,
+):
+    """
+    Read an object of each of the types in ``types`` with ``reader``.
+    """
+    record_separators, token_words, word_separators = separators
+    word_and_record_separators = word_separators + record_separators
+
+    result = []
+
     for typ in types.elements:
         try:
-            if typ is Symbol("Byte"):
-                tmp = stream.io.read(1)
-                if tmp == "":
-                    raise EOFError
-                result.append(ord(tmp))
-            elif typ is Symbol("Character"):
-                tmp = stream.io.read(1)
-                if tmp == "":
-                    raise EOFError
-                result.append(tmp)
+            if typ is SymbolByte:
+                result.append(ord(reader.read_char()))
+            elif typ is SymbolCharacter:
+                result.append(reader.read_char())
             elif typ in (SymbolExpression, SymbolHoldExpression):
-                tmp = next(read_record)
+                tmp = reader.read_token(record_separators, token_words)
                 while True:
                     try:
                         feeder = MathicsMultiLineFeeder(tmp)
@@ -235,7 +372,7 @@ def eval_Read(
                         break
                     except (IncompleteSyntaxError, InvalidSyntaxError):
                         try:
-                            nextline = next(read_record)
+                            nextline = reader.read_token(record_separators, token_words)
                             tmp = tmp + "\n" + nextline
                         except EOFError:
                             expr = SymbolEndOfFile
@@ -246,7 +383,7 @@ def eval_Read(
                 if expr is None:
                     result.append(None)
                 elif expr is SymbolEndOfFile:
-                    evaluation.message(name, "readt", tmp, String(stream.name))
+                    evaluation.message(name, "readt", tmp, String(reader.stream.name))
                     return SymbolFailed
                 elif isinstance(expr, BaseElement):
                     if typ is SymbolHoldExpression:
@@ -256,50 +393,33 @@ def eval_Read(
                 #  TODO: Supposedly we can't get here
                 # what code should we put here?
 
-            elif typ is Symbol("Number"):
-                tmp = next(read_number)
+            elif typ in (SymbolNumber, SymbolReal):
                 try:
-                    tmp = int(tmp)
-                except ValueError:
-                    try:
-                        tmp = float(tmp)
-                    except ValueError:
-                        evaluation.message(
-                            name, "readn", to_expression("InputSteam", name, n)
-                        )
-                        return SymbolFailed
-                result.append(tmp)
-
-            elif typ is SymbolReal:
-                tmp = next(read_real)
-                tmp = tmp.replace("*^", "E")
-                try:
-                    tmp = float(tmp)
+                    tmp = read_number(
+                        reader, typ, word_and_record_separators, token_words
+                    )
                 except ValueError:
                     evaluation.message(
                         name, "readn", to_expression("InputSteam", name, n)
                     )
                     return SymbolFailed
                 result.append(tmp)
-            elif typ is Symbol("Record"):
-                result.append(next(read_record))
-            elif typ is Symbol("String"):
-                tmp = stream.io.readline()
-                if len(tmp) == 0:
-                    raise EOFError
-                result.append(tmp.rstrip("\n"))
+            elif typ is SymbolRecord:
+                result.append(reader.read_token(record_separators, token_words))
+            elif typ is SymbolString:
+                result.append(reader.read_line())
             elif typ is SymbolWord:
-                # next() for word tokens can return one or two words:
+                # Reading word tokens can return one or two words:
                 # the next word in the list and a following TokenWord
                 # match.  Therefore, test for this and do list-like
                 # appending here.
 
                 # THINK ABOUT: We might need to reconsider/refactor
                 # other cases to allow for multiple words as well. And
-                # for uniformity, we may want to redo the generators to
+                # for uniformity, we may want to redo read_token() to
                 # always return *lists* instead instead of either a
                 # word or a list (which is always at most two words?)
-                words = next(read_word)
+                words = reader.read_token(word_and_record_separators, token_words)
                 if not isinstance(words, list):
                     words = [words]
                 result += words
@@ -3,7 +3,9 @@ Functions to support Read[]
 """
 
 import io
-from typing import Callable, Optional, Tuple
+import re
+from functools import lru_cache
+from typing import Callable, FrozenSet, List, Optional, Sequence, Tuple, Union
 
 from mathics.builtin.atomic.strings import to_python_encoding
 from mathics.core.atoms import Integer, String
@@ -360,66 +362,166 @@ def read_get_separators(
     return record_separators, token_words, word_separators
 
 
-def read_from_stream(
-    stream, word_separators: list, token_words: list, msgfn: Callable, accepted=None
-):
+@lru_cache(maxsize=64)
+def _token_patterns(
+    separators: Tuple[str, ...],
+    token_words: Tuple[str, ...],
+    accepted: Optional[str],
+) -> Tuple[re.Pattern, re.Pattern, FrozenSet[str]]:
     """
-    This is a generator that returns "words" from stream deliminated by
-    "word_separators" or "token_words".
+    Return the regular expressions matching a run of separators and
+    the characters of a token, and the set of separator characters.
+
+    Separators and token words are compared with single characters, so
+    longer ones never match.
+    """
+    separator_chars = frozenset(s for s in separators if len(s) == 1)
+    token_chars = frozenset(t for t in token_words if len(t) == 1)
+    stop_chars = separator_chars | token_chars
+
+    def char_class(chars) -> str:
+        return "".join(re.escape(c) for c in sorted(chars))
+
+    if separator_chars:
+        skip_re = re.compile(f"[{char_class(separator_chars)}]*")
+    else:
+        skip_re = re.compile("")
+    if accepted is not None:
+        word_chars = set(accepted) - stop_chars
+        word_re = re.compile(f"[{char_class(word_chars)}]*" if word_chars else "")
+    elif stop_chars:
+        word_re = re.compile(f"[^{char_class(stop_chars)}]*")
+    else:
+        word_re = re.compile(".*", re.DOTALL)
+    return skip_re, word_re, separator_chars
+
+
+class StreamReader:
+    """
+    Reads the characters of a text stream in chunks, for Read[] and
+    ReadList[].
+
+    Characters are read from ``stream.io`` ahead of the ones used.
+    ``sync()`` gives them back, setting the position of the stream just
+    after the last character used, so that StreamPosition[] and the
+    functions that read from ``stream.io`` directly see the position
+    they expect.
     """
-    while True:
-        word = ""
-        some_token_word_prefix = ""
+
+    chunk_size = 8192
+
+    def __init__(self, stream: Stream, msgfn: Callable):
+        self.stream = stream
+        self.io = stream.io
+        self.msgfn = msgfn
+        self.seekable = self.io.seekable()
+        if not self.seekable:
+            # Characters read ahead can not be given back.
+            self.chunk_size = 1
+        self.buffer = ""
+        self.pos = 0
+        # The position of the stream at the start of the buffer.
+        self.buffer_start = None
+
+    def _fill(self) -> bool:
+        """
+        Read the next chunk of the stream into the buffer. Return False
+        at the end of the stream.
+        """
+        if self.seekable:
+            self.buffer_start = self.io.tell()
+        try:
+            chunk = self.io.read(self.chunk_size)
+        except UnicodeDecodeError:
+            self.msgfn("General", "ucdec")
+            chunk = ""
+        self.buffer = chunk
+        self.pos = 0
+        return chunk != ""
+
+    def sync(self):
+        """
+        Set the position of the stream after the last character used,
+        and empty the buffer.
+        """
+        if self.pos < len(self.buffer) and self.seekable:
+            # Positions in text files can not be computed, so the
+            # characters used are read again.
+            self.io.seek(self.buffer_start)
+            self.io.read(self.pos)
+        self.buffer = ""
+        self.pos = 0
+
+    def read_char(self) -> str:
+        """Read a character, raising EOFError at the end of the stream."""
+        if self.pos == len(self.buffer) and not self._fill():
+            raise EOFError
+        char = self.buffer[self.pos]
+        self.pos += 1
+        return char
+
+    def read_line(self) -> str:
+        """
+        Read a line, without its newline, raising EOFError at the end of
+        the stream.
+        """
+        pieces = []
         while True:
-            try:
-                tmp = stream.io.read(1)
-            except UnicodeDecodeError:
-                tmp = " "  # ignore
-                msgfn("General", "ucdec")
-            except EOFError:
-                return SymbolEndOfFile
-
-            if tmp == "":
-                if word == "":
-                    pos = stream.io.tell()
-                    newchar = stream.io.read(1)
-                    if pos == stream.io.tell():
-                        raise EOFError
-                    else:
-                        if newchar:
-                            word = newchar
-                            continue
-                        else:
-                            yield word
-                            continue
-                yield word
+            if self.pos == len(self.buffer) and not self._fill():
+                if not pieces:
+                    raise EOFError
                 break
-
-            if tmp in word_separators:
-                if word == "":
-                    continue
-                if stream.io.seekable():
-                    stream.io.seek(stream.io.tell() - 1)
-                word += some_token_word_prefix
-                some_token_word_prefix = ""
-                yield word
+            end = self.buffer.find("\n", self.pos)
+            if end != -1:
+                pieces.append(self.buffer[self.pos : end])
+                self.pos = end + 1
                 break
+            pieces.append(self.buffer[self.pos :])
+            self.pos = len(self.buffer)
+        return "".join(pieces)
+
+    def read_token(
+        self,
+        separators: Sequence[str],
+        token_words: Sequence[str],
+        accepted: Optional[str] = None,
+    ) -> Union[str, List[str]]:
+        """
+        Read a "word" delimited by ``separators`` or ``token_words``,
+        raising EOFError at the end of the stream.
+
+        Separators before the word are skipped, and the separator after
+        it is left in the stream. A token word after the word is read
+        too, and returned with it. If ``accepted`` is given, the word ends
+        at the first character not in ``accepted``, which is dropped.
+        """
+        skip_re, word_re, separator_chars = _token_patterns(
+            tuple(separators), tuple(token_words), accepted
+        )
 
-            if accepted is not None and tmp not in accepted:
-                word += some_token_word_prefix
-                some_token_word_prefix = ""
-                yield word
+        while True:
+            if self.pos == len(self.buffer) and not self._fill():
+                raise EOFError
+            self.pos = skip_re.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
                 break
 
-            some_token_word_prefix += tmp
-            for token_word in token_words:
-                if token_word == some_token_word_prefix:
-                    if word:
-                        yield [word, token_word]
-                    else:
-                        yield token_word
-                    some_token_word_prefix = ""
-                    break
-            else:
-                word += some_token_word_prefix
-                some_token_word_prefix = ""
+        pieces = []
+        while True:
+            match = word_re.match(self.buffer, self.pos)
+            pieces.append(match.group())
+            self.pos = match.end()
+            if self.pos < len(self.buffer):
+                break
+            if not self._fill():
+                return "".join(pieces)
+        word = "".join(pieces)
+
+        char = self.buffer[self.pos]
+        if char in separator_chars:
+            return word
+        self.pos += 1
+        if accepted is not None and char not in accepted:
+            return word
+        # char is a token word.
+        return [word, char] if word else char
@@ -0,0 +1,235 @@
+"""
+Functions to support the Import[] of CSV and TSV tables.
+"""
+
+import csv
+import re
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Sequence, TextIO, Union
+
+import numpy
+
+from mathics.core.atoms import Integer, MachineReal, String
+from mathics.core.element import BaseElement, ElementsProperties
+from mathics.core.evaluation import Evaluation
+from mathics.core.expression import Expression
+from mathics.core.list import ListExpression, PackedListExpression
+from mathics.core.systemsymbols import SymbolAll, SymbolPart
+
+# Fields imported as integers and as reals. The spaces around the
+# number are allowed, as in "1, 2, 3".
+INTEGER_FIELD_RE = re.compile(r"\s*[+-]?\d+\s*")
+REAL_FIELD_RE = re.compile(r"\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*")
+
+# Properties of the rows of a table, and of the table.
+ROW_PROPERTIES = ElementsProperties(elements_fully_evaluated=True, is_flat=True)
+TABLE_PROPERTIES = ElementsProperties(elements_fully_evaluated=True)
+
+TableIndex = Union[int, List[int]]
+
+
+def read_table_rows(
+    io: TextIO, separators: Sequence[str], start: int, stop: Optional[int]
+) -> List[List[str]]:
+    """
+    Read the rows ``start`` to ``stop`` of the table in ``io``, as lists of
+    fields. If ``stop`` is None, the rows are read up to the end of ``io``.
+
+    A single character separator is handled by the ``csv`` module, which
+    also reads quoted fields. Otherwise, the lines are split at any of the
+    separators.
+    """
+    if len(separators) == 1 and len(separators[0]) == 1:
+        rows: Iterator[List[str]] = csv.reader(io, delimiter=separators[0])
+    else:
+        separators = [s for s in separators if s]
+        if separators:
+            pattern = re.compile("|".join(re.escape(s) for s in separators))
+            rows = (pattern.split(line.rstrip("\r\n")) for line in io)
+        else:
+            rows = ([line.rstrip("\r\n")] for line in io)
+        # Empty lines are empty rows, as with csv.reader.
+        rows = (row if row != [""] else [] for row in rows)
+    return list(islice(rows, start, stop))
+
+
+def rows_needed(spec: BaseElement) -> Optional[int]:
+    """
+    Return the number of rows that must be read to take the part ``spec``
+    of a table, or None if the whole table is needed.
+    """
+    if isinstance(spec, Integer):
+        indices = [spec]
+    elif spec.has_form("Span", 2, 3):
+        indices = spec.elements[:2]
+    elif spec.has_form("List", None):
+        indices = spec.elements
+    else:
+        return None
+    if indices and all(
+        isinstance(index, Integer) and index.value > 0 for index in indices
+    ):
+        return max(index.value for index in indices)
+    return None
+
+
+def part_indices(
+    length: int, spec: BaseElement, evaluation: Evaluation
+) -> Optional[TableIndex]:
+    """
+    Return the 0-based index, or the list of indices, that the part ``spec``
+    takes from a list with ``length`` elements. If the part does not exist,
+    Part[] gives a message and None is returned.
+    """
+    if spec is SymbolAll:
+        return list(range(length))
+    # Part[] is applied to the list of the positions, so that its messages
+    # show the positions in the table.
+    if length:
+        positions = PackedListExpression(numpy.arange(1, length + 1, dtype=numpy.int64))
+    else:
+        positions = ListExpression()
+    result = Expression(SymbolPart, positions, spec).evaluate(evaluation)
+    if isinstance(result, Integer):
+        return result.value - 1
+    if result.has_form("List", None) and all(
+        isinstance(element, Integer) for element in result.elements
+    ):
+        return [element.value - 1 for element in result.elements]
+    return None
+
+
+def convert_field(field: str) -> Union[int, float, str]:
+    """Convert a field to an integer or a real when it is a number."""
+    if INTEGER_FIELD_RE.fullmatch(field):
+        return int(field)
+    if REAL_FIELD_RE.fullmatch(field):
+        return float(field)
+    return field
+
+
+def to_atom(value: Union[int, float, str]) -> BaseElement:
+    """Convert a converted field to a Mathics atom."""
+    value_type = type(value)
+    if value_type is float:
+        return MachineReal(value)
+    if value_type is int:
+        return Integer(value)
+    return String(value)
+
+
+def convert_table(rows: List[List[str]]) -> ListExpression:
+    """
+    Convert the fields of a table to numbers and strings.
+
+    In rectangular tables, the type of each column is found first, so
+    that the columns of numbers are converted without checking each
+    field again. The table is packed when all its fields are integers, or
+    all its fields are reals.
+    """
+    if not rows or len({len(row) for row in rows}) != 1 or not rows[0]:
+        return ListExpression(
+            *(
+                ListExpression(
+                    *(to_atom(convert_field(field)) for field in row),
+                    elements_properties=ROW_PROPERTIES,
+                )
+                for row in rows
+            ),
+            elements_properties=TABLE_PROPERTIES,
+        )
+
+    columns = []
+    kinds = set()
+    for column in zip(*rows):
+        if all(map(INTEGER_FIELD_RE.fullmatch, column)):
+            columns.append(list(map(int, column)))
+            kinds.add(int)
+        elif all(map(REAL_FIELD_RE.fullmatch, column)) and not any(
+            map(INTEGER_FIELD_RE.fullmatch, column)
+        ):
+            columns.append(list(map(float, column)))
+            kinds.add(float)
+        else:
+            columns.append(list(map(convert_field, column)))
+            kinds.add(None)
+
+    if kinds == {int} or kinds == {float}:
+        dtype = numpy.int64 if kinds == {int} else numpy.float64
+        try:
+            array = numpy.array(columns, dtype=dtype)
+        except OverflowError:
+            pass
+        else:
+            return PackedListExpression(numpy.ascontiguousarray(array.T))
+
+    return ListExpression(
+        *(
+            ListExpression(*map(to_atom, row), elements_properties=ROW_PROPERTIES)
+            for row in zip(*columns)
+        ),
+        elements_properties=TABLE_PROPERTIES,
+    )
+
+
+def import_table(
+    io: TextIO,
+    separators: Sequence[str],
+    header_lines: int,
+    evaluation: Evaluation,
+    row_spec: BaseElement = SymbolAll,
+    column_spec: BaseElement = SymbolAll,
+) -> Optional[BaseElement]:
+    """
+    Import the table in ``io``, skipping its first ``header_lines`` rows.
+
+    Only the rows and the columns given by the Part specifications
+    ``row_spec`` and ``column_spec`` are converted, and the rows after the
+    last one needed are not read. None is returned when a part does not
+    exist.
+    """
+    stop = rows_needed(row_spec)
+    rows = read_table_rows(
+        io, separators, header_lines, None if stop is None else header_lines + stop
+    )
+
+    row_indices = part_indices(len(rows), row_spec, evaluation)
+    if row_indices is None:
+        return None
+    single_row = isinstance(row_indices, int)
+    if single_row:
+        rows = [rows[row_indices]]
+    elif row_spec is not SymbolAll:
+        rows = [rows[index] for index in row_indices]
+
+    single_column = False
+    if column_spec is not SymbolAll:
+        # The indices are found once for each length of the rows.
+        column_indices: Dict[int, Optional[TableIndex]] = {}
+        selected = []
+        for row in rows:
+            length = len(row)
+            if length not in column_indices:
+                column_indices[length] = part_indices(length, column_spec, evaluation)
+            indices = column_indices[length]
+            if indices is None:
+                return None
+            if isinstance(indices, int):
+                single_column = True
+                selected.append([row[indices]])
+            else:
+                selected.append([row[index] for index in indices])
+        rows = selected
+
+    table = convert_table(rows)
+    if single_column:
+        if table.is_packed:
+            table = PackedListExpression(numpy.ascontiguousarray(table.array[:, 0]))
+        else:
+            table = ListExpression(
+                *(row.elements[0] for row in table.elements),
+                elements_properties=ROW_PROPERTIES,
+            )
+    if single_row:
+        return table.elements[0]
+    return table
@@ -0,0 +1,199 @@
+"""
+Functions to support the Export[] of expressions to streams.
+
+The exporters produce their output as a sequence of pieces of text, which
+are gathered in chunks and written to the stream one chunk at a time. In
+this way, the whole output is never built in memory: only the text of a
+single element of a list, or an SVG image, which the graphics formatter
+builds as a whole, is held at once.
+"""
+
+import csv
+import json
+from io import StringIO, TextIOBase
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from mathics.core.atoms import Integer, Rational, Real, String
+from mathics.core.element import BaseElement
+from mathics.core.evaluation import Evaluation
+from mathics.core.streams import Stream
+from mathics.core.symbols import SymbolFalse, SymbolNull, SymbolTrue
+from mathics.core.systemsymbols import SymbolOutputForm
+from mathics.eval.makeboxes import format_element
+
+# Number of characters gathered before a chunk is written.
+CHUNK_SIZE = 1 << 16
+
+# Number of rows of a table formatted together.
+CHUNK_ROWS = 1024
+
+
+def group_pieces(pieces: Iterable[str], size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Gather the pieces of text in ``pieces`` in chunks of about ``size`` characters."""
+    buffer: List[str] = []
+    length = 0
+    for piece in pieces:
+        buffer.append(piece)
+        length += len(piece)
+        if length >= size:
+            yield "".join(buffer)
+            buffer = []
+            length = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def write_chunks(
+    stream: Stream, chunks: Iterable[str], encoding: Optional[str] = None
+) -> None:
+    """
+    Write the chunks of text in ``chunks`` to ``stream``.
+
+    Binary streams, like the ones used by ExportString[] for binary
+    formats, are written the text encoded with ``encoding``, or with the
+    encoding of the stream.
+    """
+    io = stream.io
+    if isinstance(io, TextIOBase):
+        for chunk in chunks:
+            io.write(chunk)
+    else:
+        encoding = encoding or stream.encoding or "utf-8"
+        for chunk in chunks:
+            io.write(chunk.encode(encoding))
+    io.flush()
+
+
+def to_text(expr: BaseElement, evaluation: Evaluation) -> str:
+    """Return the text of ``expr``, as ToString[] gives it."""
+    if isinstance(expr, String):
+        return expr.value
+    if isinstance(expr, Integer):
+        return str(expr.value)
+    if isinstance(expr, Real):
+        # Reals are boxed directly, instead of trying each rule of MakeBoxes[].
+        boxes = expr.make_boxes(SymbolOutputForm.get_name())
+        return boxes.boxes_to_text(evaluation=evaluation)
+    boxes = format_element(expr, evaluation, SymbolOutputForm)
+    return boxes.boxes_to_text(evaluation=evaluation)
+
+
+def text_pieces(expr: BaseElement, evaluation: Evaluation) -> Iterator[str]:
+    """
+    Return the pieces of the text of ``expr``, as ToString[] gives it.
+
+    Lists are written one element at a time, so only the text of a single
+    element that is not a list is built as a whole.
+    """
+    if not expr.has_form("List", None):
+        yield to_text(expr, evaluation)
+        return
+    yield "{"
+    for index, element in enumerate(expr.elements):
+        if index:
+            yield ", "
+        yield from text_pieces(element, evaluation)
+    yield "}"
+
+
+def text_chunks(expr: BaseElement, evaluation: Evaluation) -> Iterator[str]:
+    """Return the chunks of the text of ``expr``."""
+    return group_pieces(text_pieces(expr, evaluation))
+
+
+def string_chunks(text: str) -> Iterator[str]:
+    """Return the chunks of ``text``, which was built as a whole."""
+    for start in range(0, len(text), CHUNK_SIZE):
+        yield text[start : start + CHUNK_SIZE]
+
+
+def table_rows(expr: BaseElement) -> Iterator[Sequence[BaseElement]]:
+    """
+    Return the rows of the table ``expr``. Elements that are not lists are
+    rows with a single field, and an expression that is not a list is a
+    table with a single row.
+    """
+    if not expr.has_form("List", None):
+        yield (expr,)
+        return
+    for row in expr.elements:
+        yield row.elements if row.has_form("List", None) else (row,)
+
+
+def table_chunks(
+    expr: BaseElement, separator: str, evaluation: Evaluation
+) -> Iterator[str]:
+    """
+    Return the chunks of the table ``expr``, with its fields separated by
+    ``separator`` and its rows by newlines.
+
+    With a single character separator, the fields that contain the
+    separator, quotes or newlines are quoted by the ``csv`` module.
+    """
+    rows = table_rows(expr)
+    first = True
+    while True:
+        fields = [
+            [to_text(field, evaluation) for field in row]
+            for row in islice(rows, CHUNK_ROWS)
+        ]
+        if not fields:
+            return
+        if len(separator) == 1:
+            buffer = StringIO()
+            csv.writer(buffer, delimiter=separator, lineterminator="\n").writerows(
+                fields
+            )
+            # The table does not end with a newline.
+            chunk = buffer.getvalue()[:-1]
+        else:
+            chunk = "\n".join(separator.join(row) for row in fields)
+        yield chunk if first else "\n" + chunk
+        first = False
+
+
+def json_pieces(expr: BaseElement, evaluation: Evaluation) -> Iterator[str]:
+    """
+    Return the pieces of the JSON text of ``expr``.
+
+    Lists of rules and associations are JSON objects, and other lists are
+    JSON arrays. Expressions that have no JSON equivalent are written as
+    strings with their text.
+    """
+    if isinstance(expr, String):
+        yield json.dumps(expr.value)
+    elif isinstance(expr, Integer):
+        yield str(expr.value)
+    elif isinstance(expr, (Real, Rational)):
+        yield json.dumps(float(expr.value))
+    elif expr is SymbolTrue:
+        yield "true"
+    elif expr is SymbolFalse:
+        yield "false"
+    elif expr is SymbolNull:
+        yield "null"
+    elif expr.has_form("Association", None) or (
+        expr.has_form("List", 1, None)
+        and all(
+            element.has_form(("Rule", "RuleDelayed"), 2) for element in expr.elements
+        )
+    ):
+        yield "{"
+        for index, rule in enumerate(expr.elements):
+            if index:
+                yield ", "
+            key, value = rule.elements
+            yield json.dumps(to_text(key, evaluation))
+            yield ": "
+            yield from json_pieces(value, evaluation)
+        yield "}"
+    elif expr.has_form("List", None):
+        yield "["
+        for index, element in enumerate(expr.elements):
+            if index:
+                yield ", "
+            yield from json_pieces(element, evaluation)
+        yield "]"
+    else:
+        yield json.dumps(to_text(expr, evaluation))
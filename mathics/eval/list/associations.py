@@ -0,0 +1,54 @@
+"""
+Evaluation functions for associations.
+"""
+from typing import List, Optional
+
+from mathics.core.association import AssociationExpression
+from mathics.core.element import BaseElement
+
+
+def get_association_rules(expr: BaseElement) -> List[BaseElement]:
+    """
+    Return the rules of ``expr``, an association or a list of rules. Nested
+    lists and associations are flattened.
+
+    Raises TypeError if ``expr`` is not an association or a list of rules.
+    """
+    if isinstance(expr, AssociationExpression):
+        return list(expr.elements)
+    if not expr.has_form(("List", "Association"), None):
+        raise TypeError
+
+    rules: List[BaseElement] = []
+
+    def collect(elements):
+        for element in elements:
+            if element.has_form(("Rule", "RuleDelayed"), 2):
+                rules.append(element)
+            elif element.has_form(("List", "Association"), None):
+                collect(element.elements)
+            else:
+                raise TypeError
+
+    collect(expr.elements)
+    return rules
+
+
+def get_association_rule(expr: BaseElement, key: BaseElement) -> Optional[BaseElement]:
+    """
+    Return the rule for ``key`` in ``expr``, an association or a list of
+    rules, or None if there is no rule for ``key``. If there are several,
+    the last one is returned.
+
+    Associations built by ``Association`` are looked up in their table;
+    other expressions are searched rule by rule.
+
+    Raises TypeError if ``expr`` is not an association or a list of rules.
+    """
+    if isinstance(expr, AssociationExpression):
+        return expr.get_rule(key)
+    result = None
+    for rule in get_association_rules(expr):
+        if rule.elements[0].sameQ(key):
+            result = rule
+    return result
@@ -0,0 +1,252 @@
+"""
+Evaluation of expressions in a pool of worker kernels.
+
+The kernels are processes of a ``ProcessPoolExecutor``, each of them with
+its own builtin definitions, loaded from the builtin snapshot. The user
+definitions to distribute are sent with the expressions to evaluate, and
+each kernel loads them only when they changed since its last evaluation.
+
+The expressions are sent in chunks, and the results are collected in the
+order of the expressions. The messages and the printed output of the
+kernels are shown in the main kernel, after the evaluation.
+"""
+
+import base64
+import math
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Sequence, Set, Tuple
+
+from mathics.core.definitions import Definitions
+from mathics.core.element import BaseElement
+from mathics.core.evaluation import Evaluation, Message
+from mathics.core.interrupt import (
+    BreakInterrupt,
+    ContinueInterrupt,
+    EvaluationInterrupt,
+    ReturnInterrupt,
+)
+from mathics.core.symbols import SymbolNull
+from mathics.core.systemsymbols import SymbolAborted, SymbolFailed
+
+# Number of chunks sent to each kernel with Method -> Automatic.
+CHUNKS_PER_KERNEL = 4
+
+# Contexts whose definitions are always distributed to the kernels.
+DISTRIBUTED_CONTEXTS = ("Global`",)
+
+# The pool of kernels of this process, and the number of its kernels.
+_pool: Optional[ProcessPoolExecutor] = None
+_kernel_count = 0
+
+# Symbols whose definitions were distributed with DistributeDefinitions[].
+distributed_names: Set[str] = set()
+
+# The state of a worker kernel: its evaluation, and the user definitions
+# it loaded last.
+_worker_evaluation: Optional[Evaluation] = None
+_worker_definitions: Optional[str] = None
+
+
+def kernel_count() -> int:
+    """Return the number of running kernels."""
+    return _kernel_count
+
+
+def is_worker() -> bool:
+    """Return True when called from a worker kernel."""
+    return _worker_evaluation is not None
+
+
+def _init_worker() -> None:
+    """Create the definitions and the evaluation of a worker kernel."""
+    global _worker_evaluation
+
+    import mathics.format  # noqa: F401  (the formats must be loaded)
+    from mathics.settings import BUILTIN_SNAPSHOT_PCL
+
+    definitions = Definitions(add_builtin=True, builtin_filename=BUILTIN_SNAPSHOT_PCL)
+    _worker_evaluation = Evaluation(definitions=definitions, catch_interrupt=False)
+
+
+def _ping() -> int:
+    """A task that returns once the kernel is initialized."""
+    return os.getpid()
+
+
+def _evaluate_chunk(
+    user_definitions: str, chunk: bytes
+) -> Tuple[List[BaseElement], list]:
+    """
+    Evaluate the pickled expressions ``chunk`` in a worker kernel, with the
+    user definitions ``user_definitions``. Return the results, and the
+    messages and the printed output of the evaluation.
+    """
+    global _worker_definitions
+
+    evaluation = _worker_evaluation
+    assert evaluation is not None
+    if user_definitions != _worker_definitions:
+        evaluation.definitions.set_user_definitions(user_definitions)
+        _worker_definitions = user_definitions
+
+    evaluation.out = []
+    results = []
+    for expr in pickle.loads(chunk):
+        try:
+            result = expr.evaluate(evaluation)
+        except ReturnInterrupt as e:
+            result = e.expr
+        except (BreakInterrupt, ContinueInterrupt):
+            result = SymbolNull
+        except EvaluationInterrupt:
+            result = SymbolAborted
+        results.append(result)
+    return results, evaluation.out
+
+
+def launch_kernels(count: int) -> range:
+    """
+    Start ``count`` new kernels, and return the range of their numbers.
+    The running kernels are replaced by a pool with all the kernels.
+    """
+    global _pool, _kernel_count
+
+    first = _kernel_count + 1
+    total = _kernel_count + count
+    if _pool is not None:
+        _pool.shutdown()
+    _pool = ProcessPoolExecutor(max_workers=total, initializer=_init_worker)
+    _kernel_count = total
+    # The kernels are started now, instead of at the first evaluation.
+    for future in [_pool.submit(_ping) for _ in range(total)]:
+        future.result()
+    return range(first, total + 1)
+
+
+def close_kernels() -> range:
+    """Stop the running kernels, and return the range of their numbers."""
+    global _pool, _kernel_count
+
+    closed = range(1, _kernel_count + 1)
+    if _pool is not None:
+        _pool.shutdown()
+    _pool = None
+    _kernel_count = 0
+    return closed
+
+
+def ensure_kernels() -> None:
+    """Launch a kernel for each processor if no kernel is running."""
+    if _kernel_count == 0 and not is_worker():
+        launch_kernels(os.cpu_count() or 1)
+
+
+def distributed_definitions(definitions: Definitions) -> str:
+    """
+    Return the encoded user definitions sent to the kernels: the ones of
+    the symbols in DISTRIBUTED_CONTEXTS, and the ones distributed with
+    DistributeDefinitions[].
+    """
+    user = {
+        name: definition
+        for name, definition in definitions.user.items()
+        if name.startswith(DISTRIBUTED_CONTEXTS) or name in distributed_names
+    }
+    return base64.encodebytes(pickle.dumps(user, protocol=2)).decode("ascii")
+
+
+def chunk_size(length: int, method: str) -> int:
+    """
+    Return the number of expressions sent together to a kernel, out of
+    ``length`` expressions, for the distribution method ``method``.
+    """
+    kernels = max(1, _kernel_count)
+    if method == "FinestGrained":
+        return 1
+    if method == "CoarsestGrained":
+        return max(1, math.ceil(length / kernels))
+    return max(1, math.ceil(length / (CHUNKS_PER_KERNEL * kernels)))
+
+
+def split_in_chunks(
+    elements: Sequence[BaseElement], method: str
+) -> List[Sequence[BaseElement]]:
+    """Split ``elements`` in the chunks sent to the kernels with ``method``."""
+    size = chunk_size(len(elements), method)
+    return [elements[start : start + size] for start in range(0, len(elements), size)]
+
+
+def show_output(out: list, evaluation: Evaluation) -> None:
+    """Show the messages and the printed output of a kernel."""
+    if evaluation.quiet_all:
+        return
+    quiet_messages = {
+        (
+            evaluation.definitions.shorten_name(pattern.elements[0].get_name()),
+            pattern.elements[1].get_string_value(),
+        )
+        for pattern in evaluation.get_quiet_messages()
+        if pattern.has_form("MessageName", 2)
+    }
+    for item in out:
+        if isinstance(item, Message):
+            evaluation.message_count += 1
+            if (item.symbol, item.tag) in quiet_messages:
+                continue
+        evaluation.out.append(item)
+        evaluation.output.out(item)
+
+
+def parallel_evaluate(
+    exprs: Sequence[BaseElement], method: str, evaluation: Evaluation
+) -> List[BaseElement]:
+    """
+    Evaluate ``exprs`` in the kernels, and return their results in the
+    same order.
+
+    The kernels are launched if none is running. The expressions are
+    evaluated in the main kernel when called from a worker kernel, when
+    the definitions or the expressions cannot be sent to the kernels, and
+    when a kernel stopped. Other errors of the kernels are reported, and
+    the results of their chunk are $Failed.
+    """
+    if not exprs or is_worker():
+        return [expr.evaluate(evaluation) for expr in exprs]
+    ensure_kernels()
+    assert _pool is not None
+
+    # Everything is pickled before the first chunk is sent, so that
+    # nothing is evaluated twice when something cannot be sent.
+    chunks = split_in_chunks(exprs, method)
+    try:
+        user_definitions = distributed_definitions(evaluation.definitions)
+        pickled_chunks = [pickle.dumps(chunk, protocol=2) for chunk in chunks]
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return [expr.evaluate(evaluation) for expr in exprs]
+
+    futures = [
+        _pool.submit(_evaluate_chunk, user_definitions, pickled)
+        for pickled in pickled_chunks
+    ]
+
+    results: List[BaseElement] = []
+    for chunk, future in zip(chunks, futures):
+        evaluation.check_stopped()
+        try:
+            chunk_results, out = future.result()
+        except BrokenProcessPool:
+            # A kernel stopped, and the pool cannot be used anymore. New
+            # kernels are launched with the next parallel evaluation.
+            close_kernels()
+            results.extend(expr.evaluate(evaluation) for expr in chunk)
+            continue
+        except Exception as e:
+            evaluation.message("General", "kernerr", f"{type(e).__name__}: {e}")
+            results.extend([SymbolFailed] * len(chunk))
+            continue
+        show_output(out, evaluation)
+        results.extend(chunk_results)
+    return results
@@ -5,6 +5,7 @@ from mathics.core.element import BaseElement
 from mathics.core.evaluation import Evaluation
 from mathics.core.expression import Expression
 from mathics.core.list import ListExpression
+from mathics.core.rule_index import DispatchTable
 from mathics.core.rules import Rule
 from mathics.core.symbols import Atom, Symbol, SymbolList
 from mathics.core.systemsymbols import SymbolDispatch, SymbolRule, SymbolRuleDelayed
@@ -101,11 +102,8 @@ def eval_dispatch_atom(
     """Dispatch[rules_List]"""
     # TODO:
     # The next step would be to enlarge this method, in order to
-    # check that all the elements in x are rules, eliminate redundancies
-    # in the list, and sort the list in a way that increases efficiency.
-    # A second step would be to implement an ``Atom`` class containing the
-    # compiled patterns, and modify Replace and ReplaceAll to handle this
-    # kind of objects.
+    # check that all the elements in x are rules and eliminate redundancies
+    # in the list.
     #
 
     all_list = all(rule.has_form("List", None) for rule in rules)
@@ -147,22 +145,26 @@ def eval_replace_with_levelspec(expr, rules, ls, heads, evaluation, options):
 
 
 class Dispatch(Atom):
+    """
+    An atom holding a list of rules, together with a hash index
+    (a ``DispatchTable``) that ``Replace``, ``ReplaceAll`` and friends
+    use to try only the rules that could match each subexpression.
+    """
+
     class_head_name = "System`Dispatch"
 
     src: ListExpression
-    rules: List[Rule]
+    rules: DispatchTable
 
     def __init__(
         self, rule_tuple: Tuple[Expression, ...], evaluation: Evaluation
     ) -> None:
         assert isinstance(rule_tuple, tuple)
         self.src = ListExpression(*rule_tuple)
-        try:
-            self.rules = [
-                Rule(rule.elements[0], rule.elements[1]) for rule in rule_tuple
-            ]
-        except:
-            raise
+        self.rules = DispatchTable(
+            [Rule(rule.elements[0], rule.elements[1]) for rule in rule_tuple],
+            evaluation,
+        )
         self._elements = None
         self._head = SymbolDispatch
 
@@ -2,12 +2,16 @@
 Evaluation module corresponding to builtin functions in mathics.builtins.scoping.
 """
 import re
+from typing import Dict, Iterable, List, Optional, Set
 
-from mathics.core.atoms import String
-from mathics.core.definitions import Definitions
+from mathics.core.atoms import Integer, String
+from mathics.core.definitions import Definition, Definitions, ScopingFrame
+from mathics.core.element import BaseElement
 from mathics.core.evaluation import Evaluation
+from mathics.core.expression import Expression
 from mathics.core.list import ListExpression
 from mathics.core.symbols import Symbol, fully_qualified_symbol_name
+from mathics.eval.share import definition_rules
 
 
 def dynamic_scoping(func, vars, evaluation: Evaluation):
@@ -15,22 +19,16 @@ def dynamic_scoping(func, vars, evaluation: Evaluation):
     Changes temporarily the value of a set of symbols listed in vars,
     and evaluates func(evaluation)
     """
-    original_definitions = {}
-    for var_name, new_def in vars.items():
-        assert fully_qualified_symbol_name(var_name)
-        original_definitions[var_name] = evaluation.definitions.get_user_definition(
-            var_name
-        )
-        evaluation.definitions.reset_user_definition(var_name)
-        if new_def is not None:
-            new_def = new_def.evaluate(evaluation)
-            evaluation.definitions.set_ownvalue(var_name, new_def)
+    frame = ScopingFrame(evaluation.definitions)
     try:
-        result = func(evaluation)
+        for var_name, new_def in vars.items():
+            assert fully_qualified_symbol_name(var_name)
+            frame.bind(var_name)
+            if new_def is not None:
+                frame.set_value(var_name, new_def.evaluate(evaluation))
+        return func(evaluation)
     finally:
-        for name, definition in original_definitions.items():
-            evaluation.definitions.add_user_definition(name, definition)
-    return result
+        frame.exit()
 
 
 def eval_contexts(definitions: Definitions) -> ListExpression:
@@ -90,3 +88,175 @@ def get_scoping_vars(var_list, msg_symbol="", evaluation=None):
         else:
             scoping_vars.add(var_name)
             yield var_name, new_def
+
+
+# Temporary symbols
+#
+# Module[] creates a new symbol for each of its local variables. These
+# symbols are temporary: once nothing refers to them, their definitions
+# are removed, as the "Temporary" attribute does in WMA.
+#
+# A temporary symbol created while evaluating a Module[] can only be
+# referred to by the result of the Module[], by the values sown during its
+# evaluation to a pending Reap[], or by the definitions (rules and
+# options) that changed during its evaluation. So, when the Module[]
+# returns, the temporary symbols created since it started that are not
+# reachable from these roots are removed right away. The others are kept in
+# ``Definitions.temporaries``, and are collected at the end of a later
+# evaluation, by looking for references in all the user definitions.
+
+
+def add_symbol_names(expr: BaseElement, names: Set[str], seen: Set[int]) -> None:
+    """
+    Add the names of the symbols in ``expr`` to ``names``. The
+    subexpressions whose id is in ``seen`` were already visited, and
+    are skipped.
+    """
+    stack = [expr]
+    while stack:
+        expr = stack.pop()
+        if isinstance(expr, Symbol):
+            names.add(expr.get_name())
+        elif (
+            isinstance(expr, Expression) and not expr.is_packed and id(expr) not in seen
+        ):
+            seen.add(id(expr))
+            stack.append(expr.head)
+            stack.extend(expr.elements)
+
+
+def add_definition_symbol_names(
+    definition: Definition, names: Set[str], seen: Set[int]
+) -> None:
+    """
+    Add the names of the symbols in the rules and the options of
+    ``definition`` to ``names``.
+    """
+    for rule in definition_rules(definition):
+        add_symbol_names(rule.pattern.expr, names, seen)
+        add_symbol_names(rule.replace, names, seen)
+    # ClearAll[] leaves an empty list instead of an empty dict.
+    if definition.options:
+        for value in definition.options.values():
+            add_symbol_names(value, names, seen)
+
+
+def release_temporary(definitions: Definitions, name: str) -> None:
+    """Remove the temporary symbol ``name`` and its definition."""
+    del definitions.temporaries[name]
+    if definitions.user.pop(name, None) is not None:
+        definitions.clear_cache(name)
+    definitions.changed_epochs.pop(name, None)
+    definitions.scoped_names.discard(name)
+    definitions.temporaries_reclaimed += 1
+    Symbol.release(name)
+
+
+def collect_temporaries(
+    definitions: Definitions,
+    roots: Iterable[BaseElement],
+    first: int = 0,
+    epoch: Optional[int] = None,
+) -> int:
+    """
+    Remove the temporary symbols with a serial number from ``first`` on,
+    which cannot be reached from ``roots`` or from the user definitions.
+
+    If ``epoch`` is given, the temporary symbols were created after it, and
+    only the definitions that changed after it are looked at. Return the
+    number of temporary symbols removed.
+    """
+    temporaries = definitions.temporaries
+    candidates: Dict[str, int] = {}
+    for name, serial in reversed(temporaries.items()):
+        if serial < first:
+            break
+        candidates[name] = serial
+    if not candidates:
+        return 0
+
+    user = definitions.user
+    names: Set[str] = set()
+    seen: Set[int] = set()
+    for root in roots:
+        if root is not None:
+            add_symbol_names(root, names, seen)
+    changed = user if epoch is None else definitions.get_changed_names(epoch)
+    for name in changed:
+        if name not in candidates and name in user:
+            add_definition_symbol_names(user[name], names, seen)
+
+    # The candidates reachable from the roots, through the definitions
+    # of other candidates.
+    reached: Set[str] = set()
+    stack = [name for name in names if name in candidates]
+    while stack:
+        name = stack.pop()
+        if name in reached:
+            continue
+        reached.add(name)
+        definition = user.get(name)
+        if definition is not None:
+            found: Set[str] = set()
+            add_definition_symbol_names(definition, found, seen)
+            stack.extend(
+                name for name in found if name in candidates and name not in reached
+            )
+
+    released = 0
+    for name in candidates:
+        if name not in reached:
+            release_temporary(definitions, name)
+            released += 1
+    return released
+
+
+def eval_Module(vars, expr, evaluation: Evaluation) -> BaseElement:
+    """
+    Evaluate ``expr`` with the local variables in ``vars`` renamed to new
+    temporary symbols. The temporary symbols that the result does not
+    refer to are removed.
+    """
+    definitions = evaluation.definitions
+    scoping_vars = get_scoping_vars(vars, "Module", evaluation)
+    replace = {}
+    number = Symbol("$ModuleNumber").evaluate(evaluation).get_int_value()
+    if number is None:
+        number = 1
+    definitions.set_ownvalue("$ModuleNumber", Integer(number + 1))
+    epoch = definitions.now
+    first = definitions.temporaries_created
+    for name, new_def in scoping_vars:
+        new_name = "%s$%d" % (name, number)
+        # After resetting $ModuleNumber, the name may be in use already.
+        if new_name not in definitions.user and new_name not in definitions.temporaries:
+            definitions.temporaries[new_name] = definitions.temporaries_created
+            definitions.temporaries_created += 1
+        if new_def is not None:
+            definitions.set_ownvalue(new_name, new_def.copy())
+        replace[name] = Symbol(new_name)
+    new_expr = expr.replace_vars(replace, in_scoping=False)
+    # Drop the references to the temporary symbols, so that they can be
+    # released.
+    del replace
+
+    # The values and the tags sown to a pending Reap[] are kept as roots.
+    sown: List[BaseElement] = []
+
+    def listener(value: BaseElement, tag: BaseElement) -> bool:
+        sown.append(value)
+        sown.append(tag)
+        # Let the Reap[] get the value.
+        return False
+
+    reaping = bool(evaluation.listeners.get("sow"))
+    if reaping:
+        evaluation.add_listener("sow", listener)
+    try:
+        result = new_expr.evaluate(evaluation)
+    finally:
+        if reaping:
+            evaluation.remove_listener("sow", listener)
+    del new_expr
+    collect_temporaries(definitions, (result, *sown), first, epoch)
+    return result
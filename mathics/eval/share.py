@@ -0,0 +1,215 @@
+"""
+Evaluation routines for Share[].
+
+The definitions of a session, and the Out[] history stored with them,
+often hold many copies of the same subexpression. ``ShareTable`` keeps a
+single canonical copy of each subexpression, indexed by its structure,
+and the stored rules are rewritten to refer to the canonical copies.
+"""
+
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+
+from pympler.asizeof import asizeof
+
+from mathics.core.association import AssociationExpression
+from mathics.core.atoms import (
+    ByteArrayAtom,
+    Integer,
+    MachineReal,
+    PrecisionReal,
+    Rational,
+    String,
+)
+from mathics.core.definitions import Definition, Definitions
+from mathics.core.element import BaseElement
+from mathics.core.expression import Expression
+from mathics.core.pattern import BasePattern
+from mathics.core.rules import BaseRule, Rule
+from mathics.core.sparse import SparseArrayExpression
+
+# Positions of a definition that hold lists of rules.
+RULE_POSITIONS = (
+    "ownvalues",
+    "downvalues",
+    "subvalues",
+    "upvalues",
+    "nvalues",
+    "defaultvalues",
+    "messages",
+)
+
+
+def atom_key(atom: BaseElement) -> Optional[Hashable]:
+    """
+    Return the key of ``atom`` in a ``ShareTable``, or None if the atom
+    is not shared. Two atoms get the same key only if they are identical:
+    reals must have the same bits and the same precision.
+
+    Symbols are not shared, since they are unique already.
+    """
+    if isinstance(atom, (String, Integer, Rational, ByteArrayAtom)):
+        return (type(atom), atom.value)
+    if isinstance(atom, MachineReal):
+        # float.hex() tells 0. from -0.
+        return (MachineReal, atom.value.hex())
+    if isinstance(atom, PrecisionReal):
+        return (PrecisionReal, atom.value._mpf_, atom.value._prec)
+    return None
+
+
+def is_leaf(expr: BaseElement) -> bool:
+    """
+    Return True if ``expr`` is not walked by a ``ShareTable``: atoms, and
+    the expressions that keep their data in a compact table instead of a
+    tuple of elements. Their elements are built only on demand, so walking
+    them would take more memory than sharing could release, and replacing
+    them would turn the expression into an ordinary one.
+    """
+    return not isinstance(expr, Expression) or (
+        expr.is_packed
+        or isinstance(expr, (AssociationExpression, SparseArrayExpression))
+    )
+
+
+class ShareTable:
+    """
+    Intern table of expressions, indexed by their structure.
+
+    The key of an expression is built from its type and the identities of
+    the canonical copies of its head and its elements. Since the elements
+    are shared before their expression, two structurally equal
+    expressions get the same key.
+    """
+
+    def __init__(self):
+        self.canonical: Dict[Hashable, BaseElement] = {}
+        # Expressions already visited, with their canonical copy. The
+        # expression is kept, so that its id is not reused while sharing.
+        self.visited: Dict[int, Tuple[BaseElement, BaseElement]] = {}
+        # Tuples of elements already replaced, with their replacement.
+        # Copies of an expression may share its tuple of elements.
+        self.tuples: Dict[int, Tuple[tuple, tuple]] = {}
+
+    def share(self, expr: BaseElement) -> BaseElement:
+        """
+        Return the canonical copy of ``expr``. The elements of ``expr``
+        are replaced by their canonical copies.
+        """
+        visited = self.visited.get(id(expr))
+        if visited is not None:
+            return visited[1]
+
+        key: Optional[Hashable]
+        if is_leaf(expr):
+            key = atom_key(expr)
+        else:
+            head = self.share(expr.head)
+            elements = tuple(self.share(element) for element in expr.elements)
+            # The canonical copies have the same structure, so the
+            # properties of ``expr`` are still valid. The cached sort key
+            # is dropped, since it refers to the replaced elements.
+            if head is not expr.head:
+                expr._head = head
+            if any(new is not old for new, old in zip(elements, expr.elements)):
+                old_elements = expr._elements
+                replaced = self.tuples.get(id(old_elements))
+                if replaced is None:
+                    self.tuples[id(old_elements)] = (old_elements, elements)
+                else:
+                    elements = replaced[1]
+                expr._elements = elements
+                if expr._cache is not None:
+                    expr._cache = expr._cache.without_sort_key()
+            key = (
+                type(expr),
+                id(head),
+                tuple(id(element) for element in elements),
+            )
+
+        canonical = expr if key is None else self.canonical.setdefault(key, expr)
+        self.visited[id(expr)] = (expr, canonical)
+        return canonical
+
+    def share_pattern(self, pattern: BasePattern) -> None:
+        """Share the expressions of ``pattern`` and of its subpatterns."""
+        expr = getattr(pattern, "expr", None)
+        if isinstance(expr, BaseElement):
+            pattern.expr = self.share(expr)
+            if hasattr(pattern, "atom"):
+                pattern.atom = pattern.expr
+        head = getattr(pattern, "head", None)
+        if isinstance(head, BasePattern):
+            self.share_pattern(head)
+        for element in getattr(pattern, "elements", ()):
+            if isinstance(element, BasePattern):
+                self.share_pattern(element)
+
+    def share_rule(self, rule: Rule) -> None:
+        """Share the expressions of the pattern and the replacement of ``rule``."""
+        self.share_pattern(rule.pattern)
+        rule.replace = self.share(rule.replace)
+        # The compiled matcher may hold the atoms that were replaced. It
+        # is built again the next time the rule is applied.
+        rule.__dict__.pop("_matcher", None)
+        rule.__dict__.pop("_matcher_compiled", None)
+
+
+def definition_rules(definition: Definition) -> Iterator[Rule]:
+    """Return the rewrite rules stored in ``definition``."""
+    for position in RULE_POSITIONS:
+        for rule in definition.get_values_list(position):
+            if isinstance(rule, Rule):
+                yield rule
+    for rules in definition.formatvalues.values():
+        for rule in rules:
+            if isinstance(rule, Rule):
+                yield rule
+
+
+def pattern_expressions(pattern: BasePattern) -> Iterator[BaseElement]:
+    """Return the expressions of ``pattern`` and of its subpatterns."""
+    expr = getattr(pattern, "expr", None)
+    if isinstance(expr, BaseElement):
+        yield expr
+    head = getattr(pattern, "head", None)
+    if isinstance(head, BasePattern):
+        yield from pattern_expressions(head)
+    for element in getattr(pattern, "elements", ()):
+        if isinstance(element, BasePattern):
+            yield from pattern_expressions(element)
+
+
+def rules_byte_count(rules: List[BaseRule]) -> int:
+    """
+    Return the memory used by the expressions of ``rules``, in bytes, as
+    ByteCount[] counts it. Expressions shared between rules are counted once.
+    """
+    exprs: List[BaseElement] = []
+    for rule in rules:
+        exprs.extend(pattern_expressions(rule.pattern))
+        exprs.append(rule.replace)
+    return asizeof(*exprs) if exprs else 0
+
+
+def eval_Share(definitions: Definitions, names: Optional[List[str]] = None) -> int:
+    """
+    Share the subexpressions of the user definitions of the symbols in
+    ``names``, or of all the symbols if ``names`` is None. Return the
+    number of bytes released.
+    """
+    if names is None:
+        names = list(definitions.user)
+    rules = [
+        rule
+        for name in names
+        if name in definitions.user
+        for rule in definition_rules(definitions.user[name])
+    ]
+    before = rules_byte_count(rules)
+    table = ShareTable()
+    for rule in rules:
+        table.share_rule(rule)
+    del table
+    # Sharing only drops references, but the sizes that Pympler reports
+    # for some objects, like the dicts of the rules, may still grow a bit.
+    return max(0, before - rules_byte_count(rules))
@@ -0,0 +1,315 @@
+"""
+Evaluation functions for sorting with an ordering function, as in
+``Sort[list, p]`` and ``SortBy[list, f]``.
+
+``Sort[list, p]`` puts ``a`` before ``b`` unless ``p[b, a]`` is ``True``.
+Evaluating ``p`` for each of the O(n log n) comparisons is slow, so:
+
+* common ordering functions on numbers, like ``Less``, ``Greater``,
+  ``#1 < #2 &``, ``#1[[2]] > #2[[2]] &`` or ``OrderedQ[{#1, #2}] &``, are
+  translated into a Python sort key (see ``compile_ordering_function()``),
+  and
+* otherwise, the result of ``p[a, b]`` is remembered, so that it is
+  evaluated just once for each pair of distinct elements.
+
+For ordering functions like ``Less``, which are not ``True`` for equal
+elements, the order of elements that are equal is not specified. The
+sort keys keep them in their original order.
+"""
+
+from fractions import Fraction
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from mathics.core.atoms import Integer, MachineReal, Rational
+from mathics.core.element import BaseElement
+from mathics.core.evaluation import Evaluation
+from mathics.core.expression import Expression
+from mathics.core.rule_index import literal_key
+from mathics.core.symbols import Symbol, SymbolTrue
+from mathics.core.systemsymbols import (
+    SymbolFunction,
+    SymbolGreater,
+    SymbolGreaterEqual,
+    SymbolLess,
+    SymbolLessEqual,
+    SymbolOrderedQ,
+    SymbolPart,
+    SymbolPatternsOrderedQ,
+)
+
+# A sort key function, and whether the order is reversed.
+SortKey = Tuple[Callable[[BaseElement], object], bool]
+
+# Numeric comparisons that can be turned into sort keys, and whether they
+# sort in decreasing order.
+NUMERIC_COMPARISONS: Dict[Symbol, bool] = {
+    SymbolLess: False,
+    SymbolLessEqual: False,
+    SymbolGreater: True,
+    SymbolGreaterEqual: True,
+}
+
+
+def real_number_value(element: BaseElement):
+    """
+    Return ``element`` as a Python number that compares exactly, or None if
+    ``element`` is not an Integer, a Rational or a machine Real.
+    """
+    if isinstance(element, Integer):
+        return element.value
+    if isinstance(element, MachineReal):
+        return element.value
+    if isinstance(element, Rational):
+        numerator, denominator = element.value.as_numer_denom()
+        return Fraction(int(numerator), int(denominator))
+    return None
+
+
+def canonical_sort_key(element: BaseElement) -> tuple:
+    return element.get_sort_key()
+
+
+def pattern_sort_key(element: BaseElement) -> tuple:
+    return element.get_sort_key(pattern_sort=True)
+
+
+def _slot_number(expr: BaseElement, parameters: Sequence[Symbol]) -> Optional[int]:
+    """
+    Return 1 or 2 if ``expr`` is the first or the second argument of
+    a function with ``parameters``, or None otherwise.
+    """
+    if parameters:
+        for number, parameter in enumerate(parameters, 1):
+            if expr is parameter:
+                return number
+        return None
+    if expr.has_form("Slot", 1):
+        number = expr.elements[0].get_int_value()
+        if number in (1, 2):
+            return number
+    return None
+
+
+def _get_argument(
+    expr: BaseElement, parameters: Sequence[Symbol]
+) -> Optional[Tuple[int, Tuple[int, ...]]]:
+    """
+    Return the number of the argument ``expr`` refers to, and the
+    positions of the Part of the argument, if any.
+    """
+    number = _slot_number(expr, parameters)
+    if number is not None:
+        return number, ()
+    if isinstance(expr, Expression) and expr.head is SymbolPart:
+        if len(expr.elements) < 2:
+            return None
+        number = _slot_number(expr.elements[0], parameters)
+        if number is None:
+            return None
+        positions = tuple(position.get_int_value() for position in expr.elements[1:])
+        if any(position is None or position == 0 for position in positions):
+            return None
+        return number, positions
+    return None
+
+
+def _get_part(element: BaseElement, positions: Tuple[int, ...]):
+    """
+    Return the part of ``element`` at ``positions``, or None if there is no
+    such part.
+    """
+    for position in positions:
+        if not isinstance(element, Expression):
+            return None
+        elements = element.elements
+        if position > 0:
+            position -= 1
+        if not -len(elements) <= position < len(elements):
+            return None
+        element = elements[position]
+    return element
+
+
+def _compile_function(
+    function: Expression, definitions
+) -> Optional[Tuple[Symbol, Tuple[int, ...], bool]]:
+    """
+    Recognize a pure function comparing the (parts of the) arguments,
+    like ``#1 < #2 &``, ``Function[{x, y}, x > y]`` or ``#2[[1]] < #1[[1]] &``.
+
+    Return the comparison, the positions of the parts, and whether
+    the arguments are swapped.
+    """
+    if len(function.elements) == 1:
+        parameters: Tuple[Symbol, ...] = ()
+        body = function.elements[0]
+    elif len(function.elements) == 2 and function.elements[0].has_form("List", 2):
+        parameters = function.elements[0].elements
+        if not all(isinstance(parameter, Symbol) for parameter in parameters):
+            return None
+        body = function.elements[1]
+    else:
+        return None
+
+    if not isinstance(body, Expression):
+        return None
+    comparison = body.head
+    if comparison is SymbolOrderedQ and len(body.elements) == 1:
+        # OrderedQ[{#1, #2}]
+        if not body.elements[0].has_form("List", 2):
+            return None
+        compared = body.elements[0].elements
+    elif comparison in NUMERIC_COMPARISONS and len(body.elements) == 2:
+        compared = body.elements
+    else:
+        return None
+
+    arguments = [_get_argument(element, parameters) for element in compared]
+    if None in arguments:
+        return None
+    (first, first_positions), (second, second_positions) = arguments
+    if first_positions != second_positions or {first, second} != {1, 2}:
+        return None
+    if first_positions and SymbolPart.get_name() in definitions.user:
+        return None
+    return comparison, first_positions, first == 2
+
+
+def compile_ordering_function(
+    p: BaseElement, elements: Sequence[BaseElement], evaluation: Evaluation
+) -> Optional[SortKey]:
+    """
+    Return a sort key that puts ``elements`` in the same order as
+    the ordering function ``p``, or None if ``p`` is not recognized.
+
+    Numeric comparisons are only recognized if all the values compared
+    are Integers, Rationals or machine Reals.
+    """
+    definitions = evaluation.definitions
+
+    if isinstance(p, Symbol):
+        if p.get_name() in definitions.user:
+            return None
+        if p is SymbolPatternsOrderedQ:
+            return pattern_sort_key, False
+        if p not in NUMERIC_COMPARISONS:
+            return None
+        comparison, positions, swapped = p, (), False
+    elif isinstance(p, Expression) and p.head is SymbolFunction:
+        compiled = _compile_function(p, definitions)
+        if compiled is None:
+            return None
+        comparison, positions, swapped = compiled
+        if comparison.get_name() in definitions.user:
+            return None
+    else:
+        return None
+
+    if comparison is SymbolOrderedQ:
+        if positions:
+            return None
+        # OrderedQ[{#2, #1}] & sorts in decreasing order.
+        return canonical_sort_key, swapped
+
+    decreasing = NUMERIC_COMPARISONS.get(comparison, None)
+    if decreasing is None:
+        return None
+    for element in elements:
+        value = element if not positions else _get_part(element, positions)
+        if value is None or real_number_value(value) is None:
+            return None
+
+    if positions:
+
+        def sort_key(element: BaseElement):
+            return real_number_value(_get_part(element, positions))
+
+    else:
+        sort_key = real_number_value
+    return sort_key, decreasing != swapped
+
+
+class OrderingFunctionCache:
+    """
+    Evaluates ``p[a, b]`` for the elements ``a`` and ``b`` of a list,
+    remembering the results. Elements that are ``SameQ`` share their
+    results, if they have a ``literal_key()``.
+    """
+
+    def __init__(
+        self, p: BaseElement, elements: Sequence[BaseElement], evaluation: Evaluation
+    ):
+        self.p = p
+        self.elements = elements
+        self.evaluation = evaluation
+        self.results: Dict[Tuple[int, int], bool] = {}
+
+        # The index of the first element with the same literal key.
+        first_indices: Dict[Hashable, int] = {}
+        self.classes: List[int] = []
+        for index, element in enumerate(elements):
+            key = literal_key(element)
+            if key is not None:
+                index = first_indices.setdefault(key, index)
+            self.classes.append(index)
+
+    def test(self, index1: int, index2: int) -> bool:
+        """Return True if ``p[a, b]`` is True for elements ``index1`` and ``index2``"""
+        pair = (self.classes[index1], self.classes[index2])
+        result = self.results.get(pair, None)
+        if result is None:
+            result = (
+                Expression(
+                    self.p, self.elements[index1], self.elements[index2]
+                ).evaluate(self.evaluation)
+                is SymbolTrue
+            )
+            self.results[pair] = result
+        return result
+
+
+def eval_sort_with_ordering_function(
+    elements: Sequence[BaseElement], p: BaseElement, evaluation: Evaluation
+) -> List[BaseElement]:
+    """
+    Return ``elements`` sorted with the ordering function ``p``.
+    """
+    compiled = compile_ordering_function(p, elements, evaluation)
+    if compiled is not None:
+        sort_key, reverse = compiled
+        return sorted(elements, key=sort_key, reverse=reverse)
+
+    cache = OrderingFunctionCache(p, elements, evaluation)
+    test = cache.test
+
+    class Key:
+        __slots__ = ("index",)
+
+        def __init__(self, index: int):
+            self.index = index
+
+        def __lt__(self, other: "Key") -> bool:
+            # a goes before b unless p[b, a] is True.
+            return not test(other.index, self.index)
+
+    indices = sorted(range(len(elements)), key=Key)
+    return [elements[index] for index in indices]
+
+
+def eval_sort_by_keys(
+    elements: Sequence[BaseElement], keys: Sequence[BaseElement]
+) -> List[BaseElement]:
+    """
+    Return ``elements`` sorted in the canonical order of ``keys``. Elements
+    with the same key are sorted in canonical order.
+    """
+    if all(isinstance(key, (Integer, MachineReal)) for key in keys):
+        # Machine numbers are ordered by their values.
+        key_values = [key.value for key in keys]
+    else:
+        key_values = [key.get_sort_key() for key in keys]
+    element_keys = [element.get_sort_key() for element in elements]
+    indices = sorted(
+        range(len(elements)), key=lambda index: (key_values[index], element_keys[index])
+    )
+    return [elements[index] for index in indices]
@@ -0,0 +1,569 @@
+"""
+Evaluation functions for sparse arrays stored in a SparseArrayExpression.
+
+Numeric sparse arrays are computed with NumPy and, for products of
+matrices and linear systems, with SciPy, if it is available. Other sparse
+arrays are computed element by element on their explicit elements.
+Neither builds the dense array.
+"""
+
+import math
+import warnings
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy
+
+from mathics.core.atoms import Integer, Integer0, Integer1, MachineReal
+from mathics.core.element import BaseElement
+from mathics.core.evaluation import Evaluation
+from mathics.core.expression import Expression
+from mathics.core.list import (
+    MACHINE_INTEGER_MAX,
+    PackedListExpression,
+    to_packed_list,
+)
+from mathics.core.sparse import (
+    Position,
+    SparseArrayExpression,
+    is_machine_number,
+    numeric_sparse_array,
+    sparse_array_from_dict,
+    sparse_array_from_rules,
+    to_dense_list,
+)
+from mathics.core.symbols import SymbolPlus, SymbolTimes
+from mathics.core.systemsymbols import SymbolDot, SymbolRule
+from mathics.eval.arithfns.basic import (
+    MAX_EXACT_FLOAT_INTEGER,
+    MAX_MACHINE_INTEGER,
+    machine_real_result,
+    max_abs,
+)
+from mathics.eval.tensors import get_dimensions
+
+
+def get_sparse_dims(dims: BaseElement) -> Optional[Position]:
+    """
+    Return the dimensions in the List ``dims``, or None if they are not
+    positive machine integers.
+    """
+    if not dims.has_form("List", None) or not dims.elements:
+        return None
+    result = []
+    for dim in dims.elements:
+        if not isinstance(dim, Integer) or not 1 <= dim.value <= MACHINE_INTEGER_MAX:
+            return None
+        result.append(dim.value)
+    return tuple(result)
+
+
+def eval_SparseArray_positions(
+    positions: BaseElement,
+    values: BaseElement,
+    dims: Position,
+    default: BaseElement,
+) -> Optional[SparseArrayExpression]:
+    """
+    Build the sparse array ``SparseArray[{pos1, pos2, ...} -> values, dims,
+    default]``, where ``values`` is a List with the value at each position,
+    or the value at all the positions.
+    """
+    count = len(positions.elements)
+    if values.has_form("List", count):
+        value_list = values.elements
+    else:
+        value_list = (values,) * count
+
+    packed = to_packed_list(positions)
+    if (
+        packed.is_packed
+        and packed.array.shape == (count, len(dims))
+        and packed.array.dtype.kind == "i"
+        and is_machine_number(default)
+    ):
+        value_array = None
+        if values.has_form("List", count):
+            packed_values = to_packed_list(values)
+            if packed_values.is_packed and packed_values.array.ndim == 1:
+                value_array = packed_values.array
+        elif isinstance(values, MachineReal):
+            value_array = numpy.full(count, values.value, dtype=numpy.float64)
+        elif is_machine_number(values):
+            value_array = numpy.full(count, values.value, dtype=numpy.int64)
+        if value_array is not None:
+            indices = packed.array - 1
+            if ((indices < 0) | (indices >= numpy.array(dims))).any():
+                return None
+            return numeric_sparse_array(dims, default, indices, value_array)
+
+    rules = [
+        Expression(SymbolRule, position, value)
+        for position, value in zip(positions.elements, value_list)
+    ]
+    return sparse_array_from_rules(dims, default, rules)
+
+
+def is_zero(element: BaseElement) -> bool:
+    """Return True if ``element`` is the machine number 0."""
+    return isinstance(element, (Integer, MachineReal)) and element.value == 0
+
+
+def _has_numeric_zero_default(array: SparseArrayExpression) -> bool:
+    """
+    Return True if ``array`` has numeric storage, and its default is a zero
+    that does not change its values when they are added: an Integer 0, or
+    a real 0 if the values are reals.
+    """
+    return (
+        array.data is None
+        and is_zero(array.default)
+        and (isinstance(array.default, Integer) or array.values.dtype.kind == "f")
+    )
+
+
+def _numeric_result(
+    result: numpy.ndarray, integer_bound: int
+) -> Optional[numpy.ndarray]:
+    """
+    Check the result of a NumPy operation: integer results are exact if
+    their absolute values are at most ``integer_bound``; real results
+    must be finite machine reals.
+    """
+    if result.dtype.kind == "i":
+        return result if integer_bound <= MAX_MACHINE_INTEGER else None
+    with numpy.errstate(all="ignore"):
+        return machine_real_result(result)
+
+
+def _as_reals(arrays: Sequence[numpy.ndarray]) -> Optional[List[numpy.ndarray]]:
+    """
+    If some of ``arrays`` are reals, convert the integer ones to reals,
+    if that is exact. Otherwise, return None.
+    """
+    if all(array.dtype.kind == "i" for array in arrays):
+        return list(arrays)
+    result = []
+    for array in arrays:
+        if array.dtype.kind == "i":
+            if max_abs(array) > MAX_EXACT_FLOAT_INTEGER:
+                return None
+            array = array.astype(numpy.float64)
+        result.append(array)
+    return result
+
+
+def _group_sums(
+    indices: numpy.ndarray, values: numpy.ndarray
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Add up the values with the same index, returning the distinct indices
+    in lexicographic order and their sums.
+    """
+    if len(indices) == 0:
+        return indices, values
+    order = numpy.lexsort(indices.T[::-1]) if indices.shape[1] else slice(None)
+    indices = indices[order]
+    values = values[order]
+    starts = numpy.flatnonzero(
+        numpy.concatenate(([True], (indices[1:] != indices[:-1]).any(axis=1)))
+    )
+    return indices[starts], numpy.add.reduceat(values, starts)
+
+
+def eval_Part_sparse(
+    array: SparseArrayExpression,
+    indices: Sequence[Integer],
+    evaluation: Evaluation,
+) -> Optional[BaseElement]:
+    """
+    Return the part of ``array`` at the nonzero Integer ``indices``: an element,
+    or a sparse array if there are fewer indices than dimensions.
+    """
+    if len(indices) > len(array.dims):
+        evaluation.message("Part", "partd")
+        return None
+    prefix = []
+    for index, dim in zip(indices, array.dims):
+        value = index.value
+        if value < 0:
+            value += dim + 1
+        if not 1 <= value <= dim:
+            evaluation.message("Part", "partw", index, array)
+            return None
+        prefix.append(value)
+    position = tuple(prefix)
+
+    if len(position) == len(array.dims):
+        return array.get(position)
+    dims = array.dims[len(position) :]
+    if array.data is None:
+        start, end = array.find_range(tuple(index - 1 for index in position))
+        return SparseArrayExpression(
+            dims,
+            array.default,
+            indices=array.indices[start:end, len(position) :],
+            values=array.values[start:end],
+        )
+    data = {
+        key[len(position) :]: value
+        for key, value in array.data.items()
+        if key[: len(position)] == position
+    }
+    return SparseArrayExpression(dims, array.default, data=data)
+
+
+def eval_Transpose_sparse(
+    array: SparseArrayExpression,
+) -> Optional[SparseArrayExpression]:
+    """Transpose the first two dimensions of ``array``."""
+    rank = len(array.dims)
+    if rank < 2:
+        return None
+    dims = (array.dims[1], array.dims[0]) + array.dims[2:]
+    if array.data is None:
+        columns = [1, 0] + list(range(2, rank))
+        return numeric_sparse_array(
+            dims, array.default, array.indices[:, columns], array.values
+        )
+    data = {
+        (position[1], position[0]) + position[2:]: value
+        for position, value in array.data.items()
+    }
+    return sparse_array_from_dict(dims, array.default, data)
+
+
+def _split_sparse_arguments(
+    items: Sequence[BaseElement],
+) -> Optional[Tuple[List[SparseArrayExpression], List[BaseElement]]]:
+    """
+    Split the arguments of Plus or Times into sparse arrays and scalars,
+    or return None if some of them are other arrays, or the sparse arrays
+    have different dimensions.
+    """
+    arrays = []
+    scalars = []
+    for item in items:
+        if isinstance(item, SparseArrayExpression):
+            arrays.append(item)
+        elif item.has_form(("List", "SparseArray"), None):
+            return None
+        else:
+            scalars.append(item)
+    if any(array.dims != arrays[0].dims for array in arrays):
+        return None
+    return arrays, scalars
+
+
+def eval_Plus_sparse(
+    items: Sequence[BaseElement], evaluation: Evaluation
+) -> Optional[SparseArrayExpression]:
+    """
+    Add sparse arrays with the same dimensions, and scalars, which are
+    added to all the elements.
+    """
+    split = _split_sparse_arguments(items)
+    if split is None:
+        return None
+    arrays, scalars = split
+    dims = arrays[0].dims
+    scalar = (
+        Expression(SymbolPlus, *scalars).evaluate(evaluation) if scalars else Integer0
+    )
+    default = Expression(
+        SymbolPlus, *(array.default for array in arrays), scalar
+    ).evaluate(evaluation)
+
+    if (
+        all(array.data is None and is_zero(array.default) for array in arrays)
+        and is_machine_number(scalar)
+        and is_machine_number(default)
+    ):
+        numeric_values = _as_reals(
+            [array.values for array in arrays] + [numpy.array([scalar.value])]
+        )
+        if numeric_values is not None:
+            indices, values = _group_sums(
+                numpy.concatenate([array.indices for array in arrays]),
+                numpy.concatenate(numeric_values[:-1]),
+            )
+            with numpy.errstate(all="ignore"):
+                values = _numeric_result(
+                    values + numeric_values[-1],
+                    sum(max_abs(array.values) for array in arrays) + abs(scalar.value),
+                )
+            if values is not None:
+                return numeric_sparse_array(dims, default, indices, values)
+
+    data_list = [array.to_dict() for array in arrays]
+    data = {}
+    for position in dict.fromkeys(
+        position for array_data in data_list for position in array_data
+    ):
+        terms = [
+            array_data.get(position, array.default)
+            for array_data, array in zip(data_list, arrays)
+        ]
+        data[position] = Expression(SymbolPlus, *terms, scalar).evaluate(evaluation)
+    return sparse_array_from_dict(dims, default, data)
+
+
+def eval_Times_sparse(
+    items: Sequence[BaseElement], evaluation: Evaluation
+) -> Optional[SparseArrayExpression]:
+    """Multiply a sparse array by scalars."""
+    split = _split_sparse_arguments(items)
+    if split is None or len(split[0]) != 1:
+        return None
+    (array,), scalars = split
+    scalar = (
+        Expression(SymbolTimes, *scalars).evaluate(evaluation) if scalars else Integer1
+    )
+    default = Expression(SymbolTimes, scalar, array.default).evaluate(evaluation)
+
+    if array.data is None and is_machine_number(scalar) and is_machine_number(default):
+        numeric_values = _as_reals([array.values, numpy.array([scalar.value])])
+        if numeric_values is not None:
+            with numpy.errstate(all="ignore"):
+                values = _numeric_result(
+                    numeric_values[0] * numeric_values[1],
+                    max_abs(array.values) * abs(scalar.value),
+                )
+            if values is not None:
+                return numeric_sparse_array(array.dims, default, array.indices, values)
+
+    data = {
+        position: Expression(SymbolTimes, scalar, value).evaluate(evaluation)
+        for position, value in array.items()
+    }
+    return sparse_array_from_dict(array.dims, default, data)
+
+
+def eval_Total_sparse(
+    array: SparseArrayExpression, evaluation: Evaluation
+) -> BaseElement:
+    """
+    Add up the elements of ``array`` along its first dimension, like
+    ``Total[array]``.
+    """
+    length = array.dims[0]
+    dims = array.dims[1:]
+
+    if _has_numeric_zero_default(array):
+        if not dims:
+            values = array.values.tolist()
+            if array.values.dtype.kind == "i":
+                return Integer(sum(values))
+            try:
+                return MachineReal(math.fsum(values))
+            except OverflowError:
+                pass
+        else:
+            indices, values = _group_sums(array.indices[:, 1:], array.values)
+            values = _numeric_result(values, max_abs(array.values) * length)
+            if values is not None:
+                return numeric_sparse_array(dims, array.default, indices, values)
+
+    groups: Dict[Position, List[BaseElement]] = {}
+    for position, value in array.items():
+        groups.setdefault(position[1:], []).append(value)
+
+    def total(values: List[BaseElement]) -> BaseElement:
+        missing = length - len(values)
+        if missing:
+            values = values + [Expression(SymbolTimes, Integer(missing), array.default)]
+        return Expression(SymbolPlus, *values).evaluate(evaluation)
+
+    if not dims:
+        return total(groups.get((), []))
+    data = {position: total(values) for position, values in groups.items()}
+    default = total([])
+    return sparse_array_from_dict(dims, default, data)
+
+
+def _list_items(
+    expr: BaseElement, rank: int, position: Position = ()
+) -> Iterator[Tuple[Position, BaseElement]]:
+    """Iterate over the positions and the elements of a rectangular List."""
+    for index, element in enumerate(expr.elements, 1):
+        if rank == 1:
+            yield position + (index,), element
+        else:
+            yield from _list_items(element, rank - 1, position + (index,))
+
+
+def _dot_operand(expr: BaseElement):
+    """
+    Return the SciPy matrix of a numeric sparse matrix, or the NumPy array
+    of a numeric sparse vector or of a packed List of rank at most 2, or
+    None.
+    """
+    if isinstance(expr, SparseArrayExpression):
+        if not _has_numeric_zero_default(expr) or len(expr.dims) > 2:
+            return None
+        if len(expr.dims) == 1:
+            return expr.to_numpy()
+        return expr.to_scipy()
+    packed = to_packed_list(expr)
+    if not packed.is_packed or packed.array.ndim > 2:
+        return None
+    return packed.array
+
+
+def _eval_Dot_numeric(a: BaseElement, b: BaseElement) -> Optional[BaseElement]:
+    """
+    Compute ``a . b`` with SciPy, if ``a`` and ``b`` are numeric sparse
+    arrays or packed Lists.
+    """
+    operand1 = _dot_operand(a)
+    operand2 = _dot_operand(b)
+    if operand1 is None or operand2 is None:
+        return None
+
+    def numpy_values(operand) -> numpy.ndarray:
+        return operand if isinstance(operand, numpy.ndarray) else operand.data
+
+    values1 = numpy_values(operand1)
+    values2 = numpy_values(operand2)
+    reals = _as_reals([values1, values2])
+    if reals is None:
+        return None
+    inner = operand2.shape[0]
+    integer_bound = max_abs(values1) * max_abs(values2) * inner
+    if values1.dtype != reals[0].dtype:
+        operand1 = operand1.astype(numpy.float64)
+    if values2.dtype != reals[1].dtype:
+        operand2 = operand2.astype(numpy.float64)
+    if reals[0].dtype.kind == "i" and integer_bound > MAX_MACHINE_INTEGER:
+        return None
+
+    with numpy.errstate(all="ignore"):
+        result = operand1 @ operand2
+    if isinstance(result, numpy.generic):
+        result = numpy.asarray(result)
+    sparse_result = isinstance(a, SparseArrayExpression) and isinstance(
+        b, SparseArrayExpression
+    )
+    if isinstance(result, numpy.ndarray):
+        result = _numeric_result(result, integer_bound)
+        if result is None:
+            return None
+        if result.ndim == 0:
+            value = result.item()
+            return MachineReal(value) if isinstance(value, float) else Integer(value)
+        if not sparse_result:
+            return PackedListExpression(result)
+        indices = numpy.argwhere(result != 0)
+        values = result[tuple(indices.T)]
+    else:
+        coo = result.tocoo()
+        # Products of SciPy matrices are SciPy matrices.
+        values = _numeric_result(coo.data, integer_bound)
+        if values is None:
+            return None
+        indices = numpy.stack([coo.row, coo.col], axis=1)
+    if isinstance(a.default, Integer) and isinstance(b.default, Integer):
+        default = Integer0
+    else:
+        default = MachineReal(0.0)
+    return numeric_sparse_array(result.shape, default, indices, values)
+
+
+def eval_Dot_sparse(
+    a: BaseElement, b: BaseElement, evaluation: Evaluation
+) -> Optional[BaseElement]:
+    """
+    Compute ``a . b``, where ``a`` or ``b`` is a sparse array and the other
+    is a sparse array or a List. The result is a sparse array if both are.
+    """
+    dims1 = a.dims if isinstance(a, SparseArrayExpression) else get_dimensions(a)
+    dims2 = b.dims if isinstance(b, SparseArrayExpression) else get_dimensions(b)
+    if not dims1 or not dims2:
+        return None
+    if dims1[-1] != dims2[0]:
+        evaluation.message("Inner", "incom", dims1[-1], len(dims1), a, dims2[0], b)
+        return None
+    sparse_arrays = [x for x in (a, b) if isinstance(x, SparseArrayExpression)]
+    if not all(is_zero(array.default) for array in sparse_arrays):
+        # Sparse arrays with other defaults are multiplied as Lists.
+        return Expression(
+            SymbolDot,
+            *(
+                to_dense_list(x) if isinstance(x, SparseArrayExpression) else x
+                for x in (a, b)
+            ),
+        )
+
+    result = _eval_Dot_numeric(a, b)
+    if result is not None:
+        return result
+
+    # Otherwise, add up the products of the explicit elements of a and b.
+    items1 = (
+        a.items()
+        if isinstance(a, SparseArrayExpression)
+        else _list_items(a, len(dims1))
+    )
+    rows2: Dict[int, List[Tuple[Position, BaseElement]]] = {}
+    items2 = (
+        b.items()
+        if isinstance(b, SparseArrayExpression)
+        else _list_items(b, len(dims2))
+    )
+    for position, value in items2:
+        rows2.setdefault(position[0], []).append((position[1:], value))
+    terms: Dict[Position, List[BaseElement]] = {}
+    for position1, value1 in items1:
+        for position2, value2 in rows2.get(position1[-1], ()):
+            terms.setdefault(position1[:-1] + position2, []).append(
+                Expression(SymbolTimes, value1, value2)
+            )
+    data = {
+        position: Expression(SymbolPlus, *products).evaluate(evaluation)
+        for position, products in terms.items()
+    }
+    dims = tuple(dims1[:-1]) + tuple(dims2[1:])
+    if not dims:
+        return data.get((), Integer0)
+    result = sparse_array_from_dict(dims, Integer0, data)
+    return result if len(sparse_arrays) == 2 else to_dense_list(result)
+
+
+def eval_LinearSolve_sparse(
+    matrix: SparseArrayExpression, b: BaseElement, evaluation: Evaluation
+) -> Optional[BaseElement]:
+    """
+    Solve ``matrix . x == b`` with SciPy, if ``matrix`` is a square numeric
+    sparse matrix, ``b`` is a numeric vector or matrix, and one of them is
+    inexact. Otherwise, or if ``matrix`` is singular, return None.
+    """
+    scipy_matrix = matrix.to_scipy() if _has_numeric_zero_default(matrix) else None
+    if scipy_matrix is None or matrix.dims[0] != matrix.dims[1]:
+        return None
+    if isinstance(b, SparseArrayExpression):
+        if not _has_numeric_zero_default(b):
+            return None
+        rhs = b.to_numpy()
+    else:
+        packed = to_packed_list(b)
+        if not packed.is_packed:
+            return None
+        rhs = packed.array
+    if rhs.ndim > 2 or len(rhs) != matrix.dims[0]:
+        return None
+    if matrix.values.dtype.kind == "i" and rhs.dtype.kind == "i":
+        return None
+    if max(max_abs(matrix.values), max_abs(rhs)) > MAX_EXACT_FLOAT_INTEGER:
+        return None
+
+    from scipy.sparse.linalg import spsolve
+
+    with warnings.catch_warnings(), numpy.errstate(all="ignore"):
+        # Singular matrices give a warning, and NaNs.
+        warnings.simplefilter("ignore")
+        solution = spsolve(
+            scipy_matrix.astype(numpy.float64).tocsc(), rhs.astype(numpy.float64)
+        )
+    solution = machine_real_result(numpy.asarray(solution).reshape(rhs.shape))
+    if solution is None:
+        return None
+    return PackedListExpression(solution)
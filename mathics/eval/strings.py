@@ -6,7 +6,7 @@ import re
 from mathics.core.atoms import Integer1, Integer3, String
 from mathics.core.convert.expression import to_mathics_list
 from mathics.core.convert.python import from_bool
-from mathics.core.convert.regex import to_regex
+from mathics.core.convert.regex import compile_regex
 from mathics.core.element import BaseElement
 from mathics.core.evaluation import Evaluation
 from mathics.core.expression import Expression
@@ -31,20 +31,20 @@ def eval_StringContainsQ(name, string, patt, evaluation, options, matched):
         patts = patt.elements
     else:
         patts = [patt]
+    flags = re.MULTILINE
+    if options["System`IgnoreCase"] is SymbolTrue:
+        flags = flags | re.IGNORECASE
+
     re_patts = []
     for p in patts:
-        py_p = to_regex(p, show_message=evaluation.message)
+        py_p = compile_regex(p, flags, show_message=evaluation.message)
         if py_p is None:
             evaluation.message("StringExpression", "invld", p, patt)
             return
         re_patts.append(py_p)
 
-    flags = re.MULTILINE
-    if options["System`IgnoreCase"] is SymbolTrue:
-        flags = flags | re.IGNORECASE
-
     def _search(patts, str, flags, matched):
-        if any(re.search(p, str, flags=flags) for p in patts):
+        if any(p.search(str) for p in patts):
             return from_bool(matched)
         return from_bool(not matched)
 
@@ -86,10 +86,15 @@ def eval_StringFind(self, string, rule, n, evaluation, options, cases):
             evaluation.message(self.get_name(), "strse", Integer1, expr)
             return
 
+    # flags
+    flags = re.MULTILINE
+    if options["System`IgnoreCase"] is SymbolTrue:
+        flags = flags | re.IGNORECASE
+
     # convert rule
     def convert_rule(r):
         if r.has_form("Rule", None) and len(r.elements) == 2:
-            py_s = to_regex(r.elements[0], show_message=evaluation.message)
+            py_s = compile_regex(r.elements[0], flags, show_message=evaluation.message)
             if py_s is None:
                 evaluation.message(
                     "StringExpression", "invld", r.elements[0], r.elements[0]
@@ -98,7 +103,7 @@ def eval_StringFind(self, string, rule, n, evaluation, options, cases):
             py_sp = r.elements[1]
             return py_s, py_sp
         elif cases:
-            py_s = to_regex(r, show_message=evaluation.message)
+            py_s = compile_regex(r, flags, show_message=evaluation.message)
             if py_s is None:
                 evaluation.message("StringExpression", "invld", r, r)
                 return
@@ -125,11 +130,6 @@ def eval_StringFind(self, string, rule, n, evaluation, options, cases):
             evaluation.message(self.get_name(), "innf", Integer3, expr)
             return
 
-    # flags
-    flags = re.MULTILINE
-    if options["System`IgnoreCase"] is SymbolTrue:
-        flags = flags | re.IGNORECASE
-
     if isinstance(py_strings, list):
         return to_mathics_list(
             *[
@@ -1,18 +1,20 @@
-from typing import Union
+from typing import Optional, Sequence, Union
 
+import numpy
 from sympy.combinatorics import Permutation
 from sympy.utilities.iterables import permutations
 
-from mathics.core.atoms import Integer, Integer0, Integer1, String
+from mathics.core.atoms import Integer, Integer0, Integer1, MachineReal, String
 from mathics.core.convert.python import from_python
 from mathics.core.evaluation import Evaluation
 from mathics.core.expression import BaseElement, Expression
-from mathics.core.list import ListExpression
+from mathics.core.list import ListExpression, PackedListExpression, to_packed_list
 from mathics.core.symbols import (
     Atom,
     Symbol,
     SymbolFalse,
     SymbolList,
+    SymbolPlus,
     SymbolTimes,
     SymbolTrue,
 )
@@ -24,6 +26,13 @@ from mathics.core.systemsymbols import (
     SymbolRule,
     SymbolSparseArray,
 )
+from mathics.eval.arithfns.basic import (
+    MAX_EXACT_FLOAT_INTEGER,
+    MAX_MACHINE_INTEGER,
+    eval_Times_vectorized,
+    machine_real_result,
+    max_abs,
+)
 from mathics.eval.parts import get_part
 
 
@@ -65,6 +74,8 @@ def get_dimensions(expr, head=None):
     else:
         if head is not None and not expr.head.sameQ(head):
             return []
+        if expr.is_packed:
+            return list(expr.array.shape)
         sub_dim = None
         sub = []
         for element in expr.elements:
@@ -166,9 +177,75 @@ def construct_outer(lists, current, const_etc: tuple) -> Union[list, BaseElement
     return _unpack_outer(lists[0], lists[1:], current, 1)
 
 
+def _packed_arrays(
+    lists: Sequence[BaseElement], evaluation: Evaluation, *names: str
+) -> Optional[list]:
+    """
+    Return the NumPy arrays of ``lists`` if they are all Lists of machine
+    numbers that can be packed, and the builtins ``names`` were not changed
+    by the user. Otherwise, return None.
+    """
+    if any(name in evaluation.definitions.user for name in names):
+        return None
+    arrays = []
+    for element in lists:
+        packed = to_packed_list(element)
+        if not packed.is_packed:
+            return None
+        arrays.append(packed.array)
+    return arrays
+
+
+def _from_numeric_result(result: numpy.ndarray) -> BaseElement:
+    if result.ndim == 0:
+        value = result.item()
+        return MachineReal(value) if isinstance(value, float) else Integer(value)
+    return PackedListExpression(result)
+
+
+def eval_Dot_numeric(
+    array1: numpy.ndarray, array2: numpy.ndarray
+) -> Optional[numpy.ndarray]:
+    """
+    Compute ``Inner[Times, array1, array2, Plus]`` with NumPy, contracting
+    the last dimension of ``array1`` with the first dimension of ``array2``.
+
+    Integer products are exact: if they could overflow, return None.
+    Products with reals are computed with machine reals, so the sums may
+    be rounded differently than by ``Plus``.
+    """
+    if array1.shape[-1] != array2.shape[0]:
+        return None
+    integer1 = array1.dtype.kind == "i"
+    integer2 = array2.dtype.kind == "i"
+    if integer1 and integer2:
+        if max_abs(array1) * max_abs(array2) * array2.shape[0] > MAX_MACHINE_INTEGER:
+            return None
+        return numpy.tensordot(array1, array2, axes=1)
+    if integer1:
+        if max_abs(array1) > MAX_EXACT_FLOAT_INTEGER:
+            return None
+        array1 = array1.astype(numpy.float64)
+    elif integer2:
+        if max_abs(array2) > MAX_EXACT_FLOAT_INTEGER:
+            return None
+        array2 = array2.astype(numpy.float64)
+    with numpy.errstate(all="ignore"):
+        return machine_real_result(numpy.tensordot(array1, array2, axes=1))
+
+
 def eval_Inner(f, list1, list2, g, evaluation: Evaluation):
     "Evaluates recursively the inner product of list1 and list2"
 
+    if f is SymbolTimes and g is SymbolPlus:
+        arrays = _packed_arrays(
+            (list1, list2), evaluation, "System`Times", "System`Plus"
+        )
+        if arrays is not None:
+            result = eval_Dot_numeric(*arrays)
+            if result is not None:
+                return _from_numeric_result(result)
+
     m = get_dimensions(list1)
     n = get_dimensions(list2)
 
@@ -222,6 +299,14 @@ def eval_Outer(f, lists, evaluation: Evaluation):
 
     # If f=!=Times, or lists contain both SparseArray and List, then convert all SparseArrays to Lists
     lists = lists.get_sequence()
+
+    if f is SymbolTimes and len(lists) > 1:
+        arrays = _packed_arrays(lists, evaluation, "System`Times")
+        if arrays is not None:
+            result = eval_Outer_numeric(arrays)
+            if result is not None:
+                return PackedListExpression(result)
+
     head = None
     sparse_to_list = f != SymbolTimes
     contain_sparse = False
@@ -307,6 +392,36 @@ def eval_Outer(f, lists, evaluation: Evaluation):
     )
 
 
+def eval_Outer_numeric(arrays: Sequence[numpy.ndarray]) -> Optional[numpy.ndarray]:
+    """
+    Compute ``Outer[Times, array1, array2, ...]`` with NumPy, or return None
+    if the result would not be the same as multiplying the elements.
+    """
+    # Give each array its own axes, so that broadcasting builds all
+    # the products.
+    ndim = sum(array.ndim for array in arrays)
+    args = []
+    before = 0
+    for array in arrays:
+        after = ndim - before - array.ndim
+        args.append(array.reshape((1,) * before + array.shape + (1,) * after))
+        before += array.ndim
+    with numpy.errstate(all="ignore"):
+        result = eval_Times_vectorized(*args)
+    return result
+
+
+def eval_Transpose_numeric(matrix: BaseElement) -> Optional[PackedListExpression]:
+    """
+    Transpose ``matrix`` with NumPy, if it is a List of machine numbers that
+    can be packed. Otherwise, return None.
+    """
+    packed = to_packed_list(matrix)
+    if not packed.is_packed or packed.array.ndim != 2:
+        return None
+    return PackedListExpression(numpy.ascontiguousarray(packed.array.T))
+
+
 def eval_LeviCivitaTensor(d, type):
     "Evaluates Levi-Civita tensor of rank d"
 
@@ -114,6 +114,12 @@ def eval_ArrayQ(expr, pattern, test_condition, evaluation: Evaluation) -> Boolea
 
     pattern = BasePattern.create(pattern, evaluation=evaluation)
 
+    if expr.is_packed and test_condition is None:
+        # Packed arrays are rectangular, and their elements are numbers.
+        if pattern.does_match(Integer(expr.array.ndim), {"evaluation": evaluation}):
+            return SymbolTrue
+        return SymbolFalse
+
     dims = [len(expr.get_elements())]  # to ensure an atom is not an array
 
     def check(level, expr):
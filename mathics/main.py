@@ -482,7 +482,9 @@ Please contribute to Mathics!""",
         atexit.register(show_lru_cache_statistics)
 
     definitions = Definitions(
-        add_builtin=True, extension_modules=tuple(extension_modules)
+        add_builtin=True,
+        builtin_filename=settings.BUILTIN_SNAPSHOT_PCL,
+        extension_modules=tuple(extension_modules),
     )
     definitions.set_line_no(0)
 
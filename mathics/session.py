@@ -17,6 +17,7 @@ from typing import Optional
 from mathics.core.definitions import Definitions
 from mathics.core.evaluation import Evaluation, Result
 from mathics.core.parser import MathicsSingleLineFeeder, parse
+from mathics.settings import BUILTIN_SNAPSHOT_PCL
 
 
 def autoload_files(
@@ -125,12 +126,16 @@ class MathicsSession:
         reset the definitions and the evaluation objects.
         """
         try:
-            self.definitions = Definitions(add_builtin)
+            self.definitions = Definitions(
+                add_builtin, builtin_filename=BUILTIN_SNAPSHOT_PCL
+            )
         except KeyError:
             from mathics.core.load_builtin import import_and_load_builtins
 
             import_and_load_builtins()
-            self.definitions = Definitions(add_builtin)
+            self.definitions = Definitions(
+                add_builtin, builtin_filename=BUILTIN_SNAPSHOT_PCL
+            )
 
         self.evaluation = Evaluation(
             definitions=self.definitions, catch_interrupt=catch_interrupt
@@ -57,6 +57,29 @@ else:
     )
 USER_PACKAGE_DIR = osp.join(DATA_DIR, "Packages")
 
+if sys.platform.startswith("win"):
+    CACHE_DIR = canonic_filename(
+        osp.join(os.environ.get("LOCALAPPDATA", DATA_DIR), "Mathics3", "Cache")
+    )
+else:
+    CACHE_DIR = osp.join(
+        os.environ.get("XDG_CACHE_HOME", osp.expanduser("~/.cache")), "Mathics3"
+    )
+CACHE_DIR = os.environ.get("MATHICS3_CACHE_DIR", CACHE_DIR)
+
+# Snapshot of the builtin definitions, taken after the autoload files
+# are loaded. Loading it is faster than building the definitions from
+# the Builtin classes. It is rebuilt whenever the version of Mathics3
+# or the contents of its builtin modules and autoload files change.
+# Set MATHICS3_BUILTIN_SNAPSHOT to an empty string to disable it.
+BUILTIN_SNAPSHOT_PCL = os.environ.get(
+    "MATHICS3_BUILTIN_SNAPSHOT",
+    osp.join(
+        CACHE_DIR,
+        "builtin-definitions-py%d%d.pcl" % sys.version_info[:2],
+    ),
+)
+
 # In contrast to ROOT_DIR, LOCAL_ROOT_DIR is used in building
 # LaTeX documentation. When Mathics is installed, we don't want LaTeX file documentation.tex
 # to get put in the installation directory, but instead we build documentation
@@ -94,6 +117,15 @@ TIME_12HOUR = False
 # users to access local files.
 ENABLE_FILES_MODULE = True
 
+# Set this True to defer the import of the builtin modules listed
+# in mathics/data/builtin-manifest.json until one of their symbols
+# is used. This speeds up the startup of short-lived sessions.
+LAZY_BUILTINS = os.environ.get("MATHICS3_LAZY_BUILTINS", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
 # Rocky: this is probably a hack. LoadModule[] needs to handle
 # whatever it is that setting this thing did.
 default_pymathics_modules: List[str] = []
@@ -66,13 +66,21 @@ def show_lru_cache_statistics():
     Print statistics from LRU caches (@lru_cache of functools)
     """
     from mathics.builtin.atomic.numbers import log_n_b
-    from mathics.core.atoms import Integer, Rational
+    from mathics.core.atoms import NUMBER_INTERN_TABLES
     from mathics.core.builtin import MPMathFunction
     from mathics.core.convert.mpmath import from_mpmath
+    from mathics.core.convert.regex import REGEX_CACHE
     from mathics.eval.arithmetic import run_mpmath
 
-    print(f"Integer             {len(Integer._integers)}")
-    print(f"Rational            {len(Rational._rationals)}")
+    for head_name, table in NUMBER_INTERN_TABLES.items():
+        print(
+            f"{head_name:<20}size={len(table) + len(table.pinned)}, "
+            f"hits={table.hits}, misses={table.misses}"
+        )
+    print(
+        f"{'to_regex':<20}size={len(REGEX_CACHE)}, "
+        f"hits={REGEX_CACHE.hits}, misses={REGEX_CACHE.misses}"
+    )
     print(f"run_mpmath         {run_mpmath.cache_info()}")
     print(f"log_n_b             {log_n_b.cache_info()}")
     print(f"from_mpmath         {from_mpmath.cache_info()}")
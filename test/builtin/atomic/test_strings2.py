@@ -53,6 +53,7 @@ def test_string_split():
         ),
         ('StringSplit["a-b:c-d:e-f-g", {":", "-"}]', "{a, b, c, d, e, f, g}"),
         ('StringSplit["a-b:c-d:e-f-g", ":" | "-"]', "{a, b, c, d, e, f, g}"),
+        ('StringSplit["a b", {}]', "{a b}"),
         (
             'StringSplit[{"a:b:c:d", "listable:element"}, ":"]',
             "{{a, b, c, d}, {listable, element}}",
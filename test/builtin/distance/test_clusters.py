@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for mathics.builtin.distance.clusters
+"""
+
+from test.helper import check_evaluation, session
+
+import mpmath
+import numpy
+import pytest
+
+from mathics.algorithm.clusters import kmeans
+
+
+@pytest.mark.parametrize(
+    ("str_expr", "str_expected"),
+    [
+        ('Nearest[{1, 2, 3}, 2.2, Method -> "Scan"]', "{2}"),
+        ('Nearest[{1, 2, 3}, 2.2, 2, Method -> "KDTree"]', "{2, 3}"),
+        ("Nearest[{1, 2, 3}][2.2]", "{2}"),
+        ("Nearest[{1, 3, 2, 2, 3}, 2, 2]", "{2, 2}"),
+        ("Nearest[{3, 1, 2, 1, 3}, 2, 2]", "{2, 3}"),
+        ("Nearest[{1, 2, 3}, {1.2, 2.6}]", "{{1}, {3}}"),
+        ("Nearest[{{1, 2}, {3, 4}}, {{1, 1}, {3, 3}}]", "{{{1, 2}}, {{3, 4}}}"),
+        ("Nearest[{1/2, 5, 3}, 2, 2]", "{3, 1/2}"),
+        ("Nearest[{1, 2, 3}, 2, 0]", "{}"),
+        ("Nearest[{}, 1]", "{}"),
+        ("Nearest[{}][1]", "{}"),
+        (
+            "Nearest[{{0, 0}, {1, 1}, {2, 0}}, {0, 0}, All, DistanceFunction -> ChessboardDistance]",
+            "{{0, 0}, {1, 1}, {2, 0}}",
+        ),
+        (
+            "Nearest[{{0, 0}, {1, 1}, {2, 0}}, {0, 0}, {All, 2}, DistanceFunction -> ManhattanDistance]",
+            "{{0, 0}, {1, 1}, {2, 0}}",
+        ),
+        (
+            "Nearest[{{0, 0}, {1, 1}, {2, 0}}, {0, 0}, {All, 1.9}, DistanceFunction -> ManhattanDistance]",
+            "{{0, 0}}",
+        ),
+        ('Nearest[{"abc", "abd", "xyz"}]["abx", 2]', "{abc, abd}"),
+        (
+            'Nearest[{1, 2, 3}, 2, DistanceFunction -> (Abs[#1 - #2]&), Method -> "KDTree"]',
+            "{2}",
+        ),
+    ],
+)
+def test_nearest(str_expr, str_expected):
+    check_evaluation(str_expr, str_expected)
+
+
+@pytest.mark.parametrize(
+    ("str_expr",),
+    [
+        ('Nearest[{1, 2, 3}, 2, Method -> "Bogus"]',),
+        ('Nearest[{1, 2, 3}, 2, 2, Method -> "Bogus"]',),
+        ('Nearest[{1, 2, 3}, Method -> "Bogus"]',),
+    ],
+)
+def test_nearest_bad_method(str_expr):
+    check_evaluation(
+        str_expr,
+        str_expr,
+        expected_messages=("Method Bogus is not implemented yet.",),
+    )
+
+
+@pytest.mark.parametrize(
+    ("data", "options"),
+    [
+        ("RandomInteger[5, 200]", ""),
+        ("RandomReal[1, {300, 2}]", ""),
+        ("RandomInteger[4, {300, 3}]", ", DistanceFunction -> EuclideanDistance"),
+        ("RandomInteger[4, {300, 2}]", ", DistanceFunction -> ManhattanDistance"),
+        ("RandomReal[1, {300, 2}]", ", DistanceFunction -> ChessboardDistance"),
+        (
+            'Table[StringJoin[RandomChoice[{"a", "b", "c"}, 4]], {60}]',
+            "",
+        ),
+    ],
+)
+def test_nearest_methods(data, options):
+    """The trees give the same items as scanning the data, in the same order."""
+    session.evaluate(f"SeedRandom[42]; data = {data}; queries = RandomSample[data, 5];")
+    for limit in ("1", "4", "{All, 2}", "{3, 1}"):
+        results = [
+            session.evaluate(
+                f"Table[Nearest[data, q, {limit}, Method -> {method}{options}], {{q, queries}}]"
+            )
+            for method in ('"Scan"', '"KDTree"', "Automatic")
+        ]
+        results.append(
+            session.evaluate(
+                f"With[{{nf = Nearest[data{options}]}}, Table[nf[q, {limit}], {{q, queries}}]]"
+            )
+        )
+        for result in results[1:]:
+            assert result.sameQ(results[0]), (limit, results)
+    session.evaluate("ClearAll[data, queries]")
+
+
+@pytest.mark.parametrize(
+    ("data", "distance"),
+    [
+        ("RandomInteger[100, 40]", "SquaredEuclideanDistance"),
+        ("RandomReal[10, {50, 2}]", "SquaredEuclideanDistance"),
+        ("RandomInteger[20, {40, 3}]", "ManhattanDistance"),
+        ("RandomReal[1, {40, 2}]", "ChessboardDistance"),
+        ("RandomReal[1, {40, 2}]", "EuclideanDistance"),
+    ],
+)
+def test_cluster_distances(data, distance):
+    """Distances computed with NumPy give the clusters of the evaluated distances."""
+    session.evaluate(f"SeedRandom[42]; data = {data};")
+    for method in ('"Optimize"', '"Agglomerate"'):
+        for k in ("", ", 3"):
+            results = [
+                session.evaluate(
+                    f"ClusteringComponents[data{k}, Method -> {method}, DistanceFunction -> {function}]"
+                )
+                for function in (distance, f"({distance}[#1, #2]&)")
+            ]
+            assert results[0].sameQ(results[1]), (method, k)
+    session.evaluate("ClearAll[data]")
+
+
+@pytest.mark.parametrize(
+    ("points", "k"),
+    [
+        ([[x] for x in (10, 100, 20, 12, 95, 3, 50, 51, 49)], None),
+        ([[x, (x * 7) % 11] for x in range(30)], 3),
+        ([[x * 0.25, (x * x) % 13 * 0.5] for x in range(40)], None),
+    ],
+)
+def test_kmeans_array(points, k):
+    """K-means with NumPy gives the clusters of k-means with mpmath numbers."""
+    x = [[mpmath.mpf(c) for c in point] for point in points]
+    eps = 0.5**46
+    expected = kmeans(x, points, k, "components", 12345, eps)
+    assert kmeans(numpy.array(points), points, k, "components", 12345, eps) == expected
+
+
+@pytest.mark.parametrize(
+    ("str_expr", "str_expected", "expected_messages"),
+    [
+        (
+            'ClusteringComponents[{1, 2, 3, 50, 51, 52, 100, 101}, 3, Method -> {"KMeans", "BatchSize" -> 4}]',
+            "{1, 1, 1, 2, 2, 2, 0, 0}",
+            None,
+        ),
+        (
+            'FindClusters[{1, 2, 10, 11}, Method -> {"KMeans", "BatchSize" -> 0}]',
+            'FindClusters[{1, 2, 10, 11}, Method -> {"KMeans", "BatchSize" -> 0}]',
+            (
+                'The only suboption of Method in Method → {KMeans, BatchSize → 0} is "BatchSize", which must be a positive integer, for "KMeans".',
+            ),
+        ),
+        (
+            'FindClusters[{1, 2, 10, 11}, Method -> "Foo"]',
+            'FindClusters[{1, 2, 10, 11}, Method -> "Foo"]',
+            (
+                'Method in Method → Foo must be either "Optimize", "Agglomerate" or "KMeans".',
+            ),
+        ),
+    ],
+)
+def test_cluster_methods(str_expr, str_expected, expected_messages):
+    check_evaluation(str_expr, str_expected, expected_messages=expected_messages)
@@ -70,6 +70,12 @@ if not (os.environ.get("CI", False) or sys.platform in ("win32",)):
             )
             assert open(file_path, "r").read() == "1,2,3\n4,5,6"
 
+            # Check exporting JSON files (file extension ".json")
+            file_path = run_export(
+                temp_dirname, "rules.json", '{"a" -> {1, 2.5}, "b" -> True}', None
+            )
+            assert open(file_path, "r").read() == '{"a": [1, 2.5], "b": true}'
+
             # Check exporting SVG files (file extension ".svg")
             file_path = run_export(
                 temp_dirname, "sine.svg", "Plot[Sin[x], {x,0,1}]", None
@@ -133,13 +139,55 @@ if not (os.environ.get("CI", False) or sys.platform in ("win32",)):
         (
             'Import["ExampleData/numberdata.csv", "Data"]',
             None,
-            "{{0.88, 0.60, 0.94}, {0.76, 0.19, 0.51}, {0.97, 0.04, 0.26}, {0.33, 0.74, 0.79}, {0.42, 0.64, 0.56}}",
+            "{{0.88, 0.6, 0.94}, {0.76, 0.19, 0.51}, {0.97, 0.04, 0.26}, {0.33, 0.74, 0.79}, {0.42, 0.64, 0.56}}",
             None,
         ),
         (
             'Import["ExampleData/numberdata.csv"]',
             None,
-            "{{0.88, 0.60, 0.94}, {0.76, 0.19, 0.51}, {0.97, 0.04, 0.26}, {0.33, 0.74, 0.79}, {0.42, 0.64, 0.56}}",
+            "{{0.88, 0.6, 0.94}, {0.76, 0.19, 0.51}, {0.97, 0.04, 0.26}, {0.33, 0.74, 0.79}, {0.42, 0.64, 0.56}}",
+            None,
+        ),
+        (
+            'Developer`PackedArrayQ[Import["ExampleData/numberdata.csv"]]',
+            None,
+            "True",
+            None,
+        ),
+        (
+            'Import["ExampleData/numberdata.csv", {"Data", 2}]',
+            None,
+            "{0.76, 0.19, 0.51}",
+            None,
+        ),
+        (
+            'Import["ExampleData/numberdata.csv", {"CSV", "Data", 2 ;; 3, {1, 3}}]',
+            None,
+            "{{0.76, 0.51}, {0.97, 0.26}}",
+            None,
+        ),
+        (
+            'Import["ExampleData/numberdata.csv", {"Data", All, -1}]',
+            None,
+            "{0.94, 0.51, 0.26, 0.79, 0.56}",
+            None,
+        ),
+        (
+            'Import["ExampleData/numberdata.csv", {"Data", 6}]',
+            ("Part 6 of {1, 2, 3, 4, 5} does not exist.",),
+            "$Failed",
+            None,
+        ),
+        (
+            'Import["ExampleData/numberdata.csv", "HeaderLines" -> 3]',
+            None,
+            "{{0.33, 0.74, 0.79}, {0.42, 0.64, 0.56}}",
+            None,
+        ),
+        (
+            'Import["ExampleData/numberdata.csv", "Grid"] // Head',
+            None,
+            "Grid",
             None,
         ),
         (
@@ -198,7 +246,7 @@ if not (os.environ.get("CI", False) or sys.platform in ("win32",)):
         (
             'ImportString[datastring, {"CSV", "Data"}]',
             None,
-            "{{0.88,  0.60,  0.94}, {.076,  0.19,  .51}, {0.97,  0.04,  .26}}",
+            "{{0.88, 0.6, 0.94}, {0.076, 0.19, 0.51}, {0.97, 0.04, 0.26}}",
             None,
         ),
         (
@@ -210,7 +258,25 @@ if not (os.environ.get("CI", False) or sys.platform in ("win32",)):
         (
             'ImportString[datastring, "CSV","FieldSeparators" -> "."]',
             None,
-            "{{0, 88, 0, 60, 0, 94}, {076, 0, 19, , 51}, {0, 97, 0, 04, , 26}}",
+            "{{0, 88, 0, 60, 0, 94}, {, 076, 0, 19, , 51}, {0, 97, 0, 04, , 26}}",
+            None,
+        ),
+        (
+            'ImportString["a,\\"b,c\\",3\\n\\n1,2", "CSV"] // InputForm',
+            None,
+            '{{"a", "b,c", 3}, {}, {1, 2}}',
+            None,
+        ),
+        (
+            'ImportString["1\\t2\\n3\\t4.5", {"TSV", "Data"}]',
+            None,
+            "{{1, 2}, {3, 4.5}}",
+            None,
+        ),
+        (
+            'ImportString["1,2", "CSV", "HeaderLines" -> x]',
+            ("Value of option HeaderLines -> x should be a non-negative integer.",),
+            "$Failed",
             None,
         ),
         ## Invalid Filename
@@ -245,6 +311,51 @@ if not (os.environ.get("CI", False) or sys.platform in ("win32",)):
             "$Failed",
             None,
         ),
+        ## Streaming exporters
+        (
+            'ExportString[{{1, 2}, {3, 4}}, "CSV", "FieldSeparators" -> ";"]',
+            None,
+            "1;2\n3;4",
+            None,
+        ),
+        (
+            'ExportString[{{"a\\"b", "c\\nd"}, 1.5}, "CSV"]',
+            None,
+            '"a""b","c\nd"\n1.5',
+            None,
+        ),
+        (
+            'ExportString[{{1, 2}, {3, 4}}, "CSV", "FieldSeparators" -> 1]',
+            ("Value of option FieldSeparators -> 1 should be a string.",),
+            "$Failed",
+            None,
+        ),
+        ('ExportString[{{1, "a b"}, {3, 4}}, "TSV"]', None, "1\ta b\n3\t4", None),
+        (
+            'ExportString[{"a" -> {1, 1/2, False}, "b" -> <|"c" -> f[x]|>}, "JSON"]',
+            None,
+            '{"a": [1, 0.5, false], "b": {"c": "f[x]"}}',
+            None,
+        ),
+        (
+            'shl = {1, {"a", x -> 2, {}}, 1/2, 1.5}; '
+            'ExportString[shl, "Text"] === ExportString[ToString[shl], "Text"]',
+            None,
+            "True",
+            None,
+        ),
+        (
+            'Normal[ExportString["\\[Alpha]", "Text", CharacterEncoding -> "UTF-8"]]',
+            None,
+            "{206, 177}",
+            None,
+        ),
+        (
+            'ExportString["\\[Alpha]", "Text", CharacterEncoding -> "ISOLatin1"]',
+            None,
+            "$Failed",
+            None,
+        ),
         ## FORMATS
         ## ASCII text
         ('FileFormat["ExampleData/BloodToilTearsSweat.txt"]', None, "Text", None),
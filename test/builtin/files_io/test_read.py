@@ -23,6 +23,37 @@ import pytest
             "{ReadList, Invalid}",
             "",
         ),
+        (
+            'stream = StringToStream["1 2 3\\n4 5 6"]; '
+            "{ReadList[stream, {Number, Number}], StreamPosition[stream]}",
+            None,
+            "{{{1, 2}, {3, 4}, {5, 6}}, 11}",
+            None,
+        ),
+        (
+            'ReadList[StringToStream["1.5 2 3e2\\n4*^2"], Real]',
+            None,
+            "{1.5, 2., 300., 400.}",
+            None,
+        ),
+        (
+            'Developer`PackedArrayQ[ReadList[StringToStream["1 2 3"], Number]]',
+            None,
+            "True",
+            "ReadList[] packs lists of machine integers",
+        ),
+        (
+            'Developer`PackedArrayQ[ReadList[StringToStream["1 2. 3"], Number]]',
+            None,
+            "False",
+            "ReadList[] does not pack integers and reals together",
+        ),
+        (
+            'ReadList[StringToStream["1 2 3"], {Number, Number}]',
+            None,
+            "{{1, 2}}",
+            "ReadList[] drops an incomplete last record",
+        ),
     ],
 )
 def test_read_list(str_expr, msgs, str_expected, fail_msg):
@@ -63,6 +94,14 @@ invalid_path = f"{data_dir}/file-should-not-appear"
             "$Failed",
             "Read[] with unparsable default data",
         ),
+        (
+            'stream = StringToStream["a b 12 cd\\nef"]; '
+            "{Read[stream, Word], Read[stream, {Word, Number}], StreamPosition[stream], "
+            "Read[stream, Record], Read[stream, String], Read[stream, String]}",
+            None,
+            '{"a", {"b", 12}, 6, " cd", "", "ef"}',
+            "Read[] sets the stream position after the objects read",
+        ),
     ],
 )
 def test_read(str_expr, msgs, str_expected, fail_msg):
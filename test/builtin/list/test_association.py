@@ -193,3 +193,40 @@ def test_associations_private_doctests(
         failure_message=assert_message,
         expected_messages=expected_messages,
     )
+
+
+@pytest.mark.parametrize(
+    ("str_expr", "str_expected"),
+    [
+        ("a = <|1 -> x, y -> 2, {z} -> 3, 1.5 -> 4|>; a[1.5]", "4"),
+        ("b = <|1 -> x, y -> 2, {z} -> 3|>; c = b; b[{z}]", "3"),
+        ("AssociateTo[c, {y -> 5, w -> 6}]", "<|1 -> x, y -> 5, {z} -> 3, w -> 6|>"),
+        ("{b[y], c[y], b[w], c[w]}", "{2, 5, Missing[KeyAbsent, w], 6}"),
+        (
+            "AssociateTo[b, 2 -> 7]; {b, c}",
+            "{<|1 -> x, y -> 2, {z} -> 3, 2 -> 7|>, <|1 -> x, y -> 5, {z} -> 3, w -> 6|>}",
+        ),
+        ("AssociateTo[a, 2.5 -> 5]; a[2.5]", "5"),
+        ("{c[[Key[w]]], c[[Key[{z}]]], c[[Key[v]]]}", "{6, 3, Missing[KeyAbsent, v]}"),
+        (
+            "{Lookup[c, w], Lookup[c, v, 0], KeyExistsQ[c, {z}], KeyExistsQ[c, z]}",
+            "{6, 0, True, False}",
+        ),
+        ("Keys[c]", "{1, y, {z}, w}"),
+        ("Lookup[<|x -> 1, y -> 2|>, {x, y}]", "{1, 2}"),
+        ("Lookup[{<|x -> 1|>, <|x -> 2|>}, x]", "{1, 2}"),
+        (
+            "Lookup[{<|x -> 1|>, <|y -> 2|>}, {x, y}]",
+            "{{1, Missing[KeyAbsent, y]}, {Missing[KeyAbsent, x], 2}}",
+        ),
+        ("{Lookup[c, Key[{z}]], Lookup[c, {{z}}, 0]}", "{3, {{0}}}"),
+        ("Lookup[{<|x -> 1|>, x}, x]", "Lookup[{<|x -> 1|>, x}, x]"),
+        (
+            "d = Association @@ Table[k -> k^2, {k, 1000}]; {Length[d], d[999], Lookup[d, {2, 1001}, 0]}",
+            "{1000, 998001, {4, 0}}",
+        ),
+        ("ClearAll[a, b, c, d]", "Null"),
+    ],
+)
+def test_association_table(str_expr, str_expected):
+    check_evaluation(str_expr, str_expected)
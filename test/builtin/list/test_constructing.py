@@ -68,6 +68,15 @@ def test_range(str_expr, str_expected, failure_message):
             "Table[i, {i, 1, 9, 0}]",
             "Table::iterb: Iterator does not have appropriate bounds.",
         ),
+        ("Table[x, {x, 1, 2, 1/3}]", "{1, 4/3, 5/3, 2}", None),
+        ("Table[x, {x, 1, 2, 0.5}]", "{1, 1.5, 2.}", None),
+        ("Table[x, {x, 1/2, 3}]", "{1/2, 3/2, 5/2}", None),
+        ("Table[x, {x, 5, 1, -2}]", "{5, 3, 1}", None),
+        ("Table[x, {x, 2, 1}]", "{}", None),
+        ("Table[x, {x, a, a + 2}]", "{a, 1 + a, 2 + a}", None),
+        ("Module[{x = 7}, {Table[x, {x, 3}], x}]", "{{1, 2, 3}, 7}", None),
+        ("Table[x = 2 x; x, {x, 3}]", "{2, 4, 6}", None),
+        ("Do[If[i > 3, Return[i]], {i, 1, Infinity}]", "4", None),
     ],
 )
 def test_table(str_expr, str_expected, failure_message):
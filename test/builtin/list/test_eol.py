@@ -164,6 +164,8 @@ import pytest
         ("A[x__] := 7 /; Length[{x}] == 3;Most[A[1, 2, 3, 4]]", None, "7", None),
         ("ClearAll[A];", None, "Null", None),
         ("a = {2,3,4}; i = 1; a[[i]] = 0; a", None, "{0, 3, 4}", None),
+        ("a = {1, {2, 3}}; a[[2, 1]] = x; a", None, "{1, {x, 3}}", None),
+        ("a = {1, {2, 3}}; a[[2, 1]] = 5; a[[2]] + 1", None, "{6, 4}", None),
         ## Negative step
         ("{1,2,3,4,5}[[3;;1;;-1]]", None, "{3, 2, 1}", None),
         ("ClearAll[a]", None, "Null", None),
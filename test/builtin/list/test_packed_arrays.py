@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for mathics.builtin.list.packed_arrays and the vectorized
+evaluation of arithmetic on packed arrays.
+"""
+from test.helper import check_evaluation, evaluate, session
+
+import numpy
+import pytest
+
+from mathics.core.list import PackedListExpression, unpack_list
+
+
+@pytest.mark.parametrize(
+    ("str_expr", "str_expected"),
+    [
+        ("Developer`PackedArrayQ[Range[1000]]", "True"),
+        ("Developer`PackedArrayQ[Range[0.5, 1., 0.25]]", "True"),
+        ("Developer`PackedArrayQ[Range[2^70, 2^70 + 2]]", "False"),
+        ("Developer`PackedArrayQ[Range[0]]", "False"),
+        ("Developer`PackedArrayQ[RandomInteger[10, {4, 3}], Integer, 2]", "True"),
+        ("Developer`PackedArrayQ[Table[i^2, {i, 1000}], Integer, 1]", "True"),
+        ("Developer`PackedArrayQ[Table[i, {i, 10}]]", "False"),
+        ("Developer`PackedArrayQ[Range[10] + {1, 2}]", "False"),
+        ("Developer`PackedArrayQ[Range[10] / 2]", "False"),
+        ("Developer`PackedArrayQ[Range[10] - Range[10.]]", "True"),
+        ("Developer`PackedArrayQ[Sqrt[Range[0.5, 10.]]]", "True"),
+        ("Developer`PackedArrayQ[Sqrt[Range[10]]]", "False"),
+        ("Developer`PackedArrayQ[Range[10]^2]", "True"),
+        ("Developer`PackedArrayQ[Range[10]^-1]", "False"),
+        ("Developer`PackedArrayQ[Range[10] + x]", "False"),
+        ("Developer`PackedArrayQ[2^62 Range[10]]", "False"),
+        (
+            "Developer`PackedArrayQ[Developer`ToPackedArray[{{1}, {2.}}], Real, 2]",
+            "True",
+        ),
+        ("Developer`ToPackedArray[{{1, 2}, {3}}]", "{{1, 2}, {3}}"),
+        ("Range[3] + 1", "{2, 3, 4}"),
+        ("Range[3] * 0.5", "{0.5, 1., 1.5}"),
+        ("Range[3] + {{1}, {2}, {3}}", "{{2}, {4}, {6}}"),
+        (
+            "{{1, 2}, {3, 4}} + Developer`ToPackedArray[{10, 20}]",
+            "{{11, 12}, {23, 24}}",
+        ),
+        ("Range[-1.5, 1.5] * 0", "{0., 0., 0., 0.}"),
+        ("1 / Range[0., 1.]", "{ComplexInfinity, 1.}"),
+        ("Range[2^62, 2^62 + 1] + 2^62", "{9223372036854775808, 9223372036854775809}"),
+        ("Developer`PackedArrayQ[Range[2^62, 2^62 + 1] * 1.]", "False"),
+        ("Total[Range[100]]", "5050"),
+        ("Range[5][[2 ;; 3]]", "{2, 3}"),
+        ("Range[5] === {1, 2, 3, 4, 5}", "True"),
+        ("Developer`ToPackedArray[{1, 2}, Real] === {1, 2}", "False"),
+    ],
+)
+def test_packed_arrays(str_expr, str_expected):
+    check_evaluation(str_expr, str_expected, hold_expected=True)
+
+
+def test_vectorized_arithmetic():
+    """
+    The arithmetic on packed arrays gives the same result as the arithmetic
+    on the unpacked lists.
+    """
+    rng = numpy.random.default_rng(0)
+    arrays = {
+        "Global`a": rng.integers(-100, 100, 20),
+        "Global`b": rng.normal(size=20) * 1.0e10,
+        "Global`c": rng.integers(-2, 10, 20),
+        "Global`d": rng.normal(size=20),
+    }
+    expressions = [
+        "a + b",
+        "a * b",
+        "a + b + c + 1",
+        "a * d * 3",
+        "a - d",
+        "b / d",
+        "d / 2.5",
+        "2.5 / d",
+        "-b",
+        "a ^ Abs[c]",
+        "b ^ 2",
+        "d ^ -1",
+        "Sqrt[Abs[b]]",
+        "a b + c d",
+        "3 a^2 + 2 a - 1",
+    ]
+    definitions = session.definitions
+    try:
+        for str_expr in expressions:
+            for name, array in arrays.items():
+                definitions.set_ownvalue(name, PackedListExpression(array))
+            packed = evaluate(str_expr)
+            for name, array in arrays.items():
+                definitions.set_ownvalue(name, unpack_list(PackedListExpression(array)))
+            unpacked = evaluate(str_expr)
+            assert packed.sameQ(unpacked), str_expr
+            assert [type(element) for element in packed.elements] == [
+                type(element) for element in unpacked.elements
+            ], str_expr
+    finally:
+        evaluate("ClearAll[a, b, c, d]")
+
+
+def test_vectorized_user_rules():
+    """The rules added to a Listable builtin are applied to packed arrays."""
+    try:
+        check_evaluation(
+            "Unprotect[Plus]; Plus[1, 1000] := plus; Range[3] + 1000",
+            "{plus, 1002, 1003}",
+        )
+    finally:
+        # Removing the user definition restores the builtin one.
+        evaluate("Remove[Plus]")
+    check_evaluation("Developer`PackedArrayQ[Range[3] + 1000]", "True")
+
+
+@pytest.mark.parametrize(
+    "str_expr",
+    [
+        "Range[100000]",
+        "Range[0.5, 100000.]",
+        "Outer[Times, Range[400], Range[250]]",
+        "With[{m = Outer[Times, Range[400], Range[250]]}, m[[2, 3]]; m]",
+    ],
+)
+def test_packed_array_byte_count(str_expr):
+    """ByteCount includes the data of packed arrays."""
+    assert evaluate(f"Developer`PackedArrayQ[{str_expr}]").to_python() is True
+    assert evaluate(f"ByteCount[{str_expr}]").value > 800000
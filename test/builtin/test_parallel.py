@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for mathics.builtin.parallel
+"""
+
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from test.helper import check_evaluation
+
+import pytest
+
+import mathics.eval.parallel as parallel
+
+
+@pytest.mark.parametrize(
+    ("str_expr", "msgs", "str_expected"),
+    [
+        (None, None, None),
+        ("Length[LaunchKernels[2]]", None, "2"),
+        ("$KernelCount", None, "2"),
+        ("ParallelMap[#^2 &, Range[10]]", None, "Range[10]^2"),
+        (
+            'ParallelMap[#^2 &, Range[10], Method -> "FinestGrained"]',
+            None,
+            "Range[10]^2",
+        ),
+        ("ParallelMap[f, x]", None, "x"),
+        ("g[n_] := n + 1; ParallelMap[g, h[1, 2]]", None, "h[2, 3]"),
+        (
+            "ParallelMap[1/# &, {1, 0}]",
+            ("Infinite expression 1 / 0 encountered.",),
+            "{1, ComplexInfinity}",
+        ),
+        ("Quiet[ParallelMap[1/# &, {1, 0}]]", (), "{1, ComplexInfinity}"),
+        ("ParallelDo[Print[i], {i, 2}]", ("1", "2"), "Null"),
+        ("ParallelTable[i + j, {i, 3}, {j, i}]", None, "{{2}, {3, 4}, {4, 5, 6}}"),
+        (
+            'ParallelTable[i, {i, 0, 1, 1/4}, Method -> "CoarsestGrained"]',
+            None,
+            "{0, 1/4, 1/2, 3/4, 1}",
+        ),
+        ("i = 5; ParallelTable[i, {i, 2}]", None, "{1, 2}"),
+        ("i", None, "5"),
+        ("ParallelSum[1/k^2, {k, 1, 4}]", None, "205/144"),
+        ("ParallelSum[k, {k, 1, n}]", None, "n (n + 1) / 2"),
+        (
+            'ParallelCombine[Reverse, {1, 2, 3, 4}, List, Method -> "CoarsestGrained"]',
+            None,
+            "{{2, 1}, {4, 3}}",
+        ),
+        ("ParallelCombine[Total, {1, 2, 3, 4}, Plus]", None, "10"),
+        (
+            "Private`p[x_] := -x; FreeQ[ParallelMap[Private`p, {1, 2}], Private`p]",
+            None,
+            "False",
+        ),
+        ("DistributeDefinitions[Private`p]", None, "{Private`p}"),
+        ("ParallelMap[Private`p, {1, 2}]", None, "{-1, -2}"),
+        (
+            'ParallelMap[f, {1, 2}, Method -> "Bogus"]',
+            (
+                'Value of option Method -> Bogus is not Automatic, "CoarsestGrained" or "FinestGrained".',
+            ),
+            'ParallelMap[f, {1, 2}, Method -> "Bogus"]',
+        ),
+        (
+            'ParallelTable[i, {i, 2}, Method -> "Bogus"]',
+            (
+                'Value of option Method -> Bogus is not Automatic, "CoarsestGrained" or "FinestGrained".',
+            ),
+            'ParallelTable[i, {i, 2}, Method -> "Bogus"]',
+        ),
+        (
+            "ParallelDo[Print[i], {i, 2}, Method -> Bogus]",
+            (
+                'Value of option Method -> Bogus is not Automatic, "CoarsestGrained" or "FinestGrained".',
+            ),
+            "ParallelDo[Print[i], {i, 2}, Method -> Bogus]",
+        ),
+        (
+            'ParallelCombine[Total, {1, 2}, Plus, Method -> "Bogus"]',
+            (
+                'Value of option Method -> Bogus is not Automatic, "CoarsestGrained" or "FinestGrained".',
+            ),
+            'ParallelCombine[Total, {1, 2}, Plus, Method -> "Bogus"]',
+        ),
+        ("Length[CloseKernels[]]", None, "2"),
+        ("$KernelCount", None, "0"),
+        ("Clear[g, i]; ClearAll[Private`p]", None, "Null"),
+    ],
+)
+def test_parallel(str_expr, msgs, str_expected):
+    check_evaluation(str_expr, str_expected, expected_messages=msgs)
+
+
+class _FailingPool:
+    """A pool whose evaluations fail with ``error``."""
+
+    def __init__(self, error):
+        self.error = error
+
+    def submit(self, *args):
+        future = Future()
+        future.set_exception(self.error)
+        return future
+
+    def shutdown(self):
+        pass
+
+
+@pytest.mark.parametrize(
+    ("error", "str_expected", "msgs"),
+    [
+        (
+            ValueError("invalid chunk"),
+            "{$Failed, $Failed}",
+            ("A parallel kernel failed with ValueError: invalid chunk.",),
+        ),
+        (BrokenProcessPool("a kernel stopped"), "{Null, Null}", ("1", "2")),
+    ],
+)
+def test_parallel_kernel_errors(monkeypatch, error, str_expected, msgs):
+    monkeypatch.setattr(parallel, "_pool", _FailingPool(error))
+    monkeypatch.setattr(parallel, "_kernel_count", 1)
+    check_evaluation(
+        'ParallelMap[Print, {1, 2}, Method -> "CoarsestGrained"]',
+        str_expected,
+        expected_messages=msgs,
+    )
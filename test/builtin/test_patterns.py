@@ -67,6 +67,45 @@ def test_replace_all():
             "Flatten nested rules.",
         ),
         # TODO: handle 2 or more arguments.
+        (
+            "rules = {{a_, b_} -> a^b, F[x_] -> x^2, a -> b, 1 -> one, G[1] -> g1, "
+            "G[x_] -> gx, _H -> h, x_Real -> real}; "
+            "test = {F[2], {5, 6}, a, 1, G[1], G[2], H[a], 2.5, c, Hold[G[1]]};"
+            "(test /. Dispatch[rules]) === (test /. rules)",
+            None,
+            "True",
+            "Dispatch tables give the same result as the list of rules.",
+        ),
+        (
+            "Replace[test, Dispatch[rules], {1}] === Replace[test, rules, {1}]",
+            None,
+            "True",
+            "Dispatch tables give the same result as the list of rules in Replace.",
+        ),
+        (
+            "ReplaceList[G[1], Dispatch[rules]]",
+            None,
+            "{g1, gx}",
+            "ReplaceList tries all the candidates in order.",
+        ),
+        (
+            "a + b + c /. Dispatch[{a + b -> 1, x_. y_ -> prod}]",
+            None,
+            "1 + c",
+            "Literal rules with Flat heads are not looked up by hash.",
+        ),
+        (
+            "{3 c, c} /. Dispatch[{x_. y_ -> prod}]",
+            None,
+            "prod",
+            "Patterns with OneIdentity heads can match other heads.",
+        ),
+        (
+            "Total[Range[1000] /. Dispatch[Table[i -> i^2, {i, 1000}]]]",
+            None,
+            "333833500",
+            "Large literal dispatch table.",
+        ),
     ],
 )
 def test_private_doctests_dispatch(str_expr, msgs, str_expected, fail_msg):
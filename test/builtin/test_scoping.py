@@ -77,3 +77,62 @@ def test_scoping_constructs(str_expr, msgs, str_expected, fail_msg):
         failure_message=fail_msg,
         expected_messages=msgs,
     )
+
+
+def test_module_temporaries():
+    """
+    Temporary symbols of Module[] are removed once nothing refers to them.
+    """
+
+    def live_temporaries():
+        return session.evaluate('"Live" /. Internal`TemporarySymbolStatistics[]').value
+
+    live = live_temporaries()
+    session.evaluate("tmpf[n_] := Module[{x = n, y}, y = x^2; y + 1]")
+    assert session.evaluate("Table[tmpf[i], {i, 100}]").elements[-1].value == 10001
+    assert live_temporaries() == live
+    assert session.evaluate('Names["Global`x$*"]').elements == ()
+
+    # Temporary symbols referred to by the result or by a definition stay.
+    session.evaluate("tmph = Module[{x = 3}, Hold[x]]")
+    session.evaluate("Module[{v}, tmps = Hold[v]; v = 7; 0]")
+    session.evaluate("tmpc = Module[{c = 10}, Function[c++]]")
+    assert live_temporaries() == live + 3
+    check_evaluation("ReleaseHold /@ {tmph, tmps}", "{3, 7}")
+    check_evaluation("{tmpc[], tmpc[]}", "{10, 11}")
+
+    # Temporary symbols referred to by options or by values sown to a
+    # pending Reap stay.
+    session.evaluate("Module[{t}, t = 7; Options[tmpo] = {opt -> Hold[t]};]")
+    check_evaluation("ReleaseHold[opt /. Options[tmpo]]", "7")
+    session.evaluate("tmpr = Reap[Module[{t}, t = 5; Sow[Hold[t]]; Null]]")
+    check_evaluation("ReleaseHold[tmpr[[2, 1, 1]]]", "5")
+    check_evaluation(
+        "Reap[Module[{t}, t = 6; Sow[1, Hold[t]]; Null], _, ReleaseHold[#1] &]",
+        "{Null, {6}}",
+    )
+
+    session.evaluate("ClearAll[tmpf, tmph, tmps, tmpc, tmpo, tmpr]")
+
+
+@pytest.mark.parametrize(
+    ("str_expr", "str_expected"),
+    [
+        ("blk = 5; Table[blk, {blk, 3}]", "{1, 2, 3}"),
+        ("blk", "5"),
+        ("Table[blk = 7; blk, {blk, 2}]", "{7, 7}"),
+        ("Table[Clear[blk]; ValueQ[blk], {blk, 2}]", "{False, False}"),
+        ("blk", "5"),
+        ("Block[{blk = 2}, Block[{blk = 3}, blk] + blk]", "5"),
+        # Cached expressions see the values of the bound symbols.
+        ("blkg = blkk^2; blkh = blkg + 1; Table[blkh, {blkk, 3}]", "{2, 5, 10}"),
+        ("Block[{blkk = 1}, {blkh, Block[{blkk = 2}, blkh], blkh}]", "{2, 5, 2}"),
+        ("Sum[blkh, {blkk, 1, 3}]", "17"),
+        ("Table[N[Pi], {Pi, 2}]", "{1., 2.}"),
+        ("N[Pi] == N[Pi, 6]", "True"),
+        ("ClearAll[blk, blkg, blkh]", "Null"),
+    ],
+)
+def test_dynamic_scoping(str_expr, str_expected):
+    """Bindings of Block[] and of the iterators, and their restoration."""
+    check_evaluation(str_expr, str_expected)
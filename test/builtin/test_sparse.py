@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for mathics.builtin.sparse
+"""
+
+from test.helper import check_evaluation, evaluate
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    ("str_expr", "str_expected"),
+    [
+        (
+            "S = SparseArray[{{1, 2} -> 1, {2, 3} -> 2, {1, 2} -> 5}, {3, 3}]",
+            "SparseArray[Automatic, {3, 3}, 0, {{1, 2} -> 1, {2, 3} -> 2}]",
+        ),
+        ("Normal[S]", "{{0, 1, 0}, {0, 0, 2}, {0, 0, 0}}"),
+        ("Dimensions[S]", "{3, 3}"),
+        (
+            "{S[[1, 2]], S[[3, 3]], S[[-1]]}",
+            "{1, 0, SparseArray[Automatic, {3}, 0, {}]}",
+        ),
+        ("S[[All, 2]]", "{1, 0, 0}"),
+        ("S . S", "SparseArray[Automatic, {3, 3}, 0, {{1, 3} -> 2}]"),
+        ("S . {1, 1, 1}", "{1, 2, 0}"),
+        ("{1, 1, 1} . S", "{0, 1, 2}"),
+        ("Normal[S . S] == Normal[S] . Normal[S]", "True"),
+        ("Transpose[S] // Normal", "{{0, 0, 0}, {1, 0, 0}, {0, 2, 0}}"),
+        ("S + S - 2 S", "SparseArray[Automatic, {3, 3}, 0, {}]"),
+        ("Normal[S + 1]", "{{1, 2, 1}, {1, 1, 3}, {1, 1, 1}}"),
+        ("Normal[x S]", "{{0, x, 0}, {0, 0, 2 x}, {0, 0, 0}}"),
+        ("Total[S]", "SparseArray[Automatic, {3}, 0, {{2} -> 1, {3} -> 2}]"),
+        ("Total[S, 2]", "3"),
+        ("Total[0.5 S, Infinity]", "1.5"),
+        ("S . {{1}, {2}, {3}}", "{{2}, {6}, {0}}"),
+        ("S == S", "True"),
+        ("S === Transpose[Transpose[S]]", "True"),
+        ("S === SparseArray[Normal[S]]", "True"),
+        (
+            "LinearSolve[SparseArray[{{1, 1} -> 2., {2, 2} -> 4.}], {1., 1.}]",
+            "{0.5, 0.25}",
+        ),
+        (
+            "LinearSolve[SparseArray[{{1, 1} -> 2, {2, 2} -> 4}], {1, 1}]",
+            "{1 / 2, 1 / 4}",
+        ),
+        (
+            "T = SparseArray[{{1, 1} -> a, {2, 2} -> b}, {2, 2}, c]",
+            "SparseArray[Automatic, {2, 2}, c, {{1, 1} -> a, {2, 2} -> b}]",
+        ),
+        ("T[[1]]", "SparseArray[Automatic, {2}, c, {{1} -> a}]"),
+        ("Normal[T + 1]", "{{1 + a, 1 + c}, {1 + c, 1 + b}}"),
+        (
+            "Total[T]",
+            "SparseArray[Automatic, {2}, 2 c, {{1} -> a + c, {2} -> b + c}]",
+        ),
+        ("ClearAll[S, T]", "Null"),
+    ],
+)
+def test_sparse_array(str_expr, str_expected):
+    check_evaluation(str_expr, str_expected)
+
+
+def test_sparse_array_byte_count():
+    """ByteCount includes the positions and values of sparse arrays."""
+    result = evaluate("ByteCount[SparseArray[Table[{i} -> i, {i, 10000}]]]")
+    assert result.value > 160000
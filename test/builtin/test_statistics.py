@@ -29,3 +29,47 @@ def test_private_doctests_statistics_orderstatistics(
         failure_message=fail_msg,
         expected_messages=msgs,
     )
+
+
+@pytest.mark.parametrize(
+    ("str_expr", "str_expected"),
+    [
+        ("Sort[{3, 1/2, -2, 2.5, 0}, Less]", "{-2, 0, 1 / 2, 2.5, 3}"),
+        ("Sort[{3, 1/2, -2, 2.5, 0}, Greater]", "{3, 2.5, 1 / 2, 0, -2}"),
+        ("Sort[{3, 1, 2}, #2 <= #1 &]", "{3, 2, 1}"),
+        ("Sort[{3, 1, 2}, Function[{x, y}, x < y]]", "{1, 2, 3}"),
+        (
+            "Sort[{{a, 3}, {b, 1}, {c, 2}}, #1[[2]] > #2[[2]] &]",
+            "{{a, 3}, {c, 2}, {b, 1}}",
+        ),
+        (
+            "Sort[{{a, 3}, {b, 1}, {c, 2}}, #1[[-1]] < #2[[-1]] &]",
+            "{{b, 1}, {c, 2}, {a, 3}}",
+        ),
+        ("Sort[{c, 2, b, a}, OrderedQ[{#1, #2}] &]", "{2, a, b, c}"),
+        ("Sort[{c, 2, b, a}, OrderedQ[{#2, #1}] &]", "{c, b, a, 2}"),
+        # Not numbers: the ordering function is evaluated.
+        ("Sort[{c, b, a}, Less]", "{a, b, c}"),
+        ("Sort[{3, x, 1}, #1 < #2 &]", "{1, x, 3}"),
+        ("Sort[{{a, 3}, {b}, {c, 2}}, #1[[2]] < #2[[2]] &]", "{{c, 2}, {b}, {a, 3}}"),
+        ("Sort[{3, 1, 2}, If[#1 > #2, True, False] &]", "{3, 2, 1}"),
+        ("Sort[{1, 1., 2, 1}, Less]", "{1, 1., 1, 2}"),
+        ("Sort[{1, 1., 2, 1}, Greater]", "{2, 1, 1., 1}"),
+        (
+            "SortBy[{{a, 3}, {b, 1}, {c, 2}, {d, 1.}}, Last]",
+            "{{b, 1}, {d, 1.}, {c, 2}, {a, 3}}",
+        ),
+        ("SortBy[{c, B, a}, ToLowerCase[ToString[#]] &]", "{a, B, c}"),
+    ],
+)
+def test_sort_ordering_function(str_expr, str_expected):
+    check_evaluation(str_expr, str_expected, hold_expected=True)
+
+
+def test_sort_ordering_function_cache():
+    """Each pair of elements is compared at most once."""
+    check_evaluation(
+        "n = 0; {Sort[{3, 1, 2, 1, 3, 2, 1, 3}, (n++; #1 < #2) &], n <= 9}",
+        "{{1, 1, 1, 2, 2, 3, 3, 3}, True}",
+    )
+    check_evaluation("Clear[n]", "Null")
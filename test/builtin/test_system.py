@@ -16,6 +16,21 @@ import pytest
         ("Head[$ParentProcessID] == Integer", "True"),
         ("Head[$ProcessID] == Integer", "True"),
         ("Head[$SystemWordLength] == Integer", "True"),
+        (
+            "Internal`NumberCacheStatistics[][[All, 1]]"
+            ' == {"Integer", "MachineReal", "PrecisionReal", "Rational", "Complex"}',
+            "True",
+        ),
+        (
+            'Head["HitRate" /. ("Integer" /. Internal`NumberCacheStatistics[])]'
+            " == Real",
+            "True",
+        ),
+        (
+            "Internal`EvaluationCacheStatistics[][[All, 1]]"
+            ' == {"Size", "MaxSize", "Hits", "Misses", "HitRate"}',
+            "True",
+        ),
     ],
 )
 def test_private_doctests_system(str_expr, str_expected):
@@ -27,3 +42,38 @@ def test_private_doctests_system(str_expr, str_expected):
         to_string_expected=True,
         hold_expected=True,
     )
+
+
+@pytest.mark.parametrize(
+    ("str_expr", "str_expected"),
+    [
+        (
+            'Do[sh[k] = {"a", k^2 + x, f[1.5, 2/3]}; sh[-k] = {"a", f[1.5, 2/3]}, {k, 20}];'
+            " Share[sh] > 0",
+            "True",
+        ),
+        ("Share[sh]", "0"),
+        ("{sh[3], sh[-3]}", '{{"a", 9 + x, f[1.5, 2/3]}, {"a", f[1.5, 2/3]}}'),
+        ("shp[x_, 1.5] := {x, 1.5}; shp[y_, 1.5] := {y, 2.5}; Share[shp] >= 0", "True"),
+        ("shp[a, 1.5]", "{a, 2.5}"),
+        (
+            "shq = {1.5`20, 1.5`30, 1.5`20}; Share[shq]; Precision /@ shq",
+            "{20., 30., 20.}",
+        ),
+        ("Share[] >= 0", "True"),
+        ("shw = Range[20000]; Share[] >= 0", "True"),
+        ("Developer`PackedArrayQ[shw]", "True"),
+        ("{sh[3], shp[b, 1.5]}", '{{"a", 9 + x, f[1.5, 2/3]}, {b, 2.5}}'),
+        ("shm = {{1, 2}, {1, 2}}; Share[]; shm[[1, 1]] = 9; shm", "{{9, 2}, {1, 2}}"),
+        (
+            "sh[4] = {1, 2, {x}}; shn = {1, 2, {x}}; Share[]; shn[[3, 1]] = z;"
+            " {sh[4], shn}",
+            "{{1, 2, {x}}, {1, 2, {z}}}",
+        ),
+        ("shh = {1.5, {1.5}}; Share[shh] >= 0", "True"),
+        ("shh", "{1.5, {1.5}}"),
+        ("ClearAll[sh, shh, shm, shn, shp, shq, shw]", "Null"),
+    ],
+)
+def test_share(str_expr, str_expected):
+    check_evaluation(str_expr, str_expected)
@@ -39,3 +39,30 @@ def test_private_doctests_tensor(str_expr, msgs, str_expected, fail_msg):
         failure_message=fail_msg,
         expected_messages=msgs,
     )
+
+
+@pytest.mark.parametrize(
+    ("str_expr", "str_expected"),
+    [
+        ("{1, 2, 3} . {4, 5, 6}", "32"),
+        ("{1., 2.} . {4, 5}", "14."),
+        ("{{1, 2}, {3, 4}} . {{5, 6}, {7, 8}}", "{{19, 22}, {43, 50}}"),
+        ("{{1, 2}, {3, 4}} . {1, -1}", "{-1, -1}"),
+        ("{1, 2} . {{1, 2, 3}, {4, 5, 6}}", "{9, 12, 15}"),
+        ("{{1., 2.}} . {{1}, {1}}", "{{3.}}"),
+        ("Inner[Times, {{1, 2}, {3, 4}}, {1, 1}, Plus]", "{3, 7}"),
+        # Integers that would overflow machine integers are multiplied exactly.
+        ("{2^62, 2} . {2, 1}", "9223372036854775810"),
+        ("Outer[Times, {1, 2}, {3., 4.}]", "{{3., 4.}, {6., 8.}}"),
+        ("Outer[Times, {{1, 2}}, {3, 4}]", "{{{3, 4}, {6, 8}}}"),
+        ("Outer[Times, {2^62}, {2}]", "{{9223372036854775808}}"),
+        ("Transpose[{{1, 2, 3}, {4, 5, 6}}]", "{{1, 4}, {2, 5}, {3, 6}}"),
+        # Mixed integers and reals are not packed.
+        ("Outer[Times, {1., 2}, {3., 4}]", "{{3., 4.}, {6., 8}}"),
+        ("Developer`PackedArrayQ[{{1, 2}} . {{3}, {4}}]", "True"),
+        ("Developer`PackedArrayQ[Outer[Times, {1, 2}, {3, 4}]]", "True"),
+        ("Developer`PackedArrayQ[Transpose[{{1., 2.}}]]", "True"),
+    ],
+)
+def test_numeric_tensors(str_expr, str_expected):
+    check_evaluation(str_expr, str_expected)
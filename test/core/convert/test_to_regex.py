@@ -1,8 +1,9 @@
+import re
 from test.helper import check_evaluation, evaluate, session
 
 import pytest
 
-from mathics.core.convert.regex import to_regex
+from mathics.core.convert.regex import REGEX_CACHE, compile_regex, to_regex
 
 
 @pytest.mark.parametrize(
@@ -59,3 +60,34 @@ def test_regex_err_msg(str_expr, str_expected, failure, msg):
         expected_messages=[failure],
         failure_message=msg,
     )
+
+
+def test_regex_cache():
+    expr = evaluate('"a" ~~ DigitCharacter..')
+    REGEX_CACHE.clear()
+    compiled = compile_regex(expr)
+    hits = REGEX_CACHE.hits
+    # The same pattern, built again, gives the same compiled regex.
+    assert compile_regex(evaluate('"a" ~~ DigitCharacter..')) is compiled
+    assert REGEX_CACHE.hits == hits + 1
+    # Patterns compiled with other flags are kept apart.
+    ignore_case = compile_regex(expr, re.IGNORECASE)
+    assert ignore_case is not compiled
+    assert ignore_case.flags & re.IGNORECASE
+    assert to_regex(expr) == compiled.pattern
+
+
+def test_regex_cache_messages():
+    # The message is given each time the pattern is used.
+    for _ in range(2):
+        check_evaluation(
+            'StringReplace["ab", x_ ~~ x:"a" -> "z"]',
+            "ab",
+            to_string_expr=True,
+            to_string_expected=True,
+            hold_expected=True,
+            expected_messages=[
+                "Ignored restriction given for x in x : a as it does not "
+                "match previous occurrences of x."
+            ],
+        )
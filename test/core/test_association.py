@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for mathics.core.association
+"""
+from mathics.core.association import AssociationTable
+
+
+def test_association_table_versions():
+    table = AssociationTable([("a", 1), ("b", 2)])
+    table2 = table.set("c", 3)
+    table3 = table.set("a", 4)
+    table4 = table2.set("b", 5)
+    assert list(table.items()) == [("a", 1), ("b", 2)]
+    assert list(table4.items()) == [("a", 1), ("b", 5), ("c", 3)]
+    assert list(table3.items()) == [("a", 4), ("b", 2)]
+    assert list(table2.items()) == [("a", 1), ("b", 2), ("c", 3)]
+    assert [len(t) for t in (table, table2, table3, table4)] == [2, 3, 2, 3]
+    assert table3.get("c") is None and table4.get("c") == 3
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 
+import gc
 import sys
 
 import mathics.core.atoms as atoms
@@ -238,3 +239,43 @@ def test_mixed_object_canonicalization():
         Complex(Rational(1, 0), Integer(0)), # 3
     )
     # fmt: on
+
+
+def test_number_interning():
+    """check that unused numbers are released from the interning tables"""
+    # Small integers are kept even when they are not used.
+    small_id = id(Integer(1000))
+    gc.collect()
+    assert id(Integer(1000)) == small_id
+    assert 1000 in Integer._integers.pinned
+
+    for number_class, args in (
+        (Integer, [10**30 + 7]),
+        (MachineReal, [2.718281828459]),
+        (Rational, [10**30 + 7, 3]),
+    ):
+        number = number_class(*args)
+        table = atoms.NUMBER_INTERN_TABLES[number_class.__name__]
+        size = len(table)
+        hits = table.hits
+        # While the number is in use, there is a single copy of it.
+        assert number_class(*args) is number
+        assert table.hits == hits + 1
+        del number
+        gc.collect()
+        assert len(table) == size - 1
+
+
+def test_interned_numbers_hash():
+    """check that the numbers built again are the interned ones, with the same hash"""
+    for number_class, args in (
+        (Integer, [10**30 + 7]),
+        (MachineReal, [2.718281828459]),
+        (Rational, [10**30 + 7, 3]),
+        (Complex, [Integer(10**30 + 7), MachineReal(2.718281828459)]),
+    ):
+        number = number_class(*args)
+        again = number_class(*args)
+        assert again is number
+        assert again.sameQ(number)
+        assert hash(again) == hash(number)
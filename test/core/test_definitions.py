@@ -3,10 +3,23 @@
 Tests functions in mathics.core.definition
 """
 
+import os.path as osp
+import pickle
+
 import pytest
 
-from mathics.core.definitions import get_tag_position
+import mathics.core.builtin
+import mathics.core.definitions
+from mathics.builtin.files_io.importexport import EXPORTERS, IMPORTERS
+from mathics.core.atoms import Integer
+from mathics.core.definitions import (
+    Definitions,
+    get_builtin_snapshot_key,
+    get_tag_position,
+)
+from mathics.core.evaluation import Evaluation
 from mathics.core.parser import parse_builtin_rule
+from mathics.settings import LAZY_BUILTINS
 
 
 @pytest.mark.parametrize(
@@ -61,3 +74,74 @@ from mathics.core.parser import parse_builtin_rule
 def test_get_tag_position(pattern_str, tag, position):
     pattern = parse_builtin_rule(pattern_str)
     assert get_tag_position(pattern, f"System`{tag}") == position
+
+
+@pytest.mark.skipif(LAZY_BUILTINS, reason="Snapshots are not used with lazy builtins")
+def test_builtin_snapshot(tmp_path):
+    snapshot_path = str(tmp_path / "builtin-definitions.pcl")
+
+    built = Definitions(add_builtin=True, builtin_filename=snapshot_path)
+    assert osp.exists(snapshot_path)
+
+    loaded = Definitions(add_builtin=True, builtin_filename=snapshot_path)
+    assert loaded.now == built.now
+    assert set(loaded.builtin) == set(built.builtin)
+    evaluation = Evaluation(loaded)
+    for str_expr, str_expected in (
+        ("Plus[1, 2, x, x]", "3 + 2 x"),
+        ("D[Sin[x], x]", "Cos[x]"),
+        # Definitions coming from the autoload files are part of the snapshot.
+        ("Settings`$PreferredBackendMethod", '"sympy"'),
+    ):
+        result = evaluation.parse(str_expr).evaluate(evaluation)
+        expected = evaluation.parse(str_expected).evaluate(evaluation)
+        assert result.sameQ(expected)
+
+    # So are the formats that they register.
+    IMPORTERS.clear()
+    EXPORTERS.clear()
+    Definitions(add_builtin=True, builtin_filename=snapshot_path)
+    assert "CSV" in IMPORTERS and "CSV" in EXPORTERS
+
+    # A snapshot taken from other builtins is discarded and rebuilt.
+    with open(snapshot_path, "wb") as snapshot_file:
+        pickle.dump("other key", snapshot_file)
+        pickle.dump({"builtin": {}, "now": 0}, snapshot_file)
+    rebuilt = Definitions(add_builtin=True, builtin_filename=snapshot_path)
+    assert set(rebuilt.builtin) == set(built.builtin)
+    with open(snapshot_path, "rb") as snapshot_file:
+        assert pickle.load(snapshot_file) == get_builtin_snapshot_key()
+
+
+@pytest.mark.skipif(LAZY_BUILTINS, reason="Snapshots are not used with lazy builtins")
+def test_builtin_snapshot_environment(tmp_path, monkeypatch):
+    # The key changes when a package that some builtin requires is missing.
+    key = get_builtin_snapshot_key()
+    monkeypatch.setattr(
+        mathics.core.builtin,
+        "check_requires_list",
+        lambda requires: "numpy" not in requires,
+    )
+    assert get_builtin_snapshot_key() != key
+    monkeypatch.undo()
+
+    # No snapshot is stored when some builtin module could not be imported.
+    snapshot_path = str(tmp_path / "builtin-definitions.pcl")
+    monkeypatch.setattr(
+        mathics.core.definitions, "failed_builtin_modules", ["mathics.builtin.bad"]
+    )
+    Definitions(add_builtin=True, builtin_filename=snapshot_path)
+    assert not osp.exists(snapshot_path)
+
+
+def test_is_uncertain_final_value():
+    definitions = Definitions()
+    time = definitions.now
+    symbols = {"Global`x", "Global`y"}
+    assert not definitions.is_uncertain_final_value(time, symbols)
+
+    definitions.set_ownvalue("Global`x", Integer(1))
+    assert definitions.now > time
+    assert definitions.is_uncertain_final_value(time, symbols)
+    assert not definitions.is_uncertain_final_value(time, {"Global`y"})
+    assert not definitions.is_uncertain_final_value(definitions.now, symbols)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for mathics.core.evaluation_cache
+"""
+from test.helper import check_evaluation, evaluate, session
+
+import pytest
+
+from mathics.core.evaluation_cache import argument_key
+from mathics.core.parser import parse_builtin_rule
+
+
+@pytest.mark.parametrize(
+    ("str_expr1", "str_expr2", "same"),
+    [
+        ("1", "1", True),
+        ("1", "1.", False),
+        ("1/2", "1/2", True),
+        ("0.5", "0.5", True),
+        ("0.5", "0.5000000000000001", False),
+        ('"a"', '"a"', True),
+        ("1 + 2 I", "1 + 2 I", True),
+        ("1 + 2 I", "1 + 2. I", False),
+    ],
+)
+def test_argument_key(str_expr1, str_expr2, same):
+    key1 = argument_key(evaluate(str_expr1))
+    key2 = argument_key(evaluate(str_expr2))
+    assert key1 is not None and key2 is not None
+    assert (key1 == key2) == same
+
+
+@pytest.mark.parametrize(
+    ("str_expr",),
+    [
+        ("x",),
+        ("1.5`30",),
+        ("F[1]",),
+    ],
+)
+def test_argument_key_not_cacheable(str_expr):
+    assert argument_key(parse_builtin_rule(str_expr)) is None
+
+
+def test_evaluation_cache():
+    cache = session.definitions.evaluation_cache
+    evaluate("Settings`$EvaluationCacheSize = 3")
+    try:
+        assert cache.max_size == 3
+        hits, misses = cache.hits, cache.misses
+        for _ in range(3):
+            check_evaluation("Gamma[2.5]", "1.32934")
+            check_evaluation("Sin[0.5]", "0.479426")
+        assert cache.misses - misses == 2
+        assert cache.hits - hits >= 4
+
+        # Impure builtins and symbolic arguments are not cached.
+        evaluate("RandomReal[]")
+        evaluate("Sin[x]")
+        assert len(cache) == 2
+
+        # Results are forgotten when the definition of the head changes.
+        check_evaluation("Unprotect[Sin]; Sin[0.5] = 3; Sin[0.5]", "3")
+        check_evaluation("Sin[0.5] =.; Protect[Sin]; Sin[0.5]", "0.479426")
+
+        # Calls that issue messages are not cached.
+        for _ in range(2):
+            check_evaluation(
+                "FactorInteger[1.5]",
+                "FactorInteger[1.5]",
+                expected_messages=("Argument 1.5 is not an exact number.",),
+            )
+
+        for n in range(5):
+            evaluate(f"Sin[{n} / 7]")
+        assert len(cache) == 3
+
+        check_evaluation(
+            "Settings`$EvaluationCacheSize = -1",
+            "-1",
+            expected_messages=(
+                "Cannot set the size of the evaluation cache to -1; "
+                "value must be a non-negative integer.",
+            ),
+        )
+        assert cache.max_size == 3
+    finally:
+        evaluate("Settings`$EvaluationCacheSize = 0")
+    assert cache.max_size == 0 and len(cache) == 0
+
+
+@pytest.mark.parametrize(
+    ("str_clear",),
+    [
+        ("Clear[Sin]",),
+        ("ClearAll[Sin]",),
+        ("Sin[0.5] =.",),
+        ("Remove[Sin]",),
+    ],
+)
+def test_evaluation_cache_clear(str_clear):
+    evaluate("Settings`$EvaluationCacheSize = 3")
+    try:
+        check_evaluation("Unprotect[Sin]; Sin[0.5] = 3; Sin[0.5]", "3")
+        evaluate(str_clear)
+        check_evaluation("Sin[0.5]", "0.479426")
+    finally:
+        # Removing the user definition restores the builtin one.
+        evaluate("Unprotect[Sin]; Remove[Sin]")
+        evaluate("Settings`$EvaluationCacheSize = 0")
+    check_evaluation("Attributes[Sin]", "{Listable, NumericFunction, Protected}")
@@ -4,8 +4,9 @@ from test.helper import check_evaluation, evaluate_value
 
 import pytest
 
+from mathics.core.atoms import Integer, MachineReal, Rational
 from mathics.core.builtin import check_requires_list
-from mathics.core.expression import Expression
+from mathics.core.expression import Expression, sorted_elements
 from mathics.core.symbols import Symbol, SymbolPlus, SymbolTimes
 
 
@@ -59,3 +60,55 @@ def test_Expression_sameQ():
     assert (
         nested_expr.sameQ(expr_plus) == False
     ), "should fail when one expression has the other embedded in it"
+
+
+def test_sort_key_cache():
+    """
+    Test that sort keys are kept in the cache of the expression until
+    its elements change.
+    """
+    symbolX, symbolY = Symbol("X"), Symbol("Y")
+    expr = Expression(SymbolPlus, symbolY, symbolX)
+    key = expr.get_sort_key()
+    assert expr.get_sort_key() is key
+    assert expr._cache.sort_key is key
+
+    expr.sort()
+    assert expr.elements == (symbolX, symbolY)
+    sorted_expr = Expression(SymbolPlus, symbolX, symbolY)
+    assert expr.get_sort_key() == sorted_expr.get_sort_key()
+
+    expr.elements = (symbolX,)
+    assert expr.get_sort_key() == Expression(SymbolPlus, symbolX).get_sort_key()
+
+
+def test_sorted_elements():
+    """
+    Test that numbers are sorted by their values, with the same order as
+    the one given by the sort keys.
+    """
+    numbers = [Integer(3), MachineReal(1.5), Integer(-2), MachineReal(3.0), Integer(0)]
+    assert sorted_elements(numbers) == sorted(numbers)
+    assert [number.value for number in sorted_elements(numbers)] == [
+        -2,
+        0,
+        1.5,
+        3,
+        3.0,
+    ]
+    mixed = numbers + [Rational(1, 3), Symbol("X")]
+    assert sorted_elements(mixed) == sorted(mixed)
+
+
+@pytest.mark.parametrize(
+    ("str_expr", "str_expected"),
+    [
+        ("Sort[{3, 1.5, -2, 3., 0}]", "{-2, 0, 1.5, 3, 3.}"),
+        ("Sort[{1/3, 1/4, 0.3, x, 2}]", "{1/4, 0.3, 1/3, 2, x}"),
+        ("Sort[Developer`ToPackedArray[{3., 1., 2.}]]", "{1., 2., 3.}"),
+        ("Developer`PackedArrayQ[Sort[Developer`ToPackedArray[{3, 1, 2}]]]", "True"),
+        ("Union[{c, 2, b}, {1/2, a, 2.5, b}]", "{1/2, 2, 2.5, a, b, c}"),
+    ],
+)
+def test_sort(str_expr, str_expected):
+    check_evaluation(str_expr, str_expected)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the lazy loading of builtin modules in mathics.core.load_builtin
+"""
+import json
+import os
+import os.path as osp
+import subprocess
+import sys
+
+import pytest
+
+from mathics.core.load_builtin import (
+    BUILTIN_MANIFEST_PATH,
+    import_and_load_builtins,
+    load_lazy_builtin_module,
+    mathics3_builtins_modules,
+)
+
+LAZY_SESSION_SCRIPT = """
+import sys
+from mathics.session import MathicsSession
+
+session = MathicsSession()
+definitions = session.definitions
+assert "pint" not in sys.modules
+assert "System`Quantity" in definitions.lazy_builtins
+assert "System`Quantity" in definitions.get_names()
+assert str(session.evaluate("Total[Range[10]]")) == "55"
+assert "pint" not in sys.modules
+
+result = session.evaluate('QuantityMagnitude[Quantity[3, "Meters"] + Quantity[2, "Meters"]]')
+assert str(result) == "5", result
+assert "pint" in sys.modules
+assert "System`Quantity" not in definitions.lazy_builtins
+assert "System`UnitConvert" not in definitions.lazy_builtins
+
+# Option symbols defined by lazy modules are in the System` context.
+assert "System`SplineDegree" in definitions.lazy_builtins
+assert session.evaluate("Context[SplineDegree]").value == "System`"
+session.reset()
+assert "System`Quantity" not in session.definitions.lazy_builtins
+assert str(session.evaluate('QuantityQ[Quantity[1, "Meters"]]')) == "System`True"
+"""
+
+
+def test_builtin_manifest():
+    if not mathics3_builtins_modules:
+        import_and_load_builtins()
+    with open(BUILTIN_MANIFEST_PATH) as manifest_file:
+        manifest = json.load(manifest_file)
+    assert "mathics.builtin.quantities" in manifest
+    for module_name, names in manifest.items():
+        builtin_names = {
+            builtin.get_name() for builtin in load_lazy_builtin_module(module_name)
+        }
+        assert builtin_names <= set(names)
+
+
+@pytest.mark.skipif(
+    sys.platform in ("emscripten",),
+    reason="Pyodide does not support processes",
+)
+def test_lazy_builtins():
+    root_dir = osp.dirname(osp.dirname(osp.dirname(osp.abspath(__file__))))
+    env = dict(os.environ)
+    env["MATHICS3_LAZY_BUILTINS"] = "1"
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (root_dir, env.get("PYTHONPATH")) if path
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", LAZY_SESSION_SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
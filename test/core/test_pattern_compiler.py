@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for mathics.core.pattern_compiler
+"""
+from test.helper import check_evaluation, session
+
+import pytest
+
+from mathics.core.evaluation import Evaluation
+from mathics.core.pattern import BasePattern, StopGenerator
+from mathics.core.pattern_compiler import compile_pattern
+
+
+def general_match(pattern, expr, evaluation):
+    """Match with the general matcher, returning the first match or None."""
+
+    def yield_match(vars_dict, rest):
+        raise StopGenerator(vars_dict)
+
+    try:
+        pattern.match(
+            expr,
+            pattern_context={
+                "yield_func": yield_match,
+                "vars_dict": {},
+                "evaluation": evaluation,
+            },
+        )
+    except StopGenerator as exc:
+        return exc.value
+    return None
+
+
+@pytest.mark.parametrize(
+    ("str_pattern", "str_exprs"),
+    [
+        ("F[x_]", ["F[1]", "F[a]", "F[]", "F[1, 2]", "G[1]", "F[Sequence[]]", "F"]),
+        ("F[x_, x_]", ["F[1, 1]", "F[1, 2]", "F[G[a], G[a]]"]),
+        ("F[_Integer, y_String]", ['F[1, "a"]', 'F[1., "a"]', "F[1, a]"]),
+        ("F[x_?NumberQ]", ["F[1]", "F[a]", "F[Sequence[1, 2]]", "F[Sequence[1, a]]"]),
+        ("F[x_?EvenQ]", ["F[2]", "F[3]", "F[a]"]),
+        ("F[x_?(# > 1 &)]", ["F[2]", "F[0]", "F[a]"]),
+        ('F[1, a, "s"]', ['F[1, a, "s"]', 'F[1, b, "s"]', 'F[1., a, "s"]']),
+        ("F[G[x_, 1], y_]", ["F[G[a, 1], b]", "F[G[a, 2], b]", "F[G[a], b]"]),
+        ("F[{x_, y_}]", ["F[{1, 2}]", "F[{1}]", "F[List]"]),
+    ],
+)
+def test_compiled_match(str_pattern, str_exprs):
+    evaluation = Evaluation(session.definitions)
+    pattern = BasePattern.create(session.parse(str_pattern), evaluation=evaluation)
+    matcher = compile_pattern(pattern, evaluation)
+    assert matcher is not None
+    for str_expr in str_exprs:
+        expr = session.parse(str_expr)
+        assert matcher(expr, evaluation) == general_match(
+            pattern, expr, evaluation
+        ), str_expr
+
+
+@pytest.mark.parametrize(
+    ("str_pattern",),
+    [
+        ("x_",),
+        ("F[x__]",),
+        ("F[x_, y___]",),
+        ("F[x_ /; x > 0]",),
+        ("F[x_:1]",),
+        ("F[x_ | y_]",),
+        ("F[OptionsPattern[]]",),
+        ("Plus[x_, y_]",),
+        ("F[G[x_]]",),
+    ],
+)
+def test_not_compiled(str_pattern):
+    evaluation = Evaluation(session.definitions)
+    session.evaluate("SetAttributes[G, Orderless]")
+    try:
+        pattern = BasePattern.create(session.parse(str_pattern), evaluation=evaluation)
+        assert compile_pattern(pattern, evaluation) is None
+    finally:
+        session.evaluate("ClearAll[G]")
+
+
+def test_compiled_rules():
+    check_evaluation(
+        'h[x_Integer, y_?StringQ] := {x, y}; {h[1, "a"], h[1., "a"], h[1, 2]}',
+        "{{1, a}, h[1., a], h[1, 2]}",
+    )
+    check_evaluation("ClearAll[h]", "Null")
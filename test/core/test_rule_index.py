@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for mathics.core.rule_index
+"""
+from test.helper import check_evaluation, session
+
+import pytest
+
+from mathics.core.attributes import A_NO_ATTRIBUTES, A_ORDERLESS
+from mathics.core.parser import parse_builtin_rule
+from mathics.core.rule_index import RuleIndex, literal_key
+
+
+@pytest.mark.parametrize(
+    ("str_expr1", "str_expr2", "same"),
+    [
+        ("a", "a", True),
+        ("a", "b", False),
+        ("1", "1", True),
+        ("1", '"1"', False),
+        ("1/2", "1/2", True),
+        ("F[1, a]", "F[1, a]", True),
+        ("F[1, a]", "F[a, 1]", False),
+        ("F[G[1]]", "F[G[2]]", False),
+    ],
+)
+def test_literal_key(str_expr1, str_expr2, same):
+    key1 = literal_key(parse_builtin_rule(str_expr1))
+    key2 = literal_key(parse_builtin_rule(str_expr2))
+    assert key1 is not None and key2 is not None
+    assert (key1 == key2) == same
+
+
+@pytest.mark.parametrize(
+    ("str_expr",),
+    [
+        ("1.5",),
+        ("F[1.5]",),
+        ("F[x, 1 + 2. I]",),
+    ],
+)
+def test_literal_key_inexact(str_expr):
+    assert literal_key(parse_builtin_rule(str_expr)) is None
+
+
+def test_rule_index_candidates():
+    session.evaluate(
+        """
+        ClearAll[h];
+        h[x_, y_] := {2, x, y}; h[1] := one; h[x_] := {1, x};
+        h[1, 2] := twelve; h[a___, 5] := five; h[p_Integer, q_] /; p > 10 := big;
+        h[2, 3] = 23; h[4] = 4;
+        """
+    )
+    definition = session.definitions.get_definition("Global`h")
+    rules = definition.downvalues
+    index = RuleIndex(rules)
+    assert index.is_valid_for(rules)
+
+    def candidates(str_expr, attributes=A_NO_ATTRIBUTES):
+        expr = session.evaluate(f"Hold[{str_expr}]").elements[0]
+        return index.get_candidates(expr, attributes)
+
+    # Rules are returned in the order of the rule list.
+    for str_expr in ("h[1]", "h[1, 2]", "h[7]", "h[3, 5]", "h[]", "h[1, 2, 3]"):
+        found = candidates(str_expr)
+        assert found == [rule for rule in rules if any(rule is c for c in found)]
+
+    # h[4] and the rules for two arguments are discarded.
+    assert [str(rule.pattern.expr) for rule in candidates("h[1]")] == [
+        "Global`h[1]",
+        "System`Condition[Global`h[System`Pattern[Global`p, System`Blank[System`Integer]], "
+        "System`Pattern[Global`q, System`Blank[]]], System`Greater[Global`p, 10]]",
+        "Global`h[System`Pattern[Global`x, System`Blank[]]]",
+        "Global`h[System`Pattern[Global`a, System`BlankNullSequence[]], 5]",
+    ]
+    # With no arguments, only the rule wrapped in a Condition is
+    # not discarded.
+    assert len(candidates("h[]")) == 1
+    # Orderless heads are not indexed.
+    assert candidates("h[1]", A_ORDERLESS) is rules
+
+
+def test_rule_index_literal_rules():
+    session.evaluate("ClearAll[m]; Do[m[i] = i, {i, 21}]; m[n_] := -n")
+    definition = session.definitions.get_definition("Global`m")
+    rules = definition.downvalues
+    index = definition.get_rule_index("downvalues")
+    assert index is not None and index.is_valid_for(rules)
+    # The rules were never matched, so the attributes of their patterns
+    # are not known yet.
+    assert len(index.exact) == 21 and not index.by_first
+    assert all(index.find(rule) == position for position, rule in enumerate(rules))
+
+    # A rule replaced by another one with the same pattern goes first.
+    check_evaluation("m[7] = seven; {m[7], m[8], m[30]}", "{seven, 8, -30}")
+    assert len(rules) == 22 and str(rules[0].replace) == "Global`seven"
+    assert index.is_valid_for(rules) and len(index.exact) == 21
+    session.evaluate("ClearAll[m]")
+
+
+@pytest.mark.parametrize(
+    ("str_expr", "str_expected"),
+    [
+        (None, None),
+        (
+            "fib[0] = 0; fib[1] = 1; fib[n_] := fib[n] = fib[n - 1] + fib[n - 2]; fib[50]",
+            "12586269025",
+        ),
+        ("Length[DownValues[fib]]", "52"),
+        ("fib[10] =.; Length[DownValues[fib]]", "51"),
+        ("fib[10]", "55"),
+        ("Length[DownValues[fib]]", "52"),
+        (
+            "Do[g[i] = i^2, {i, 20}]; g[n_] := -n; g[a, b_] := ab; {g[3], g[30], g[a, 1]}",
+            "{9, -30, ab}",
+        ),
+        ("g[3] = three; {g[3], g[4]}", "{three, 16}"),
+        ("Clear[g]; g[3]", "g[3]"),
+        (
+            "Do[u /: F[i, u] = i, {i, 10}]; {F[3, u], F[u, 3], F[11, u]}",
+            "{3, F[u, 3], F[11, u]}",
+        ),
+        (
+            "SetAttributes[k, Orderless]; Do[k[i, a] = i, {i, 10}]; {k[a, 3], k[3, a]}",
+            "{3, 3}",
+        ),
+        (None, None),
+    ],
+)
+def test_indexed_evaluation(str_expr, str_expected):
+    check_evaluation(str_expr, str_expected)
@@ -1,6 +1,8 @@
 import io
 import pickle
 
+from mathics.core.atoms import Integer, String
+from mathics.core.symbols import Symbol
 from mathics.session import MathicsSession
 
 
@@ -23,3 +25,15 @@ def test_session_serialization():
     assert (
         result.to_python() == 7
     ), "Rule[] and Assign[] did not dump and restore properly"
+
+
+def test_atom_hash_serialization():
+    """Check that hash values of atoms are not pickled. They differ between
+    Python processes, and loading them would change the hash of interned atoms.
+    """
+    atoms = (Symbol("Global`serializedSymbol"), String("serialized"), Integer(123))
+    lookup = {atom: i for i, atom in enumerate(atoms)}
+    for atom in atoms:
+        assert "hash" not in atom.__getstate__()
+        restored = pickle.loads(pickle.dumps(atom))
+        assert lookup[restored] == lookup[atom]